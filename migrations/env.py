@@ -0,0 +1,73 @@
+"""
+Alembic environment.
+
+Runs the versioned schema migrations against `settings.database_url` using
+the asynchronous engine, with the metadata of every SQLModel entity as the
+autogenerate target.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from src.infrastructure.connection.db import load_entities
+from src.settings import settings
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+load_entities()
+target_metadata = SQLModel.metadata
+
+
+def database_url() -> str:
+    """Return the URL set programmatically, falling back to the settings."""
+    return config.get_main_option("sqlalchemy.url") or settings.database_url
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL to stdout without connecting to the database."""
+    context.configure(
+        url=database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Run the migrations through the application's async driver."""
+    connectable = config.attributes.get("connection")
+    if connectable is not None:
+        await connectable.run_sync(do_run_migrations)
+        return
+
+    engine = create_async_engine(database_url())
+    async with engine.begin() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,45 @@
+"""Access log retention.
+
+Adds the `access_log_archive` table the monthly retention job moves old
+access logs into, and the indexes behind the access-log filters: by date,
+and by user and date. Kept out of the baseline so databases adopted with
+`alembic stamp 0001` get them on `alembic upgrade head`.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:12:40
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('access_log_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.Date(), nullable=False),
+    sa.Column('entries', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('period')
+    )
+    with op.batch_alter_table('access_log', schema=None) as batch_op:
+        batch_op.create_index('ix_access_log_acces_date', ['acces_date'], unique=False)
+        batch_op.create_index('ix_access_log_user_id_acces_date', ['user_id', 'acces_date'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('access_log', schema=None) as batch_op:
+        batch_op.drop_index('ix_access_log_user_id_acces_date')
+        batch_op.drop_index('ix_access_log_acces_date')
+
+    op.drop_table('access_log_archive')
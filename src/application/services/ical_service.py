@@ -0,0 +1,123 @@
+"""
+iCalendar Service.
+
+Renders calendar activities as an RFC 5545 iCalendar feed that phone and
+desktop calendar apps can subscribe to.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime, time, timezone
+from typing import Iterable, Iterator
+
+from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+
+_MAX_LINE_OCTETS = 75
+
+
+class ICalService:
+    """Service for rendering calendar activities as iCalendar."""
+
+    def __init__(self, product_id: str = "-//Apprendre//Calendar//EN"):
+        """
+        Initialize the ICalService.
+
+        Args:
+            product_id (str): PRODID written in every feed.
+        """
+        self.product_id = product_id
+
+    def render(
+        self,
+        name: str,
+        activities: Iterable[CalendarActivity],
+        stamp: datetime = None,
+    ) -> bytes:
+        """
+        Render a full feed.
+
+        Args:
+            name (str): Calendar name shown by the client.
+            activities (Iterable[CalendarActivity]): Activities to include.
+            stamp (datetime): DTSTAMP of the events, now by default.
+
+        Returns:
+            bytes: The UTF-8 encoded feed.
+        """
+        return b"".join(self.iter_render(name, activities, stamp))
+
+    def iter_render(
+        self,
+        name: str,
+        activities: Iterable[CalendarActivity],
+        stamp: datetime = None,
+    ) -> Iterator[bytes]:
+        """
+        Render a feed line by line.
+
+        Activities at midnight are written as all-day events, the rest as
+        UTC date-times (naive datetimes are taken as UTC).
+
+        Yields:
+            bytes: One folded, CRLF terminated content line.
+        """
+        stamp = _utc_stamp(stamp or datetime.now(timezone.utc))
+        yield from self._lines(
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{self.product_id}",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{_escape(name)}",
+        )
+        for activity in activities:
+            yield from self._lines(
+                "BEGIN:VEVENT",
+                f"UID:calendar-activity-{activity.id}@apprendre",
+                f"DTSTAMP:{stamp}",
+                _dtstart(activity.date),
+                f"SUMMARY:{_escape(activity.activity_name)}",
+                "END:VEVENT",
+            )
+        yield from self._lines("END:VCALENDAR")
+
+    def _lines(self, *lines: str) -> Iterator[bytes]:
+        for line in lines:
+            yield _fold(line.encode("utf-8"))
+
+
+def _escape(text: str) -> str:
+    return (
+        (text or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _utc_stamp(moment: datetime) -> str:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _dtstart(moment: datetime) -> str:
+    if moment.tzinfo is None and moment.time() == time(0, 0):
+        return f"DTSTART;VALUE=DATE:{moment.strftime('%Y%m%d')}"
+    return f"DTSTART:{_utc_stamp(moment)}"
+
+
+def _fold(line: bytes) -> bytes:
+    """Fold a content line at 75 octets without splitting UTF-8 sequences."""
+    parts = []
+    limit = _MAX_LINE_OCTETS
+    while len(line) > limit:
+        cut = limit
+        while cut > 0 and (line[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(line[:cut])
+        line = line[cut:]
+        limit = _MAX_LINE_OCTETS - 1
+    parts.append(line)
+    return b"\r\n ".join(parts) + b"\r\n"
@@ -0,0 +1,99 @@
+"""
+Import Reader.
+
+Turns an uploaded byte stream into raw rows without buffering the whole
+file. Supports CSV with a header line and NDJSON (one JSON object per
+line). Both formats expect one record per line.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, Tuple
+
+CSV = "csv"
+NDJSON = "ndjson"
+
+CONTENT_TYPES = {
+    "text/csv": CSV,
+    "application/csv": CSV,
+    "application/x-ndjson": NDJSON,
+    "application/ndjson": NDJSON,
+    "application/jsonl": NDJSON,
+}
+
+
+def format_from_content_type(content_type: str) -> str:
+    """
+    Resolve the import format from a Content-Type header.
+
+    Args:
+        content_type (str): Raw header value, parameters allowed.
+
+    Returns:
+        str: `csv`, `ndjson` or None when the type is not supported.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return CONTENT_TYPES.get(media_type)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Yield the non-blank lines of a UTF-8 byte stream with their line number."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    line_no = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield line_no + 1, pending.rstrip("\r")
+
+
+async def read_rows(
+    chunks: AsyncIterator[bytes], fmt: str
+) -> AsyncIterator[Tuple[int, Dict]]:
+    """
+    Parse a CSV or NDJSON stream row by row.
+
+    Empty CSV cells are dropped so optional fields fall back to their
+    defaults. Lines that cannot be parsed are yielded as a dict holding
+    only an `_error` key so the caller can report them.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Request body stream.
+        fmt (str): `csv` or `ndjson`.
+
+    Yields:
+        Tuple[int, Dict]: Line number and raw row.
+    """
+    header = None
+    async for line_no, line in iter_lines(chunks):
+        if fmt == NDJSON:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, {"_error": f"Invalid JSON: {e.msg}"}
+                continue
+            if not isinstance(row, dict):
+                yield line_no, {"_error": "Each line must be a JSON object"}
+                continue
+            yield line_no, row
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_no, {"_error": f"Expected {len(header)} columns, got {len(values)}"}
+            continue
+        yield line_no, {
+            name: value for name, value in zip(header, values) if value.strip() != ""
+        }
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import ALLERGIES, CatalogSnapshotCache
 from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
 from src.infrastructure.repositories.allergy_info import AllergyRepository
 
@@ -8,11 +9,14 @@ from src.infrastructure.repositories.allergy_info import AllergyRepository
 class CreateAllergyCase:
 
 
-    def __init__(self, repo: AllergyRepository):
+    def __init__(self, repo: AllergyRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def create(self, payload: AllergyInfo) -> CommonResponse:
         created = await self.repo.create(payload)
+        if self.catalog:
+            await self.catalog.invalidate(ALLERGIES)
 
         return CommonResponse(
             item_id=created.id,
@@ -3,6 +3,8 @@
 from datetime import datetime, timezone
 from src.application.use_case.allergy_info.find_allergy_case import FindAllergyCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import ALLERGIES, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.allergy_info import AllergyRepository
 
 
@@ -13,15 +15,22 @@ class DeleteAllergyCase:
         self,
         repo: AllergyRepository,
         find_case: FindAllergyCase,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("allergy-info")
     async def delete(self, allergy_id:int) -> CommonResponse:
 
         allergy = await self.find_case.get_allergy(allergy_id)
 
         resp = await self.repo.delete(allergy_id)
+        if self.catalog:
+            await self.catalog.invalidate(ALLERGIES)
         if resp:
             return CommonResponse(
                 item_id=allergy_id, event_date=datetime.now(timezone.utc)
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
+from src.infrastructure.cache.catalog_snapshot import ALLERGIES, CatalogSnapshotCache
 from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
 from src.infrastructure.repositories.allergy_info import AllergyRepository
 
@@ -8,11 +9,15 @@ from src.infrastructure.repositories.allergy_info import AllergyRepository
 
 class FindAllergyCase:
 
-    def __init__(self, repo: AllergyRepository):
+    def __init__(self, repo: AllergyRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def get_allergy(self, intolerance_id: int) -> Optional[AllergyInfo]:
-        allergy = await self.repo.get(intolerance_id)
+        if self.catalog:
+            allergy = await self.catalog.get(ALLERGIES, intolerance_id)
+        else:
+            allergy = await self.repo.get(intolerance_id)
         if allergy is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Allergy info not found"
@@ -20,5 +25,7 @@ class FindAllergyCase:
         return allergy
     
     async def get_all(self):
+        if self.catalog:
+            return await self.catalog.get_all(ALLERGIES)
         return await self.repo.get_all()
 
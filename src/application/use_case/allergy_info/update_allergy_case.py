@@ -1,17 +1,29 @@
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import ALLERGIES, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
 from src.infrastructure.repositories.allergy_info import AllergyRepository
 
 
 class UpdateAllergyCase:
 
-    def __init__(self,repo: AllergyRepository):
+    def __init__(
+        self,
+        repo: AllergyRepository,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
+    ):
         self.repo = repo
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("allergy-info")
     async def update(self, payload: AllergyInfo) -> CommonResponse:
         allergy = await self.repo.update(payload)
+        if self.catalog:
+            await self.catalog.invalidate(ALLERGIES)
         if allergy:
             return CommonResponse(
                 item_id=allergy.id,
@@ -0,0 +1,112 @@
+"""
+Calendar Feed Use Case.
+
+Serves the iCalendar feeds of a class or a student. Feeds are rendered once
+and kept in Redis until a calendar activity is created, updated or deleted,
+so calendar apps polling the feed only cost a cache lookup.
+
+Feed URLs carry an HMAC token instead of a JWT because calendar apps cannot
+send an Authorization header. A token names the user it was issued to and
+their token version, so a user can revoke every URL they handed out.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import hashlib
+import hmac
+from datetime import datetime, timezone
+
+from fastapi import HTTPException, status
+from src.application.services.ical_service import ICalService
+from src.domain.objects.calendar.calendar_feed_dto import CalendarFeedDTO
+from src.domain.objects.token.jwtPayload import JwtPayload
+from src.infrastructure.cache.calendar_feed import CalendarFeedCache
+from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
+
+FEED_KINDS = ("class", "student")
+# DTSTAMP of the rendering the ETag is computed from, so it only covers
+# the activities.
+CONTENT_STAMP = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class CalendarFeedCase:
+
+    def __init__(
+        self,
+        repo: CalendarActivityRepository,
+        cache: CalendarFeedCache,
+        ical_service: ICalService,
+        secret_key: str,
+        admin_role_id: int,
+    ):
+        self.repo = repo
+        self.cache = cache
+        self.ical_service = ical_service
+        self.secret_key = secret_key
+        self.admin_role_id = admin_role_id
+
+    async def feed_token(self, kind: str, item_id: int, user: JwtPayload) -> str:
+        if user.role != self.admin_role_id and not await self.repo.follows(
+            kind, item_id, user.user_id
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not your calendar"
+            )
+        version = await self.cache.token_version(user.user_id)
+        mac = self._sign(kind, item_id, user.user_id, version)
+        return f"{user.user_id}.{version}.{mac}"
+
+    async def check_token(self, kind: str, item_id: int, token: str):
+        try:
+            user_id, version, mac = (token or "").split(".")
+            user_id, version = int(user_id), int(version)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid feed token"
+            )
+        expected = self._sign(kind, item_id, user_id, version)
+        if not hmac.compare_digest(
+            expected, mac
+        ) or version != await self.cache.token_version(user_id):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid feed token"
+            )
+
+    async def revoke_tokens(self, user: JwtPayload) -> int:
+        return await self.cache.revoke_tokens(user.user_id)
+
+    def _sign(self, kind: str, item_id: int, user_id: int, version: int) -> str:
+        message = f"{kind}:{item_id}:{user_id}:{version}"
+        return hmac.new(
+            self.secret_key.encode(), message.encode(), hashlib.sha256
+        ).hexdigest()[:32]
+
+    async def get_feed(self, kind: str, item_id: int) -> CalendarFeedDTO:
+        scope = f"{kind}:{item_id}"
+        generation = await self.cache.generation()
+        feed = await self.cache.get(generation, scope)
+        if feed is not None:
+            return feed
+
+        if kind == "class":
+            activities = await self.repo.get_by_class(item_id)
+        else:
+            activities = await self.repo.get_by_student(item_id)
+
+        name = f"{kind.capitalize()} {item_id}"
+        content = self.ical_service.render(name, activities, stamp=CONTENT_STAMP)
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        last_modified = await self.cache.last_modified(scope, etag)
+        if last_modified is None:
+            last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+            await self.cache.set_last_modified(scope, etag, last_modified)
+
+        body = self.ical_service.render(name, activities, stamp=last_modified)
+        feed = CalendarFeedDTO(
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            gzip_body=self.cache.compress(body),
+        )
+        await self.cache.set(generation, scope, feed)
+        return feed
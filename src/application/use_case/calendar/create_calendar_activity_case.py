@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.calendar_feed import CalendarFeedCache
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
 from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
 
@@ -7,11 +8,13 @@ from src.infrastructure.repositories.calendary_activity import CalendarActivityR
 class CreateCalendarActivityCase:
 
 
-    def __init__(self, repo: CalendarActivityRepository):
+    def __init__(self, repo: CalendarActivityRepository, feed_cache: CalendarFeedCache):
         self.repo = repo
+        self.feed_cache = feed_cache
 
     async def create(self, payload: CalendarActivity) -> CommonResponse:
         created = await self.repo.create(payload)
+        await self.feed_cache.invalidate()
 
         return CommonResponse(
             item_id=created.id,
@@ -0,0 +1,131 @@
+"""
+Create Recurring Calendar Activity Use Case.
+
+Expands a recurrence into its occurrences and stores them, with their
+class links, in one batched transaction instead of one request per date.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi import HTTPException, status
+from src.domain.objects.calendar.calendar_recurrence_dto import (
+    MAX_OCCURRENCES,
+    MAX_SPAN,
+    CalendarBulkResultDTO,
+    CalendarRecurrenceDTO,
+)
+from src.infrastructure.cache.calendar_feed import CalendarFeedCache
+from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
+
+
+def expand_occurrences(rule: CalendarRecurrenceDTO) -> List[datetime]:
+    """
+    Expand a recurrence into sorted, unique occurrence datetimes.
+
+    Follows RFC 5545: `count` is applied before the excluded dates are
+    removed, weekly intervals are counted in Monday-based weeks from the
+    week of `start`, and a daily rule with weekdays only keeps those days.
+    Explicit `dates` are added last. The rule is walked one period at a
+    time and never past MAX_SPAN from `start`.
+
+    Args:
+        rule (CalendarRecurrenceDTO): The recurrence to expand.
+
+    Returns:
+        List[datetime]: The occurrences.
+
+    Raises:
+        HTTPException: If the rule produces more than MAX_OCCURRENCES dates,
+            or needs more than MAX_SPAN to reach its count (422).
+    """
+    occurrences = []
+    if rule.freq is not None:
+        try:
+            occurrences = _expand_rule(rule)
+        except OverflowError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="The recurrence goes past the last supported date",
+            )
+
+    excluded = set(rule.exceptions)
+    occurrences = [moment for moment in occurrences if moment.date() not in excluded]
+    occurrences = sorted(set(occurrences) | set(rule.dates))
+    if len(occurrences) > MAX_OCCURRENCES:
+        raise _too_many()
+    return occurrences
+
+
+def _expand_rule(rule: CalendarRecurrenceDTO) -> List[datetime]:
+    if rule.freq == "daily":
+        step = timedelta(days=rule.interval)
+        offsets = [timedelta(0)]
+        period_start = rule.start
+    else:
+        step = timedelta(weeks=rule.interval)
+        days = sorted(set(rule.weekdays) or {rule.start.weekday()})
+        offsets = [timedelta(days=day) for day in days]
+        period_start = rule.start - timedelta(days=rule.start.weekday())
+    # Daily rules keep the listed weekdays only; weekly ones generate them.
+    weekdays = set(rule.weekdays) if rule.freq == "daily" else set()
+    last = rule.start + MAX_SPAN if rule.until is None else min(rule.until, rule.start + MAX_SPAN)
+
+    occurrences = []
+    while period_start <= last:
+        for offset in offsets:
+            current = period_start + offset
+            if current < rule.start or (weekdays and current.weekday() not in weekdays):
+                continue
+            if current > last:
+                break
+            occurrences.append(current)
+            if len(occurrences) > MAX_OCCURRENCES:
+                raise _too_many()
+            if rule.count is not None and len(occurrences) == rule.count:
+                return occurrences
+        period_start += step
+    if rule.count is not None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"A recurrence can span at most {MAX_SPAN.days} days",
+        )
+    return occurrences
+
+
+def _too_many() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        detail=f"A recurrence can create at most {MAX_OCCURRENCES} activities",
+    )
+
+
+class CreateRecurringActivityCase:
+
+    def __init__(self, repo: CalendarActivityRepository, feed_cache: CalendarFeedCache):
+        self.repo = repo
+        self.feed_cache = feed_cache
+
+    async def create(self, payload: CalendarRecurrenceDTO) -> CalendarBulkResultDTO:
+        occurrences = expand_occurrences(payload)
+        if not occurrences:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="The recurrence has no occurrences",
+            )
+        activities = [
+            CalendarActivity(
+                course_id=payload.course_id,
+                activity_name=payload.activity_name,
+                activity_type_id=payload.activity_type_id,
+                date=moment,
+            )
+            for moment in occurrences
+        ]
+        ids = await self.repo.bulk_create(activities, payload.class_ids)
+        await self.feed_cache.invalidate()
+
+        return CalendarBulkResultDTO(ids=ids, event_date=datetime.now(timezone.utc))
@@ -3,6 +3,7 @@ from src.application.use_case.calendar.find_calendar_activity_case import FindCa
 from src.application.use_case.course.find_course_case import FindCourseCase
 from src.application.use_case.medical_info.find_medical_case import FindMedicalCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.calendar_feed import CalendarFeedCache
 from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
 from src.infrastructure.repositories.course import CourseRepository
 from src.infrastructure.repositories.medical_info import MedicalInfoRepository
@@ -15,9 +16,11 @@ class DeleteCalendarActivityCase:
         self,
         repo: CalendarActivityRepository,
         find_case: FindCalendarActivityCase,
+        feed_cache: CalendarFeedCache,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.feed_cache = feed_cache
 
     async def delete(self, course_id:int) -> CommonResponse:
 
@@ -25,6 +28,7 @@ class DeleteCalendarActivityCase:
 
         resp = await self.repo.delete(course_id)
         if resp:
+            await self.feed_cache.invalidate()
             return CommonResponse(
                 item_id=course_id, event_date=datetime.now(timezone.utc)
             )
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
+from src.domain.objects.calendar.calendar_filter_dto import CalendarFilterDTO, CalendarWindowDTO
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
 from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
 
@@ -19,5 +20,10 @@ class FindCalendarActivityCase:
             )
         return course
 
-    async def get_all(self) -> List[CalendarActivity]:
-        return await self.repo.get_all()
\ No newline at end of file
+    async def get_all(self, filters: Optional[CalendarFilterDTO] = None) -> List[CalendarActivity]:
+        return await self.repo.get_all(filters)
+
+    async def get_by_class(
+        self, class_id: int, window: Optional[CalendarWindowDTO] = None
+    ) -> List[CalendarActivity]:
+        return await self.repo.get_by_class(class_id, window)
@@ -1,6 +1,7 @@
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.calendar_feed import CalendarFeedCache
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
 from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
 
@@ -8,12 +9,14 @@ from src.infrastructure.repositories.calendary_activity import CalendarActivityR
 
 class UpdateCalendarActivityCase:
 
-    def __init__(self,repo: CalendarActivityRepository):
+    def __init__(self,repo: CalendarActivityRepository, feed_cache: CalendarFeedCache):
         self.repo = repo
+        self.feed_cache = feed_cache
 
     async def update(self, payload: CalendarActivity) -> CommonResponse:
         course = await self.repo.update(payload)
         if course:
+            await self.feed_cache.invalidate()
             return CommonResponse(
                 item_id=course.id,
                 event_date=datetime.now(timezone.utc)
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from src.application.use_case.classes.find_classes_case import FindClassesCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.classes import ClassesRepository
 
 
@@ -12,10 +13,13 @@ class DeleteClassesCase:
         self,
         repo: ClassesRepository,
         find_case: FindClassesCase,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.response_cache = response_cache
 
+    @evicts("class:{class_id}", "subject-classes")
     async def delete(self, class_id:int) -> CommonResponse:
 
         await self.find_case.get(class_id)
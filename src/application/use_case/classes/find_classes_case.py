@@ -1,6 +1,7 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
 from src.domain.objects.classes.class_subjects_dto import ClassSubjectsDTO
+from src.infrastructure.cache.response_cache import ResponseCache, cached_response
 from src.infrastructure.entities.course.classes import Classes
 from src.infrastructure.repositories.classes import ClassesRepository
 
@@ -8,9 +9,16 @@ from src.infrastructure.repositories.classes import ClassesRepository
 
 class FindClassesCase:
 
-    def __init__(self, repo: ClassesRepository):
+    def __init__(self, repo: ClassesRepository, response_cache: ResponseCache = None):
         self.repo = repo
+        self.response_cache = response_cache
 
+    @cached_response(
+        "class",
+        "{class_id}",
+        ClassSubjectsDTO,
+        tags=("class:{class_id}", "course:{result.course_id}", "subject-classes"),
+    )
     async def get(self, class_id: int) -> Optional[ClassSubjectsDTO]:
         classes = await self.repo.get_by_id(class_id)
         if classes is None:
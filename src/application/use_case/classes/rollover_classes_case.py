@@ -0,0 +1,18 @@
+from src.domain.objects.classes.class_rollover_dto import (
+    ClassRolloverDTO,
+    ClassRolloverReportDTO,
+)
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
+from src.infrastructure.repositories.classes import ClassesRepository
+
+
+class RolloverClassesCase:
+
+
+    def __init__(self, repo: ClassesRepository, response_cache: ResponseCache = None):
+        self.repo = repo
+        self.response_cache = response_cache
+
+    @evicts("subject-classes")
+    async def rollover(self, payload: ClassRolloverDTO) -> ClassRolloverReportDTO:
+        return await self.repo.rollover(payload)
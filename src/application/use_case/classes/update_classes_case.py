@@ -4,15 +4,18 @@ from typing import List
 from src.domain.objects.classes.class_subjects_dto import ClassSubjectsDTO
 from src.domain.objects.classes.update_class_subjects_dto import UpdateClassSubjectsDTO
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.course.classes import Classes
 from src.infrastructure.repositories.classes import ClassesRepository
 
 
 class UpdateClassesCase:
 
-    def __init__(self,repo: ClassesRepository):
+    def __init__(self, repo: ClassesRepository, response_cache: ResponseCache = None):
         self.repo = repo
+        self.response_cache = response_cache
 
+    @evicts("class:{payload.id}", "student-classes")
     async def update(self, payload: Classes) -> CommonResponse:
         classes = await self.repo.update(payload)
         if classes:
@@ -21,6 +24,7 @@ class UpdateClassesCase:
                 event_date=datetime.now(timezone.utc)
             )
         
+    @evicts("class:{subjects.class_id}", "subject-classes")
     async def update_subjects(self, subjects:UpdateClassSubjectsDTO) -> ClassSubjectsDTO:
         classes: ClassSubjectsDTO = await self.repo.update_subjects(subjects)
         return CommonResponse(
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from src.application.use_case.course.find_course_case import FindCourseCase
 from src.application.use_case.medical_info.find_medical_case import FindMedicalCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.course import CourseRepository
 from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 
@@ -13,10 +14,13 @@ class DeleteCourseCase:
         self,
         repo: CourseRepository,
         find_case: FindCourseCase,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.response_cache = response_cache
 
+    @evicts("course:{course_id}", "subject-classes")
     async def delete(self, course_id:int) -> CommonResponse:
 
         await self.find_case.get(course_id)
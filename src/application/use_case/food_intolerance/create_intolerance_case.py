@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import FOOD_INTOLERANCES, CatalogSnapshotCache
 from src.infrastructure.entities.student_info.food_intolerance import FoodIntolerance
 from src.infrastructure.repositories.food_intolerance import FoodIntoleranceRepository
 
@@ -10,11 +11,14 @@ from src.infrastructure.repositories.food_intolerance import FoodIntoleranceRepo
 class CreateIntoleranceCase:
 
 
-    def __init__(self, repo: FoodIntoleranceRepository):
+    def __init__(self, repo: FoodIntoleranceRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def create(self, payload: FoodIntolerance) -> CommonResponse:
         created = await self.repo.create(payload)
+        if self.catalog:
+            await self.catalog.invalidate(FOOD_INTOLERANCES)
 
         return CommonResponse(
             item_id=created.id,
@@ -3,6 +3,8 @@
 from datetime import datetime, timezone
 from src.application.use_case.food_intolerance.find_intolerance_case import FindIntoleranceCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import FOOD_INTOLERANCES, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.food_intolerance import FoodIntoleranceRepository
 
 
@@ -12,15 +14,22 @@ class DeleteIntoleranceCase:
         self,
         repo: FoodIntoleranceRepository,
         find_case: FindIntoleranceCase,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("food-intolerance")
     async def delete(self, intolerance_id:int) -> CommonResponse:
 
         student = await self.find_case.get_intolerance(intolerance_id)
 
         resp = await self.repo.delete(intolerance_id)
+        if self.catalog:
+            await self.catalog.invalidate(FOOD_INTOLERANCES)
         if resp:
             return CommonResponse(
                 item_id=intolerance_id, event_date=datetime.now(timezone.utc)
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
+from src.infrastructure.cache.catalog_snapshot import FOOD_INTOLERANCES, CatalogSnapshotCache
 from src.infrastructure.entities.student_info.food_intolerance import FoodIntolerance
 from src.infrastructure.repositories.food_intolerance import FoodIntoleranceRepository
 
@@ -7,11 +8,15 @@ from src.infrastructure.repositories.food_intolerance import FoodIntoleranceRepo
 
 class FindIntoleranceCase:
 
-    def __init__(self, repo: FoodIntoleranceRepository):
+    def __init__(self, repo: FoodIntoleranceRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def get_intolerance(self, intolerance_id: int) -> Optional[FoodIntolerance]:
-        intolerance = await self.repo.get(intolerance_id)
+        if self.catalog:
+            intolerance = await self.catalog.get(FOOD_INTOLERANCES, intolerance_id)
+        else:
+            intolerance = await self.repo.get(intolerance_id)
         if intolerance is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Intolerance not found"
@@ -19,5 +24,7 @@ class FindIntoleranceCase:
         return intolerance
 
     async def get_all(self):
+        if self.catalog:
+            return await self.catalog.get_all(FOOD_INTOLERANCES)
         return await self.repo.get_all()
 
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import MEDICAL_INFO, CatalogSnapshotCache
 from src.infrastructure.entities.student_info.medical_info import MedicalInfo
 from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 
@@ -8,11 +9,14 @@ from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 class CreateMedicalCase:
 
 
-    def __init__(self, repo: MedicalInfoRepository):
+    def __init__(self, repo: MedicalInfoRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def create(self, payload: MedicalInfo) -> CommonResponse:
         created = await self.repo.create(payload)
+        if self.catalog:
+            await self.catalog.invalidate(MEDICAL_INFO)
 
         return CommonResponse(
             item_id=created.id,
@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from src.application.use_case.medical_info.find_medical_case import FindMedicalCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import MEDICAL_INFO, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 
 
@@ -11,15 +13,22 @@ class DeleteMedicalCase:
         self,
         repo: MedicalInfoRepository,
         find_case: FindMedicalCase,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("medical-info")
     async def delete(self, medical_id:int) -> CommonResponse:
 
         medical = await self.find_case.get_medical(medical_id)
 
         resp = await self.repo.delete(medical_id)
+        if self.catalog:
+            await self.catalog.invalidate(MEDICAL_INFO)
         if resp:
             return CommonResponse(
                 item_id=medical_id, event_date=datetime.now(timezone.utc)
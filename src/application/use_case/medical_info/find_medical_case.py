@@ -1,5 +1,6 @@
 from typing import Optional
 from fastapi import HTTPException, status
+from src.infrastructure.cache.catalog_snapshot import MEDICAL_INFO, CatalogSnapshotCache
 from src.infrastructure.entities.student_info.medical_info import MedicalInfo
 from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 
@@ -7,11 +8,15 @@ from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 
 class FindMedicalCase:
 
-    def __init__(self, repo: MedicalInfoRepository):
+    def __init__(self, repo: MedicalInfoRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def get_medical(self, intolerance_id: int) -> Optional[MedicalInfo]:
-        intolerance = await self.repo.get(intolerance_id)
+        if self.catalog:
+            intolerance = await self.catalog.get(MEDICAL_INFO, intolerance_id)
+        else:
+            intolerance = await self.repo.get(intolerance_id)
         if intolerance is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Medical info not found"
@@ -19,4 +24,6 @@ class FindMedicalCase:
         return intolerance
 
     async def get_all(self):
+        if self.catalog:
+            return await self.catalog.get_all(MEDICAL_INFO)
         return await self.repo.get_all()
\ No newline at end of file
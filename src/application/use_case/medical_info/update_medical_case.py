@@ -1,17 +1,29 @@
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import MEDICAL_INFO, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.student_info.medical_info import MedicalInfo
 from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 
 
 class UpdateMedicalCase:
 
-    def __init__(self,repo: MedicalInfoRepository):
+    def __init__(
+        self,
+        repo: MedicalInfoRepository,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
+    ):
         self.repo = repo
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("medical-info")
     async def update(self, payload: MedicalInfo) -> CommonResponse:
         medical = await self.repo.update(payload)
+        if self.catalog:
+            await self.catalog.invalidate(MEDICAL_INFO)
         if medical:
             return CommonResponse(
                 item_id=medical.id,
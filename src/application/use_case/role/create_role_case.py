@@ -8,20 +8,23 @@ Handles the creation of new roles in the system.
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import ROLES, CatalogSnapshotCache
 from src.infrastructure.repositories.role import RoleRepository
 
 
 class CreateRoleCase:
     """Use case for creating a new role."""
 
-    def __init__(self, role_repo: RoleRepository):
+    def __init__(self, role_repo: RoleRepository, catalog: CatalogSnapshotCache = None):
         """
         Initialize the CreateRoleCase with the required role repository.
 
         Args:
             role_repo (RoleRepository): Repository for managing role persistence.
+            catalog (CatalogSnapshotCache): In-process role snapshot.
         """
         self.role_repo = role_repo
+        self.catalog = catalog
 
     async def create(self, role_name: str) -> CommonResponse:
         """
@@ -34,6 +37,8 @@ class CreateRoleCase:
             CommonResponse: Contains the new role's ID and the creation timestamp.
         """
         role = await self.role_repo.create(role_name)
+        if self.catalog:
+            await self.catalog.invalidate(ROLES)
         return CommonResponse(
             item_id=role.role_id,
             event_date=datetime.now(timezone.utc)
@@ -8,20 +8,23 @@ Handles the deletion of roles in the system.
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import ROLES, CatalogSnapshotCache
 from src.infrastructure.repositories.role import RoleRepository
 
 
 class DeleteRoleCase:
     """Use case for deleting a role."""
 
-    def __init__(self, role_repo: RoleRepository):
+    def __init__(self, role_repo: RoleRepository, catalog: CatalogSnapshotCache = None):
         """
         Initialize the DeleteRoleCase with the required role repository.
 
         Args:
             role_repo (RoleRepository): Repository for managing role persistence.
+            catalog (CatalogSnapshotCache): In-process role snapshot.
         """
         self.role_repo = role_repo
+        self.catalog = catalog
 
     async def delete(self, role_id: int) -> CommonResponse:
         """
@@ -34,6 +37,8 @@ class DeleteRoleCase:
             CommonResponse: Contains the deleted role's ID and the timestamp of the deletion.
         """
         await self.role_repo.delete(role_id)
+        if self.catalog:
+            await self.catalog.invalidate(ROLES)
         return CommonResponse(
             item_id=role_id,
             event_date=datetime.now(timezone.utc)
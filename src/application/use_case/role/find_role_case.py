@@ -9,20 +9,23 @@ Provides methods to retrieve roles by ID, name, or fetch all roles.
 from typing import List
 from fastapi import HTTPException, status
 from src.domain.objects.role.role_dto import RoleDTO
+from src.infrastructure.cache.catalog_snapshot import ROLES, CatalogSnapshotCache
 from src.infrastructure.repositories.role import RoleRepository
 
 
 class FindRoleCase:
     """Use case for retrieving role information from the repository."""
 
-    def __init__(self, role_repo: RoleRepository):
+    def __init__(self, role_repo: RoleRepository, catalog: CatalogSnapshotCache = None):
         """
         Initialize the FindRoleCase with the role repository.
 
         Args:
             role_repo (RoleRepository): Repository for accessing role data.
+            catalog (CatalogSnapshotCache): In-process role snapshot.
         """
         self.role_repo = role_repo
+        self.catalog = catalog
 
     async def get_all(self) -> List[RoleDTO]:
         """
@@ -31,6 +34,8 @@ class FindRoleCase:
         Returns:
             List[RoleDTO]: List of all roles.
         """
+        if self.catalog:
+            return await self.catalog.get_all(ROLES)
         role = await self.role_repo.get_roles()
         return role
 
@@ -47,7 +52,10 @@ class FindRoleCase:
         Raises:
             HTTPException: If the role is not found (HTTP 404).
         """
-        role = await self.role_repo.find_role(role_id)
+        if self.catalog:
+            role = await self.catalog.get(ROLES, role_id)
+        else:
+            role = await self.role_repo.find_role(role_id)
         if role:
             return role
         raise HTTPException(
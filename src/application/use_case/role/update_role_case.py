@@ -9,20 +9,23 @@ Handles updating role information in the system.
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
 from src.domain.objects.role.role_dto import RoleDTO
+from src.infrastructure.cache.catalog_snapshot import ROLES, CatalogSnapshotCache
 from src.infrastructure.repositories.role import RoleRepository
 
 
 class UpdateRoleCase:
     """Use case for updating role information."""
 
-    def __init__(self, role_repo: RoleRepository):
+    def __init__(self, role_repo: RoleRepository, catalog: CatalogSnapshotCache = None):
         """
         Initialize the UpdateRoleCase with the required role repository.
 
         Args:
             role_repo (RoleRepository): Repository for managing role persistence.
+            catalog (CatalogSnapshotCache): In-process role snapshot.
         """
         self.role_repo = role_repo
+        self.catalog = catalog
 
     async def update(self, role_update: RoleDTO) -> CommonResponse:
         """
@@ -35,6 +38,8 @@ class UpdateRoleCase:
             CommonResponse: Contains the updated role's ID and the timestamp of the update.
         """
         role = await self.role_repo.update_role(role_update)
+        if self.catalog:
+            await self.catalog.invalidate(ROLES)
         return CommonResponse(
             item_id=role.role_id,
             event_date=datetime.now(timezone.utc)
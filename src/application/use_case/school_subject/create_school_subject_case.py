@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import SCHOOL_SUBJECTS, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.course.school_subject import SchoolSubject
 from src.infrastructure.repositories.school_subject import SchoolSubjectRepository
 
@@ -7,11 +9,21 @@ from src.infrastructure.repositories.school_subject import SchoolSubjectReposito
 
 class CreateSchoolSubjectCase:
 
-    def __init__(self, repo: SchoolSubjectRepository):
+    def __init__(
+        self,
+        repo: SchoolSubjectRepository,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
+    ):
         self.repo = repo
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("school-subjects")
     async def create(self, payload: SchoolSubject) -> CommonResponse:
         created = await self.repo.create(payload)
+        if self.catalog:
+            await self.catalog.invalidate(SCHOOL_SUBJECTS)
 
         return CommonResponse(
             item_id=created.id,
@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from src.application.use_case.school_subject.find_school_subject_case import FindSchoolSubjectCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import SCHOOL_SUBJECTS, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.school_subject import SchoolSubjectRepository
 
 
@@ -11,15 +13,22 @@ class DeleteSchoolSubjectCase:
         self,
         repo: SchoolSubjectRepository,
         find_case: FindSchoolSubjectCase,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("school-subjects")
     async def delete(self, school_subject_id:int) -> CommonResponse:
 
         await self.find_case.get(school_subject_id)
 
         resp = await self.repo.delete(school_subject_id)
+        if self.catalog:
+            await self.catalog.invalidate(SCHOOL_SUBJECTS)
         if resp:
             return CommonResponse(
                 item_id=school_subject_id, event_date=datetime.now(timezone.utc)
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
+from src.infrastructure.cache.catalog_snapshot import SCHOOL_SUBJECTS, CatalogSnapshotCache
 from src.infrastructure.entities.course.course import Course
 from src.infrastructure.entities.course.school_subject import SchoolSubject
 from src.infrastructure.repositories.school_subject import SchoolSubjectRepository
@@ -8,11 +9,15 @@ from src.infrastructure.repositories.school_subject import SchoolSubjectReposito
 
 class FindSchoolSubjectCase:
 
-    def __init__(self, repo: SchoolSubjectRepository):
+    def __init__(self, repo: SchoolSubjectRepository, catalog: CatalogSnapshotCache = None):
         self.repo = repo
+        self.catalog = catalog
 
     async def get(self, school_subject_id: int) -> Optional[SchoolSubject]:
-        school_subject = await self.repo.get(school_subject_id)
+        if self.catalog:
+            school_subject = await self.catalog.get(SCHOOL_SUBJECTS, school_subject_id)
+        else:
+            school_subject = await self.repo.get(school_subject_id)
         if school_subject is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="School Subject not found"
@@ -20,4 +25,6 @@ class FindSchoolSubjectCase:
         return school_subject
 
     async def get_all(self) -> List[SchoolSubject]:
+        if self.catalog:
+            return await self.catalog.get_all(SCHOOL_SUBJECTS)
         return await self.repo.get_all()
\ No newline at end of file
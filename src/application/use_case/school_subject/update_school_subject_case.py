@@ -1,6 +1,8 @@
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.catalog_snapshot import SCHOOL_SUBJECTS, CatalogSnapshotCache
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.course.course import Course
 from src.infrastructure.entities.course.school_subject import SchoolSubject
 from src.infrastructure.repositories.course import CourseRepository
@@ -9,11 +11,21 @@ from src.infrastructure.repositories.school_subject import SchoolSubjectReposito
 
 class UpdateSchoolSubjectCase:
 
-    def __init__(self,repo: SchoolSubjectRepository):
+    def __init__(
+        self,
+        repo: SchoolSubjectRepository,
+        catalog: CatalogSnapshotCache = None,
+        response_cache: ResponseCache = None,
+    ):
         self.repo = repo
+        self.catalog = catalog
+        self.response_cache = response_cache
 
+    @evicts("school-subjects")
     async def update(self, payload: SchoolSubject) -> CommonResponse:
         school_subject = await self.repo.update(payload)
+        if self.catalog:
+            await self.catalog.invalidate(SCHOOL_SUBJECTS)
         if school_subject:
             return CommonResponse(
                 item_id=school_subject.id,
@@ -3,6 +3,7 @@
 from datetime import datetime, timezone
 from src.application.use_case.student.find_student_case import FindStudentCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.student import StudentRepository
 
 
@@ -12,10 +13,13 @@ class DeleteStudentCase:
         self,
         repo: StudentRepository,
         find_student_case: FindStudentCase,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_student_case
+        self.response_cache = response_cache
 
+    @evicts("student:{student_id}")
     async def delete(self, student_id:int) -> CommonResponse:
 
         student = await self.find_case.get_student_by_id(student_id)
@@ -2,6 +2,7 @@ from typing import List, Optional
 from fastapi import HTTPException, status
 from src.domain.objects.profiles.student_info_dto import StudentInfoDTO
 from src.domain.objects.user.user_dto import UserDTO
+from src.infrastructure.cache.response_cache import ResponseCache, cached_response
 from src.infrastructure.entities.student_info.student import Student
 from src.infrastructure.repositories.student import StudentRepository
 
@@ -9,8 +10,9 @@ from src.infrastructure.repositories.student import StudentRepository
 
 class FindStudentCase:
 
-    def __init__(self, repo: StudentRepository):
+    def __init__(self, repo: StudentRepository, response_cache: ResponseCache = None):
         self.repo = repo
+        self.response_cache = response_cache
 
     async def get_student_by_id(self, student_id: int) -> Optional[UserDTO]:
         student = await self.repo.get_student(student_id)
@@ -23,6 +25,19 @@ class FindStudentCase:
     async def get_all(self) -> List[Student]:
         return await self.repo.get_all()
 
+    @cached_response(
+        "student-profile",
+        "{student_id}",
+        StudentInfoDTO,
+        tags=(
+            "student:{student_id}",
+            "user:{result.user_id}",
+            "student-classes",
+            "allergy-info",
+            "food-intolerance",
+            "medical-info",
+        ),
+    )
     async def get_student_full_info(self, student_id: int) -> Optional[StudentInfoDTO]:
         student: Optional[StudentInfoDTO] = await self.repo.get_student_full_info(
             student_id=student_id
@@ -2,14 +2,17 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
 from src.domain.objects.profiles.student_update_dto import StudentUpdateDTO
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.student import StudentRepository
 
 
 class UpdateStudentCase:
 
-    def __init__(self,repo: StudentRepository):
+    def __init__(self, repo: StudentRepository, response_cache: ResponseCache = None):
         self.repo = repo
+        self.response_cache = response_cache
 
+    @evicts("student:{payload.student_id}")
     async def update_student(self, payload: StudentUpdateDTO) -> CommonResponse:
         student = await self.repo.update(payload)
         if student:
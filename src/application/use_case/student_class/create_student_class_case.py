@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.course.student_class import StudentClass
 from src.infrastructure.repositories.student_class import StudentClassRepository
 
@@ -7,9 +8,15 @@ from src.infrastructure.repositories.student_class import StudentClassRepository
 
 class CreateStudentClassCase:
 
-    def __init__(self, repo: StudentClassRepository):
+    def __init__(
+        self,
+        repo: StudentClassRepository,
+        response_cache: ResponseCache = None,
+    ):
         self.repo = repo
+        self.response_cache = response_cache
 
+    @evicts("student-classes")
     async def create(self, payload: StudentClass) -> CommonResponse:
         created = await self.repo.create(payload)
 
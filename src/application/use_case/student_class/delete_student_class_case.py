@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from src.application.use_case.student_class.find_student_class_case import FindStudentClassCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.student_class import StudentClassRepository
 
 
@@ -11,10 +12,13 @@ class DeleteStudentClassCase:
         self,
         repo: StudentClassRepository,
         find_case: FindStudentClassCase,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.response_cache = response_cache
 
+    @evicts("student-classes")
     async def delete(self, student_class_id:int) -> CommonResponse:
 
         await self.find_case.get(student_class_id)
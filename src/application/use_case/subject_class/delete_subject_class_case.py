@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from src.application.use_case.subject_class.find_subject_class_case import FindSubjectClassCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.subject_class import SubjectClassRepository
 
 
@@ -11,10 +12,13 @@ class DeleteSubjectClassCase:
         self,
         repo: SubjectClassRepository,
         find_case: FindSubjectClassCase,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.response_cache = response_cache
 
+    @evicts("subject-classes")
     async def delete(self, subject_class_id:int) -> CommonResponse:
 
         await self.find_case.get(subject_class_id)
@@ -1,15 +1,22 @@
 
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.course.subject_class import SubjectClass
 from src.infrastructure.repositories.subject_class import SubjectClassRepository
 
 
 class UpdateSubjectClassCase:
 
-    def __init__(self,repo: SubjectClassRepository):
+    def __init__(
+        self,
+        repo: SubjectClassRepository,
+        response_cache: ResponseCache = None,
+    ):
         self.repo = repo
+        self.response_cache = response_cache
 
+    @evicts("subject-classes")
     async def update(self, payload: SubjectClass) -> CommonResponse:
         subject_class = await self.repo.update(payload)
         if subject_class:
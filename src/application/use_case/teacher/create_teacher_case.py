@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.teacher import TeacherRepository
 
 
@@ -7,9 +8,11 @@ from src.infrastructure.repositories.teacher import TeacherRepository
 class CreateTeacherCase:
 
 
-    def __init__(self, repo: TeacherRepository):
+    def __init__(self, repo: TeacherRepository, response_cache: ResponseCache = None):
         self.repo = repo
+        self.response_cache = response_cache
 
+    @evicts("teachers")
     async def create(self, user_id: int) -> CommonResponse:
         resp = await self.repo.create(user_id=user_id)
 
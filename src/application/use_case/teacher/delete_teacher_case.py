@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from src.application.use_case.teacher.find_teacher_case import FindTeacherCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.teacher import TeacherRepository
 
 
@@ -10,10 +11,13 @@ class DeleteTeacherCase:
         self,
         repo: TeacherRepository,
         find_case: FindTeacherCase,
+        response_cache: ResponseCache = None,
     ):
         self.repo = repo
         self.find_case = find_case
+        self.response_cache = response_cache
 
+    @evicts("teacher:{teacher_id}", "teachers")
     async def delete(self, teacher_id:int) -> CommonResponse:
 
         await self.find_case.get(teacher_id)
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
 from src.domain.objects.profiles.teacher_dto import TeacherDTO
+from src.infrastructure.cache.response_cache import ResponseCache, cached_response
 from src.infrastructure.entities.users.teacher import Teacher
 from src.infrastructure.repositories.teacher import TeacherRepository
 
@@ -8,8 +9,9 @@ from src.infrastructure.repositories.teacher import TeacherRepository
 
 class FindTeacherCase:
 
-    def __init__(self, repo: TeacherRepository):
+    def __init__(self, repo: TeacherRepository, response_cache: ResponseCache = None):
         self.repo = repo
+        self.response_cache = response_cache
 
     async def get(self, student_id: int) -> Optional[Teacher]:
         teacher = await self.repo.get_teacher(student_id)
@@ -19,6 +21,12 @@ class FindTeacherCase:
             )
         return teacher
     
+    @cached_response(
+        "teachers",
+        "all",
+        List[TeacherDTO],
+        tags=("teachers", "users", "subject-classes", "school-subjects"),
+    )
     async def get_all(self) -> Optional[TeacherDTO]:
         student = await self.repo.get_all()
         if student is None:
@@ -28,6 +36,17 @@ class FindTeacherCase:
         return student
 
 
+    @cached_response(
+        "teacher-profile",
+        "{teacher_id}",
+        TeacherDTO,
+        tags=(
+            "teacher:{teacher_id}",
+            "user:{result.user_id}",
+            "subject-classes",
+            "school-subjects",
+        ),
+    )
     async def get_teacher_full_info(self, teacher_id: int) -> Optional[TeacherDTO]:
         teacher: Optional[TeacherDTO] = await self.repo.get_teacher_full_info(
             teacher_id=teacher_id
@@ -0,0 +1,51 @@
+"""
+Archive Access Logs Use Case.
+
+Applies the access log retention policy: every complete month older than
+the retention window is moved from `access_log` to the compressed archive.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime, timezone
+from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.repositories.acces_logs import AccessRepository
+
+
+class ArchiveAccessLogsCase:
+    """Use case for archiving access logs past the retention window."""
+
+    def __init__(self, repo: AccessRepository, retention_months: int):
+        """
+        Initialize the ArchiveAccessLogsCase.
+
+        Args:
+            repo (AccessRepository): Repository for access log persistence.
+            retention_months (int): Number of complete months kept in the hot table.
+        """
+        self.access_repo = repo
+        self.retention_months = retention_months
+
+    def cutoff(self, now: datetime = None) -> datetime:
+        """
+        Compute the first instant that stays in the hot table.
+
+        Args:
+            now (datetime): Reference instant, defaults to the current UTC time.
+
+        Returns:
+            datetime: First day of the oldest month kept in `access_log`.
+        """
+        now = now or datetime.now(timezone.utc)
+        months = now.year * 12 + (now.month - 1) - self.retention_months
+        return datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)
+
+    async def archive(self) -> CommonResponse:
+        """
+        Archive every access log older than the retention window.
+
+        Returns:
+            CommonResponse: Number of archived logs and the event timestamp.
+        """
+        archived = await self.access_repo.archive_before(self.cutoff())
+        return CommonResponse(item_id=archived, event_date=datetime.now(timezone.utc))
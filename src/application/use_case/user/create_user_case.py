@@ -15,6 +15,7 @@ from src.application.use_case.student.create_student_case import CreateStudenCas
 from src.application.use_case.teacher.create_teacher_case import CreateTeacherCase
 from src.domain.objects.common.common_resp import CommonResponse
 from src.domain.objects.user.user_create_dto import UserCreateDTO
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.student_info.student import Student
 from src.infrastructure.repositories.user import UserRepository
 
@@ -28,7 +29,8 @@ class CreateUserCase:
         repo: UserRepository,
         create_student_case: CreateStudenCase,
         create_teacher_case: CreateTeacherCase,
-        find_role_case:FindRoleCase
+        find_role_case:FindRoleCase,
+        response_cache: ResponseCache = None,
     ):
         """
         Initialize the CreateUserCase with required services and repository.
@@ -36,13 +38,16 @@ class CreateUserCase:
         Args:
             pwd_service (PasswordService): Service for hashing passwords.
             repo (UserRepository): Repository for user persistence.
+            response_cache (ResponseCache): Cache of the use-case reads.
         """
         self.pwdService = pwd_service
         self.userRepo = repo
         self.create_student_case = create_student_case
         self.create_teacher_case = create_teacher_case
         self.find_role_case = find_role_case
+        self.response_cache = response_cache
 
+    @evicts("users")
     async def create(self, payload: UserCreateDTO) -> CommonResponse:
         """
         Create a new user, ensuring the username is unique and hashing the password.
@@ -10,6 +10,7 @@ with information about who performed the action.
 from datetime import datetime, timezone
 from src.application.use_case.user.find_user_case import FindUserCase
 from src.domain.objects.common.common_resp import CommonResponse
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.entities.users.deletion_logs import DeletionLog
 from src.infrastructure.repositories.deletion_logs import DeletionRepository
 from src.infrastructure.repositories.user import UserRepository
@@ -23,6 +24,7 @@ class DeleteUserCase:
         repo: UserRepository,
         find_user_case: FindUserCase,
         deletion_repo: DeletionRepository,
+        response_cache: ResponseCache = None,
     ):
         """
         Initialize the DeleteUserCase with required repositories and services.
@@ -31,11 +33,14 @@ class DeleteUserCase:
             repo (UserRepository): Repository for user persistence.
             find_user_case (FindUserCase): Use case for retrieving user information.
             deletion_repo (DeletionRepository): Repository for logging deletions.
+            response_cache (ResponseCache): Cache of the use-case reads.
         """
         self.userRepo = repo
         self.find_case = find_user_case
         self.deletion_repo = deletion_repo
+        self.response_cache = response_cache
 
+    @evicts("user:{user_id}", "users")
     async def delete(self, user_id: int, user_who_delete: int) -> CommonResponse:
         """
         Delete a user and log the deletion action.
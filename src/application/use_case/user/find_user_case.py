@@ -8,6 +8,7 @@ Provides methods to retrieve users by ID, username, or fetch all users.
 
 from typing import List, Optional
 from fastapi import HTTPException, status
+from src.domain.objects.user.access_log_filter_dto import AccessLogFilterDTO
 from src.domain.objects.user.user_dto import UserDTO
 from src.domain.objects.user.user_update_dto import UserUpdateDTO
 from src.infrastructure.entities.users.accces_logs import AccessLog
@@ -110,6 +111,8 @@ class FindUserCase:
     async def get_day_sessions(self) -> int:
         return await self.user_repo.get_day_sessions()
     
-    async def get_access_logs(self) -> List[AccessLog]:
-        return await self.acces_repo.get_all()
+    async def get_access_logs(
+        self, filters: Optional[AccessLogFilterDTO] = None
+    ) -> List[AccessLog]:
+        return await self.acces_repo.get_all(filters)
         
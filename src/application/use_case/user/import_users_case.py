@@ -0,0 +1,130 @@
+"""
+Import Users Use Case.
+
+Handles the start-of-year bulk user import: validates the uploaded rows as
+they are read, hashes passwords and writes the valid ones in batches,
+collecting a per-row error report instead of failing the whole file.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import AsyncIterator, Dict, List, Tuple
+from pydantic import ValidationError
+from src.application.services.password_service import PasswordService
+from src.application.use_case.role.find_role_case import FindRoleCase
+from src.domain.objects.user.user_import_dto import (
+    UserImportErrorDTO,
+    UserImportReportDTO,
+    UserImportRowDTO,
+)
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
+from src.infrastructure.repositories.user import UserRepository
+
+
+class ImportUsersCase:
+    """Use case for importing users in bulk."""
+
+    def __init__(
+        self,
+        pwd_service: PasswordService,
+        repo: UserRepository,
+        find_role_case: FindRoleCase,
+        batch_size: int = 500,
+        response_cache: ResponseCache = None,
+    ):
+        """
+        Initialize the ImportUsersCase with required services and repository.
+
+        Args:
+            pwd_service (PasswordService): Service for hashing passwords.
+            repo (UserRepository): Repository for user persistence.
+            find_role_case (FindRoleCase): Use case to resolve the role names.
+            batch_size (int): Number of valid rows written per transaction.
+            response_cache (ResponseCache): Cache of the use-case reads.
+        """
+        self.pwdService = pwd_service
+        self.userRepo = repo
+        self.find_role_case = find_role_case
+        self.batch_size = batch_size
+        self.response_cache = response_cache
+
+    @evicts("users")
+    async def import_rows(
+        self, rows: AsyncIterator[Tuple[int, Dict]]
+    ) -> UserImportReportDTO:
+        """
+        Validate and store a stream of raw rows.
+
+        Parents may only reference students that already exist or that appear
+        earlier in the file.
+
+        Args:
+            rows (AsyncIterator[Tuple[int, Dict]]): Line number and raw row pairs.
+
+        Returns:
+            UserImportReportDTO: Totals and the error of every rejected row.
+        """
+        roles = await self.find_role_case.get_all()
+        profiles = {r.role_id: r.role_name.lower() for r in roles}
+        report = UserImportReportDTO()
+        seen = set()
+        batch: List[Tuple[int, UserImportRowDTO]] = []
+
+        async for line_no, raw in rows:
+            report.total += 1
+            username = raw.get("username")
+            username = str(username) if username is not None else None
+            if "_error" in raw:
+                self._reject(report, line_no, username, raw["_error"])
+                continue
+            try:
+                row = UserImportRowDTO.model_validate(raw)
+            except ValidationError as e:
+                message = "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                    for err in e.errors()
+                )
+                self._reject(report, line_no, username, message)
+                continue
+
+            if row.role_id not in profiles:
+                self._reject(report, line_no, row.username, "Role not valid")
+                continue
+            if row.username in seen:
+                self._reject(report, line_no, row.username, "Duplicated username in file")
+                continue
+            if row.children and profiles[row.role_id] != "parent":
+                self._reject(report, line_no, row.username, "Only parents can have children")
+                continue
+
+            seen.add(row.username)
+            row.password = self.pwdService.hash_password(row.password)
+            batch.append((line_no, row))
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, profiles, report)
+                batch = []
+
+        if batch:
+            await self._flush(batch, profiles, report)
+        report.errors.sort(key=lambda e: e.row)
+        return report
+
+    async def _flush(
+        self,
+        batch: List[Tuple[int, UserImportRowDTO]],
+        profiles: Dict[int, str],
+        report: UserImportReportDTO,
+    ):
+        rejected = await self.userRepo.bulk_create([row for _, row in batch], profiles)
+        for line_no, row in batch:
+            if row.username in rejected:
+                self._reject(report, line_no, row.username, rejected[row.username])
+            else:
+                report.created += 1
+
+    @staticmethod
+    def _reject(report: UserImportReportDTO, line_no: int, username, message: str):
+        report.failed += 1
+        report.errors.append(
+            UserImportErrorDTO(row=line_no, username=username, message=message)
+        )
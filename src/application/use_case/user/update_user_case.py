@@ -11,23 +11,32 @@ from src.application.services.password_service import PasswordService
 from src.domain.objects.common.common_resp import CommonResponse
 from src.domain.objects.auth.change_pass_dto import ChangePasswordDTO
 from src.domain.objects.user.user_update_dto import UserUpdateDTO
+from src.infrastructure.cache.response_cache import ResponseCache, evicts
 from src.infrastructure.repositories.user import UserRepository
 
 
 class UpdateUserCase:
     """Use case for updating user information."""
 
-    def __init__(self, pwd_service: PasswordService, repo: UserRepository):
+    def __init__(
+        self,
+        pwd_service: PasswordService,
+        repo: UserRepository,
+        response_cache: ResponseCache = None,
+    ):
         """
         Initialize the UpdateUserCase with required services and repository.
 
         Args:
             pwd_service (PasswordService): Service for password hashing.
             repo (UserRepository): Repository for user persistence.
+            response_cache (ResponseCache): Cache of the use-case reads.
         """
         self.pwdService = pwd_service
         self.userRepo = repo
+        self.response_cache = response_cache
 
+    @evicts("user:{userUpt.user_id}", "users")
     async def update_user(self, userUpt: UserUpdateDTO) -> CommonResponse:
         """
         Update user details.
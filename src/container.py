@@ -9,6 +9,7 @@ repositories, and application services.
 """
 
 from dependency_injector import containers, providers
+from src.application.services.ical_service import ICalService
 from src.application.services.password_service import PasswordService
 from src.application.services.token_service import TokenService
 from src.application.use_case.allergy_info.create_allergy_case import CreateAllergyCase
@@ -17,13 +18,16 @@ from src.application.use_case.allergy_info.find_allergy_case import FindAllergyC
 from src.application.use_case.allergy_info.update_allergy_case import UpdateAllergyCase
 from src.application.use_case.auth.login_use_case import LoginUseCase
 from src.application.use_case.auth.logout_use_case import LogoutUseCase
+from src.application.use_case.calendar.calendar_feed_case import CalendarFeedCase
 from src.application.use_case.calendar.create_calendar_activity_case import CreateCalendarActivityCase
+from src.application.use_case.calendar.create_recurring_activity_case import CreateRecurringActivityCase
 from src.application.use_case.calendar.delete_calendar_activity_case import DeleteCalendarActivityCase
 from src.application.use_case.calendar.find_calendar_activity_case import FindCalendarActivityCase
 from src.application.use_case.calendar.update_calendar_activity_case import UpdateCalendarActivityCase
 from src.application.use_case.classes.create_classes_case import CreateClassesCase
 from src.application.use_case.classes.delete_classes_case import DeleteClassesCase
 from src.application.use_case.classes.find_classes_case import FindClassesCase
+from src.application.use_case.classes.rollover_classes_case import RolloverClassesCase
 from src.application.use_case.classes.update_classes_case import UpdateClassesCase
 from src.application.use_case.course.create_course_case import CreateCourseCase
 from src.application.use_case.course.delete_course_case import DeleteCourseCase
@@ -71,12 +75,34 @@ from src.application.use_case.subject_class.update_subject_class_case import Upd
 from src.application.use_case.teacher.create_teacher_case import CreateTeacherCase
 from src.application.use_case.teacher.delete_teacher_case import DeleteTeacherCase
 from src.application.use_case.teacher.find_teacher_case import FindTeacherCase
+from src.application.use_case.user.archive_access_logs_case import ArchiveAccessLogsCase
 from src.application.use_case.user.create_user_case import CreateUserCase
 from src.application.use_case.user.delete_user_case import DeleteUserCase
 from src.application.use_case.user.find_user_case import FindUserCase
+from src.application.use_case.user.import_users_case import ImportUsersCase
 from src.application.use_case.user.update_user_case import UpdateUserCase
 from src.infrastructure.connection.db import get_engine, get_session
-from src.infrastructure.connection.redis import get_redis_client, get_redis_session
+from src.infrastructure.cache.calendar_feed import CalendarFeedCache
+from src.infrastructure.cache.catalog_snapshot import (
+    ACTIVITY_TYPES,
+    ALLERGIES,
+    FOOD_INTOLERANCES,
+    MEDICAL_INFO,
+    ROLES,
+    SCHOOL_SUBJECTS,
+    CatalogSnapshotCache,
+)
+from src.infrastructure.cache.resource_version import ResourceVersionCache
+from src.infrastructure.cache.response_body import ResponseBodyCache
+from src.infrastructure.cache.response_cache import ResponseCache
+from src.infrastructure.connection.redis import get_redis_client, shared_redis_session
+from src.infrastructure.metrics.loop_monitor import LoopMonitor
+from src.infrastructure.metrics.memory import AllocationTracker
+from src.infrastructure.metrics.profiler import ProfileStore
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.metrics.slow_queries import SlowQueryLog
+from src.infrastructure.controllers.admin import AdminController
+from src.infrastructure.controllers.metrics import MetricsController
 from src.infrastructure.controllers.allergy_info import AllergyController
 from src.infrastructure.controllers.auth import AuthController
 from src.infrastructure.controllers.calendar_activity import CalendarController
@@ -127,11 +153,36 @@ class Container(containers.DeclarativeContainer):
     :author: Carlos S. Paredes Morillo
     """
 
-    database_engine = providers.Singleton(get_engine)
-    session = providers.Factory(get_session, engine=database_engine)
-    redis_client = providers.Singleton(get_redis_client)
-    redis_session = providers.Factory(get_redis_session)
     config = providers.Object(settings)
+    metrics = providers.Singleton(MetricsRegistry)
+    slow_query_log = providers.Singleton(
+        SlowQueryLog,
+        threshold_ms=config.provided.slow_query_ms,
+        capacity=config.provided.slow_query_capacity,
+        explain=config.provided.slow_query_explain,
+        analyze=config.provided.slow_query_explain_analyze,
+    )
+    profile_store = providers.Singleton(ProfileStore, capacity=config.provided.profile_capacity)
+    allocation_tracker = providers.Singleton(AllocationTracker)
+    loop_monitor = providers.Singleton(
+        LoopMonitor,
+        metrics=metrics,
+        interval_ms=config.provided.loop_lag_interval_ms,
+        block_threshold_ms=config.provided.loop_block_ms,
+        capture_stacks=config.provided.loop_debug,
+    )
+    database_engine = providers.Singleton(
+        get_engine, metrics=metrics, slow_queries=slow_query_log
+    )
+    session = providers.Factory(get_session, engine=database_engine)
+    redis_client = providers.Singleton(get_redis_client, metrics=metrics)
+    redis_binary_client = providers.Singleton(
+        get_redis_client, decode_responses=False, metrics=metrics
+    )
+    redis_session = providers.Factory(shared_redis_session, client=redis_client)
+    redis_binary_session = providers.Factory(
+        shared_redis_session, client=redis_binary_client
+    )
 
     # Repositories
     user_repository = providers.Factory(UserRepository, session=session.provider)
@@ -140,7 +191,6 @@ class Container(containers.DeclarativeContainer):
     deletion_repository = providers.Factory(
         DeletionRepository, session=session.provider
     )
-    student_repository = providers.Factory(StudentRepository, session=session.provider)
     medical_info_repository = providers.Factory(
         MedicalInfoRepository, session=session.provider
     )
@@ -171,8 +221,54 @@ class Container(containers.DeclarativeContainer):
 
     find_user_case = providers.Factory(FindUserCase, repo=user_repository, repo_access_logs= access_repository)
 
+    # Caches
+    calendar_feed_cache = providers.Factory(
+        CalendarFeedCache,
+        redis_session=redis_binary_session.provider,
+        ttl=config.provided.calendar_feed_ttl,
+        gzip_min_size=config.provided.gzip_minimum_size,
+        gzip_level=config.provided.gzip_level,
+    )
+    resource_version_cache = providers.Factory(
+        ResourceVersionCache, redis_session=redis_session.provider
+    )
+    catalog_cache = providers.Singleton(
+        CatalogSnapshotCache,
+        redis_session=redis_session.provider,
+        loaders=providers.Dict(
+            {
+                ROLES: role_repository.provided.get_roles,
+                ALLERGIES: allergy_repository.provided.get_all,
+                FOOD_INTOLERANCES: intolerance_food_repository.provided.get_all,
+                MEDICAL_INFO: medical_info_repository.provided.get_all,
+                SCHOOL_SUBJECTS: school_subject_repository.provided.get_all,
+                ACTIVITY_TYPES: activity_type_repository.provided.get_all,
+            }
+        ),
+        ttl=config.provided.catalog_snapshot_ttl,
+    )
+    response_body_cache = providers.Factory(
+        ResponseBodyCache,
+        redis_session=redis_binary_session.provider,
+        ttl=config.provided.response_body_ttl,
+        gzip_min_size=config.provided.gzip_minimum_size,
+        gzip_level=config.provided.gzip_level,
+    )
+    response_cache = providers.Singleton(
+        ResponseCache,
+        redis_session=redis_session.provider,
+        ttl=config.provided.response_cache_ttl,
+        stale_ttl=config.provided.response_cache_stale_ttl,
+        lock_timeout=config.provided.response_cache_lock_timeout,
+    )
+
+    student_repository = providers.Factory(
+        StudentRepository, session=session.provider, catalog=catalog_cache
+    )
+
     # Services
     pwd_service = providers.Factory(PasswordService)
+    ical_service = providers.Factory(ICalService)
     token_service = providers.Factory(
         TokenService,
         find_case=find_user_case,
@@ -183,9 +279,15 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Use case
-    find_role_case = providers.Factory(FindRoleCase, role_repo=role_repository)
+    find_role_case = providers.Factory(
+        FindRoleCase, role_repo=role_repository, catalog=catalog_cache
+    )
     create_student_case = providers.Factory(CreateStudenCase, repo=student_repository)
-    create_teacher_case = providers.Factory(CreateTeacherCase, repo=teacher_repository)
+    create_teacher_case = providers.Factory(
+        CreateTeacherCase,
+        repo=teacher_repository,
+        response_cache=response_cache,
+    )
     create_user_case = providers.Factory(
         CreateUserCase,
         repo=user_repository,
@@ -193,15 +295,33 @@ class Container(containers.DeclarativeContainer):
         create_student_case=create_student_case,
         create_teacher_case=create_teacher_case,
         find_role_case=find_role_case,
+        response_cache=response_cache,
+    )
+    import_users_case = providers.Factory(
+        ImportUsersCase,
+        repo=user_repository,
+        pwd_service=pwd_service,
+        find_role_case=find_role_case,
+        batch_size=config.provided.user_import_batch_size,
+        response_cache=response_cache,
     )
     delete_user_case = providers.Factory(
         DeleteUserCase,
         repo=user_repository,
         find_user_case=find_user_case,
         deletion_repo=deletion_repository,
+        response_cache=response_cache,
     )
     update_user_case = providers.Factory(
-        UpdateUserCase, repo=user_repository, pwd_service=pwd_service
+        UpdateUserCase,
+        repo=user_repository,
+        pwd_service=pwd_service,
+        response_cache=response_cache,
+    )
+    archive_access_logs_case = providers.Factory(
+        ArchiveAccessLogsCase,
+        repo=access_repository,
+        retention_months=config.provided.access_log_retention_months,
     )
     login_user_case = providers.Factory(
         LoginUseCase,
@@ -216,49 +336,91 @@ class Container(containers.DeclarativeContainer):
         token_service=token_service,
     )
 
-    create_role_case = providers.Factory(CreateRoleCase, role_repo=role_repository)
-    delete_role_case = providers.Factory(DeleteRoleCase, role_repo=role_repository)
-    update_role_case = providers.Factory(UpdateRoleCase, role_repo=role_repository)
-    find_student_case = providers.Factory(FindStudentCase, repo=student_repository)
+    create_role_case = providers.Factory(
+        CreateRoleCase, role_repo=role_repository, catalog=catalog_cache
+    )
+    delete_role_case = providers.Factory(
+        DeleteRoleCase, role_repo=role_repository, catalog=catalog_cache
+    )
+    update_role_case = providers.Factory(
+        UpdateRoleCase, role_repo=role_repository, catalog=catalog_cache
+    )
+    find_student_case = providers.Factory(
+        FindStudentCase,
+        repo=student_repository,
+        response_cache=response_cache,
+    )
 
-    find_medical_case = providers.Factory(FindMedicalCase, repo=medical_info_repository)
+    find_medical_case = providers.Factory(
+        FindMedicalCase, repo=medical_info_repository, catalog=catalog_cache
+    )
     create_medical_case = providers.Factory(
-        CreateMedicalCase, repo=medical_info_repository
+        CreateMedicalCase, repo=medical_info_repository, catalog=catalog_cache
     )
     update_medical_case = providers.Factory(
-        UpdateMedicalCase, repo=medical_info_repository
+        UpdateMedicalCase,
+        repo=medical_info_repository,
+        catalog=catalog_cache,
+        response_cache=response_cache,
     )
     delete_medical_case = providers.Factory(
-        DeleteMedicalCase, repo=medical_info_repository, find_case=find_medical_case
+        DeleteMedicalCase,
+        repo=medical_info_repository,
+        find_case=find_medical_case,
+        catalog=catalog_cache,
+        response_cache=response_cache,
     )
 
-    find_allergy_case = providers.Factory(FindAllergyCase, repo=allergy_repository)
-    create_allergy_case = providers.Factory(CreateAllergyCase, repo=allergy_repository)
-    update_allergy_case = providers.Factory(UpdateAllergyCase, repo=allergy_repository)
+    find_allergy_case = providers.Factory(
+        FindAllergyCase, repo=allergy_repository, catalog=catalog_cache
+    )
+    create_allergy_case = providers.Factory(
+        CreateAllergyCase, repo=allergy_repository, catalog=catalog_cache
+    )
+    update_allergy_case = providers.Factory(
+        UpdateAllergyCase,
+        repo=allergy_repository,
+        catalog=catalog_cache,
+        response_cache=response_cache,
+    )
     delete_allergy_case = providers.Factory(
-        DeleteAllergyCase, repo=allergy_repository, find_case=find_allergy_case
+        DeleteAllergyCase,
+        repo=allergy_repository,
+        find_case=find_allergy_case,
+        catalog=catalog_cache,
+        response_cache=response_cache,
     )
 
     find_intolerance_case = providers.Factory(
-        FindIntoleranceCase, repo=intolerance_food_repository
+        FindIntoleranceCase, repo=intolerance_food_repository, catalog=catalog_cache
     )
     create_intolerance_case = providers.Factory(
-        CreateIntoleranceCase, repo=intolerance_food_repository
+        CreateIntoleranceCase, repo=intolerance_food_repository, catalog=catalog_cache
     )
     update_intolerance_case = providers.Factory(
-        UpdateIntoleranceCase, repo=intolerance_food_repository
+        UpdateIntoleranceCase,
+        repo=intolerance_food_repository,
+        catalog=catalog_cache,
+        response_cache=response_cache,
     )
     delete_intolerance_Case = providers.Factory(
         DeleteIntoleranceCase,
         repo=intolerance_food_repository,
         find_case=find_intolerance_case,
+        catalog=catalog_cache,
+        response_cache=response_cache,
     )
 
-    update_student_case = providers.Factory(UpdateStudentCase, repo=student_repository)
+    update_student_case = providers.Factory(
+        UpdateStudentCase,
+        repo=student_repository,
+        response_cache=response_cache,
+    )
     delete_student_case = providers.Factory(
         DeleteStudentCase,
         repo=student_repository,
         find_student_case=find_student_case,
+        response_cache=response_cache,
     )
 
     find_parent_case = providers.Factory(
@@ -270,10 +432,17 @@ class Container(containers.DeclarativeContainer):
         repo=parent_repository,
     )
 
-    find_teacher_case = providers.Factory(FindTeacherCase, repo=teacher_repository)
+    find_teacher_case = providers.Factory(
+        FindTeacherCase,
+        repo=teacher_repository,
+        response_cache=response_cache,
+    )
 
     delete_teacher_case = providers.Factory(
-        DeleteTeacherCase, repo=teacher_repository, find_case=find_teacher_case
+        DeleteTeacherCase,
+        repo=teacher_repository,
+        find_case=find_teacher_case,
+        response_cache=response_cache,
     )
 
     find_course_case = providers.Factory(FindCourseCase, repo=course_repository)
@@ -283,60 +452,141 @@ class Container(containers.DeclarativeContainer):
         DeleteCourseCase,
         repo=course_repository,
         find_case=find_course_case,
+        response_cache=response_cache,
     )
 
-    find_classes_case = providers.Factory(FindClassesCase, repo=classes_repository)
+    find_classes_case = providers.Factory(
+        FindClassesCase,
+        repo=classes_repository,
+        response_cache=response_cache,
+    )
     create_classes_case = providers.Factory(CreateClassesCase, repo=classes_repository)
-    update_classes_case = providers.Factory(UpdateClassesCase, repo=classes_repository)
+    update_classes_case = providers.Factory(
+        UpdateClassesCase,
+        repo=classes_repository,
+        response_cache=response_cache,
+    )
+    rollover_classes_case = providers.Factory(
+        RolloverClassesCase,
+        repo=classes_repository,
+        response_cache=response_cache,
+    )
     delete_classes_Case = providers.Factory(
         DeleteClassesCase,
         repo=classes_repository,
         find_case=find_classes_case,
+        response_cache=response_cache,
     )
 
     find_calendar_case = providers.Factory(FindCalendarActivityCase, repo=calendar_activity_repository)
-    create_calendar_case = providers.Factory(CreateCalendarActivityCase, repo=calendar_activity_repository)
-    update_calendar_case = providers.Factory(UpdateCalendarActivityCase, repo=calendar_activity_repository)
+    create_calendar_case = providers.Factory(
+        CreateCalendarActivityCase,
+        repo=calendar_activity_repository,
+        feed_cache=calendar_feed_cache,
+    )
+    create_recurring_calendar_case = providers.Factory(
+        CreateRecurringActivityCase,
+        repo=calendar_activity_repository,
+        feed_cache=calendar_feed_cache,
+    )
+    update_calendar_case = providers.Factory(
+        UpdateCalendarActivityCase,
+        repo=calendar_activity_repository,
+        feed_cache=calendar_feed_cache,
+    )
     delete_calendar_case = providers.Factory(
         DeleteCalendarActivityCase,
         repo=calendar_activity_repository,
         find_case=find_calendar_case,
+        feed_cache=calendar_feed_cache,
+    )
+    calendar_feed_case = providers.Factory(
+        CalendarFeedCase,
+        repo=calendar_activity_repository,
+        cache=calendar_feed_cache,
+        ical_service=ical_service,
+        secret_key=config.provided.secret_key,
+        admin_role_id=config.provided.admin_role_id,
     )
 
-    find_school_subject_case = providers.Factory(FindSchoolSubjectCase, repo=school_subject_repository)
-    create_school_subject_case = providers.Factory(CreateSchoolSubjectCase, repo=school_subject_repository)
-    update_school_subject_case = providers.Factory(UpdateSchoolSubjectCase, repo=school_subject_repository)
+    find_school_subject_case = providers.Factory(
+        FindSchoolSubjectCase, repo=school_subject_repository, catalog=catalog_cache
+    )
+    create_school_subject_case = providers.Factory(
+        CreateSchoolSubjectCase,
+        repo=school_subject_repository,
+        catalog=catalog_cache,
+        response_cache=response_cache,
+    )
+    update_school_subject_case = providers.Factory(
+        UpdateSchoolSubjectCase,
+        repo=school_subject_repository,
+        catalog=catalog_cache,
+        response_cache=response_cache,
+    )
     delete_school_subject_case = providers.Factory(
         DeleteSchoolSubjectCase,
         repo=school_subject_repository,
         find_case=find_school_subject_case,
+        catalog=catalog_cache,
+        response_cache=response_cache,
     )
 
     find_student_class_case = providers.Factory(FindStudentClassCase, repo=student_class_repository)
-    create_student_class_case = providers.Factory(CreateStudentClassCase, repo=student_class_repository)
+    create_student_class_case = providers.Factory(
+        CreateStudentClassCase,
+        repo=student_class_repository,
+        response_cache=response_cache,
+    )
     update_student_class_case = providers.Factory(UpdateStudentClassCase, repo=student_class_repository)
     delete_student_class_case = providers.Factory(
         DeleteStudentClassCase,
         repo=student_class_repository,
         find_case=find_student_class_case,
+        response_cache=response_cache,
     )
     
     find_subject_class_case = providers.Factory(FindSubjectClassCase, repo=subject_class_repository)
-    create_subject_class_case = providers.Factory(CreateSubjectClassCase, repo=subject_class_repository)
-    update_subject_class_case = providers.Factory(UpdateSubjectClassCase, repo=subject_class_repository)
+    create_subject_class_case = providers.Factory(
+        CreateSubjectClassCase,
+        repo=subject_class_repository,
+        response_cache=response_cache,
+    )
+    update_subject_class_case = providers.Factory(
+        UpdateSubjectClassCase,
+        repo=subject_class_repository,
+        response_cache=response_cache,
+    )
     delete_subject_class_case = providers.Factory(
         DeleteSubjectClassCase,
         repo=subject_class_repository,
         find_case=find_subject_class_case,
+        response_cache=response_cache,
     )
 
     # Controllers
+    admin_controller = providers.Factory(
+        AdminController,
+        response_cache=response_cache,
+        slow_query_log=slow_query_log,
+        profiles=profile_store,
+        allocations=allocation_tracker,
+    )
+    metrics_controller = providers.Factory(
+        MetricsController,
+        metrics=metrics,
+        response_cache=response_cache,
+        engine=database_engine,
+    )
+
     user_controller = providers.Factory(
         UserController,
         find_case=find_user_case,
         create_case=create_user_case,
         update_case=update_user_case,
         delete_case=delete_user_case,
+        archive_logs_case=archive_access_logs_case,
+        import_case=import_users_case,
     )
 
     role_controller = providers.Factory(
@@ -407,6 +657,7 @@ class Container(containers.DeclarativeContainer):
         create_case=create_classes_case,
         update_case=update_classes_case,
         delete_case=delete_classes_Case,
+        rollover_case=rollover_classes_case,
     )
 
     calendar_controller = providers.Factory(
@@ -415,6 +666,8 @@ class Container(containers.DeclarativeContainer):
         create_case=create_calendar_case,
         update_case=update_calendar_case,
         delete_case=delete_calendar_case,
+        feed_case=calendar_feed_case,
+        recurring_case=create_recurring_calendar_case,
     )
 
     school_subject_controller = providers.Factory(
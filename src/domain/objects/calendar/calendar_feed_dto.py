@@ -0,0 +1,19 @@
+"""
+Calendar Feed DTO Object.
+
+A pre-rendered iCalendar feed with the validators used for conditional
+requests.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CalendarFeedDTO(BaseModel):
+    body: bytes
+    etag: str
+    last_modified: datetime
+    gzip_body: Optional[bytes] = None
@@ -0,0 +1,22 @@
+"""
+Calendar Filter DTO Objects.
+
+Data Transfer Objects with the filters accepted when querying calendar
+activities. The window is half-open: `date_from` included, `date_to`
+excluded, so a calendar screen asks for exactly the week or month it shows.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class CalendarWindowDTO(BaseModel):
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+
+class CalendarFilterDTO(CalendarWindowDTO):
+    course_id: Optional[int] = None
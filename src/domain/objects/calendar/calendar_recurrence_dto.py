@@ -0,0 +1,55 @@
+"""
+Calendar Recurrence DTO Objects.
+
+Data Transfer Objects for creating many calendar activities at once, either
+from an RRULE-like pattern (daily or weekly, with an interval, weekdays,
+an end date or a count, and excluded dates) or from an explicit list of
+dates, or both.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import date, datetime, timedelta
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+
+MAX_OCCURRENCES = 500
+MAX_INTERVAL = 365
+MAX_SPAN = timedelta(days=5 * 366)
+
+
+class CalendarRecurrenceDTO(BaseModel):
+    course_id: int
+    activity_name: str = Field(max_length=50)
+    activity_type_id: Optional[int] = None
+    start: Optional[datetime] = None
+    freq: Optional[Literal["daily", "weekly"]] = None
+    interval: int = Field(default=1, ge=1, le=MAX_INTERVAL)
+    weekdays: List[int] = []
+    until: Optional[datetime] = None
+    count: Optional[int] = Field(default=None, ge=1, le=MAX_OCCURRENCES)
+    exceptions: List[date] = []
+    dates: List[datetime] = Field(default=[], max_length=MAX_OCCURRENCES)
+    class_ids: List[int] = []
+
+    @model_validator(mode="after")
+    def check_rule(self):
+        if any(day < 0 or day > 6 for day in self.weekdays):
+            raise ValueError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+        if self.freq is not None and self.start is None:
+            raise ValueError("A recurrence needs a start")
+        if self.freq is not None and (self.until is None) == (self.count is None):
+            raise ValueError("A recurrence needs exactly one of until or count")
+        if self.freq is None and not self.dates:
+            raise ValueError("Provide a recurrence (freq) or a list of dates")
+        moments = [self.start, self.until, *self.dates]
+        if len({moment.tzinfo is None for moment in moments if moment is not None}) > 1:
+            raise ValueError("start, until and dates must be all naive or all timezone-aware")
+        if self.start is not None and self.until is not None and self.until - self.start > MAX_SPAN:
+            raise ValueError(f"A recurrence can span at most {MAX_SPAN.days} days")
+        return self
+
+
+class CalendarBulkResultDTO(BaseModel):
+    ids: List[int]
+    event_date: datetime
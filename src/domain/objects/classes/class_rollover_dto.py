@@ -0,0 +1,24 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class ClassRolloverMappingDTO(BaseModel):
+    source_class_id: int
+    name: str
+    tutor_id: Optional[int] = None
+
+
+class ClassRolloverDTO(BaseModel):
+    source_course_id: int
+    target_course_id: int
+    classes: List[ClassRolloverMappingDTO] = Field(min_length=1)
+    copy_subjects: bool = True
+    dry_run: bool = False
+
+
+class ClassRolloverReportDTO(BaseModel):
+    dry_run: bool
+    classes: int
+    subjects: int
+    students: int
+    created: Dict[int, int] = {}
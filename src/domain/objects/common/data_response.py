@@ -0,0 +1,18 @@
+"""
+Data Response.
+
+Typed `{"status", "data"}` envelope returned by the list endpoints, used
+as their response model.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Generic, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class DataResponse(BaseModel, Generic[T]):
+    status: str = "success"
+    data: T
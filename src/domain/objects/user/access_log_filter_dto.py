@@ -0,0 +1,21 @@
+"""
+Access Log Filter DTO Object.
+
+Data Transfer Object with the filters accepted when querying access logs.
+All filters are optional and combined with AND.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class AccessLogFilterDTO(BaseModel):
+    user_id: Optional[int] = None
+    username: Optional[str] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    limit: int = Field(default=100, ge=1, le=1000)
+    offset: int = Field(default=0, ge=0)
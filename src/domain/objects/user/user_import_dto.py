@@ -0,0 +1,41 @@
+"""
+User Import DTO Objects.
+
+Data Transfer Objects for the bulk user import: one validated row of the
+uploaded file and the per-row report returned once the import finishes.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel, field_validator
+
+from src.domain.objects.user.user_create_dto import UserCreateDTO
+
+
+class UserImportRowDTO(UserCreateDTO):
+    """A user to import. Parents list the usernames of their children."""
+
+    children: List[str] = []
+
+    @field_validator("children", mode="before")
+    @classmethod
+    def split_children(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [name.strip() for name in value.split(";") if name.strip()]
+        return value
+
+
+class UserImportErrorDTO(BaseModel):
+    row: int
+    username: Optional[str] = None
+    message: str
+
+
+class UserImportReportDTO(BaseModel):
+    total: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: List[UserImportErrorDTO] = []
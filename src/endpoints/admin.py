@@ -0,0 +1,237 @@
+"""
+Admin Endpoint.
+
+Defines the API routes reserved to administrators for inspecting the
+running service.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+from dependency_injector.wiring import Provide, inject
+
+from src.container import Container
+from src.domain.objects.token.jwtPayload import JwtPayload
+from src.infrastructure.controllers.admin import AdminController
+from src.middleware.token.authenticateToken import require_admin
+from src.middleware.metrics.server_timing import TimedRoute
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    route_class=TimedRoute,
+)
+
+
+@router.get(
+    "/cache/stats",
+    status_code=status.HTTP_200_OK,
+    name="cache-stats",
+    summary="Get response cache counters",
+    response_description="Returns hit, miss and evict counters per cache of this worker",
+)
+@inject
+async def get_cache_stats(
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Retrieve the response cache counters of the worker serving the request.
+
+    Args:
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Counters per cache name.
+    """
+    return await controller.cache_stats()
+
+
+@router.get(
+    "/slow-queries",
+    status_code=status.HTTP_200_OK,
+    name="slow-queries",
+    summary="Get the slow SQL statements",
+    response_description="Returns the slow statements of this worker with their plans, newest first",
+)
+@inject
+async def get_slow_queries(
+    limit: Optional[int] = Query(default=None, ge=1),
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Retrieve the slow SQL statements logged by the worker serving the request.
+
+    Args:
+        limit (Optional[int]): Maximum number of statements to return.
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Statements with redacted parameters, caller, route and plan.
+    """
+    return await controller.slow_queries(limit)
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_200_OK,
+    name="clear-slow-queries",
+    summary="Clear the slow SQL statements",
+    response_description="Empties the slow query log of this worker",
+)
+@inject
+async def clear_slow_queries(
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Empty the slow query log of the worker serving the request.
+
+    Args:
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Success status.
+    """
+    return await controller.clear_slow_queries()
+
+
+@router.get(
+    "/profiles",
+    status_code=status.HTTP_200_OK,
+    name="profiles",
+    summary="List the request profiles",
+    response_description="Returns the requests profiled on this worker, newest first",
+)
+@inject
+async def list_profiles(
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """List the requests profiled with the `X-Profile` flag on the worker serving the request.
+
+    Args:
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Profile ids with their request, route, duration and sample count.
+    """
+    return await controller.list_profiles()
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    status_code=status.HTTP_200_OK,
+    name="profile",
+    summary="Download a request profile",
+    response_description="Returns the profile in the speedscope format",
+)
+@inject
+async def get_profile(
+    profile_id: str,
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Download a request profile, to open in https://www.speedscope.app.
+
+    Args:
+        profile_id (str): Id sent in the `X-Profile-Id` response header.
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        JSONResponse: The speedscope document as an attachment.
+    """
+    return JSONResponse(
+        await controller.get_profile(profile_id),
+        headers={
+            "Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'
+        },
+    )
+
+
+@router.post(
+    "/memory/tracing",
+    status_code=status.HTTP_200_OK,
+    name="start-allocation-tracing",
+    summary="Start tracing memory allocations",
+    response_description="Starts tracemalloc on this worker",
+)
+@inject
+async def start_allocation_tracing(
+    frames: int = Query(default=1, ge=1, le=64),
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Start tracing the memory allocations of the worker serving the request.
+
+    Every allocation is slower while tracing; stop it after the measurement.
+
+    Args:
+        frames (int): Frames stored per allocation.
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Success status.
+    """
+    return await controller.start_allocation_tracing(frames)
+
+
+@router.delete(
+    "/memory/tracing",
+    status_code=status.HTTP_200_OK,
+    name="stop-allocation-tracing",
+    summary="Stop tracing memory allocations",
+    response_description="Stops tracemalloc on this worker",
+)
+@inject
+async def stop_allocation_tracing(
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Stop tracing the memory allocations of the worker serving the request.
+
+    Args:
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Success status.
+    """
+    return await controller.stop_allocation_tracing()
+
+
+@router.get(
+    "/memory/allocations",
+    status_code=status.HTTP_200_OK,
+    name="top-allocations",
+    summary="Get the top memory allocation sites",
+    response_description="Returns the allocation sites holding the most memory on this worker",
+)
+@inject
+async def get_top_allocations(
+    limit: int = Query(default=20, ge=1, le=200),
+    group_by: Literal["module", "line"] = Query(default="module"),
+    since_start: bool = Query(default=False),
+    admin: JwtPayload = Depends(require_admin),
+    controller: AdminController = Depends(Provide[Container.admin_controller]),
+):
+    """Retrieve the allocation sites of the worker serving the request.
+
+    Args:
+        limit (int): Sites returned.
+        group_by (str): `module` for one entry per module, `line` per source line.
+        since_start (bool): Rank by growth since the tracing started.
+        admin (JwtPayload): Authenticated administrator.
+        controller (AdminController): Controller handling admin operations.
+
+    Returns:
+        dict: Traced and peak bytes and the top sites.
+    """
+    return await controller.top_allocations(limit, group_by, since_start)
@@ -7,10 +7,17 @@ from src.container import Container
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.allergy_info import AllergyController
 from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
+from src.middleware.cache.cached_body import CachedBody, cached_body
+from src.middleware.cache.conditional_get import CATALOG, conditional_get, invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
 
-router = APIRouter(prefix="/allergy-info", tags=["allergy-info"])
+router = APIRouter(
+    prefix="/allergy-info",
+    tags=["allergy-info"],
+    route_class=TimedRoute,
+)
 
 @router.get(
     "/all",
@@ -21,12 +28,16 @@ router = APIRouter(prefix="/allergy-info", tags=["allergy-info"])
 )
 @inject
 async def find_all(
+    etag: None = Depends(conditional_get("allergy-info", CATALOG)),
+    body: CachedBody = Depends(cached_body("allergy-info")),
     controller: AllergyController = Depends(Provide[Container.allergy_controller]),
 ):
     """
     Retrieve all allergy info records.
 
     Args:
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (AllergyController): Controller handling allergy info logic.
 
     Returns:
@@ -35,7 +46,7 @@ async def find_all(
     Raises:
         HTTPException: If retrieval fails.
     """
-    return await controller.get_all()
+    return await body.respond("all", controller.get_all)
 
 
 @router.get(
@@ -49,6 +60,7 @@ async def find_all(
 async def find(
     allergy_id: int,
     current_user: JwtPayload = Depends(get_current_user),
+    etag: None = Depends(conditional_get("allergy-info", CATALOG)),
     controller: AllergyController = Depends(Provide[Container.allergy_controller]),
 ):
     """
@@ -57,6 +69,7 @@ async def find(
     Args:
         allergy_id (int): ID of the allergy info record.
         current_user (JwtPayload): Authenticated user.
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
         controller (AllergyController): Controller handling allergy info logic.
 
     Returns:
@@ -71,6 +84,7 @@ async def find(
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("allergy-info"))],
     name="create-allergy-info",
     summary="Create an allergy info record",
     response_description="Returns the created allergy info record",
@@ -101,6 +115,7 @@ async def create(
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("allergy-info"))],
     name="update-allergy-info",
     summary="Update an existing allergy info record",
     response_description="Returns the updated allergy info record",
@@ -131,6 +146,7 @@ async def update(
 @router.delete(
     "/{allergy_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("allergy-info"))],
     name="delete-allergy-info",
     summary="Delete an allergy info record",
     response_description="Returns the deleted allergy info ID",
@@ -14,11 +14,13 @@ from src.domain.objects.auth.login_resp import LoginResponse
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.auth import AuthController
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
 
 router = APIRouter(
     prefix="/auth",
-    tags=["authentication"]
+    tags=["authentication"],
+    route_class=TimedRoute,
 )
 
 
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, status
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Header, status
 from dependency_injector.wiring import inject, Provide
 
 from src.container import Container
+from src.domain.objects.calendar.calendar_filter_dto import CalendarFilterDTO, CalendarWindowDTO
+from src.domain.objects.calendar.calendar_recurrence_dto import CalendarRecurrenceDTO
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.calendar_activity import CalendarController
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
-router = APIRouter(prefix="/calendar", tags=["calendar"])
+router = APIRouter(prefix="/calendar", tags=["calendar"], route_class=TimedRoute)
 
 
 @router.get(
@@ -19,19 +23,141 @@ router = APIRouter(prefix="/calendar", tags=["calendar"])
 )
 @inject
 async def find_all(
+    filters: CalendarFilterDTO = Depends(),
     current_user: JwtPayload = Depends(get_current_user),
     controller: CalendarController = Depends(Provide[Container.calendar_controller]),
 ):
-    """Retrieve all calendar activities in the system.
+    """Retrieve the calendar activities, optionally filtered.
 
     Args:
+        filters (CalendarFilterDTO): Optional course_id, date_from and date_to
+            query parameters.
         current_user (JwtPayload): Authenticated user's JWT payload.
         controller (CalendarController): Controller handling calendar activity operations.
 
     Returns:
-        list: List of CalendarActivity objects.
+        list: List of CalendarActivity objects ordered by date.
     """
-    return await controller.get_all()
+    return await controller.get_all(filters)
+
+
+@router.get(
+    "/class/{class_id}",
+    status_code=status.HTTP_200_OK,
+    name="find_by_class",
+    summary="Get the calendar activities of a class",
+    response_description="Returns the calendar activities linked to the class",
+)
+@inject
+async def find_by_class(
+    class_id: int,
+    window: CalendarWindowDTO = Depends(),
+    current_user: JwtPayload = Depends(get_current_user),
+    controller: CalendarController = Depends(Provide[Container.calendar_controller]),
+):
+    """Retrieve the calendar activities of a class in a date window.
+
+    Args:
+        class_id (int): ID of the class.
+        window (CalendarWindowDTO): Optional date_from and date_to query parameters.
+        current_user (JwtPayload): Authenticated user's JWT payload.
+        controller (CalendarController): Controller handling calendar activity operations.
+
+    Returns:
+        list: List of CalendarActivity objects ordered by date.
+    """
+    return await controller.get_by_class(class_id, window)
+
+
+@router.get(
+    "/feed/{kind}/{item_id}/url",
+    status_code=status.HTTP_200_OK,
+    name="feed_url",
+    summary="Get the iCalendar subscription URL of a class or student",
+    response_description="Returns the feed path including its access token",
+)
+@inject
+async def feed_url(
+    kind: Literal["class", "student"],
+    item_id: int,
+    current_user: JwtPayload = Depends(get_current_user),
+    controller: CalendarController = Depends(Provide[Container.calendar_controller]),
+):
+    """Build the subscription URL to add to a calendar app.
+
+    Args:
+        kind (str): `class` or `student`.
+        item_id (int): ID of the class or the student.
+        current_user (JwtPayload): Authenticated user's JWT payload.
+        controller (CalendarController): Controller handling calendar activity operations.
+
+    Returns:
+        dict: The feed path with its token.
+    """
+    return await controller.feed_url(kind, item_id, current_user)
+
+
+@router.delete(
+    "/feed/tokens",
+    status_code=status.HTTP_200_OK,
+    name="revoke_feed_tokens",
+    summary="Revoke the iCalendar subscription URLs of the current user",
+    response_description="Every feed URL issued to the user stops working",
+)
+@inject
+async def revoke_feed_tokens(
+    current_user: JwtPayload = Depends(get_current_user),
+    controller: CalendarController = Depends(Provide[Container.calendar_controller]),
+):
+    """Revoke every subscription URL handed out to the current user.
+
+    Args:
+        current_user (JwtPayload): Authenticated user's JWT payload.
+        controller (CalendarController): Controller handling calendar activity operations.
+
+    Returns:
+        dict: Success status.
+    """
+    return await controller.revoke_feed_tokens(current_user)
+
+
+@router.get(
+    "/feed/{kind}/{item_id}.ics",
+    status_code=status.HTTP_200_OK,
+    name="feed",
+    summary="iCalendar feed of a class or student",
+    response_description="Returns the calendar activities as text/calendar",
+)
+@inject
+async def feed(
+    kind: Literal["class", "student"],
+    item_id: int,
+    token: str,
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+    controller: CalendarController = Depends(Provide[Container.calendar_controller]),
+):
+    """Serve the iCalendar feed polled by calendar apps.
+
+    Authenticated by the token in the subscription URL. Answers 304 when the
+    client sends the current ETag or Last-Modified back.
+
+    Args:
+        kind (str): `class` or `student`.
+        item_id (int): ID of the class or the student.
+        token (str): Feed token from the subscription URL.
+        if_none_match (Optional[str]): If-None-Match request header.
+        if_modified_since (Optional[str]): If-Modified-Since request header.
+        accept_encoding (Optional[str]): Accept-Encoding request header.
+        controller (CalendarController): Controller handling calendar activity operations.
+
+    Returns:
+        Response: The text/calendar feed.
+    """
+    return await controller.feed(
+        kind, item_id, token, if_none_match, if_modified_since, accept_encoding
+    )
 
 
 @router.get(
@@ -86,6 +212,36 @@ async def create(
     return await controller.create(payload)
 
 
+@router.post(
+    "/recurring",
+    status_code=status.HTTP_200_OK,
+    name="create_recurring",
+    summary="Create a recurring or bulk calendar activity",
+    response_description="Returns the IDs of the created calendar activities",
+)
+@inject
+async def create_recurring(
+    payload: CalendarRecurrenceDTO,
+    current_user: JwtPayload = Depends(get_current_user),
+    controller: CalendarController = Depends(Provide[Container.calendar_controller]),
+):
+    """Create all the occurrences of an activity in one request.
+
+    Occurrences come from a daily or weekly rule (interval, weekdays,
+    until or count, excluded dates) and/or an explicit list of dates, and
+    are linked to the given classes.
+
+    Args:
+        payload (CalendarRecurrenceDTO): Recurrence rule, extra dates and classes.
+        current_user (JwtPayload): Authenticated user's JWT payload.
+        controller (CalendarController): Controller handling calendar activity operations.
+
+    Returns:
+        dict: Created calendar activity IDs and creation timestamp.
+    """
+    return await controller.create_recurring(payload)
+
+
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
@@ -2,13 +2,17 @@ from fastapi import APIRouter, Body, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.container import Container
+from src.domain.objects.classes.class_rollover_dto import ClassRolloverDTO
 from src.domain.objects.classes.update_class_subjects_dto import UpdateClassSubjectsDTO
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.classes import ClassesController
 from src.infrastructure.entities.course.classes import Classes
+from src.middleware.cache.cached_body import CachedBody, cached_body
+from src.middleware.cache.conditional_get import NO_CACHE, conditional_get, invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
-router = APIRouter(prefix="/classes", tags=["class"])
+router = APIRouter(prefix="/classes", tags=["class"], route_class=TimedRoute)
 
 
 @router.get(
@@ -20,17 +24,21 @@ router = APIRouter(prefix="/classes", tags=["class"])
 )
 @inject
 async def find_all(
+    etag: None = Depends(conditional_get("classes", NO_CACHE)),
+    body: CachedBody = Depends(cached_body("classes")),
     controller: ClassesController = Depends(Provide[Container.classes_controller]),
 ):
     """Retrieve all classes in the system.
 
     Args:
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (ClassesController): Controller handling class operations.
 
     Returns:
         list: List of all Classes objects.
     """
-    return await controller.get_all()
+    return await body.respond("all", controller.get_all)
 
 
 @router.get(
@@ -44,6 +52,8 @@ async def find_all(
 async def find(
     classes_id: int,
     current_user: JwtPayload = Depends(get_current_user),
+    etag: None = Depends(conditional_get("classes", NO_CACHE)),
+    body: CachedBody = Depends(cached_body("classes")),
     controller: ClassesController = Depends(Provide[Container.classes_controller]),
 ):
     """Retrieve a single class by its ID.
@@ -51,17 +61,20 @@ async def find(
     Args:
         classes_id (int): ID of the class to retrieve.
         current_user (JwtPayload): Authenticated user's JWT payload.
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (ClassesController): Controller handling class operations.
 
     Returns:
         dict: Class information.
     """
-    return await controller.get(classes_id)
+    return await body.respond(str(classes_id), lambda: controller.get(classes_id))
 
 
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes"))],
     name="create",
     summary="Create a class",
     response_description="Returns the information of the created class",
@@ -85,9 +98,40 @@ async def create(
     return await controller.create(payload)
 
 
+@router.post(
+    "/rollover",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes", "teachers"))],
+    name="rollover",
+    summary="Roll classes over to the next course",
+    response_description="Returns the number of classes, subjects and enrollments created",
+)
+@inject
+async def rollover(
+    payload: ClassRolloverDTO,
+    current_user: JwtPayload = Depends(get_current_user),
+    controller: ClassesController = Depends(Provide[Container.classes_controller]),
+):
+    """Create the target course classes from the source course classes.
+
+    Copies the subject assignments and enrolls the students of each source
+    class in its new class. With `dry_run` only the counts are returned.
+
+    Args:
+        payload (ClassRolloverDTO): Source and target courses and the class mapping.
+        current_user (JwtPayload): Authenticated user's JWT payload.
+        controller (ClassesController): Controller handling class operations.
+
+    Returns:
+        dict: Rollover report.
+    """
+    return await controller.rollover(payload)
+
+
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes"))],
     name="update-class",
     summary="Update an existing class",
     response_description="Returns the updated class",
@@ -114,6 +158,7 @@ async def update(
 @router.put(
     "/subjects",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes", "teachers"))],
     name="update-class-subjects",
     summary="Update an existing class with subjects",
     response_description="Returns the updated subjects of a class",
@@ -140,6 +185,7 @@ async def update_subjects(
 @router.delete(
     "/{classes_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes"))],
     name="delete-class",
     summary="Delete a class",
     response_description="Returns the deleted class ID and timestamp",
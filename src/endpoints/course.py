@@ -5,9 +5,11 @@ from src.container import Container
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.course import CourseController
 from src.infrastructure.entities.course.course import Course
+from src.middleware.cache.conditional_get import invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
-router = APIRouter(prefix="/courses", tags=["course"])
+router = APIRouter(prefix="/courses", tags=["course"], route_class=TimedRoute)
 
 
 @router.get(
@@ -113,6 +115,7 @@ async def update(
 @router.delete(
     "/{course_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes"))],
     name="delete-course",
     summary="Delete a course",
     response_description="Returns the deleted course ID",
@@ -8,10 +8,17 @@ from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.food_intolrance import FoodIntoleranceController
 from src.infrastructure.controllers.student import StudentController
 from src.infrastructure.entities.student_info.food_intolerance import FoodIntolerance
+from src.middleware.cache.cached_body import CachedBody, cached_body
+from src.middleware.cache.conditional_get import CATALOG, conditional_get, invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
 
-router = APIRouter(prefix="/food-intolerance", tags=["food-intolerance"])
+router = APIRouter(
+    prefix="/food-intolerance",
+    tags=["food-intolerance"],
+    route_class=TimedRoute,
+)
 @router.get(
     "/all",
     status_code=status.HTTP_200_OK,
@@ -21,12 +28,16 @@ router = APIRouter(prefix="/food-intolerance", tags=["food-intolerance"])
 )
 @inject
 async def find_all(
+    etag: None = Depends(conditional_get("food-intolerance", CATALOG)),
+    body: CachedBody = Depends(cached_body("food-intolerance")),
     controller: FoodIntoleranceController = Depends(Provide[Container.food_intolerance_controller]),
 ):
     """
     Retrieve all food intolerance records.
 
     Args:
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (FoodIntoleranceController): Controller handling food intolerance logic.
 
     Returns:
@@ -35,7 +46,7 @@ async def find_all(
     Raises:
         HTTPException: If retrieval fails.
     """
-    return await controller.get_all()
+    return await body.respond("all", controller.get_all)
 
 
 @router.get(
@@ -49,6 +60,7 @@ async def find_all(
 async def find(
     intolerance_id: int,
     current_user: JwtPayload = Depends(get_current_user),
+    etag: None = Depends(conditional_get("food-intolerance", CATALOG)),
     controller: FoodIntoleranceController = Depends(Provide[Container.food_intolerance_controller]),
 ):
     """
@@ -57,6 +69,7 @@ async def find(
     Args:
         intolerance_id (int): ID of the food intolerance record.
         current_user (JwtPayload): Authenticated user.
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
         controller (FoodIntoleranceController): Controller handling food intolerance logic.
 
     Returns:
@@ -71,6 +84,7 @@ async def find(
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("food-intolerance"))],
     name="create-food-intolerance",
     summary="Create a food intolerance record",
     response_description="Returns the created food intolerance record",
@@ -101,6 +115,7 @@ async def create(
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("food-intolerance"))],
     name="update-food-intolerance",
     summary="Update an existing food intolerance record",
     response_description="Returns the updated food intolerance record",
@@ -131,6 +146,7 @@ async def update(
 @router.delete(
     "/{intolerance_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("food-intolerance"))],
     name="delete-food-intolerance",
     summary="Delete a food intolerance record",
     response_description="Returns the deleted food intolerance ID",
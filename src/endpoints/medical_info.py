@@ -7,10 +7,17 @@ from src.container import Container
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.medical_info import MedicalInfoController
 from src.infrastructure.entities.student_info.medical_info import MedicalInfo
+from src.middleware.cache.cached_body import CachedBody, cached_body
+from src.middleware.cache.conditional_get import CATALOG, conditional_get, invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
 
-router = APIRouter(prefix="/medical-info", tags=["medical-info"])
+router = APIRouter(
+    prefix="/medical-info",
+    tags=["medical-info"],
+    route_class=TimedRoute,
+)
 
 @router.get(
     "/all",
@@ -21,12 +28,16 @@ router = APIRouter(prefix="/medical-info", tags=["medical-info"])
 )
 @inject
 async def find_all(
+    etag: None = Depends(conditional_get("medical-info", CATALOG)),
+    body: CachedBody = Depends(cached_body("medical-info")),
     controller: MedicalInfoController = Depends(Provide[Container.medical_info_controller]),
 ):
     """
     Retrieve all medical info records.
 
     Args:
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (MedicalInfoController): Controller handling medical info logic.
 
     Returns:
@@ -35,7 +46,7 @@ async def find_all(
     Raises:
         HTTPException: If retrieval fails.
     """
-    return await controller.get_all()
+    return await body.respond("all", controller.get_all)
 
 
 @router.get(
@@ -49,6 +60,7 @@ async def find_all(
 async def find(
     medical_id: int,
     current_user: JwtPayload = Depends(get_current_user),
+    etag: None = Depends(conditional_get("medical-info", CATALOG)),
     controller: MedicalInfoController = Depends(Provide[Container.medical_info_controller]),
 ):
     """
@@ -57,6 +69,7 @@ async def find(
     Args:
         medical_id (int): ID of the medical info record.
         current_user (JwtPayload): Authenticated user.
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
         controller (MedicalInfoController): Controller handling medical info logic.
 
     Returns:
@@ -71,6 +84,7 @@ async def find(
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("medical-info"))],
     name="create-medical-info",
     summary="Create a medical info record",
     response_description="Returns the created medical info record",
@@ -101,6 +115,7 @@ async def create(
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("medical-info"))],
     name="update-medical-info",
     summary="Update a medical info record",
     response_description="Returns the updated medical info record",
@@ -131,6 +146,7 @@ async def update(
 @router.delete(
     "/{medical_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("medical-info"))],
     name="delete-medical-info",
     summary="Delete a medical info record",
     response_description="Returns the deleted medical info ID",
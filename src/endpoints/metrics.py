@@ -0,0 +1,44 @@
+"""
+Metrics Endpoint.
+
+Exposes the request, database, Redis and cache metrics of the worker in
+the Prometheus text format. The scraper must send `METRICS_TOKEN` as a
+bearer token; the endpoint answers 401 while no token is set, unless
+`METRICS_PUBLIC=true` opens it for a port firewalled to the scraper.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from fastapi import APIRouter, Depends, status
+from dependency_injector.wiring import Provide, inject
+
+from src.container import Container
+from src.infrastructure.controllers.metrics import MetricsController
+from src.middleware.token.authenticateToken import require_metrics_token
+from src.middleware.metrics.server_timing import TimedRoute
+
+
+router = APIRouter(tags=["metrics"], route_class=TimedRoute)
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    name="metrics",
+    summary="Get the worker metrics",
+    response_description="Returns the metrics in the Prometheus text format",
+    dependencies=[Depends(require_metrics_token)],
+)
+@inject
+async def get_metrics(
+    controller: MetricsController = Depends(Provide[Container.metrics_controller]),
+):
+    """Render the metrics of the worker serving the request.
+
+    Args:
+        controller (MetricsController): Controller rendering the metrics.
+
+    Returns:
+        Response: The metrics in the Prometheus text format.
+    """
+    return await controller.render()
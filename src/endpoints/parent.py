@@ -1,12 +1,17 @@
 
+from typing import List
 from fastapi import APIRouter, Body, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.container import Container
+from src.domain.objects.common.data_response import DataResponse
+from src.domain.objects.profiles.parent_info import ParentDTO
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.parent import ParentController
 from src.infrastructure.entities.users.parents import Parent
+from src.middleware.serialization.fast_json import FastJSONResponse
 from src.middleware.token.authenticateToken import get_current_user, require_role
+from src.middleware.metrics.server_timing import TimedRoute
 
 """
 Parents Endpoints.
@@ -17,11 +22,12 @@ Provides API routes for managing Parent entities.
 """
 
 
-router = APIRouter(prefix="/parents", tags=["parents"])
+router = APIRouter(prefix="/parents", tags=["parents"], route_class=TimedRoute)
 
 @router.get(
     "/all",
     status_code=status.HTTP_200_OK,
+    response_model=DataResponse[List[ParentDTO]],
     name="find-all-parents",
     summary="Get all parents",
     response_description="Returns a list of all parents",
@@ -44,7 +50,7 @@ async def find_all(
     Raises:
         HTTPException: If no parents found or a database error occurs.
     """
-    return await controller.get_all()
+    return FastJSONResponse(await controller.get_all(), DataResponse[List[ParentDTO]])
 
 
 @router.get(
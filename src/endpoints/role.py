@@ -14,11 +14,15 @@ from dependency_injector.wiring import Provide, inject
 from src.container import Container
 from src.domain.objects.role.role_dto import RoleDTO
 from src.infrastructure.controllers.role import RoleController
+from src.middleware.cache.cached_body import CachedBody, cached_body
+from src.middleware.cache.conditional_get import CATALOG, conditional_get, invalidates
+from src.middleware.metrics.server_timing import TimedRoute
 
 
 router = APIRouter(
     prefix="/roles",
-    tags=["roles"]
+    tags=["roles"],
+    route_class=TimedRoute,
 )
 
 security = HTTPBearer()
@@ -33,22 +37,27 @@ security = HTTPBearer()
 )
 @inject
 async def get_roles(
+    etag: None = Depends(conditional_get("roles", CATALOG)),
+    body: CachedBody = Depends(cached_body("roles")),
     controller: RoleController = Depends(Provide[Container.role_controller])
 ):
     """Retrieve all roles in the system.
 
     Args:
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (RoleController): Controller handling role operations.
 
     Returns:
         list: List of RoleDTO objects.
     """
-    return await controller.get_all()
+    return await body.respond("all", controller.get_all)
 
 
 @router.post(
     "/create-role",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("roles"))],
     name="create-role",
     summary="Create a new role",
     response_description="Returns the created role ID and timestamp",
@@ -73,6 +82,7 @@ async def create_role(
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("roles"))],
     name="update-role",
     summary="Update an existing role",
     response_description="Returns the updated role ID and timestamp",
@@ -97,6 +107,7 @@ async def update_role(
 @router.delete(
     "/{role_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("roles"))],
     name="delete-role",
     summary="Delete a role",
     response_description="Returns the deleted role ID and timestamp",
@@ -5,9 +5,15 @@ from src.container import Container
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.school_subject import SchoolSubjectController
 from src.infrastructure.entities.course.school_subject import SchoolSubject
+from src.middleware.cache.conditional_get import invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
-router = APIRouter(prefix="/school-subjects", tags=["school-subject"])
+router = APIRouter(
+    prefix="/school-subjects",
+    tags=["school-subject"],
+    route_class=TimedRoute,
+)
 
 
 @router.get(
@@ -61,6 +67,7 @@ async def find(
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="create",
     summary="Create a school subject",
     response_description="Returns the information of the created school subject",
@@ -87,6 +94,7 @@ async def create(
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="update",
     summary="Update an existing school subject",
     response_description="Returns the updated school subject",
@@ -113,6 +121,7 @@ async def update(
 @router.delete(
     "/{school_subject_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="delete",
     summary="Delete a school subject",
     response_description="Returns the deleted school subject ID",
@@ -9,6 +9,7 @@ from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.student import StudentController
 from src.infrastructure.entities.student_info.student import Student
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
 """
 Students Endpoints.
@@ -19,7 +20,7 @@ Provides API routes for managing Student entities.
 """
 
 
-router = APIRouter(prefix="/students", tags=["students"])
+router = APIRouter(prefix="/students", tags=["students"], route_class=TimedRoute)
 @router.get(
     "/all",
     status_code=status.HTTP_200_OK,
@@ -6,8 +6,13 @@ from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.student_class import StudentClassController
 from src.infrastructure.entities.course.student_class import StudentClass
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
-router = APIRouter(prefix="/student_classes", tags=["student_classes"])
+router = APIRouter(
+    prefix="/student_classes",
+    tags=["student_classes"],
+    route_class=TimedRoute,
+)
 
 
 @router.get(
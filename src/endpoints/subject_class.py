@@ -6,9 +6,15 @@ from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.subject_class import SubjectClassController
 from src.infrastructure.entities.course.school_subject import SchoolSubject
 from src.infrastructure.entities.course.subject_class import SubjectClass
+from src.middleware.cache.conditional_get import invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
-router = APIRouter(prefix="/subject_classes", tags=["subject_classes"])
+router = APIRouter(
+    prefix="/subject_classes",
+    tags=["subject_classes"],
+    route_class=TimedRoute,
+)
 
 
 @router.get(
@@ -62,6 +68,7 @@ async def find(
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes", "teachers"))],
     name="create",
     summary="Create a subject class",
     response_description="Returns the information of the created subject class",
@@ -88,6 +95,7 @@ async def create(
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes", "teachers"))],
     name="update",
     summary="Update an existing subject class",
     response_description="Returns the updated subject class",
@@ -114,6 +122,7 @@ async def update(
 @router.delete(
     "/{subject_class_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("classes", "teachers"))],
     name="delete",
     summary="Delete a subject class",
     response_description="Returns the deleted subject class ID",
@@ -1,11 +1,16 @@
+from typing import List
 from fastapi import APIRouter, Body, Depends, status
 from dependency_injector.wiring import inject, Provide
 
 from src.container import Container
+from src.domain.objects.common.data_response import DataResponse
 from src.domain.objects.profiles.teacher_dto import TeacherDTO
 from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.controllers.teacher import TeacherController
+from src.middleware.cache.cached_body import CachedBody, cached_body
+from src.middleware.cache.conditional_get import NO_CACHE, conditional_get, invalidates
 from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.metrics.server_timing import TimedRoute
 
 """
 Teachers Endpoints.
@@ -16,11 +21,12 @@ Provides API routes for managing Teacher entities.
 """
 
 
-router = APIRouter(prefix="/teachers", tags=["teachers"])
+router = APIRouter(prefix="/teachers", tags=["teachers"], route_class=TimedRoute)
 
 @router.get(
     "/all",
     status_code=status.HTTP_200_OK,
+    response_model=DataResponse[List[TeacherDTO]],
     name="find-all-teacher",
     summary="Get all teachers",
     response_description="Returns a list of teachers",
@@ -28,6 +34,8 @@ router = APIRouter(prefix="/teachers", tags=["teachers"])
 @inject
 async def find_all(
     current_user: JwtPayload = Depends(get_current_user),
+    etag: None = Depends(conditional_get("teachers", NO_CACHE)),
+    body: CachedBody = Depends(cached_body("teachers")),
     controller: TeacherController = Depends(Provide[Container.teacher_controller])
 ):
     """
@@ -35,6 +43,8 @@ async def find_all(
 
     Args:
         current_user (JwtPayload): The authenticated user.
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
+        body (CachedBody): Serves the encoded body cached for the current version.
         controller (TeacherController): Controller to handle business logic.
 
     Returns:
@@ -43,7 +53,7 @@ async def find_all(
     Raises:
         HTTPException: If there is an error fetching teachers.
     """
-    return await controller.get_all()
+    return await body.respond("all", controller.get_all, DataResponse[List[TeacherDTO]])
 
 
 @router.get(
@@ -57,6 +67,7 @@ async def find_all(
 async def find(
     teacher_id: int,
     current_user: JwtPayload = Depends(get_current_user),
+    etag: None = Depends(conditional_get("teachers", NO_CACHE)),
     controller: TeacherController = Depends(Provide[Container.teacher_controller])
 ):
     """
@@ -65,6 +76,7 @@ async def find(
     Args:
         teacher_id (int): The teacher's ID.
         current_user (JwtPayload): The authenticated user.
+        etag (None): Conditional GET check, answers 304 while the client copy is current.
         controller (TeacherController): Controller to handle business logic.
 
     Returns:
@@ -79,6 +91,7 @@ async def find(
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="createTeacher",
     summary="Create a teacher",
     response_description="Returns the created teacher",
@@ -109,6 +122,7 @@ async def create(
 @router.delete(
     "/{teacher_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="deleteTeacher",
     summary="Delete one teacher",
     response_description="Delete one teacher"
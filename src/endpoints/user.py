@@ -7,19 +7,27 @@ updating, password change, and deletion.
 :author: Carlos S. Paredes Morillo
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from dependency_injector.wiring import inject, Provide
 
+from src.application.services.import_reader import format_from_content_type
 from src.container import Container
 from src.domain.objects.auth.change_pass_dto import ChangePasswordDTO
+from src.domain.objects.common.data_response import DataResponse
 from src.domain.objects.token.jwtPayload import JwtPayload
+from src.domain.objects.user.access_log_filter_dto import AccessLogFilterDTO
 from src.domain.objects.user.user_create_dto import UserCreateDTO
+from src.domain.objects.user.user_dto import UserDTO
 from src.domain.objects.user.user_update_dto import UserUpdateDTO
 from src.infrastructure.controllers.user import UserController
-from src.middleware.token.authenticateToken import get_current_user
+from src.middleware.cache.conditional_get import invalidates
+from src.middleware.serialization.fast_json import FastJSONResponse
+from src.middleware.token.authenticateToken import get_current_user, require_admin
+from src.middleware.metrics.server_timing import TimedRoute
 
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=TimedRoute)
 
 
 @router.get(
@@ -77,23 +85,52 @@ async def me(
 )
 @inject
 async def get_access_logs(
+    filters: AccessLogFilterDTO = Depends(),
     controller: UserController = Depends(Provide[Container.user_controller]),
     current_user: JwtPayload = Depends(get_current_user),
 ):
-    """Retrieve information about logs of the users.
+    """Retrieve a page of access logs, newest first.
 
     Args:
+        filters (AccessLogFilterDTO): Optional user_id, username, date_from,
+            date_to, limit and offset query parameters.
         controller (UserController): The user controller injected by DI.
         current_user (JwtPayload): The current authenticated user's JWT payload.
 
     Returns:
-        dict: The current user's data.
+        dict: The access logs matching the filters.
+    """
+    return await controller.get_access_logs(filters)
+
+@router.post(
+    "/access-logs/archive",
+    status_code=status.HTTP_200_OK,
+    name="archive-access-logs",
+    summary="Archive old access logs",
+    response_description="Returns the number of archived access logs",
+)
+@inject
+async def archive_access_logs(
+    controller: UserController = Depends(Provide[Container.user_controller]),
+    admin: JwtPayload = Depends(require_admin),
+):
+    """Move the access logs older than the retention window to the archive.
+
+    Restricted to administrators.
+
+    Args:
+        controller (UserController): The user controller injected by DI.
+        admin (JwtPayload): The authenticated administrator's JWT payload.
+
+    Returns:
+        dict: Number of archived access logs and timestamp.
     """
-    return await controller.get_access_logs()
+    return await controller.archive_access_logs()
 
 @router.get(
     "/all",
     status_code=status.HTTP_200_OK,
+    response_model=DataResponse[List[UserDTO]],
     name="findAll",
     summary="Get all users",
     response_description="Returns a list of all users",
@@ -112,11 +149,12 @@ async def find_all_user(
     Returns:
         list: List of UserDTO objects.
     """
-    return await controller.get_all()
+    return FastJSONResponse(await controller.get_all(), DataResponse[List[UserDTO]])
 
 @router.get(
     "/{role_id}/all",
     status_code=status.HTTP_200_OK,
+    response_model=DataResponse[List[UserDTO]],
     name="find-all-by-role",
     summary="Get all users of one role",
     response_description="Returns a list of all users of one role",
@@ -136,7 +174,9 @@ async def find_all_user_by_role(
     Returns:
         list: List of UserDTO objects.
     """
-    return await controller.get_all_by_role(role_id=role_id)
+    return FastJSONResponse(
+        await controller.get_all_by_role(role_id=role_id), DataResponse[List[UserDTO]]
+    )
 
 
 @router.get(
@@ -166,6 +206,7 @@ async def find_user(
 @router.post(
     "/create-user",
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(invalidates("teachers"))],
     name="create-user",
     summary="Create a new user",
     response_description="Returns the created user information",
@@ -187,9 +228,47 @@ async def create_user(
     return await controller.create_user(payload)
 
 
+@router.post(
+    "/import",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
+    name="import-users",
+    summary="Bulk import users from CSV or NDJSON",
+    response_description="Returns the import totals and the rejected rows",
+)
+@inject
+async def import_users(
+    request: Request,
+    controller: UserController = Depends(Provide[Container.user_controller]),
+    current_user: JwtPayload = Depends(get_current_user),
+):
+    """Import users from the raw request body.
+
+    The body is a `text/csv` file with a header line or an
+    `application/x-ndjson` file with one user per line. Parents list their
+    children usernames in `children` (separated by `;` in CSV).
+
+    Args:
+        request (Request): Incoming request, read as a stream.
+        controller (UserController): Controller handling user operations.
+        current_user (JwtPayload): The current authenticated user's JWT payload.
+
+    Returns:
+        dict: Created and failed counts plus the error of each rejected row.
+    """
+    fmt = format_from_content_type(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail={"status": "error", "message": "Upload must be CSV or NDJSON"},
+        )
+    return await controller.import_users(request.stream(), fmt)
+
+
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="update-user",
     summary="Update an existing user",
     response_description="Returns the updated user information",
@@ -238,6 +317,7 @@ async def change_password(
 @router.delete(
     "/{user_id}",
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(invalidates("teachers"))],
     name="delete-user",
     summary="Delete a user",
     response_description="Returns the deleted user ID and timestamp",
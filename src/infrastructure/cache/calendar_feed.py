@@ -0,0 +1,159 @@
+"""
+Calendar Feed Cache.
+
+Stores rendered iCalendar feeds in Redis as raw bytes. Entries are keyed by
+a generation number instead of being deleted one by one: bumping the
+generation makes every cached feed unreachable at once and the old entries
+simply expire.
+
+The time a feed's content last changed is kept per feed, across
+generations, so re-rendering an unchanged feed keeps its DTSTAMP,
+Last-Modified and ETag, and calendar clients keep their copy.
+
+Each user also has a feed token version. Bumping it revokes every feed URL
+handed out to that user.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from datetime import datetime
+from typing import Callable, Optional
+
+from src.domain.objects.calendar.calendar_feed_dto import CalendarFeedDTO
+from src.middleware.compression.gzip_middleware import gzip_copy
+
+GENERATION_KEY = "calendar:feed:generation"
+STAMP_TTL = 30 * 24 * 3600
+
+
+class CalendarFeedCache:
+    """Redis cache for rendered calendar feeds."""
+
+    def __init__(
+        self,
+        redis_session: Callable,
+        ttl: int,
+        gzip_min_size: int = 1024,
+        gzip_level: int = 6,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_session (Callable): Async Redis session factory returning bytes.
+            ttl (int): Seconds a rendered feed is kept.
+            gzip_min_size (int): Smallest feed, in bytes, also stored gzipped.
+            gzip_level (int): gzip compression level, 1 to 9.
+        """
+        self.redis = redis_session
+        self.ttl = ttl
+        self.gzip_min_size = gzip_min_size
+        self.gzip_level = gzip_level
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """Return the gzipped copy of a rendered feed, None if it is small."""
+        return gzip_copy(body, self.gzip_min_size, self.gzip_level)
+
+    async def generation(self) -> int:
+        """Return the current feed generation."""
+        async for redis in self.redis():
+            return int(await redis.get(GENERATION_KEY) or 0)
+
+    async def get(self, generation: int, scope: str) -> Optional[CalendarFeedDTO]:
+        """
+        Look up a rendered feed.
+
+        Args:
+            generation (int): Generation read before rendering.
+            scope (str): Feed owner, e.g. `class:3` or `student:7`.
+
+        Returns:
+            Optional[CalendarFeedDTO]: The cached feed, or None on a miss.
+        """
+        async for redis in self.redis():
+            entry = await redis.hgetall(_key(generation, scope))
+            if not entry:
+                return None
+            return CalendarFeedDTO(
+                body=entry[b"body"],
+                etag=entry[b"etag"].decode(),
+                last_modified=datetime.fromisoformat(entry[b"last_modified"].decode()),
+                gzip_body=entry.get(b"gzip_body"),
+            )
+
+    async def set(self, generation: int, scope: str, feed: CalendarFeedDTO) -> bool:
+        """
+        Store a rendered feed under the generation it was rendered for.
+
+        A feed rendered while a calendar write bumped the generation lands
+        under the old generation and is never served.
+        """
+        async for redis in self.redis():
+            key = _key(generation, scope)
+            pipe = redis.pipeline(transaction=False)
+            mapping = {
+                "body": feed.body,
+                "etag": feed.etag,
+                "last_modified": feed.last_modified.isoformat(),
+            }
+            if feed.gzip_body is not None:
+                mapping["gzip_body"] = feed.gzip_body
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+            return True
+
+    async def last_modified(self, scope: str, etag: str) -> Optional[datetime]:
+        """
+        Return when a feed got its current content.
+
+        Args:
+            scope (str): Feed owner, e.g. `class:3` or `student:7`.
+            etag (str): Validator of the content just read.
+
+        Returns:
+            Optional[datetime]: The stored time, None if the content changed
+                or was never stored.
+        """
+        async for redis in self.redis():
+            entry = await redis.hgetall(_stamp_key(scope))
+            if not entry or entry[b"etag"].decode() != etag:
+                return None
+            return datetime.fromisoformat(entry[b"last_modified"].decode())
+
+    async def set_last_modified(self, scope: str, etag: str, moment: datetime) -> bool:
+        """Record the time a feed got the content with this validator."""
+        async for redis in self.redis():
+            key = _stamp_key(scope)
+            pipe = redis.pipeline(transaction=False)
+            pipe.hset(key, mapping={"etag": etag, "last_modified": moment.isoformat()})
+            pipe.expire(key, STAMP_TTL)
+            await pipe.execute()
+            return True
+
+    async def token_version(self, user_id: int) -> int:
+        """Return the current feed token version of a user."""
+        async for redis in self.redis():
+            return int(await redis.get(_version_key(user_id)) or 0)
+
+    async def revoke_tokens(self, user_id: int) -> int:
+        """Revoke the feed tokens of a user by moving to a new version."""
+        async for redis in self.redis():
+            return await redis.incr(_version_key(user_id))
+
+    async def invalidate(self) -> int:
+        """Drop every cached feed by moving to a new generation."""
+        async for redis in self.redis():
+            return await redis.incr(GENERATION_KEY)
+
+
+def _key(generation: int, scope: str) -> str:
+    return f"calendar:feed:{generation}:{scope}"
+
+
+def _stamp_key(scope: str) -> str:
+    return f"calendar:feed:stamp:{scope}"
+
+
+def _version_key(user_id: int) -> str:
+    return f"calendar:feed:token:{user_id}"
@@ -0,0 +1,177 @@
+"""
+Catalog Snapshot Cache.
+
+Keeps an in-process copy of the small catalog tables (roles, allergies,
+food intolerances, medical info, school subjects and activity types) so
+reads never reach the database. Each catalog has a version counter in
+Redis: a write bumps it and publishes the new version on a channel every
+worker listens to, and a worker drops any snapshot older than the latest
+version it has heard of. Snapshots also expire after a TTL as a safety net
+for messages lost while a subscriber was reconnecting.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import sentry_sdk
+
+ROLES = "roles"
+ALLERGIES = "allergies"
+FOOD_INTOLERANCES = "food-intolerances"
+MEDICAL_INFO = "medical-info"
+SCHOOL_SUBJECTS = "school-subjects"
+ACTIVITY_TYPES = "activity-types"
+
+CHANNEL = "catalog:invalidate"
+ID_FIELDS = {ROLES: "role_id"}
+
+
+@dataclass
+class CatalogSnapshot:
+    """Rows of one catalog as loaded for a given version."""
+
+    version: int
+    items: List[Any]
+    by_id: Dict[int, Any]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class CatalogSnapshotCache:
+    """In-process versioned cache of the catalog tables."""
+
+    def __init__(
+        self,
+        redis_session: Callable,
+        loaders: Dict[str, Callable[[], Awaitable[List[Any]]]],
+        ttl: int,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_session (Callable): Async Redis session factory.
+            loaders (Dict[str, Callable]): Catalog name to the repository
+                method returning all of its rows.
+            ttl (int): Seconds a snapshot is served without reloading,
+                0 to rely on invalidation messages only.
+            retry_delay (float): Seconds before resubscribing after the
+                Redis connection is lost.
+        """
+        self.redis = redis_session
+        self.loaders = loaders
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+        self._snapshots: Dict[str, CatalogSnapshot] = {}
+        self._latest: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def get_all(self, name: str) -> List[Any]:
+        """Return every row of a catalog."""
+        return list((await self._snapshot(name)).items)
+
+    async def get(self, name: str, item_id: int) -> Optional[Any]:
+        """Return one row of a catalog by ID, or None."""
+        return (await self._snapshot(name)).by_id.get(item_id)
+
+    async def load_all(self):
+        """Load every catalog, used to warm the cache at startup."""
+        for name in self.loaders:
+            await self._snapshot(name)
+
+    async def invalidate(self, name: str) -> int:
+        """
+        Move a catalog to a new version and tell every worker about it.
+
+        Args:
+            name (str): Catalog that was written.
+
+        Returns:
+            int: The new version.
+        """
+        async for redis in self.redis():
+            version = await redis.incr(_version_key(name))
+            await redis.publish(CHANNEL, f"{name}:{version}")
+        self._seen(name, version)
+        return version
+
+    async def listen(self):
+        """
+        Apply the invalidations published by any worker until cancelled.
+
+        Every local snapshot is dropped when the subscription is
+        re-established since messages may have been missed meanwhile.
+        """
+        resubscribe = False
+        while True:
+            try:
+                async for redis in self.redis():
+                    pubsub = redis.pubsub()
+                    await pubsub.subscribe(CHANNEL)
+                    if resubscribe:
+                        self._snapshots.clear()
+                    try:
+                        while True:
+                            # Polling with a timeout keeps the connection
+                            # socket_timeout from firing on a quiet channel.
+                            message = await pubsub.get_message(
+                                ignore_subscribe_messages=True, timeout=1.0
+                            )
+                            if message is not None:
+                                name, _, version = message["data"].rpartition(":")
+                                self._seen(name, int(version))
+                    finally:
+                        await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                sentry_sdk.capture_exception(e)
+            resubscribe = True
+            await asyncio.sleep(self.retry_delay)
+
+    def _seen(self, name: str, version: int):
+        if version > self._latest.get(name, 0):
+            self._latest[name] = version
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None and snapshot.version < version:
+            del self._snapshots[name]
+
+    def _fresh(self, name: str) -> Optional[CatalogSnapshot]:
+        snapshot = self._snapshots.get(name)
+        if snapshot is None or snapshot.version < self._latest.get(name, 0):
+            return None
+        if self.ttl and time.monotonic() - snapshot.loaded_at >= self.ttl:
+            return None
+        return snapshot
+
+    async def _snapshot(self, name: str) -> CatalogSnapshot:
+        snapshot = self._fresh(name)
+        if snapshot is not None:
+            return snapshot
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            snapshot = self._fresh(name)
+            if snapshot is not None:
+                return snapshot
+            # The version is read before the rows: a write racing the load
+            # leaves the snapshot one version behind and it is reloaded.
+            async for redis in self.redis():
+                version = int(await redis.get(_version_key(name)) or 0)
+            if version > self._latest.get(name, 0):
+                self._latest[name] = version
+            items = list(await self.loaders[name]())
+            id_field = ID_FIELDS.get(name, "id")
+            snapshot = CatalogSnapshot(
+                version=version,
+                items=items,
+                by_id={getattr(item, id_field): item for item in items},
+            )
+            self._snapshots[name] = snapshot
+            return snapshot
+
+
+def _version_key(name: str) -> str:
+    return f"catalog:version:{name}"
@@ -0,0 +1,41 @@
+"""
+Resource Version Cache.
+
+Keeps one version counter per cacheable resource in Redis. Read endpoints
+build their ETag from it and write endpoints bump it, so a conditional
+request can be answered without touching the database.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Callable
+
+
+class ResourceVersionCache:
+    """Redis counters tracking the version of read resources."""
+
+    def __init__(self, redis_session: Callable):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_session (Callable): Async Redis session factory.
+        """
+        self.redis = redis_session
+
+    async def version(self, resource: str) -> int:
+        """Return the current version of a resource, 0 if never written."""
+        async for redis in self.redis():
+            return int(await redis.get(_key(resource)) or 0)
+
+    async def bump(self, *resources: str):
+        """Move every given resource to a new version."""
+        async for redis in self.redis():
+            pipe = redis.pipeline(transaction=False)
+            for resource in resources:
+                pipe.incr(_key(resource))
+            await pipe.execute()
+
+
+def _key(resource: str) -> str:
+    return f"http:version:{resource}"
@@ -0,0 +1,90 @@
+"""
+Response Body Cache.
+
+Stores the final encoded JSON body of read routes in Redis, optionally
+next to a gzip-compressed copy, so a hit is written to the client without
+building DTOs or encoding JSON. Entries are keyed by the version counter
+of the resource they serve: the write routes that bump it make every body
+rendered for the previous version unreachable and the old entries simply
+expire.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from src.middleware.compression.gzip_middleware import gzip_copy
+
+JSON = "json"
+GZIP = "gzip"
+
+
+class ResponseBodyCache:
+    """Redis cache for encoded response bodies."""
+
+    def __init__(
+        self, redis_session: Callable, ttl: int, gzip_min_size: int, gzip_level: int = 6
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_session (Callable): Async Redis session factory returning bytes.
+            ttl (int): Seconds an encoded body is kept.
+            gzip_min_size (int): Smallest body, in bytes, also stored gzipped.
+            gzip_level (int): gzip compression level, 1 to 9.
+        """
+        self.redis = redis_session
+        self.ttl = ttl
+        self.gzip_min_size = gzip_min_size
+        self.gzip_level = gzip_level
+
+    def encode(self, body: bytes) -> Dict[str, bytes]:
+        """Return the copies of a body to store, gzipped too if large enough."""
+        encoded = {JSON: body}
+        compressed = gzip_copy(body, self.gzip_min_size, self.gzip_level)
+        if compressed is not None:
+            encoded[GZIP] = compressed
+        return encoded
+
+    async def get(
+        self, resource: str, version: int, key: str, accept_gzip: bool = False
+    ) -> Tuple[Optional[bytes], str]:
+        """
+        Look up an encoded body.
+
+        Args:
+            resource (str): Resource the body was rendered from.
+            version (int): Version of the resource read before rendering.
+            key (str): Body key within the resource, e.g. `all` or `3`.
+            accept_gzip (bool): Prefer the gzipped copy when there is one.
+
+        Returns:
+            Tuple[Optional[bytes], str]: The body, None on a miss, and its
+            encoding.
+        """
+        entry_key = _key(resource, version, key)
+        async for redis in self.redis():
+            if accept_gzip:
+                body = await redis.hget(entry_key, GZIP)
+                if body is not None:
+                    return body, GZIP
+            return await redis.hget(entry_key, JSON), JSON
+
+    async def set(self, resource: str, version: int, key: str, encoded: Dict[str, bytes]):
+        """
+        Store the copies of a body under the version it was rendered for.
+
+        A body rendered while a write bumped the version lands under the
+        old version and is never served once the bump is visible.
+        """
+        async for redis in self.redis():
+            entry_key = _key(resource, version, key)
+            pipe = redis.pipeline(transaction=False)
+            pipe.hset(entry_key, mapping=encoded)
+            pipe.expire(entry_key, self.ttl)
+            await pipe.execute()
+
+
+def _key(resource: str, version: int, key: str) -> str:
+    return f"http:body:{resource}:{version}:{key}"
@@ -0,0 +1,319 @@
+"""
+Response Cache.
+
+Caches the serialized result of use-case reads in Redis. Every entry is
+stored with the dependency tags it was built from (e.g. `student:7`,
+`class:3`) and the version each tag had at the time. Write use cases evict
+by bumping tag versions, so an entry whose recorded versions no longer
+match is treated as a miss without scanning or deleting keys.
+
+Concurrent misses of one entry within a worker share a single load, and
+with `lock_timeout` set a Redis lock makes other workers wait for that
+load too. With `stale_ttl` set an expired entry whose tags are unchanged
+is still returned while one background task reloads it; evicted entries
+are never served.
+
+Use cases opt in with the `cached_response` and `evicts` decorators and a
+`response_cache` attribute; without it they behave as before.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+import sentry_sdk
+
+HIT = "hit"
+MISS = "miss"
+EVICT = "evict"
+STALE = "stale"
+COALESCED = "coalesced"
+
+RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class ResponseCache:
+    """Tag-versioned Redis cache for use-case results."""
+
+    def __init__(
+        self,
+        redis_session: Callable,
+        ttl: int,
+        stale_ttl: int = 0,
+        lock_timeout: float = 0,
+        lock_poll: float = 0.05,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_session (Callable): Async Redis session factory.
+            ttl (int): Default seconds an entry is served as fresh.
+            stale_ttl (int): Extra seconds an expired entry is still served
+                while it is reloaded in the background, 0 to disable.
+            lock_timeout (float): Seconds a worker waits for another worker
+                loading the same entry, 0 to only coalesce within the worker.
+            lock_poll (float): Seconds between checks while waiting.
+        """
+        self.redis = redis_session
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lock_timeout = lock_timeout
+        self.lock_poll = lock_poll
+        self.counters: Dict[str, Counter] = defaultdict(Counter)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def get_or_load(
+        self,
+        name: str,
+        key: str,
+        tags: Sequence[str],
+        adapter: TypeAdapter,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Return a cached result or load and store it.
+
+        Concurrent misses of the same entry share a single load. Tags may
+        reference the loaded result (`user:{result.user_id}`); the versions
+        of those are read after loading, so a write landing in between is
+        only caught by the TTL.
+
+        Args:
+            name (str): Cache name, used for the key prefix and the counters.
+            key (str): Entry key within the name.
+            tags (Sequence[str]): Tag templates formatted with `result`.
+            adapter (TypeAdapter): Adapter for the result type.
+            loader (Callable): Coroutine factory computing the result.
+            ttl (Optional[int]): Fresh seconds, default TTL if None.
+            stale_ttl (Optional[int]): Stale seconds, default if None.
+
+        Returns:
+            Any: The result.
+        """
+        ttl = ttl or self.ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        entry_key = _entry_key(name, key)
+
+        def load():
+            return self._load(name, entry_key, tags, adapter, loader, ttl, stale_ttl)
+
+        async for redis in self.redis():
+            state, result = await self._lookup(redis, entry_key, adapter, ttl)
+        if state is not None:
+            self.counters[name][state] += 1
+        if state == HIT:
+            return result
+        if state == STALE:
+            refresh = self._single_flight(name, entry_key, load)
+            refresh.add_done_callback(_report_failure)
+            return result
+        self.counters[name][MISS] += 1
+        return await asyncio.shield(self._single_flight(name, entry_key, load))
+
+    async def invalidate(self, *tags: str):
+        """Evict every entry built from any of the given tags."""
+        if not tags:
+            return
+        async for redis in self.redis():
+            pipe = redis.pipeline(transaction=False)
+            for tag in tags:
+                pipe.incr(_tag_key(tag))
+            await pipe.execute()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Counters of this process per cache name."""
+        return {
+            name: {
+                field: counter[field]
+                for field in (HIT, MISS, EVICT, STALE, COALESCED)
+            }
+            for name, counter in self.counters.items()
+        }
+
+    def _single_flight(self, name: str, entry_key: str, load: Callable) -> asyncio.Task:
+        task = self._inflight.get(entry_key)
+        if task is not None:
+            self.counters[name][COALESCED] += 1
+            return task
+        task = asyncio.ensure_future(load())
+        self._inflight[entry_key] = task
+        task.add_done_callback(functools.partial(self._landed, entry_key))
+        return task
+
+    def _landed(self, entry_key: str, task: asyncio.Task):
+        if self._inflight.get(entry_key) is task:
+            del self._inflight[entry_key]
+        if not task.cancelled():
+            # Retrieved here so a load nobody awaits any more is not reported
+            # as never retrieved; the callers still get it through the task.
+            task.exception()
+
+    async def _lookup(self, redis, entry_key: str, adapter: TypeAdapter, ttl: int):
+        entry = await redis.get(entry_key)
+        if entry is None:
+            return None, None
+        stored_at, entry_tags, versions, payload = entry.split("\n", 3)
+        entry_tags = entry_tags.split()
+        if versions.split() != await self._versions(redis, entry_tags):
+            return EVICT, None
+        state = HIT if time.time() - float(stored_at) < ttl else STALE
+        return state, adapter.validate_json(payload)
+
+    async def _load(self, name, entry_key, tags, adapter, loader, ttl, stale_ttl):
+        async for redis in self.redis():
+            lock_key = _lock_key(entry_key)
+            token = uuid.uuid4().hex
+            locked = not self.lock_timeout or await redis.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+            if not locked:
+                # Another worker is loading it: wait for its entry and only
+                # load here if it does not show up in time.
+                deadline = time.monotonic() + self.lock_timeout
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(self.lock_poll)
+                    state, result = await self._lookup(redis, entry_key, adapter, ttl)
+                    if state == HIT:
+                        self.counters[name][COALESCED] += 1
+                        return result
+            try:
+                static = [tag for tag in tags if "{result" not in tag]
+                before = await self._versions(redis, static)
+                result = await loader()
+                dynamic = [tag.format(result=result) for tag in tags if "{result" in tag]
+                after = await self._versions(redis, dynamic)
+
+                entry = "\n".join(
+                    (
+                        repr(time.time()),
+                        " ".join(static + dynamic),
+                        " ".join(before + after),
+                        adapter.dump_json(result).decode(),
+                    )
+                )
+                await redis.set(entry_key, entry, ex=ttl + stale_ttl)
+                return result
+            finally:
+                if self.lock_timeout and locked:
+                    await redis.eval(RELEASE_LOCK, 1, lock_key, token)
+
+    @staticmethod
+    async def _versions(redis, tags: List[str]) -> List[str]:
+        if not tags:
+            return []
+        return [value or "0" for value in await redis.mget([_tag_key(t) for t in tags])]
+
+
+def cached_response(
+    name: str,
+    key: str,
+    model: Any,
+    tags: Sequence[str] = (),
+    ttl: Optional[int] = None,
+    stale_ttl: Optional[int] = None,
+):
+    """
+    Cache the result of a use-case read method.
+
+    `key` and `tags` are format strings over the method arguments; tags
+    may also use `{result...}`.
+
+    Args:
+        name (str): Cache name.
+        key (str): Entry key template.
+        model (Any): Result type, e.g. `StudentInfoDTO` or `List[TeacherDTO]`.
+        tags (Sequence[str]): Dependency tag templates.
+        ttl (Optional[int]): Fresh seconds, default TTL if None.
+        stale_ttl (Optional[int]): Stale seconds, cache default if None.
+    """
+    adapter = TypeAdapter(model)
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            cache: Optional[ResponseCache] = getattr(self, "response_cache", None)
+            if cache is None:
+                return await method(self, *args, **kwargs)
+            values = _arguments(signature, self, args, kwargs)
+            arg_tags = [
+                tag if "{result" in tag else tag.format(**values) for tag in tags
+            ]
+            return await cache.get_or_load(
+                name,
+                key.format(**values),
+                arg_tags,
+                adapter,
+                lambda: method(self, *args, **kwargs),
+                ttl,
+                stale_ttl,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def evicts(*tags: str):
+    """
+    Evict the given tags once a use-case write method has succeeded.
+
+    Args:
+        *tags (str): Tag templates formatted with the method arguments.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            result = await method(self, *args, **kwargs)
+            cache: Optional[ResponseCache] = getattr(self, "response_cache", None)
+            if cache is not None:
+                values = _arguments(signature, self, args, kwargs)
+                await cache.invalidate(*(tag.format(**values) for tag in tags))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _report_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        sentry_sdk.capture_exception(task.exception())
+
+
+def _arguments(signature: inspect.Signature, instance, args, kwargs) -> Dict[str, Any]:
+    bound = signature.bind(instance, *args, **kwargs)
+    bound.apply_defaults()
+    values = dict(bound.arguments)
+    values.pop("self", None)
+    return values
+
+
+def _entry_key(name: str, key: str) -> str:
+    return f"cache:entry:{name}:{key}"
+
+
+def _tag_key(tag: str) -> str:
+    return f"cache:tag:{tag}"
+
+
+def _lock_key(entry_key: str) -> str:
+    return f"cache:lock:{entry_key.removeprefix('cache:entry:')}"
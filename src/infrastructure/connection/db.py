@@ -2,47 +2,80 @@
 Database connection utilities.
 
 Provides the configuration and helpers to create the database engine
-(SQLAlchemy/SQLModel) and initialize the schema. Also exposes a function
-to generate asynchronous database sessions for FastAPI.
+(SQLAlchemy/SQLModel) and check that the schema is at the revision expected
+by the code. Also exposes a function to generate asynchronous database
+sessions for FastAPI.
+
+The schema itself is only changed by the Alembic migrations
+(`alembic upgrade head`, see `make migrate`).
 
 :author: Carlos S. Paredes Morillo
 """
 
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import SQLModel
+from src.infrastructure.metrics.instrumentation import instrument_engine
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.metrics.slow_queries import SlowQueryLog
+from src.infrastructure.metrics.tracing import current_tracer, trace_engine
 from ...settings import settings
 
 
-def get_engine():
+def get_engine(
+    metrics: Optional[MetricsRegistry] = None,
+    slow_queries: Optional[SlowQueryLog] = None,
+):
     """
     Create and return the asynchronous database engine.
 
+    Args:
+        metrics (Optional[MetricsRegistry]): Registry timing every SQL
+            statement of the engine, None to leave it uninstrumented.
+        slow_queries (Optional[SlowQueryLog]): Log of the statements over
+            its threshold, None to not log them.
+
+    The statements are also traced when tracing is configured.
+
     Returns:
         AsyncEngine: Database engine instance.
 
     :author: Carlos S. Paredes Morillo
     """
-    return create_async_engine(
+    engine = create_async_engine(
         settings.database_url,
         echo=False,
         pool_pre_ping=True,
     )
+    if metrics is not None:
+        instrument_engine(engine, metrics)
+    if slow_queries is not None:
+        slow_queries.attach(engine)
+    if current_tracer() is not None:
+        trace_engine(engine)
+    return engine
 
 
-async def async_init_db(engine):
+def load_entities():
     """
-    Initialize the database schema asynchronously.
-
-    Imports all entity models and creates tables if they do not exist.
+    Import every entity module so all tables are registered in
+    `SQLModel.metadata`.
 
-    Args:
-        engine (AsyncEngine): The asynchronous database engine.
+    Used by the schema bootstrap and by the Alembic environment, which
+    both need the complete metadata.
     """
     # Users
     from src.infrastructure.entities.users.roles import Role
     from src.infrastructure.entities.users.user import User
     from src.infrastructure.entities.users.accces_logs import AccessLog
+    from src.infrastructure.entities.users.access_log_archive import AccessLogArchive
     from src.infrastructure.entities.users.deletion_logs import DeletionLog
     from src.infrastructure.entities.users.teacher import Teacher
     from src.infrastructure.entities.users.parents import Parent
@@ -74,6 +107,85 @@ async def async_init_db(engine):
     from src.infrastructure.entities.quiz.reward import Reward
     from src.infrastructure.entities.quiz.reward_history import RewardHistory
 
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+def expected_revision() -> str:
+    """
+    Return the head revision of the Alembic migrations shipped with the code.
+
+    Returns:
+        str: The head revision identifier.
+    """
+    return ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_current_head()
+
+
+async def current_revision(engine) -> Optional[str]:
+    """
+    Read the revision the database is stamped with.
+
+    Args:
+        engine (AsyncEngine): The asynchronous database engine.
+
+    Returns:
+        Optional[str]: The current revision, or None if never migrated.
+    """
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+        )
+
+
+async def check_schema_revision(engine) -> None:
+    """
+    Check that the database schema is at the revision expected by the code.
+
+    Runs a single query against `alembic_version` and never issues DDL, so
+    it is cheap and safe when several workers start at once.
+
+    Args:
+        engine (AsyncEngine): The asynchronous database engine.
+
+    Raises:
+        RuntimeError: If the database is not at the expected revision.
+    """
+    expected = expected_revision()
+    current = await current_revision(engine)
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {current!r}, expected {expected!r}. "
+            "Run `make migrate` (alembic upgrade head) before starting the API."
+        )
+
+
+def upgrade_schema(database_url: str) -> None:
+    """
+    Migrate a database to the head revision, as `alembic upgrade head` does.
+
+    Blocking: the migrations run their own event loop, so call it from a
+    thread when an event loop is already running.
+
+    Args:
+        database_url (str): Database to migrate.
+    """
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    command.upgrade(config, "head")
+
+
+async def async_init_db(engine):
+    """
+    Create the database schema straight from the entity metadata.
+
+    Only meant for throwaway databases in tests; the application schema is
+    managed by the Alembic migrations.
+
+    Args:
+        engine (AsyncEngine): The asynchronous database engine.
+    """
+    load_entities()
+
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
@@ -7,41 +7,80 @@ and session for use with FastAPI or other async components.
 :author: Carlos S. Paredes Morillo
 """
 
+from typing import Optional
 import redis.asyncio as redis
+from src.infrastructure.metrics.instrumentation import instrument_redis
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.metrics.tracing import current_tracer, trace_redis
 from src.settings import settings
 
 
-def get_redis_client() -> redis.Redis:
+def get_redis_client(
+    decode_responses: bool = True, metrics: Optional[MetricsRegistry] = None
+) -> redis.Redis:
     """
     Create and return a Redis client.
 
+    Args:
+        decode_responses (bool): Decode replies to `str`. Disable it for
+            clients that store raw bytes such as pre-rendered responses.
+        metrics (Optional[MetricsRegistry]): Registry timing every command
+            of the client, None to leave it uninstrumented. The commands
+            are also traced when tracing is configured.
+
     Returns:
         redis.Redis: Asynchronous Redis client instance.
 
     Notes:
         The client is configured with UTF-8 encoding and a 5-second socket timeout.
     """
-    return redis.from_url(
+    client = redis.from_url(
         url=settings.redis_url,
         encoding="utf-8",
-        decode_responses=True,
+        decode_responses=decode_responses,
         socket_connect_timeout=5,
         socket_timeout=5
     )
+    if metrics is not None:
+        instrument_redis(client, metrics)
+    if current_tracer() is not None:
+        trace_redis(client)
+    return client
 
 
-async def get_redis_session():
+async def get_redis_session(
+    decode_responses: bool = True, metrics: Optional[MetricsRegistry] = None
+):
     """
     Generate an asynchronous Redis session for use with FastAPI dependencies.
 
+    Args:
+        decode_responses (bool): Decode replies to `str`.
+        metrics (Optional[MetricsRegistry]): Registry timing the commands.
+
     Yields:
         redis.Redis: An asynchronous Redis client session.
 
     Notes:
         Ensures the client is properly closed after use.
     """
-    client = get_redis_client()
+    client = get_redis_client(decode_responses=decode_responses, metrics=metrics)
     try:
         yield client
     finally:
         await client.aclose()
+
+
+async def shared_redis_session(client: redis.Redis):
+    """
+    Hand out a long-lived Redis client with the session interface.
+
+    Args:
+        client (redis.Redis): Client shared by every lookup, usually the
+            container singleton.
+
+    Yields:
+        redis.Redis: The shared client. It is not closed afterwards, so
+            its connection pool is reused by the next lookup.
+    """
+    yield client
@@ -0,0 +1,160 @@
+"""
+Admin Controller.
+
+Exposes the runtime diagnostics of the current worker to administrators.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from dataclasses import asdict
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from src.infrastructure.cache.response_cache import ResponseCache
+from src.infrastructure.metrics.memory import AllocationTracker
+from src.infrastructure.metrics.profiler import ProfileStore
+from src.infrastructure.metrics.slow_queries import SlowQueryLog
+
+
+class AdminController:
+    """Controller for administration endpoints."""
+
+    def __init__(
+        self,
+        response_cache: ResponseCache,
+        slow_query_log: SlowQueryLog,
+        profiles: ProfileStore,
+        allocations: AllocationTracker,
+    ):
+        """
+        Initialize AdminController with the diagnostics sources.
+
+        Args:
+            response_cache (ResponseCache): Cache of the use-case reads.
+            slow_query_log (SlowQueryLog): Slow SQL statements of the worker.
+            profiles (ProfileStore): Request profiles taken on this worker.
+            allocations (AllocationTracker): Allocation tracing of the worker.
+        """
+        self.response_cache = response_cache
+        self.slow_query_log = slow_query_log
+        self.profiles = profiles
+        self.allocations = allocations
+
+    async def cache_stats(self):
+        """
+        Retrieve the response cache counters of this worker.
+
+        Returns:
+            dict: Contains status and the hit, miss and evict counters per cache.
+        """
+        return {
+            "status": "success",
+            "data": self.response_cache.stats(),
+        }
+
+    async def slow_queries(self, limit: Optional[int] = None):
+        """
+        Retrieve the slow SQL statements logged by this worker.
+
+        Args:
+            limit (Optional[int]): Maximum number of statements, newest first.
+
+        Returns:
+            dict: Contains status and the logged statements with their plans.
+        """
+        return {
+            "status": "success",
+            "data": [asdict(entry) for entry in self.slow_query_log.recent(limit)],
+        }
+
+    async def clear_slow_queries(self):
+        """
+        Empty the slow query log of this worker.
+
+        Returns:
+            dict: Contains status.
+        """
+        self.slow_query_log.clear()
+        return {"status": "success"}
+
+    async def list_profiles(self):
+        """
+        List the request profiles kept by this worker.
+
+        Returns:
+            dict: Contains status and the profile summaries, newest first.
+        """
+        return {
+            "status": "success",
+            "data": [profile.summary() for profile in self.profiles.recent()],
+        }
+
+    async def get_profile(self, profile_id: str):
+        """
+        Retrieve a request profile in the speedscope format.
+
+        Args:
+            profile_id (str): Id sent in the `X-Profile-Id` response header.
+
+        Returns:
+            dict: The speedscope document of the profile.
+
+        Raises:
+            HTTPException: If this worker keeps no profile with that id.
+        """
+        profile = self.profiles.get(profile_id)
+        if profile is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"status": "error", "message": "Profile not found"},
+            )
+        return profile.speedscope()
+
+    async def start_allocation_tracing(self, frames: int = 1):
+        """
+        Start tracing the memory allocations of this worker.
+
+        Args:
+            frames (int): Frames stored per allocation.
+
+        Returns:
+            dict: Contains status.
+        """
+        self.allocations.start(frames)
+        return {"status": "success"}
+
+    async def stop_allocation_tracing(self):
+        """
+        Stop tracing the memory allocations of this worker.
+
+        Returns:
+            dict: Contains status.
+        """
+        self.allocations.stop()
+        return {"status": "success"}
+
+    async def top_allocations(self, limit: int, group_by: str, since_start: bool):
+        """
+        Retrieve the allocation sites holding the most memory.
+
+        Args:
+            limit (int): Sites returned.
+            group_by (str): `module` or `line`.
+            since_start (bool): Rank by growth since the tracing started.
+
+        Returns:
+            dict: Contains status, the traced and peak bytes and the sites.
+
+        Raises:
+            HTTPException: If the allocations are not being traced.
+        """
+        if not self.allocations.running:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"status": "error", "message": "Allocation tracing is not running"},
+            )
+        return {
+            "status": "success",
+            "data": self.allocations.top(limit, group_by, since_start),
+        }
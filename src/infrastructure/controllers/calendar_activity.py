@@ -1,13 +1,22 @@
-from typing import List
-from fastapi import HTTPException
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import List, Optional
+from fastapi import HTTPException, Response, status
 import sentry_sdk
 
+from src.application.use_case.calendar.calendar_feed_case import CalendarFeedCase
 from src.application.use_case.calendar.create_calendar_activity_case import CreateCalendarActivityCase
+from src.application.use_case.calendar.create_recurring_activity_case import CreateRecurringActivityCase
 from src.application.use_case.calendar.delete_calendar_activity_case import DeleteCalendarActivityCase
 from src.application.use_case.calendar.find_calendar_activity_case import FindCalendarActivityCase
 from src.application.use_case.calendar.update_calendar_activity_case import UpdateCalendarActivityCase
+from src.domain.objects.calendar.calendar_feed_dto import CalendarFeedDTO
+from src.domain.objects.calendar.calendar_filter_dto import CalendarFilterDTO, CalendarWindowDTO
+from src.domain.objects.calendar.calendar_recurrence_dto import CalendarRecurrenceDTO
+from src.domain.objects.token.jwtPayload import JwtPayload
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
 from src.infrastructure.exceptions.except_manager import manage_calendar_except
+from src.middleware.compression.gzip_middleware import accepts_gzip
 
 """
 CalendarController.
@@ -31,6 +40,8 @@ class CalendarController:
         create_case: CreateCalendarActivityCase,
         update_case: UpdateCalendarActivityCase,
         delete_case: DeleteCalendarActivityCase,
+        feed_case: CalendarFeedCase,
+        recurring_case: CreateRecurringActivityCase,
     ):
         """Initialize the controller with use case dependencies.
 
@@ -39,11 +50,15 @@ class CalendarController:
             create_case (CreateCalendarActivityCase): Use case for creating calendar activities.
             update_case (UpdateCalendarActivityCase): Use case for updating calendar activities.
             delete_case (DeleteCalendarActivityCase): Use case for deleting calendar activities.
+            feed_case (CalendarFeedCase): Use case serving the iCalendar feeds.
+            recurring_case (CreateRecurringActivityCase): Use case for recurring activities.
         """
         self.find_case = find_case
         self.create_case = create_case
         self.update_case = update_case
         self.delete_case = delete_case
+        self.feed_case = feed_case
+        self.recurring_case = recurring_case
 
     async def create(self, calendar: CalendarActivity):
         """Create a new calendar activity.
@@ -70,6 +85,31 @@ class CalendarController:
             sentry_sdk.capture_exception(e)
             manage_calendar_except(e)
 
+    async def create_recurring(self, payload: CalendarRecurrenceDTO):
+        """Create every occurrence of a recurring or bulk calendar activity.
+
+        Args:
+            payload (CalendarRecurrenceDTO): Recurrence rule, extra dates and classes.
+
+        Returns:
+            dict: Success status, created activity IDs and creation date.
+
+        Raises:
+            HTTPException: Propagates exceptions from the use case.
+        """
+        try:
+            resp = await self.recurring_case.create(payload)
+            return {
+                "status": "success",
+                "data": {
+                    "ids": [str(item_id) for item_id in resp.ids],
+                    "created_date": str(resp.event_date),
+                },
+            }
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_calendar_except(e)
+
     async def update(self, payload: CalendarActivity):
         """Update an existing calendar activity.
 
@@ -144,17 +184,43 @@ class CalendarController:
             sentry_sdk.capture_exception(e)
             manage_calendar_except(e)
 
-    async def get_all(self):
-        """Retrieve all calendar activities.
+    async def get_all(self, filters: CalendarFilterDTO = None):
+        """Retrieve the calendar activities matching the filters.
+
+        Args:
+            filters (CalendarFilterDTO): Course and date window.
+
+        Returns:
+            dict: Success status and list of calendar activities.
+
+        Raises:
+            HTTPException: Propagates exceptions from the use case.
+        """
+        try:
+            resp = await self.find_case.get_all(filters)
+            return {
+                "status": "success",
+                "data": resp
+            }
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_calendar_except(e)
+
+    async def get_by_class(self, class_id: int, window: CalendarWindowDTO = None):
+        """Retrieve the calendar activities of a class.
+
+        Args:
+            class_id (int): ID of the class.
+            window (CalendarWindowDTO): Date window.
 
         Returns:
-            dict: Success status and list of all calendar activities.
+            dict: Success status and list of the class calendar activities.
 
         Raises:
             HTTPException: Propagates exceptions from the use case.
         """
         try:
-            resp = await self.find_case.get_all()
+            resp = await self.find_case.get_by_class(class_id, window)
             return {
                 "status": "success",
                 "data": resp
@@ -162,3 +228,110 @@ class CalendarController:
         except HTTPException as e:
             sentry_sdk.capture_exception(e)
             manage_calendar_except(e)
+
+    async def feed(
+        self,
+        kind: str,
+        item_id: int,
+        token: str,
+        if_none_match: Optional[str] = None,
+        if_modified_since: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> Response:
+        """Serve the iCalendar feed of a class or a student.
+
+        Args:
+            kind (str): `class` or `student`.
+            item_id (int): ID of the class or the student.
+            token (str): Feed token from the subscription URL.
+            if_none_match (Optional[str]): If-None-Match request header.
+            if_modified_since (Optional[str]): If-Modified-Since request header.
+            accept_encoding (Optional[str]): Accept-Encoding request header.
+
+        Returns:
+            Response: The feed, precompressed if the client accepts gzip, or
+            an empty 304 when the client copy is current.
+
+        Raises:
+            HTTPException: If the token is invalid or the feed cannot be built.
+        """
+        try:
+            await self.feed_case.check_token(kind, item_id, token)
+            feed = await self.feed_case.get_feed(kind, item_id)
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_calendar_except(e)
+
+        headers = {
+            "ETag": feed.etag,
+            "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+        if _not_modified(feed, if_none_match, if_modified_since):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        body = feed.body
+        if feed.gzip_body is not None:
+            headers["Vary"] = "Accept-Encoding"
+            if accepts_gzip(accept_encoding):
+                headers["Content-Encoding"] = "gzip"
+                body = feed.gzip_body
+        return Response(
+            content=body, media_type="text/calendar; charset=utf-8", headers=headers
+        )
+
+    async def feed_url(self, kind: str, item_id: int, user: JwtPayload):
+        """Build the subscription path of a class or student feed.
+
+        Args:
+            kind (str): `class` or `student`.
+            item_id (int): ID of the class or the student.
+            user (JwtPayload): User the token is issued to.
+
+        Returns:
+            dict: Success status and the feed path with its token.
+
+        Raises:
+            HTTPException: If the user does not own the class or student.
+        """
+        try:
+            token = await self.feed_case.feed_token(kind, item_id, user)
+            return {
+                "status": "success",
+                "data": {"url": f"/calendar/feed/{kind}/{item_id}.ics?token={token}"},
+            }
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_calendar_except(e)
+
+    async def revoke_feed_tokens(self, user: JwtPayload):
+        """Revoke every feed URL issued to a user.
+
+        Args:
+            user (JwtPayload): User whose feed tokens are revoked.
+
+        Returns:
+            dict: Success status.
+        """
+        await self.feed_case.revoke_tokens(user)
+        return {"status": "success", "data": {"message": "Feed URLs revoked"}}
+
+
+def _not_modified(
+    feed: CalendarFeedDTO, if_none_match: Optional[str], if_modified_since: Optional[str]
+) -> bool:
+    """Evaluate the conditional request headers against a cached feed."""
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or feed.etag in tags or f"W/{feed.etag}" in tags
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None:
+            return False
+        if since.tzinfo is None:
+            # `-0000` and obsolete zones parse as naive: they are UTC.
+            since = since.replace(tzinfo=timezone.utc)
+        return feed.last_modified <= since
+    return False
@@ -5,7 +5,9 @@ import sentry_sdk
 from src.application.use_case.classes.create_classes_case import CreateClassesCase
 from src.application.use_case.classes.delete_classes_case import DeleteClassesCase
 from src.application.use_case.classes.find_classes_case import FindClassesCase
+from src.application.use_case.classes.rollover_classes_case import RolloverClassesCase
 from src.application.use_case.classes.update_classes_case import UpdateClassesCase
+from src.domain.objects.classes.class_rollover_dto import ClassRolloverDTO
 from src.domain.objects.classes.update_class_subjects_dto import UpdateClassSubjectsDTO
 from src.infrastructure.entities.course.classes import Classes
 from src.infrastructure.exceptions.except_manager import manage_classes_except
@@ -32,6 +34,7 @@ class ClassesController:
         create_case: CreateClassesCase,
         update_case: UpdateClassesCase,
         delete_case: DeleteClassesCase,
+        rollover_case: RolloverClassesCase,
     ):
         """Initialize the controller with use case dependencies.
 
@@ -40,11 +43,13 @@ class ClassesController:
             create_case (CreateClassesCase): Use case for creating classes.
             update_case (UpdateClassesCase): Use case for updating classes.
             delete_case (DeleteClassesCase): Use case for deleting classes.
+            rollover_case (RolloverClassesCase): Use case for the academic-year rollover.
         """
         self.find_case = find_case
         self.create_case = create_case
         self.update_case = update_case
         self.delete_case = delete_case
+        self.rollover_case = rollover_case
 
     async def create(self, classes: Classes):
         """Create a new class.
@@ -123,6 +128,28 @@ class ClassesController:
             sentry_sdk.capture_exception(e)
             manage_classes_except(e)
 
+    async def rollover(self, payload: ClassRolloverDTO):
+        """Create next year's classes, subject assignments and enrollments.
+
+        Args:
+            payload (ClassRolloverDTO): Source and target courses and the class mapping.
+
+        Returns:
+            dict: Success status and the rollover report.
+
+        Raises:
+            HTTPException: Propagates exceptions from the use case.
+        """
+        try:
+            resp = await self.rollover_case.rollover(payload)
+            return {
+                "status": "success",
+                "data": resp
+            }
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_classes_except(e)
+
     async def delete(self, classes_id: int):
         """Delete a class by ID.
 
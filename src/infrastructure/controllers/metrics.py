@@ -0,0 +1,56 @@
+"""
+Metrics Controller.
+
+Renders the metrics of the current worker for the Prometheus scraper. The
+samples that are cheap to read but costly to track, such as the database
+pool usage, the response cache counters and the memory and garbage
+collector usage, are collected here at scrape time instead of on every
+request.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from fastapi import Response
+
+from src.infrastructure.cache.response_cache import ResponseCache
+from src.infrastructure.metrics.instrumentation import collect_pool
+from src.infrastructure.metrics.memory import collect_memory
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsController:
+    """Controller for the metrics endpoint."""
+
+    def __init__(self, metrics: MetricsRegistry, response_cache: ResponseCache, engine):
+        """
+        Initialize MetricsController with the metric sources.
+
+        Args:
+            metrics (MetricsRegistry): Registry of this worker.
+            response_cache (ResponseCache): Cache of the use-case reads.
+            engine (AsyncEngine): Database engine whose pool is sampled.
+        """
+        self.metrics = metrics
+        self.response_cache = response_cache
+        self.engine = engine
+
+    async def render(self) -> Response:
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            Response: The exposition text.
+        """
+        collect_pool(self.engine, self.metrics)
+        collect_memory(self.metrics)
+        events = self.metrics.counter(
+            "apprendre_response_cache_events",
+            "Response cache lookups by outcome.",
+            ("cache", "event"),
+        )
+        for name, counters in self.response_cache.stats().items():
+            for event, value in counters.items():
+                events.set(value, name, event)
+        return Response(content=self.metrics.render(), media_type=CONTENT_TYPE)
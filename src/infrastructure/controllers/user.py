@@ -7,14 +7,18 @@ services for user-related operations.
 :author: Carlos S. Paredes Morillo
 """
 
-from typing import List
+from typing import AsyncIterator, List
 from fastapi import HTTPException
 import sentry_sdk
+from src.application.services.import_reader import read_rows
+from src.application.use_case.user.archive_access_logs_case import ArchiveAccessLogsCase
 from src.application.use_case.user.create_user_case import CreateUserCase
 from src.application.use_case.user.delete_user_case import DeleteUserCase
 from src.application.use_case.user.find_user_case import FindUserCase
+from src.application.use_case.user.import_users_case import ImportUsersCase
 from src.application.use_case.user.update_user_case import UpdateUserCase
 from src.domain.objects.auth.change_pass_dto import ChangePasswordDTO
+from src.domain.objects.user.access_log_filter_dto import AccessLogFilterDTO
 from src.domain.objects.user.user_create_dto import UserCreateDTO
 from src.domain.objects.user.user_dto import UserDTO
 from src.domain.objects.user.user_update_dto import UserUpdateDTO
@@ -34,6 +38,8 @@ class UserController:
         create_case: CreateUserCase,
         update_case: UpdateUserCase,
         delete_case: DeleteUserCase,
+        archive_logs_case: ArchiveAccessLogsCase,
+        import_case: ImportUsersCase,
     ):
         """
         Initialize the UserController with the required use cases.
@@ -43,11 +49,15 @@ class UserController:
             create_case (CreateUserCase): Use case for creating users.
             update_case (UpdateUserCase): Use case for updating users.
             delete_case (DeleteUserCase): Use case for deleting users.
+            archive_logs_case (ArchiveAccessLogsCase): Use case for archiving old access logs.
+            import_case (ImportUsersCase): Use case for bulk user imports.
         """
         self.find_user_case = find_case
         self.create_user_case = create_case
         self.update_user_case = update_case
         self.delete_user_case = delete_case
+        self.archive_logs_case = archive_logs_case
+        self.import_users_case = import_case
 
     async def create_user(self, payload: UserCreateDTO):
         """
@@ -75,6 +85,27 @@ class UserController:
             sentry_sdk.capture_exception(e)
             manage_user_except(e)
 
+    async def import_users(self, chunks: AsyncIterator[bytes], fmt: str):
+        """
+        Import users from an uploaded CSV or NDJSON stream.
+
+        Args:
+            chunks (AsyncIterator[bytes]): Uploaded file body.
+            fmt (str): `csv` or `ndjson`.
+
+        Returns:
+            dict: Status and the import report with the per-row errors.
+        """
+        try:
+            resp = await self.import_users_case.import_rows(read_rows(chunks, fmt))
+            return {
+                "status": "success",
+                "data": resp,
+            }
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_user_except(e)
+
     async def update_user(self, payload: UserUpdateDTO):
         """
         Update an existing user's information.
@@ -207,15 +238,18 @@ class UserController:
             sentry_sdk.capture_exception(e)
             manage_user_except(e)
 
-    async def get_access_logs(self):
+    async def get_access_logs(self, filters: AccessLogFilterDTO = None):
         """
-        Retrieve a total user acces logs.
+        Retrieve a page of user acces logs.
+
+        Args:
+            filters (AccessLogFilterDTO): User, username, date-range and paging filters.
 
         Returns:
             AccessLog: List oc access logs.
         """
         try:
-            resp = await self.find_user_case.get_access_logs()
+            resp = await self.find_user_case.get_access_logs(filters)
             return {
                 "status": "success",
                 "data": resp,
@@ -224,6 +258,26 @@ class UserController:
             sentry_sdk.capture_exception(e)
             manage_user_except(e)
 
+    async def archive_access_logs(self):
+        """
+        Move the access logs older than the retention window to the archive.
+
+        Returns:
+            dict: Status, number of archived logs and the archive timestamp.
+        """
+        try:
+            resp = await self.archive_logs_case.archive()
+            return {
+                "status": "success",
+                "data": {
+                    "archived": resp.item_id,
+                    "archive_date": str(resp.event_date),
+                },
+            }
+        except HTTPException as e:
+            sentry_sdk.capture_exception(e)
+            manage_user_except(e)
+
     async def me(self, user_id: str):
         """
         Retrieve information about the current authenticated user.
@@ -10,15 +10,18 @@ associated with multiple users.
 from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
-from sqlmodel import Relationship, SQLModel, Field
+from sqlmodel import Index, Relationship, SQLModel, Field
 
 
 
 class CalendarActivity(SQLModel, table=True):
     __tablename__ = "calendar_activities"
+    __table_args__ = (
+        Index("ix_calendar_activities_course_id_date", "course_id", "date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    course_id: int = Field(foreign_key="courses.id", index=True)
+    course_id: int = Field(foreign_key="courses.id")
     date: datetime
     activity_name: str = Field(max_length=50)
     activity_type_id: Optional[int] = Field(default=None, foreign_key="activity_type.id")
@@ -16,5 +16,5 @@ class StudentClass(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="students.id", index=True)
-    class_id: int = Field(default=None, foreign_key="classes.id")
+    class_id: int = Field(default=None, foreign_key="classes.id", index=True)
     points: Optional[int] = 0
@@ -16,5 +16,5 @@ class SubjectClass(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     subject_id: int = Field(foreign_key="school_subjects.id", index=True) 
-    class_id: Optional[int] = Field(default=None, foreign_key="classes.id")
-    professor_id: Optional[int] = Field(default=None, foreign_key="teachers.id")
+    class_id: Optional[int] = Field(default=None, foreign_key="classes.id", index=True)
+    professor_id: Optional[int] = Field(default=None, foreign_key="teachers.id", index=True)
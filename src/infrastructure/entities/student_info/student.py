@@ -30,6 +30,7 @@ class Student(SQLModel, table=True):
             Integer,
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
+            index=True,
         )
     )
     observations: Optional[str] = Field(default=None, max_length=500)
@@ -8,7 +8,7 @@ user access information.
 """
 from datetime import datetime, timezone
 from typing import Optional
-from sqlmodel import Column, Field, ForeignKey, Integer, SQLModel
+from sqlmodel import Column, Field, ForeignKey, Index, Integer, SQLModel
 
 class AccessLog(SQLModel, table=True):
     """Database model for user access logs.
@@ -20,9 +20,17 @@ class AccessLog(SQLModel, table=True):
         acces_date (datetime): Timestamp of the access event.
         users (User): Relationship to the user entity.
 
+    The composite index on (user_id, acces_date) backs the per-user
+    date-range filters; the index on acces_date backs the global date-range
+    filter and the retention job.
+
     :author: Carlos S. Paredes Morillo
     """
     __tablename__ = "access_log"
+    __table_args__ = (
+        Index("ix_access_log_user_id_acces_date", "user_id", "acces_date"),
+        Index("ix_access_log_acces_date", "acces_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(
@@ -0,0 +1,36 @@
+"""
+Access Logs Archive Entity.
+
+Represents the `access_log_archive` table in the database, used to keep
+old access logs out of the hot `access_log` table. Each row holds one
+calendar month of access logs as a gzip-compressed JSON lines payload.
+
+:author: Carlos S. Paredes Morillo
+"""
+from datetime import date, datetime, timezone
+from typing import Optional
+from sqlmodel import Column, Field, LargeBinary, SQLModel
+
+
+class AccessLogArchive(SQLModel, table=True):
+    """Database model for archived access logs.
+
+    Attributes:
+        id (Optional[int]): Primary key, archive identifier.
+        period (date): First day of the archived month (unique).
+        entries (int): Number of access logs stored in the payload.
+        payload (bytes): Gzip-compressed JSON lines with the archived logs.
+        archived_at (datetime): Timestamp of the last archive run for the month.
+
+    :author: Carlos S. Paredes Morillo
+    """
+    __tablename__ = "access_log_archive"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    period: date = Field(nullable=False, sa_column_kwargs={"unique": True})
+    entries: int = Field(default=0, nullable=False)
+    payload: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    archived_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -28,6 +28,7 @@ class Teacher(SQLModel, table=True):
             Integer,
             ForeignKey("users.id", ondelete="CASCADE"),
             nullable=False,
+            index=True,
         )
     )
     user: User = Relationship()
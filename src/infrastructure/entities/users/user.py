@@ -29,6 +29,6 @@ class User(SQLModel, table=True):
         default_factory=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
-    last_used: Optional[datetime] = Field(default=None)
-    role_id: int = Field(default=None, foreign_key="roles.id")
+    last_used: Optional[datetime] = Field(default=None, index=True)
+    role_id: int = Field(default=None, foreign_key="roles.id", index=True)
 
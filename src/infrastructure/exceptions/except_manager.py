@@ -256,7 +256,12 @@ def manage_calendar_except(e: HTTPException):
     if e.status_code == status.HTTP_404_NOT_FOUND:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={"status": "error", "message": "Calendar Activity not found"},
+            detail={"status": "error", "message": e.detail},
+        )
+    if e.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail={"status": "error", "message": e.detail},
         )
     if e.status_code == status.HTTP_401_UNAUTHORIZED:
         raise HTTPException(
@@ -266,6 +271,11 @@ def manage_calendar_except(e: HTTPException):
                 "message": "Unauthorizad. Invalid Token or Expired",
             },
         )
+    if e.status_code == status.HTTP_403_FORBIDDEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"status": "error", "message": e.detail},
+        )
     raise HTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
     )
@@ -0,0 +1,35 @@
+"""
+Access log retention job.
+
+Moves every access log older than `ACCESS_LOG_RETENTION_MONTHS` complete
+months to the compressed `access_log_archive` table. Meant to be scheduled
+monthly (cron, Kubernetes CronJob, ...):
+
+    python -m src.infrastructure.jobs.access_log_retention
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+
+from src.container import Container
+
+
+async def run() -> int:
+    """
+    Run the access log retention policy once.
+
+    Returns:
+        int: Number of access logs moved to the archive.
+    """
+    container = Container()
+    try:
+        resp = await container.archive_access_logs_case().archive()
+        return resp.item_id
+    finally:
+        await container.database_engine().dispose()
+
+
+if __name__ == "__main__":
+    archived = asyncio.run(run())
+    print(f"Archived {archived} access logs")
@@ -0,0 +1,172 @@
+"""
+Query plan check.
+
+Runs EXPLAIN on the main query of each repository and flags the ones whose
+plan falls back to a sequential scan. Meant to be run against the seeded
+benchmark dataset, where the planner statistics are realistic:
+
+    python -m src.infrastructure.jobs.explain_check
+
+Exits with status 1 when at least one query is flagged.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from sqlmodel import func, select, text
+
+from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+from src.infrastructure.entities.course.class_common_activity import ClassCommonActivity
+from src.infrastructure.entities.course.school_subject import SchoolSubject
+from src.infrastructure.entities.course.student_class import StudentClass
+from src.infrastructure.entities.course.subject_class import SubjectClass
+from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.student_info.student_allergy import StudentAllergy
+from src.infrastructure.entities.users.accces_logs import AccessLog
+from src.infrastructure.entities.users.parents import Parent
+from src.infrastructure.entities.users.teacher import Teacher
+from src.infrastructure.entities.users.user import User
+
+_SINCE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_UNTIL = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+HOT_QUERIES: Dict[str, Callable] = {
+    "UserRepository.get_all_by_role": lambda: select(User).where(User.role_id == 4),
+    "UserRepository.get_user_by_username": lambda: select(User).where(
+        User.username == "username"
+    ),
+    "UserRepository.get_day_sessions": lambda: select(func.count())
+    .select_from(User)
+    .where(User.last_used >= _SINCE)
+    .where(User.last_used < _UNTIL),
+    "StudentRepository.create": lambda: select(Student).where(Student.user_id == 1),
+    "StudentRepository.get_student_full_info": lambda: select(AllergyInfo)
+    .join(StudentAllergy, StudentAllergy.allergies_info_id == AllergyInfo.id)
+    .where(StudentAllergy.students_user_id == 1),
+    "TeacherRepository.create": lambda: select(Teacher).where(Teacher.user_id == 1),
+    "TeacherRepository.get_teacher_full_info": lambda: select(SubjectClass, SchoolSubject)
+    .join(SchoolSubject, SubjectClass.subject_id == SchoolSubject.id)
+    .where(SubjectClass.professor_id == 1),
+    "ParentRepository.get": lambda: select(Parent).where(Parent.user_id == 1),
+    "ClassesRepository.get_by_id": lambda: select(SubjectClass).where(
+        SubjectClass.class_id == 1
+    ),
+    "StudentClassRepository.get_all": lambda: select(StudentClass).where(
+        StudentClass.class_id == 1
+    ),
+    "CalendarActivityRepository.get_all": lambda: select(CalendarActivity)
+    .where(CalendarActivity.course_id == 1)
+    .where(CalendarActivity.date >= _SINCE)
+    .where(CalendarActivity.date < _UNTIL),
+    "CalendarActivityRepository.get_by_class": lambda: select(CalendarActivity)
+    .join(
+        ClassCommonActivity,
+        ClassCommonActivity.calendar_activities_id == CalendarActivity.id,
+    )
+    .where(ClassCommonActivity.class_id == 1)
+    .where(CalendarActivity.date >= _SINCE)
+    .where(CalendarActivity.date < _UNTIL),
+    "AccessRepository.get_all[user]": lambda: select(AccessLog)
+    .where(AccessLog.user_id == 1)
+    .where(AccessLog.acces_date >= _SINCE)
+    .order_by(AccessLog.acces_date.desc()),
+    "AccessRepository.get_all[date]": lambda: select(AccessLog)
+    .where(AccessLog.acces_date >= _SINCE)
+    .where(AccessLog.acces_date < _UNTIL),
+}
+
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+def _render(conn, statement) -> str:
+    """Render a statement as plain SQL for the connection's dialect."""
+    return str(
+        statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    )
+
+
+def _postgres_seq_scans(plan: dict) -> List[str]:
+    """Collect the relations read with a Seq Scan anywhere in a JSON plan."""
+    scans = []
+    if plan.get("Node Type") == "Seq Scan":
+        scans.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        scans.extend(_postgres_seq_scans(child))
+    return scans
+
+
+async def explain(conn, statement) -> List[str]:
+    """
+    Explain a statement and return the tables it reads sequentially.
+
+    Args:
+        conn (AsyncConnection): Open connection to the database.
+        statement: SQLAlchemy statement to explain.
+
+    Returns:
+        List[str]: Names of the tables read with a full sequential scan.
+    """
+    if conn.dialect.name == "postgresql":
+        row = (
+            await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {_render(conn, statement)}")
+        ).scalar_one()
+        plan = json.loads(row) if isinstance(row, str) else row
+        return _postgres_seq_scans(plan[0]["Plan"])
+
+    rows = (
+        await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {_render(conn, statement)}")
+    ).all()
+    return [
+        match.group(1)
+        for match in (_SQLITE_FULL_SCAN.match(row[-1]) for row in rows)
+        if match
+    ]
+
+
+async def run_check(engine, queries: Dict[str, Callable] = HOT_QUERIES) -> Dict[str, List[str]]:
+    """
+    Explain every hot query and report the sequential scans.
+
+    Args:
+        engine (AsyncEngine): Engine connected to the seeded database.
+        queries (Dict[str, Callable]): Query factories keyed by repository method.
+
+    Returns:
+        Dict[str, List[str]]: Flagged queries with the tables they scan.
+    """
+    flagged = {}
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("ANALYZE"))
+        for name, build in queries.items():
+            scans = await explain(conn, build())
+            if scans:
+                flagged[name] = scans
+    return flagged
+
+
+async def main() -> int:
+    from src.infrastructure.connection.db import get_engine
+
+    engine = get_engine()
+    try:
+        flagged = await run_check(engine)
+    finally:
+        await engine.dispose()
+
+    for name in HOT_QUERIES:
+        scans = flagged.get(name)
+        status = f"SEQ SCAN on {', '.join(scans)}" if scans else "ok"
+        print(f"{name:<45} {status}")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
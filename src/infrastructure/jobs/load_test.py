@@ -0,0 +1,407 @@
+"""
+Load test.
+
+Drives the application with the traffic of a school day and reports the
+throughput and the p50/p95/p99 latency of every route:
+
+    python -m src.infrastructure.jobs.load_test parent-dashboard \\
+        --accounts accounts.json --users 50 --duration 30 \\
+        --save baselines/parent-dashboard.json
+
+By default the app of `src.main` is driven in process through ASGI, with
+its lifespan, against the database and Redis of the settings; the
+numbers then leave out the server and the network. With `--url` the
+requests go over HTTP to a running server instead (uvicorn, the compose
+stack), one keep-alive connection per virtual user.
+
+Scenarios, run in a loop by every virtual user until the duration ends:
+
+- `login-storm`: log in again and again, as everybody does at 8:00.
+- `teacher-roster`: a teacher refreshes their profile, a class and its
+  students.
+- `parent-dashboard`: a parent opens their profile, their children and
+  the calendar of their class.
+- `bulk-points`: a teacher awards a point to every student of a class.
+
+The accounts file gives the users the scenarios log in as and the ids
+they work on, per role:
+
+    {"teacher": [{"username": "t1", "password": "...", "teacher_id": 3,
+                  "class_ids": [1, 2]}],
+     "parent": [{"username": "p1", "password": "...", "user_id": 9,
+                 "student_ids": [4], "class_ids": [1]}]}
+
+`seed_dataset --accounts` writes it for the school it generates.
+
+`--compare` reads a saved baseline and exits with status 1 when the p95
+of a route got slower by more than `--tolerance`.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+LOGIN = "POST /auth/login"
+
+Response = Tuple[int, bytes]
+
+
+class ASGIClient:
+    """Sends requests straight to an ASGI application."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(
+        self, method: str, path: str, body: bytes = b"", headers: Dict[str, str] = None
+    ) -> Response:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+        }
+        sent = False
+        complete = asyncio.Event()
+        status = 500
+        chunks = []
+
+        async def receive():
+            nonlocal sent
+            if sent:
+                await complete.wait()
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    complete.set()
+
+        await self.app(scope, receive, send)
+        return status, b"".join(chunks)
+
+    async def close(self):
+        pass
+
+
+class HTTPClient:
+    """Minimal HTTP/1.1 client keeping one connection alive."""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = parts.scheme == "https"
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(
+        self, method: str, path: str, body: bytes = b"", headers: Dict[str, str] = None
+    ) -> Response:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl
+            )
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        lines += [f"{key}: {value}" for key, value in (headers or {}).items()]
+        lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        response_headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        if "content-length" in response_headers:
+            content = await self.reader.readexactly(int(response_headers["content-length"]))
+        elif response_headers.get("transfer-encoding") == "chunked":
+            content = await self._read_chunks()
+        else:
+            content = await self.reader.read()
+            await self.close()
+        if response_headers.get("connection") == "close":
+            await self.close()
+        return status, content
+
+    async def _read_chunks(self) -> bytes:
+        chunks = []
+        while size := int((await self.reader.readline()).split(b";")[0], 16):
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+        await self.reader.readline()
+        return b"".join(chunks)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+class Recorder:
+    """Latencies and statuses of the requests, per route."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+
+    def record(self, route: str, status: int, elapsed: float):
+        self.latencies[route].append(elapsed)
+        if status >= 400:
+            self.errors[route] += 1
+
+    def report(self, duration: float) -> Dict[str, dict]:
+        """Throughput and latency percentiles in milliseconds per route."""
+        report = {}
+        for route, latencies in sorted(self.latencies.items()):
+            latencies = sorted(latencies)
+            report[route] = {
+                "requests": len(latencies),
+                "errors": self.errors[route],
+                "rps": round(len(latencies) / duration, 2),
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+                "max_ms": round(latencies[-1] * 1000, 2),
+            }
+        return report
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of sorted seconds, in milliseconds."""
+    index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+    return round(ordered[index] * 1000, 2)
+
+
+class Session:
+    """Requests of one virtual user, authenticated once logged in."""
+
+    def __init__(self, client, recorder: Recorder):
+        self.client = client
+        self.recorder = recorder
+        self.token: Optional[str] = None
+
+    async def call(self, method: str, template: str, payload=None, **ids) -> Tuple[int, object]:
+        headers = {}
+        body = b""
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+            body = json.dumps(payload).encode()
+        started = time.perf_counter()
+        status, content = await self.client.request(
+            method, template.format(**ids), body, headers
+        )
+        self.recorder.record(f"{method} {template}", status, time.perf_counter() - started)
+        try:
+            return status, json.loads(content) if content else None
+        except ValueError:
+            return status, None
+
+    async def login(self, account: dict):
+        status, data = await self.call(
+            "POST",
+            "/auth/login",
+            {"username": account["username"], "password": account["password"]},
+        )
+        self.token = data["access_token"] if status == 200 else None
+
+    async def ensure_login(self, account: dict):
+        if self.token is None:
+            await self.login(account)
+
+
+async def login_storm(session: Session, account: dict):
+    session.token = None
+    await session.login(account)
+    await session.call("GET", "/users/me")
+
+
+async def teacher_roster(session: Session, account: dict):
+    await session.ensure_login(account)
+    class_id = random.choice(account["class_ids"])
+    await session.call("GET", "/teachers/{teacher_id}", teacher_id=account["teacher_id"])
+    await session.call("GET", "/classes/{class_id}", class_id=class_id)
+    await session.call("GET", "/student_classes/{class_id}/all", class_id=class_id)
+
+
+async def parent_dashboard(session: Session, account: dict):
+    await session.ensure_login(account)
+    await session.call("GET", "/users/me")
+    await session.call("GET", "/parents/{user_id}", user_id=account["user_id"])
+    for student_id in account["student_ids"]:
+        await session.call("GET", "/students/{student_id}/find", student_id=student_id)
+    for class_id in account["class_ids"]:
+        await session.call("GET", "/calendar/class/{class_id}", class_id=class_id)
+
+
+async def bulk_points(session: Session, account: dict):
+    await session.ensure_login(account)
+    class_id = random.choice(account["class_ids"])
+    status, data = await session.call(
+        "GET", "/student_classes/{class_id}/all", class_id=class_id
+    )
+    if status != 200:
+        return
+    for row in data["data"]:
+        row["points"] = (row.get("points") or 0) + 1
+        await session.call("PUT", "/student_classes/", row)
+
+
+Scenario = Callable[[Session, dict], Awaitable[None]]
+
+SCENARIOS: Dict[str, Tuple[Scenario, Tuple[str, ...]]] = {
+    "login-storm": (login_storm, ("teacher", "parent")),
+    "teacher-roster": (teacher_roster, ("teacher",)),
+    "parent-dashboard": (parent_dashboard, ("parent",)),
+    "bulk-points": (bulk_points, ("teacher",)),
+}
+
+
+async def run_scenario(
+    scenario: Scenario,
+    accounts: List[dict],
+    users: int,
+    duration: float,
+    client_factory: Callable,
+    think: float = 0.0,
+) -> Tuple[Recorder, float]:
+    """
+    Run `users` virtual users through a scenario for `duration` seconds.
+
+    Returns:
+        Tuple[Recorder, float]: The recorded requests and the elapsed time.
+    """
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def virtual_user(account: dict):
+        client = client_factory()
+        session = Session(client, recorder)
+        try:
+            while time.perf_counter() < deadline:
+                await scenario(session, account)
+                # Also lets the other users in when the app never waits.
+                await asyncio.sleep(random.uniform(0, 2 * think) if think else 0)
+        finally:
+            await client.close()
+
+    await asyncio.gather(*(virtual_user(accounts[i % len(accounts)]) for i in range(users)))
+    return recorder, time.perf_counter() - started
+
+
+def compare(report: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Routes whose p95 exceeds the baseline by more than `tolerance`."""
+    regressions = []
+    for route, stats in report.items():
+        before = baseline.get(route)
+        if before and stats["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{route}: p95 {before['p95_ms']} ms -> {stats['p95_ms']} ms"
+            )
+    return regressions
+
+
+def print_report(report: Dict[str, dict]):
+    print(
+        f"{'route':<40}{'requests':>9}{'errors':>7}{'rps':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for route, stats in report.items():
+        print(
+            f"{route:<40}{stats['requests']:>9}{stats['errors']:>7}{stats['rps']:>9}"
+            f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+        )
+
+
+async def main(args) -> int:
+    scenario, roles = SCENARIOS[args.scenario]
+    catalog = json.loads(Path(args.accounts).read_text())
+    accounts = [account for role in roles for account in catalog.get(role, [])]
+    if not accounts:
+        print(f"{args.scenario}: the accounts file has no {' or '.join(roles)} account")
+        return 1
+    random.seed(args.seed)
+
+    if args.url:
+        recorder, elapsed = await run_scenario(
+            scenario, accounts, args.users, args.duration, lambda: HTTPClient(args.url), args.think
+        )
+    else:
+        from src.main import app
+
+        client = ASGIClient(app)
+        async with app.router.lifespan_context(app):
+            recorder, elapsed = await run_scenario(
+                scenario, accounts, args.users, args.duration, lambda: client, args.think
+            )
+
+    report = recorder.report(elapsed)
+    print_report(report)
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.save).write_text(
+            json.dumps(
+                {
+                    "scenario": args.scenario,
+                    "target": args.url or "asgi",
+                    "users": args.users,
+                    "duration": round(elapsed, 2),
+                    "recorded_at": datetime.now(timezone.utc).isoformat(),
+                    "routes": report,
+                },
+                indent=2,
+            )
+        )
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["routes"]
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--accounts", required=True, help="JSON accounts file")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--think", type=float, default=0.0, help="mean pause in seconds")
+    parser.add_argument("--url", help="base URL of a running server, in process if omitted")
+    parser.add_argument("--save", help="write the report as a JSON baseline")
+    parser.add_argument("--compare", help="baseline to compare the p95 latencies with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
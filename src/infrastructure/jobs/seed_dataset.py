@@ -0,0 +1,436 @@
+"""
+Synthetic school dataset.
+
+Generates a school with realistic volumes for benchmarks: users of every
+role, students with their parents, allergies, intolerances and medical
+conditions, one course of classes with their subjects and teachers, a
+calendar, the activities and scores of every subject, and a year of
+access logs. The same size and seed always produce the same rows, so
+benchmark runs against two builds compare like with like:
+
+    python -m src.infrastructure.jobs.seed_dataset --size medium --seed 42 \\
+        --accounts accounts.json
+
+The rows are built from the entity models with explicit ids and written
+table by table, with `COPY` on psycopg and batched inserts elsewhere, into
+the database of the settings or `--database-url`. The schema must exist:
+run the migrations first, or pass `--create-schema` to migrate the
+database to the head revision before loading it. Every user can log in with `PASSWORD`, and
+`--accounts` writes the accounts file read by the load test.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.application.services.password_service import PasswordService
+from src.infrastructure.connection.db import upgrade_schema
+from src.infrastructure.entities.course.activity_type import ActivityType
+from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+from src.infrastructure.entities.course.class_common_activity import ClassCommonActivity
+from src.infrastructure.entities.course.classes import Classes
+from src.infrastructure.entities.course.course import Course
+from src.infrastructure.entities.course.school_subject import SchoolSubject
+from src.infrastructure.entities.course.student_class import StudentClass
+from src.infrastructure.entities.course.subject_activity import SubjectActivity
+from src.infrastructure.entities.course.subject_activity_score import SubjectActivityScore
+from src.infrastructure.entities.course.subject_class import SubjectClass
+from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
+from src.infrastructure.entities.student_info.food_intolerance import FoodIntolerance
+from src.infrastructure.entities.student_info.medical_info import MedicalInfo
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.student_info.student_allergy import StudentAllergy
+from src.infrastructure.entities.student_info.student_intolerance import StudentIntolerance
+from src.infrastructure.entities.student_info.student_medical_info import StudentMedicalInfo
+from src.infrastructure.entities.users.accces_logs import AccessLog
+from src.infrastructure.entities.users.parents import Parent
+from src.infrastructure.entities.users.roles import Role
+from src.infrastructure.entities.users.teacher import Teacher
+from src.infrastructure.entities.users.user import User
+from src.settings import settings
+
+PASSWORD = "apprendre"
+ADMIN, TEACHER, STUDENT, PARENT = 1, 2, 3, 4
+ROLES = {ADMIN: "admin", TEACHER: "teacher", STUDENT: "student", PARENT: "parent"}
+
+FIRST_NAMES = (
+    "Lucía", "Hugo", "Martina", "Mateo", "Sofía", "Leo", "Julia", "Daniel", "Paula",
+    "Álvaro", "Valeria", "Pablo", "Emma", "Manuel", "Daniela", "Adrián", "Carla",
+    "Mario", "Sara", "Diego", "Alba", "Javier", "Noa", "Marcos", "Claudia",
+)
+LAST_NAMES = (
+    "García", "Rodríguez", "González", "Fernández", "López", "Martínez", "Sánchez",
+    "Pérez", "Gómez", "Martín", "Jiménez", "Ruiz", "Hernández", "Díaz", "Moreno",
+    "Muñoz", "Álvarez", "Romero", "Alonso", "Gutiérrez", "Navarro", "Torres",
+)
+SUBJECTS = (
+    "Mathematics", "Spanish", "English", "French", "Science", "History", "Geography",
+    "Music", "Art", "Physical Education", "Technology", "Religion", "Values",
+)
+ACTIVITY_TYPES = ("exam", "homework", "project", "excursion", "meeting", "festival")
+ALLERGIES = ("Peanuts", "Tree nuts", "Egg", "Milk", "Shellfish", "Fish", "Pollen", "Latex")
+INTOLERANCES = ("Lactose", "Gluten", "Fructose", "Histamine")
+CONDITIONS = ("Asthma", "Type 1 diabetes", "Epilepsy", "ADHD", "Celiac disease")
+
+ALLERGY_RATE = 0.12
+INTOLERANCE_RATE = 0.08
+MEDICAL_RATE = 0.06
+SIBLING_RATE = 0.15
+# Probability that a user of the role logs in on a school day.
+LOGIN_RATE = {ADMIN: 0.9, TEACHER: 0.85, STUDENT: 0.4, PARENT: 0.25}
+
+
+@dataclass(frozen=True)
+class SchoolSize:
+    """Volumes of a generated school."""
+
+    classes: int
+    students_per_class: int
+    teachers: int
+    subjects_per_class: int
+    activities_per_subject: int
+    calendar_activities: int
+    access_log_days: int
+    admins: int = 2
+
+
+SIZES = {
+    "tiny": SchoolSize(2, 5, 3, 3, 2, 10, 14),
+    "small": SchoolSize(6, 20, 10, 6, 4, 60, 120),
+    "medium": SchoolSize(24, 25, 40, 8, 6, 150, 365),
+    "large": SchoolSize(60, 28, 100, 10, 8, 300, 365),
+}
+
+
+@dataclass
+class Dataset:
+    """Rows per entity, in insertion order, and the login accounts."""
+
+    rows: Dict[type, List[dict]] = field(default_factory=dict)
+    accounts: Dict[str, List[dict]] = field(default_factory=dict)
+
+    def counts(self) -> Dict[str, int]:
+        return {model.__tablename__: len(rows) for model, rows in self.rows.items()}
+
+
+def generate(size: SchoolSize, seed: int = 0, year: int = 2025) -> Dataset:
+    """
+    Build the rows of a school.
+
+    Args:
+        size (SchoolSize): Volumes to generate.
+        seed (int): Seed of the generator; the same seed gives the same rows.
+        year (int): Year the course starts, in September.
+
+    Returns:
+        Dataset: The rows and the accounts of the school.
+    """
+    rng = random.Random(seed)
+    starts = datetime(year, 9, 8, tzinfo=timezone.utc)
+    ends = datetime(year + 1, 6, 23, tzinfo=timezone.utc)
+    password = PasswordService().hash_password(PASSWORD)
+    data = Dataset()
+    data.rows[Role] = [{"id": role_id, "role_name": name} for role_id, name in ROLES.items()]
+    users = data.rows[User] = []
+
+    def add_user(role_id: int) -> dict:
+        number = len(users) + 1
+        username = f"{ROLES[role_id]}{number}"
+        user = {
+            "id": number,
+            "username": username,
+            "name": rng.choice(FIRST_NAMES),
+            "last_name": f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": f"{username}@apprendre.test",
+            "phone": 600000000 + number,
+            "dni": f"{number:08d}{'TRWAGMYFPDXBNJZSQVHLCKE'[number % 23]}",
+            "password": password,
+            "create_time": starts - timedelta(days=7),
+            "last_used": None,
+            "role_id": role_id,
+        }
+        users.append(user)
+        return user
+
+    admins = [add_user(ADMIN) for _ in range(size.admins)]
+    teacher_users = [add_user(TEACHER) for _ in range(size.teachers)]
+    data.rows[Teacher] = [
+        {"id": i, "user_id": user["id"], "create_time": user["create_time"]}
+        for i, user in enumerate(teacher_users, start=1)
+    ]
+    student_count = size.classes * size.students_per_class
+    student_users = [add_user(STUDENT) for _ in range(student_count)]
+    data.rows[Student] = [
+        {
+            "id": i,
+            "user_id": user["id"],
+            "create_time": user["create_time"],
+            "observations": None,
+        }
+        for i, user in enumerate(student_users, start=1)
+    ]
+
+    # One or two parents per student; some students are siblings and
+    # share the parents of the previous one.
+    parents = data.rows[Parent] = []
+    children: Dict[int, List[int]] = {}
+    family: List[int] = []
+    for student_id in range(1, student_count + 1):
+        if not family or rng.random() >= SIBLING_RATE:
+            family = [add_user(PARENT)["id"] for _ in range(rng.choice((1, 2, 2)))]
+        for user_id in family:
+            parents.append({"id": len(parents) + 1, "user_id": user_id, "student_id": student_id})
+            children.setdefault(user_id, []).append(student_id)
+
+    data.rows[Course] = [{"id": 1, "year": year, "from_date": starts, "to_date": ends}]
+    data.rows[Classes] = [
+        {
+            "id": class_id,
+            "course_id": 1,
+            "name": f"{(class_id - 1) // 2 + 1}º {'AB'[(class_id - 1) % 2]}",
+            "tutor_id": (class_id - 1) % size.teachers + 1,
+        }
+        for class_id in range(1, size.classes + 1)
+    ]
+    data.rows[SchoolSubject] = [
+        {"id": i, "name": name, "description": f"{name} lessons"}
+        for i, name in enumerate(SUBJECTS, start=1)
+    ]
+
+    subject_classes = data.rows[SubjectClass] = []
+    teacher_classes: Dict[int, set] = {}
+    for class_id in range(1, size.classes + 1):
+        for subject_id in rng.sample(range(1, len(SUBJECTS) + 1), size.subjects_per_class):
+            professor_id = rng.randint(1, size.teachers)
+            teacher_classes.setdefault(professor_id, set()).add(class_id)
+            subject_classes.append(
+                {
+                    "id": len(subject_classes) + 1,
+                    "subject_id": subject_id,
+                    "class_id": class_id,
+                    "professor_id": professor_id,
+                }
+            )
+
+    class_of = {
+        student_id: (student_id - 1) // size.students_per_class + 1
+        for student_id in range(1, student_count + 1)
+    }
+    data.rows[StudentClass] = [
+        {"id": student_id, "student_id": student_id, "class_id": class_id, "points": rng.randint(0, 50)}
+        for student_id, class_id in class_of.items()
+    ]
+
+    data.rows[AllergyInfo] = _catalog(ALLERGIES)
+    data.rows[FoodIntolerance] = _catalog(INTOLERANCES)
+    data.rows[MedicalInfo] = [
+        {"id": i, "name": name, "description": f"{name} protocol", "medication": None}
+        for i, name in enumerate(CONDITIONS, start=1)
+    ]
+    data.rows[StudentAllergy] = _links(
+        rng, student_count, ALLERGY_RATE, len(ALLERGIES), "allergies_info_id"
+    )
+    data.rows[StudentIntolerance] = _links(
+        rng, student_count, INTOLERANCE_RATE, len(INTOLERANCES), "food_intolerance_id"
+    )
+    data.rows[StudentMedicalInfo] = _links(
+        rng, student_count, MEDICAL_RATE, len(CONDITIONS), "medical_info_id"
+    )
+
+    data.rows[ActivityType] = [
+        {"id": i, "activity_name": name} for i, name in enumerate(ACTIVITY_TYPES, start=1)
+    ]
+    school_days = _school_days(starts, ends)
+    calendar = data.rows[CalendarActivity] = []
+    common = data.rows[ClassCommonActivity] = []
+    for activity_id in range(1, size.calendar_activities + 1):
+        type_id = rng.randint(1, len(ACTIVITY_TYPES))
+        day = rng.choice(school_days)
+        calendar.append(
+            {
+                "id": activity_id,
+                "course_id": 1,
+                "date": datetime.combine(day, time(rng.randint(9, 16)), timezone.utc),
+                "activity_name": f"{ACTIVITY_TYPES[type_id - 1].capitalize()} {activity_id}",
+                "activity_type_id": type_id,
+            }
+        )
+        for class_id in rng.sample(range(1, size.classes + 1), rng.randint(1, size.classes)):
+            common.append({"class_id": class_id, "calendar_activities_id": activity_id})
+
+    activities = data.rows[SubjectActivity] = []
+    scores = data.rows[SubjectActivityScore] = []
+    students_of: Dict[int, List[int]] = {}
+    for student_id, class_id in class_of.items():
+        students_of.setdefault(class_id, []).append(student_id)
+    for subject_class in subject_classes:
+        for n in range(size.activities_per_subject):
+            activity_id = len(activities) + 1
+            activities.append(
+                {
+                    "id": activity_id,
+                    "subject_class_id": subject_class["id"],
+                    "subject_id": subject_class["subject_id"],
+                    "create_time": datetime.combine(
+                        rng.choice(school_days), time(10), timezone.utc
+                    ),
+                    "name": f"{SUBJECTS[subject_class['subject_id'] - 1]} task {n + 1}",
+                    "activity_type_id": rng.randint(1, 3),
+                }
+            )
+            for student_id in students_of[subject_class["class_id"]]:
+                scores.append(
+                    {
+                        "id": len(scores) + 1,
+                        "subject_activity_id": activity_id,
+                        "student_id": student_id,
+                        "note": round(min(10.0, max(0.0, rng.gauss(6.5, 1.8))), 1),
+                    }
+                )
+
+    logs = data.rows[AccessLog] = []
+    for day in school_days[-size.access_log_days:]:
+        for user in users:
+            if rng.random() < LOGIN_RATE[user["role_id"]]:
+                moment = datetime.combine(day, time(7), timezone.utc) + timedelta(
+                    seconds=rng.randint(0, 12 * 3600)
+                )
+                logs.append(
+                    {
+                        "id": len(logs) + 1,
+                        "user_id": user["id"],
+                        "username": user["username"],
+                        "acces_date": moment,
+                    }
+                )
+                user["last_used"] = moment
+
+    data.accounts = {
+        "admin": [_account(user) for user in admins],
+        "teacher": [
+            {
+                **_account(user),
+                "teacher_id": teacher_id,
+                "class_ids": sorted(teacher_classes.get(teacher_id, {1})),
+            }
+            for teacher_id, user in enumerate(teacher_users, start=1)
+        ],
+        "parent": [
+            {
+                **_account(users[user_id - 1]),
+                "student_ids": student_ids,
+                "class_ids": sorted({class_of[student_id] for student_id in student_ids}),
+            }
+            for user_id, student_ids in children.items()
+        ],
+    }
+    return data
+
+
+def _catalog(names) -> List[dict]:
+    return [
+        {"id": i, "name": name, "description": None} for i, name in enumerate(names, start=1)
+    ]
+
+
+def _links(rng: random.Random, students: int, rate: float, choices: int, column: str):
+    return [
+        {"students_user_id": student_id, column: item_id}
+        for student_id in range(1, students + 1)
+        if rng.random() < rate
+        for item_id in rng.sample(range(1, choices + 1), rng.choice((1, 1, 2)))
+    ]
+
+
+def _school_days(starts: datetime, ends: datetime) -> List[date]:
+    days = []
+    day = starts.date()
+    while day <= ends.date():
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def _account(user: dict) -> dict:
+    return {"username": user["username"], "password": PASSWORD, "user_id": user["id"]}
+
+
+async def load(engine, dataset: Dataset, batch_size: int = 5000):
+    """
+    Write a dataset into an empty database.
+
+    Args:
+        engine (AsyncEngine): Engine of the target database.
+        dataset (Dataset): Rows returned by `generate`.
+        batch_size (int): Rows per insert statement outside of COPY.
+    """
+    async with engine.begin() as conn:
+        copy = conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg"
+        for model, rows in dataset.rows.items():
+            if not rows:
+                continue
+            if copy:
+                await _copy(conn, model.__tablename__, rows)
+                continue
+            for start in range(0, len(rows), batch_size):
+                await conn.execute(insert(model.__table__), rows[start:start + batch_size])
+        if conn.dialect.name == "postgresql":
+            # Ids were given explicitly: move the sequences past them.
+            for model, rows in dataset.rows.items():
+                if rows and "id" in rows[0]:
+                    table = model.__tablename__
+                    await conn.execute(
+                        text(
+                            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                            f"(SELECT max(id) FROM {table}))"
+                        )
+                    )
+
+
+async def _copy(conn, table: str, rows: List[dict]):
+    columns = list(rows[0])
+    raw = await conn.get_raw_connection()
+    async with raw.driver_connection.cursor() as cursor:
+        async with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                await copy.write_row([row[column] for column in columns])
+
+
+async def main(args) -> int:
+    dataset = generate(SIZES[args.size], seed=args.seed, year=args.year)
+    database_url = args.database_url or settings.database_url
+    if args.create_schema:
+        await asyncio.to_thread(upgrade_schema, database_url)
+    engine = create_async_engine(database_url)
+    try:
+        await load(engine, dataset, args.batch_size)
+    finally:
+        await engine.dispose()
+    for table, count in dataset.counts().items():
+        print(f"{table:<28}{count:>10}")
+    if args.accounts:
+        Path(args.accounts).write_text(json.dumps(dataset.accounts, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", choices=list(SIZES), default="medium")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--year", type=int, default=2025, help="year the course starts")
+    parser.add_argument("--database-url", help="target database, the settings one by default")
+    parser.add_argument("--create-schema", action="store_true", help="run the migrations first")
+    parser.add_argument("--accounts", help="write the load test accounts to this file")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,181 @@
+"""
+List serialization benchmark.
+
+Compares, on synthetic rows, the way list endpoints used to encode their
+DTOs (`jsonable_encoder`, then `json`) with `FastJSONResponse` and a typed
+response model. The fast path is also timed with DTOs built by
+`model_construct` instead of being validated, which is slower in pydantic
+2 than the compiled validator and is why repositories keep validating:
+
+    python -m src.infrastructure.jobs.serialization_benchmark --rows 10000
+
+Every path must produce the same JSON; the job fails otherwise.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.domain.objects.common.data_response import DataResponse
+from src.domain.objects.profiles.parent_info import ParentDTO
+from src.domain.objects.profiles.teacher_dto import TeacherDTO
+from src.domain.objects.subject_dto import SubjectDTO
+from src.domain.objects.user.user_dto import UserDTO
+from src.infrastructure.entities.users.user import User
+from src.middleware.serialization.fast_json import FastJSONResponse
+
+SUBJECTS_PER_TEACHER = 3
+STUDENTS_PER_PARENT = 2
+
+
+def make_users(rows: int) -> List[User]:
+    """Build synthetic user rows as the repositories read them."""
+    return [
+        User(
+            id=i,
+            username=f"user{i}",
+            name=f"Name {i}",
+            last_name=f"Last name {i}",
+            email=f"user{i}@apprendre.test",
+            phone=600000000 + i,
+            dni=f"{i:08d}A",
+            role_id=i % 4 + 1,
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def user_dtos(users: List[User], build: Callable) -> List[UserDTO]:
+    return [
+        build(
+            UserDTO,
+            user_id=user.id,
+            username=user.username,
+            name=user.name,
+            last_name=user.last_name,
+            phone=user.phone,
+            email=user.email,
+            dni=user.dni,
+            role=user.role_id,
+        )
+        for user in users
+    ]
+
+
+def teacher_dtos(users: List[User], build: Callable) -> List[TeacherDTO]:
+    return [
+        build(
+            TeacherDTO,
+            user_id=user.id,
+            teacher_id=user.id,
+            name=user.name,
+            last_name=user.last_name,
+            dni=user.dni,
+            phone=user.phone,
+            email=user.email,
+            username=user.username,
+            subjects=[
+                build(
+                    SubjectDTO,
+                    subject_id=s,
+                    subject_name=f"Subject {s}",
+                    subject_class=user.id % 40,
+                    description="Weekly sessions",
+                )
+                for s in range(SUBJECTS_PER_TEACHER)
+            ],
+        )
+        for user in users
+    ]
+
+
+def parent_dtos(users: List[User], build: Callable) -> List[ParentDTO]:
+    return [
+        build(
+            ParentDTO,
+            user_id=user.id,
+            name=user.name,
+            last_name=user.last_name,
+            phone=user.phone,
+            email=user.email,
+            students=[user.id * STUDENTS_PER_PARENT + s for s in range(STUDENTS_PER_PARENT)],
+        )
+        for user in users
+    ]
+
+
+def validated(model, **fields):
+    return model(**fields)
+
+
+def constructed(model, **fields):
+    return model.model_construct(**fields)
+
+
+def current_path(users: List[User], dtos: Callable, model) -> bytes:
+    data = dtos(users, validated)
+    return JSONResponse(jsonable_encoder({"status": "success", "data": data})).body
+
+
+def fast_path(users: List[User], dtos: Callable, model) -> bytes:
+    data = dtos(users, validated)
+    return FastJSONResponse({"status": "success", "data": data}, model).body
+
+
+def constructed_path(users: List[User], dtos: Callable, model) -> bytes:
+    data = dtos(users, constructed)
+    return FastJSONResponse({"status": "success", "data": data}, model).body
+
+
+def best_of(repeat: int, run: Callable[[], bytes]) -> Tuple[float, bytes]:
+    """Return the fastest of `repeat` runs in milliseconds and its output."""
+    best, body = float("inf"), b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, body
+
+
+CASES: Dict[str, Tuple[Callable, object]] = {
+    "users": (user_dtos, DataResponse[List[UserDTO]]),
+    "teachers": (teacher_dtos, DataResponse[List[TeacherDTO]]),
+    "parents": (parent_dtos, DataResponse[List[ParentDTO]]),
+}
+
+
+def main(rows: int, repeat: int) -> int:
+    users = make_users(rows)
+    print(
+        f"{'list':<10}{'rows':>8}{'current ms':>12}{'fast ms':>10}"
+        f"{'construct ms':>14}{'speedup':>9}"
+    )
+    for name, (dtos, model) in CASES.items():
+        current_ms, expected = best_of(repeat, lambda: current_path(users, dtos, model))
+        fast_ms, body = best_of(repeat, lambda: fast_path(users, dtos, model))
+        constructed_ms, constructed_body = best_of(
+            repeat, lambda: constructed_path(users, dtos, model)
+        )
+        expected = json.loads(expected)
+        if json.loads(body) != expected or json.loads(constructed_body) != expected:
+            print(f"{name}: fast path output differs from the current path")
+            return 1
+        print(
+            f"{name:<10}{rows:>8}{current_ms:>12.1f}{fast_ms:>10.1f}"
+            f"{constructed_ms:>14.1f}{current_ms / fast_ms:>8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    raise SystemExit(main(args.rows, args.repeat))
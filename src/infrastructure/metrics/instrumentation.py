@@ -0,0 +1,150 @@
+"""
+Database and Redis instrumentation.
+
+Records how long SQL statements and Redis commands take into the metrics
+registry. SQL statements are timed with the SQLAlchemy cursor events of
+the engine returned by `get_engine()`, which also feed the query log and
+the Server-Timing of the current request, and the connection pool is sampled only when the
+metrics are scraped. Redis commands are timed by wrapping the
+`execute_command` and `pipeline` methods of a client instance.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import functools
+import time
+
+from sqlalchemy import event
+
+from src.infrastructure.metrics.query_log import record_query
+from src.infrastructure.metrics.registry import FAST_BUCKETS, MetricsRegistry
+from src.infrastructure.metrics.server_timing import DB, REDIS, add_timing
+from src.infrastructure.metrics.slow_queries import is_explain
+
+QUERY_START = "metrics_query_start"
+
+
+def statement_verb(statement: str) -> str:
+    """Return the leading keyword of a SQL statement, e.g. `SELECT`."""
+    head = statement.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def instrument_engine(engine, metrics: MetricsRegistry):
+    """
+    Time every SQL statement executed through an engine.
+
+    The EXPLAIN statements of the slow query log are not application
+    queries and are left out.
+
+    Args:
+        engine (AsyncEngine): Engine returned by `get_engine()`.
+        metrics (MetricsRegistry): Registry receiving the timings.
+
+    Returns:
+        AsyncEngine: The same engine.
+    """
+    duration = metrics.histogram(
+        "apprendre_db_query_duration_seconds",
+        "SQL statement execution time.",
+        ("statement",),
+        buckets=FAST_BUCKETS,
+    )
+    errors = metrics.counter(
+        "apprendre_db_query_errors", "SQL statements that raised.", ("statement",)
+    )
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(QUERY_START, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[QUERY_START].pop()
+        if is_explain(statement):
+            return
+        duration.observe(elapsed, statement_verb(statement))
+        record_query(statement, parameters, elapsed)
+        add_timing(DB, elapsed)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def failed(context):
+        starts = context.connection.info.get(QUERY_START) if context.connection else None
+        if starts:
+            starts.pop()
+        if not is_explain(context.statement or ""):
+            errors.inc(statement_verb(context.statement or ""))
+
+    return engine
+
+
+def collect_pool(engine, metrics: MetricsRegistry):
+    """
+    Sample the connection pool usage of an engine into the registry.
+
+    Args:
+        engine (AsyncEngine): Engine returned by `get_engine()`.
+        metrics (MetricsRegistry): Registry receiving the gauges.
+    """
+    pool = engine.sync_engine.pool
+    usage = metrics.gauge(
+        "apprendre_db_pool_connections", "Database pool connections by state.", ("state",)
+    )
+    for state in ("size", "checkedin", "checkedout", "overflow"):
+        sample = getattr(pool, state, None)
+        if sample is not None:
+            usage.set(sample(), state)
+
+
+def instrument_redis(client, metrics: MetricsRegistry):
+    """
+    Time every command sent through a Redis client.
+
+    A pipeline is timed as a single `PIPELINE` command when executed.
+
+    Args:
+        client (redis.Redis): Asynchronous Redis client.
+        metrics (MetricsRegistry): Registry receiving the timings.
+
+    Returns:
+        redis.Redis: The same client.
+    """
+    duration = metrics.histogram(
+        "apprendre_redis_command_duration_seconds",
+        "Redis command round-trip time.",
+        ("command",),
+        buckets=FAST_BUCKETS,
+    )
+    errors = metrics.counter(
+        "apprendre_redis_command_errors", "Redis commands that raised.", ("command",)
+    )
+
+    def timed(command: str, call):
+        @functools.wraps(call)
+        async def wrapper(*args, **kwargs):
+            name = command or str(args[0]).upper()
+            started = time.perf_counter()
+            try:
+                return await call(*args, **kwargs)
+            except Exception:
+                errors.inc(name)
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                duration.observe(elapsed, name)
+                add_timing(REDIS, elapsed)
+
+        return wrapper
+
+    pipeline = client.pipeline
+
+    @functools.wraps(pipeline)
+    def timed_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        pipe.execute = timed("PIPELINE", pipe.execute)
+        return pipe
+
+    client.execute_command = timed("", client.execute_command)
+    client.pipeline = timed_pipeline
+    return client
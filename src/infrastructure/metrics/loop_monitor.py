@@ -0,0 +1,113 @@
+"""
+Event Loop Monitor.
+
+Measures how late the event loop runs a task that sleeps for a fixed
+interval. The lag is the time the loop spent running something else
+without yielding: synchronous password hashing, the validation of a large
+payload or any blocking call in a coroutine delays every request of the
+worker by that much. It is exported as the
+`apprendre_event_loop_lag_seconds` histogram.
+
+In debug mode (`LOOP_DEBUG`), a watchdog thread also checks that the
+monitor keeps running; when the loop has not come back for longer than
+the blocking threshold, it takes the stack of the loop thread, which is
+the code blocking it, and reports it to Sentry with the blocking time
+once the loop resumes.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+import sentry_sdk
+
+from src.infrastructure.metrics.registry import FAST_BUCKETS, MetricsRegistry
+
+
+def report_blocking(duration: float, stack: str):
+    """Send a blocking step of the event loop to Sentry."""
+    with sentry_sdk.new_scope() as scope:
+        scope.set_context("event_loop", {"blocked_ms": round(duration * 1000, 1), "stack": stack})
+        sentry_sdk.capture_message(
+            f"Event loop blocked for {duration * 1000:.0f} ms", level="warning"
+        )
+
+
+class LoopMonitor:
+    """Event loop lag probe with an optional blocking-step watchdog."""
+
+    def __init__(
+        self,
+        metrics: MetricsRegistry,
+        interval_ms: float = 250,
+        block_threshold_ms: float = 100,
+        capture_stacks: bool = False,
+        on_block: Callable[[float, str], None] = report_blocking,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            metrics (MetricsRegistry): Registry receiving the lag.
+            interval_ms (float): Time between two probes.
+            block_threshold_ms (float): Time without the loop coming back
+                from which the watchdog takes the stack.
+            capture_stacks (bool): Run the watchdog.
+            on_block (Callable[[float, str], None]): Receives the blocking
+                time and the formatted stack, from the watchdog thread.
+        """
+        self.interval = interval_ms / 1000
+        self.block_threshold = block_threshold_ms / 1000
+        self.capture_stacks = capture_stacks
+        self.on_block = on_block
+        self.lag = metrics.histogram(
+            "apprendre_event_loop_lag_seconds",
+            "Delay of the event loop in running a ready task.",
+            buckets=FAST_BUCKETS,
+        )
+        self._beat = time.perf_counter()
+        self._stop = threading.Event()
+
+    async def run(self):
+        """Probe the loop until cancelled."""
+        watchdog = None
+        if self.capture_stacks:
+            self._stop.clear()
+            watchdog = threading.Thread(
+                target=self._watch,
+                args=(threading.get_ident(),),
+                name="event-loop-watchdog",
+                daemon=True,
+            )
+            watchdog.start()
+        try:
+            while True:
+                self._beat = time.perf_counter()
+                await asyncio.sleep(self.interval)
+                self.lag.observe(max(0.0, time.perf_counter() - self._beat - self.interval))
+        finally:
+            if watchdog is not None:
+                self._stop.set()
+                watchdog.join()
+
+    def _watch(self, thread_id: int):
+        deadline = self.interval + self.block_threshold
+        blocked_beat: Optional[float] = None
+        stack = ""
+        while not self._stop.wait(self.block_threshold / 2):
+            beat = self._beat
+            now = time.perf_counter()
+            if blocked_beat is not None and beat != blocked_beat:
+                # The loop came back: report how long it was stuck.
+                self.on_block(beat - blocked_beat - self.interval, stack)
+                blocked_beat = None
+            elif blocked_beat is None and now - beat > deadline:
+                frame = sys._current_frames().get(thread_id)
+                if frame is not None:
+                    stack = "".join(traceback.format_stack(frame))
+                    blocked_beat = beat
@@ -0,0 +1,186 @@
+"""
+Memory diagnostics.
+
+`collect_memory` samples the resident set size and the garbage collector
+of the worker into the metrics registry when they are scraped, so RSS
+growth can be followed per worker over time.
+
+`AllocationTracker` starts and stops `tracemalloc` on demand and reports
+the allocation sites still holding memory, grouped by module: a large
+list response shows up under the repository, the DTO module and the
+serializer that built it. `tracemalloc` slows every allocation down while
+it runs, so it is only started by an administrator for a measurement.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import gc
+import os
+import resource
+import sys
+import sysconfig
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+MODULE = "module"
+LINE = "line"
+ROOT = str(Path(__file__).resolve().parents[3]) + os.sep
+STDLIB = sysconfig.get_paths()["stdlib"] + os.sep
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def rss_bytes() -> Optional[int]:
+    """Resident set size of this process, None where /proc is missing."""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes() -> int:
+    """Highest resident set size this process has reached."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def collect_memory(metrics: MetricsRegistry):
+    """
+    Sample the memory and garbage collector usage into the registry.
+
+    Args:
+        metrics (MetricsRegistry): Registry receiving the gauges.
+    """
+    memory = metrics.gauge(
+        "apprendre_process_memory_bytes", "Process memory by kind.", ("kind",)
+    )
+    rss = rss_bytes()
+    if rss is not None:
+        memory.set(rss, "rss")
+    memory.set(peak_rss_bytes(), "peak_rss")
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        memory.set(current, "traced")
+        memory.set(peak, "traced_peak")
+
+    objects = metrics.gauge(
+        "apprendre_gc_objects",
+        "Objects tracked by the garbage collector per generation.",
+        ("generation",),
+    )
+    collections = metrics.counter(
+        "apprendre_gc_collections", "Garbage collections per generation.", ("generation",)
+    )
+    collected = metrics.counter(
+        "apprendre_gc_collected_objects",
+        "Objects freed by the garbage collector per generation.",
+        ("generation",),
+    )
+    for generation, (count, stats) in enumerate(zip(gc.get_count(), gc.get_stats())):
+        label = str(generation)
+        objects.set(count, label)
+        collections.set(stats["collections"], label)
+        collected.set(stats["collected"], label)
+
+
+class AllocationTracker:
+    """On-demand `tracemalloc` session of this worker."""
+
+    def __init__(self):
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def running(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1):
+        """
+        Start tracing allocations and take the baseline snapshot.
+
+        Args:
+            frames (int): Frames stored per allocation; more show who called
+                the allocating line but cost more memory and time.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self.baseline = self._snapshot()
+
+    def stop(self):
+        """Stop tracing and free the traces."""
+        tracemalloc.stop()
+        self.baseline = None
+
+    def top(self, limit: int = 20, group_by: str = MODULE, since_start: bool = False) -> dict:
+        """
+        Report the allocation sites holding the most memory.
+
+        Args:
+            limit (int): Sites returned.
+            group_by (str): `module` for one entry per module, `line` for one
+                per source line.
+            since_start (bool): Rank by growth since `start` rather than by
+                the memory held.
+
+        Returns:
+            dict: Traced and peak bytes and the top sites.
+        """
+        snapshot = self._snapshot()
+        key = "lineno" if group_by == LINE else "filename"
+        if since_start and self.baseline is not None:
+            stats = snapshot.compare_to(self.baseline, key)
+        else:
+            stats = snapshot.statistics(key)
+        sites = _by_module(stats) if group_by == MODULE else [_site(stat) for stat in stats]
+        sort = "size_diff" if since_start else "size"
+        sites.sort(key=lambda site: -abs(site.get(sort, site["size"])))
+        current, peak = tracemalloc.get_traced_memory()
+        return {"traced": current, "peak": peak, "sites": sites[:limit]}
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(IGNORED)
+
+
+def module_name(filename: str) -> str:
+    """Dotted module of a source file, or the installed package it belongs to."""
+    parts = Path(filename).parts
+    if "site-packages" in parts:
+        return parts[parts.index("site-packages") + 1].removesuffix(".py")
+    for root in (ROOT, STDLIB):
+        if filename.startswith(root):
+            return filename[len(root):].removesuffix(".py").replace(os.sep, ".")
+    return filename
+
+
+def _site(stat) -> dict:
+    frame = stat.traceback[0]
+    site = {
+        "site": f"{module_name(frame.filename)}:{frame.lineno}",
+        "size": stat.size,
+        "count": stat.count,
+    }
+    if hasattr(stat, "size_diff"):
+        site["size_diff"] = stat.size_diff
+        site["count_diff"] = stat.count_diff
+    return site
+
+
+def _by_module(stats) -> List[dict]:
+    modules = {}
+    for stat in stats:
+        name = module_name(stat.traceback[0].filename)
+        site = modules.setdefault(name, {"site": name, "size": 0, "count": 0})
+        site["size"] += stat.size
+        site["count"] += stat.count
+        if hasattr(stat, "size_diff"):
+            site["size_diff"] = site.get("size_diff", 0) + stat.size_diff
+            site["count_diff"] = site.get("count_diff", 0) + stat.count_diff
+    return list(modules.values())
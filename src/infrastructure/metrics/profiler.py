@@ -0,0 +1,171 @@
+"""
+Request Profiler.
+
+A sampling profiler for a single request. A background thread reads the
+stack of the event loop thread every `interval` seconds while the request
+runs and keeps it when the task of the request is the one running; the
+samples where another task runs or the loop waits for I/O are kept as a
+`[waiting]` frame, so the profile adds up to the wall time of the request
+and shows how much of it was spent awaiting the database or Redis.
+
+Profiles are exported in the speedscope format (https://www.speedscope.app),
+which renders them as a flamegraph, and kept per worker in a bounded
+`ProfileStore`.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+WAITING = "[waiting]"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+FrameKey = Tuple[str, str, int]
+
+
+@dataclass
+class Profile:
+    """Samples of one profiled request."""
+
+    method: str
+    path: str
+    route: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration_ms: float = 0.0
+    frames: List[FrameKey] = field(default_factory=list)
+    samples: List[List[int]] = field(default_factory=list)
+    weights: List[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "samples": len(self.samples),
+        }
+
+    def speedscope(self) -> dict:
+        """Render the profile as a speedscope sampled profile."""
+        name = f"{self.method} {self.path}"
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "apprendre",
+            "shared": {
+                "frames": [
+                    {"name": function, "file": file, "line": line}
+                    for function, file, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(sum(self.weights), 3),
+                    "samples": self.samples,
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+class SamplingProfiler:
+    """Stack sampler of the task running the current request."""
+
+    def __init__(self, profile: Profile, interval: float = 0.001, max_depth: int = 128):
+        """
+        Initialize the sampler.
+
+        Args:
+            profile (Profile): Profile receiving the samples.
+            interval (float): Seconds between two samples.
+            max_depth (int): Frames kept per sample, from the innermost.
+        """
+        self.profile = profile
+        self.interval = interval
+        self.max_depth = max_depth
+        self._index: Dict[FrameKey, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling the task calling this method."""
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, args=(loop, task, thread_id), name="request-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        """Stop sampling and return the profile."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.profile.duration_ms = round((time.perf_counter() - self._started) * 1000, 3)
+        return self.profile
+
+    def _run(self, loop, task, thread_id: int):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            now = time.perf_counter()
+            if frame is not None and asyncio.current_task(loop) is task:
+                stack = self._stack(frame)
+            else:
+                stack = [self._frame_index((WAITING, "", 0))]
+            self.profile.samples.append(stack)
+            self.profile.weights.append(round((now - last) * 1000, 3))
+            last = now
+
+    def _stack(self, frame) -> List[int]:
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            stack.append(self._frame_index((code.co_qualname, code.co_filename, code.co_firstlineno)))
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def _frame_index(self, key: FrameKey) -> int:
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.profile.frames)
+            self.profile.frames.append(key)
+        return index
+
+
+class ProfileStore:
+    """Most recent profiles of this worker."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.profiles: "OrderedDict[str, Profile]" = OrderedDict()
+
+    def add(self, profile: Profile):
+        self.profiles[profile.id] = profile
+        while len(self.profiles) > self.capacity:
+            self.profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        return self.profiles.get(profile_id)
+
+    def recent(self) -> List[Profile]:
+        """Stored profiles, newest first."""
+        return list(reversed(self.profiles.values()))
@@ -0,0 +1,137 @@
+"""
+Query Log.
+
+Counts and times the SQL statements run while a `QueryLog` is active in
+the current context, which is a request when `QueryCountMiddleware` is
+installed, or a block of a test under `query_budget`. A statement run
+several times with different parameters is the signature of an N+1 (one
+query per row of a previous result) and is reported as such.
+
+Recording is fed by the engine events set up in `instrument_engine` and
+is a no-op when no log is active.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+
+
+@dataclass
+class StatementStats:
+    """Executions of one SQL statement within a log."""
+
+    count: int = 0
+    duration: float = 0.0
+    parameter_sets: Set[int] = field(default_factory=set)
+
+
+class QueryLog:
+    """SQL statements run within one request or test block."""
+
+    def __init__(self, n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD):
+        """
+        Initialize an empty log.
+
+        Args:
+            n_plus_one_threshold (int): Executions of one statement with
+                different parameters from which it is flagged as an N+1.
+        """
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Dict[str, StatementStats] = {}
+
+    def record(self, statement: str, parameters, duration: float):
+        self.count += 1
+        self.duration += duration
+        stats = self.statements.get(statement)
+        if stats is None:
+            stats = self.statements[statement] = StatementStats()
+        stats.count += 1
+        stats.duration += duration
+        # Fingerprints stop once the threshold is reached: the verdict cannot
+        # change and large parameter sets are not repr'd on every execution.
+        if len(stats.parameter_sets) < self.n_plus_one_threshold:
+            stats.parameter_sets.add(hash(repr(parameters)))
+
+    def n_plus_one(self) -> List[Tuple[str, int]]:
+        """Statements run with at least `n_plus_one_threshold` parameter sets."""
+        return [
+            (statement, stats.count)
+            for statement, stats in self.statements.items()
+            if len(stats.parameter_sets) >= self.n_plus_one_threshold
+        ]
+
+    def summary(self) -> str:
+        """Statements by number of executions, for assertion messages."""
+        ranked = sorted(self.statements.items(), key=lambda item: -item[1].count)
+        return "\n".join(
+            f"{stats.count:>4}x {stats.duration * 1000:8.2f} ms  {' '.join(statement.split())}"
+            for statement, stats in ranked
+        )
+
+
+_current: ContextVar[Optional[QueryLog]] = ContextVar("query_log", default=None)
+
+
+def current_log() -> Optional[QueryLog]:
+    """Return the log active in the current context, if any."""
+    return _current.get()
+
+
+def record_query(statement: str, parameters, duration: float):
+    """Add a statement to the active log; does nothing without one."""
+    log = _current.get()
+    if log is not None:
+        log.record(statement, parameters, duration)
+
+
+@contextmanager
+def capture_queries(
+    n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD,
+) -> Iterator[QueryLog]:
+    """Activate a new log for the statements run inside the block."""
+    log = QueryLog(n_plus_one_threshold)
+    token = _current.set(log)
+    try:
+        yield log
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def query_budget(
+    max_queries: int,
+    n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD,
+    allow_n_plus_one: bool = False,
+) -> Iterator[QueryLog]:
+    """
+    Fail a test whose block runs more statements than its budget.
+
+    The engine must be instrumented, as the one returned by `get_engine()`
+    with metrics or any engine passed to `instrument_engine`:
+
+        with query_budget(2):
+            await controller.get_student_full_info(7)
+
+    Args:
+        max_queries (int): Statements the block may run.
+        n_plus_one_threshold (int): See `QueryLog`.
+        allow_n_plus_one (bool): Do not fail on statements flagged as N+1.
+
+    Raises:
+        AssertionError: If the budget is exceeded or an N+1 is detected.
+    """
+    with capture_queries(n_plus_one_threshold) as log:
+        yield log
+    if log.count > max_queries:
+        raise AssertionError(
+            f"Ran {log.count} SQL statements, budget is {max_queries}:\n{log.summary()}"
+        )
+    if not allow_n_plus_one and log.n_plus_one():
+        raise AssertionError(f"Likely N+1 statements:\n{log.summary()}")
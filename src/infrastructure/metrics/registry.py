@@ -0,0 +1,174 @@
+"""
+Metrics Registry.
+
+A minimal in-process registry of counters, gauges and histograms rendered
+in the Prometheus text exposition format. Recording is a dictionary lookup
+and, for histograms, a bisect over the bucket bounds, so it is cheap enough
+for the request, SQL and Redis hot paths. Values are per worker process:
+every uvicorn worker exposes its own series and the scraper aggregates them.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+Labels = Tuple[str, ...]
+
+
+class Metric:
+    """Base class holding the name, help text and label names of a metric."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> List[Tuple[str, Labels, Labels, float]]:
+        """Return `(suffix, label names, label values, value)` per sample."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for suffix, names, values, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_labels(names, values)} {_number(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonic counter per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def set(self, value: float, *labels: str):
+        """Mirror a counter kept elsewhere, e.g. the response cache stats."""
+        self.values[labels] = value
+
+    def samples(self):
+        return [("_total", self.labelnames, k, v) for k, v in self.values.items()]
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) - amount
+
+    def samples(self):
+        return [("", self.labelnames, k, v) for k, v in self.values.items()]
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed bucket bounds per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: one count per bucket plus +Inf, then the sum.
+        self.values: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, *labels: str):
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self.values.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self):
+        names = self.labelnames + ("le",)
+        samples = []
+        for labels, series in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                samples.append(("_bucket", names, labels + (_number(bound),), cumulative))
+            samples.append(("_sum", self.labelnames, labels, series[-1]))
+            samples.append(("_count", self.labelnames, labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Named collection of the metrics of this process."""
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, cls, name, documentation, labelnames, **kwargs):
+        # Registering twice returns the existing metric, so instrumentation
+        # applied to several engines or clients shares the same series.
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(name, documentation, labelnames, **kwargs)
+        elif type(metric) is not cls:
+            raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+        return metric
+
+
+def _labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
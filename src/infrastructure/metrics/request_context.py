@@ -0,0 +1,40 @@
+"""
+Request context.
+
+Keeps the ASGI scope of the request being served in a context variable so
+diagnostics recorded deep in the infrastructure, such as a slow SQL
+statement, can be attributed to the route that ran it.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.types import Scope
+
+UNMATCHED = "unmatched"
+
+_scope: ContextVar[Optional[Scope]] = ContextVar("request_scope", default=None)
+
+
+def bind_request(scope: Scope):
+    """Mark a scope as the request of the current context."""
+    _scope.set(scope)
+
+
+def route_name(scope: Scope) -> str:
+    """
+    Label of the route that handled a request, `unmatched` if none.
+
+    The path template identifies the route; many routes share a name such
+    as `find`, so the name is only the fallback for routes without a path.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or getattr(route, "name", None) or UNMATCHED
+
+
+def current_route() -> Optional[str]:
+    """Route label of the current request, None outside of a request."""
+    scope = _scope.get()
+    return None if scope is None else route_name(scope)
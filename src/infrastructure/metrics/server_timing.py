@@ -0,0 +1,71 @@
+"""
+Server Timing.
+
+Per-request latency breakdown sent in the `Server-Timing` response header.
+A `ServerTiming` is only active in the context of a request when the
+`SERVER_TIMING` setting is on; otherwise `add_timing` costs a context
+variable lookup and the header is never built.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+AUTH = "auth"
+DEPS = "deps"
+APP = "app"
+DB = "db"
+REDIS = "redis"
+SERIALIZE = "serialize"
+TOTAL = "total"
+
+DESCRIPTIONS = {
+    AUTH: "JWT verification and token check",
+    DEPS: "Request parsing and dependencies",
+    APP: "Dependency injection and endpoint",
+    DB: "SQL statements",
+    REDIS: "Redis commands",
+    SERIALIZE: "Response serialization",
+    TOTAL: "Total",
+}
+
+
+class ServerTiming:
+    """Durations, in seconds, accumulated per phase of one request."""
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.marks: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float):
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def header(self) -> str:
+        """Render the `Server-Timing` header value, in milliseconds."""
+        return ", ".join(
+            f'{name};desc="{DESCRIPTIONS.get(name, name)}";dur={seconds * 1000:.2f}'
+            for name, seconds in self.durations.items()
+        )
+
+
+_current: ContextVar[Optional[ServerTiming]] = ContextVar("server_timing", default=None)
+
+
+def current_timing() -> Optional[ServerTiming]:
+    """Return the timing of the current request, None when disabled."""
+    return _current.get()
+
+
+def start_timing() -> ServerTiming:
+    """Activate a new timing for the current request."""
+    timing = ServerTiming()
+    _current.set(timing)
+    return timing
+
+
+def add_timing(name: str, seconds: float):
+    """Add time to a phase of the current request; no-op when disabled."""
+    timing = _current.get()
+    if timing is not None:
+        timing.add(name, seconds)
@@ -0,0 +1,215 @@
+"""
+Slow Query Log.
+
+Records the SQL statements slower than a threshold in a bounded in-memory
+ring buffer, together with their redacted parameters, the repository
+method that ran them and the route of the request. The query plan is
+captured afterwards by a background task so the request that ran the
+statement is not slowed down any further; with `analyze` on, SELECT
+statements are re-run under `EXPLAIN ANALYZE`.
+
+The task runs in an empty context, so its EXPLAIN is not charged to the
+request, and on a connection of its own, outside the application pool,
+so a burst of slow statements cannot starve the requests of connections.
+
+Parameters are only kept in clear for the plan capture; the log stores
+their types.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import asyncio
+import contextvars
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, List, Optional
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.infrastructure.metrics.request_context import current_route
+
+SLOW_QUERY_START = "slow_query_start"
+REPOSITORIES = "src.infrastructure.repositories."
+EXPLAIN = {
+    "postgresql": ("EXPLAIN ", "EXPLAIN (ANALYZE, BUFFERS) "),
+    "sqlite": ("EXPLAIN QUERY PLAN ", "EXPLAIN QUERY PLAN "),
+}
+
+
+@dataclass
+class SlowQuery:
+    """A statement that ran over the threshold."""
+
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: Optional[str]
+    route: Optional[str]
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    plan: Optional[str] = None
+    plan_error: Optional[str] = None
+
+
+class SlowQueryLog:
+    """Ring buffer of the slow SQL statements of this worker."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        capacity: int,
+        explain: bool = True,
+        analyze: bool = False,
+        max_pending_plans: int = 2,
+    ):
+        """
+        Initialize the log.
+
+        Args:
+            threshold_ms (float): Statements at least this slow are logged,
+                0 to disable the log.
+            capacity (int): Statements kept, the oldest are dropped first.
+            explain (bool): Capture the plan of the logged statements.
+            analyze (bool): Run SELECT statements under EXPLAIN ANALYZE.
+            max_pending_plans (int): Plans captured at the same time, each
+                on its own database connection; a slow statement logged
+                while all are busy is kept without plan.
+        """
+        self.threshold = threshold_ms / 1000
+        self.entries: Deque[SlowQuery] = deque(maxlen=capacity)
+        self.explain = explain
+        self.analyze = analyze
+        self.max_pending_plans = max_pending_plans
+        self.engine = None
+        self._pending: set = set()
+
+    def attach(self, engine):
+        """
+        Watch the statements of an engine.
+
+        Args:
+            engine (AsyncEngine): Engine returned by `get_engine()`. The
+                plans are captured on an unpooled engine to the same
+                database, or on this one for in-memory SQLite.
+
+        Returns:
+            AsyncEngine: The same engine.
+        """
+        if not self.threshold:
+            return engine
+        self.engine = _plan_engine(engine)
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault(SLOW_QUERY_START, []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info[SLOW_QUERY_START].pop()
+            if elapsed >= self.threshold and not is_explain(statement):
+                self.record(statement, parameters, elapsed, executemany)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def failed(context):
+            conn = context.connection
+            starts = conn.info.get(SLOW_QUERY_START) if conn is not None else None
+            if starts:
+                starts.pop()
+
+        return engine
+
+    def record(self, statement: str, parameters, elapsed: float, executemany: bool = False):
+        entry = SlowQuery(
+            statement=statement,
+            parameters=redact(parameters),
+            duration_ms=round(elapsed * 1000, 2),
+            caller=_caller(),
+            route=current_route(),
+        )
+        self.entries.append(entry)
+        if self.explain and not executemany and self.engine is not None:
+            self._capture_plan(entry, parameters)
+        return entry
+
+    def recent(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """Logged statements, newest first."""
+        entries = list(reversed(self.entries))
+        return entries if limit is None else entries[:limit]
+
+    def clear(self):
+        self.entries.clear()
+
+    def _capture_plan(self, entry: SlowQuery, parameters):
+        prefixes = EXPLAIN.get(self.engine.dialect.name)
+        if prefixes is None:
+            entry.plan_error = f"No EXPLAIN support for {self.engine.dialect.name}"
+            return
+        if len(self._pending) >= self.max_pending_plans:
+            entry.plan_error = "Skipped: too many plans being captured"
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        explain, explain_analyze = prefixes
+        if self.analyze and entry.statement.lstrip().upper().startswith("SELECT"):
+            explain = explain_analyze
+        task = loop.create_task(
+            self._explain(entry, explain + entry.statement, parameters),
+            context=contextvars.Context(),
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters):
+        try:
+            # Never committed: the connection rolls back anything an
+            # EXPLAIN ANALYZE may have done when it is closed.
+            async with self.engine.connect() as conn:
+                rows = (await conn.exec_driver_sql(statement, parameters or ())).all()
+            entry.plan = "\n".join(str(row[-1]) for row in rows)
+        except Exception as e:
+            entry.plan_error = f"{type(e).__name__}: {e}"
+
+
+def redact(parameters) -> Any:
+    """Replace parameter values by their type names, keeping the shape."""
+    if isinstance(parameters, dict):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(value) for value in parameters]
+    if parameters is None:
+        return None
+    return f"<{type(parameters).__name__}>"
+
+
+def is_explain(statement: str) -> bool:
+    """Tell whether a statement is a plan capture."""
+    return statement.lstrip()[:7].upper() == "EXPLAIN"
+
+
+def _plan_engine(engine):
+    url = engine.url
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # Another connection would open another, empty, database.
+        return engine
+    return create_async_engine(url, poolclass=NullPool)
+
+
+def _caller() -> Optional[str]:
+    # The listener runs in the greenlet SQLAlchemy spawns for the statement;
+    # the coroutine that awaited it is suspended in the parent greenlet.
+    current = greenlet.getcurrent()
+    frame = current.parent.gr_frame if current.parent else sys._getframe()
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(REPOSITORIES):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
@@ -0,0 +1,300 @@
+"""
+Tracing.
+
+OpenTelemetry spans for the layers a request goes through: a server span
+per request (`TracingMiddleware`), one per endpoint, controller, use case
+and repository call, and client spans for every SQL statement and Redis
+command. A trace of a slow request shows where its time went down to the
+statement, which the per-route metrics cannot.
+
+Tracing is off unless `TRACING_EXPORTER` is set, and then needs the
+OpenTelemetry packages of the optional `tracing` extra:
+
+    uv sync --extra tracing          # or: pip install ".[tracing]"
+
+- `console` prints the spans on stdout.
+- `file` appends them as JSON lines to `TRACING_FILE`, for offline runs
+  such as the load tests.
+- `otlp` sends them over HTTP to `TRACING_OTLP_ENDPOINT`, a collector or a
+  local Jaeger (`http://localhost:4318/v1/traces`).
+
+`TRACING_SAMPLE_RATIO` keeps that fraction of the traces, always following
+the decision of the caller when the request carries a `traceparent`.
+
+Layers are traced by wrapping the public coroutine methods of the classes
+the container provides, once at startup, so nothing is wrapped and no
+span is created with tracing off.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import functools
+import os
+from inspect import iscoroutinefunction
+from typing import Optional
+
+from dependency_injector import providers
+from sqlalchemy import event
+
+from src.infrastructure.metrics.instrumentation import statement_verb
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - tracing stays off
+    trace = None
+
+ENDPOINT = "endpoint"
+CONTROLLER = "controller"
+USE_CASE = "use_case"
+REPOSITORY = "repository"
+LAYERS = {
+    "src.infrastructure.controllers.": CONTROLLER,
+    "src.application.use_case.": USE_CASE,
+    "src.infrastructure.repositories.": REPOSITORY,
+}
+TRACED = "__traced__"
+QUERY_SPAN = "tracing_query_span"
+
+_tracer = None
+
+
+def current_tracer():
+    """Return the tracer in use, None with tracing off."""
+    return _tracer
+
+
+def set_tracer(tracer):
+    """Use a tracer for the spans of this process, None to stop tracing."""
+    global _tracer
+    _tracer = tracer
+    return tracer
+
+
+def configure_tracing(
+    exporter: str,
+    sample_ratio: float = 1.0,
+    file_path: str = "traces.jsonl",
+    otlp_endpoint: str = "",
+    service_name: str = "apprendre",
+):
+    """
+    Set up the OpenTelemetry SDK and the tracer of the application.
+
+    Args:
+        exporter (str): `console`, `file` or `otlp`; empty to leave
+            tracing off.
+        sample_ratio (float): Fraction of the traces started here that are
+            recorded.
+        file_path (str): JSON lines file of the `file` exporter.
+        otlp_endpoint (str): Traces URL of the `otlp` exporter; empty for
+            the `OTEL_EXPORTER_OTLP_*` environment variables or the
+            default local collector.
+        service_name (str): `service.name` of the spans.
+
+    Returns:
+        Optional[Tracer]: The tracer, None with tracing off.
+
+    Raises:
+        RuntimeError: If the SDK or the exporter is not installed.
+        ValueError: If the exporter is unknown.
+    """
+    if not exporter:
+        return None
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError as e:
+        raise RuntimeError(
+            "TRACING_EXPORTER is set but opentelemetry-sdk is not installed; "
+            "install the tracing extra (uv sync --extra tracing)"
+        ) from e
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(_span_exporter(exporter, file_path, otlp_endpoint))
+    )
+    trace.set_tracer_provider(provider)
+    return set_tracer(provider.get_tracer(__name__))
+
+
+def _span_exporter(exporter: str, file_path: str, otlp_endpoint: str):
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if exporter == "console":
+        return ConsoleSpanExporter()
+    if exporter == "file":
+        return ConsoleSpanExporter(
+            out=open(file_path, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    if exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError as e:
+            raise RuntimeError(
+                "TRACING_EXPORTER=otlp needs opentelemetry-exporter-otlp-proto-http; "
+                "install the tracing extra (uv sync --extra tracing)"
+            ) from e
+        return OTLPSpanExporter(endpoint=otlp_endpoint or None)
+    raise ValueError(f"Unknown tracing exporter: {exporter}")
+
+
+def traced(layer: str, name: Optional[str] = None):
+    """
+    Run a coroutine function inside a span of the given layer.
+
+    The tracer is looked up on every call, so the wrapper costs one global
+    read while tracing is off.
+
+    Args:
+        layer (str): Layer recorded in the `app.layer` attribute.
+        name (Optional[str]): Span name, the qualified name by default.
+    """
+
+    def decorator(call):
+        span_name = name or call.__qualname__
+        attributes = {
+            "app.layer": layer,
+            "code.namespace": call.__module__,
+            "code.function": call.__name__,
+        }
+
+        @functools.wraps(call)
+        async def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return await call(*args, **kwargs)
+            with tracer.start_as_current_span(span_name, attributes=attributes):
+                return await call(*args, **kwargs)
+
+        setattr(wrapper, TRACED, True)
+        return wrapper
+
+    return decorator
+
+
+def layer_of(cls) -> Optional[str]:
+    """Return the layer of a class from its module, None if not traced."""
+    for prefix, layer in LAYERS.items():
+        if cls.__module__.startswith(prefix):
+            return layer
+    return None
+
+
+def trace_class(cls, layer: str):
+    """Wrap the public coroutine methods of a class in `traced` spans."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not iscoroutinefunction(value):
+            continue
+        if getattr(value, TRACED, False):
+            continue
+        setattr(cls, attr, traced(layer, f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def trace_layers(container):
+    """
+    Trace the controllers, use cases and repositories of a container.
+
+    Args:
+        container (Container): Container whose providers are inspected.
+    """
+    for provider in container.traverse(types=[providers.Factory, providers.Singleton]):
+        cls = provider.cls
+        if isinstance(cls, type):
+            layer = layer_of(cls)
+            if layer is not None:
+                trace_class(cls, layer)
+
+
+def trace_engine(engine):
+    """
+    Open a client span around every SQL statement executed by an engine.
+
+    Args:
+        engine (AsyncEngine): Engine returned by `get_engine()`.
+
+    Returns:
+        AsyncEngine: The same engine.
+    """
+    sync_engine = engine.sync_engine
+    system = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        # The listener runs in the greenlet of the statement, which sees the
+        # context of the awaiting coroutine, so the span has the right parent.
+        tracer = _tracer
+        span = None
+        if tracer is not None:
+            span = tracer.start_span(
+                statement_verb(statement),
+                kind=SpanKind.CLIENT,
+                attributes={"db.system": system, "db.statement": statement},
+            )
+        conn.info.setdefault(QUERY_SPAN, []).append(span)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        span = conn.info[QUERY_SPAN].pop()
+        if span is not None:
+            span.end()
+
+    @event.listens_for(sync_engine, "handle_error")
+    def failed(context):
+        spans = context.connection.info.get(QUERY_SPAN) if context.connection else None
+        span = spans.pop() if spans else None
+        if span is not None:
+            span.record_exception(context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+
+    return engine
+
+
+def trace_redis(client):
+    """
+    Open a client span around every command sent through a Redis client.
+
+    A pipeline is traced as a single `PIPELINE` span when executed.
+
+    Args:
+        client (redis.Redis): Asynchronous Redis client.
+
+    Returns:
+        redis.Redis: The same client.
+    """
+
+    def spanned(command: str, call):
+        @functools.wraps(call)
+        async def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return await call(*args, **kwargs)
+            name = command or str(args[0]).upper()
+            with tracer.start_as_current_span(
+                name, kind=SpanKind.CLIENT, attributes={"db.system": "redis"}
+            ):
+                return await call(*args, **kwargs)
+
+        return wrapper
+
+    pipeline = client.pipeline
+
+    @functools.wraps(pipeline)
+    def traced_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        pipe.execute = spanned("PIPELINE", pipe.execute)
+        return pipe
+
+    client.execute_command = spanned("", client.execute_command)
+    client.pipeline = traced_pipeline
+    return client
@@ -1,17 +1,23 @@
 """
 Access Repository.
 
-Implements data access methods for the AccessLog entity.
+Implements data access methods for the AccessLog entity and the
+monthly archive that keeps the `access_log` table small.
 
 :author: Carlos S. Paredes Morillo
 """
 
+import gzip
+import json
+from datetime import datetime, timezone
 from sqlalchemy.exc import IntegrityError
 from typing import Callable, List, Optional
 
 from fastapi import HTTPException, status
-from sqlmodel import select
+from sqlmodel import delete, func, select
+from src.domain.objects.user.access_log_filter_dto import AccessLogFilterDTO
 from src.infrastructure.entities.users.accces_logs import AccessLog
+from src.infrastructure.entities.users.access_log_archive import AccessLogArchive
 
 
 class AccessRepository:
@@ -73,29 +79,141 @@ class AccessRepository:
                     detail="Something wrong on server",
                 )
     
-    async def get_all(self) -> List[AccessLog]:
+    async def get_all(
+        self, filters: Optional[AccessLogFilterDTO] = None
+    ) -> List[AccessLog]:
         """
-        Retrieve a list of access logs.
+        Retrieve a page of access logs, newest first.
 
         Args:
-            acces_id (int): The unique identifier of the access log to retrieve.
+            filters (Optional[AccessLogFilterDTO]): User, username and date-range
+                filters plus pagination. Defaults to the first page, unfiltered.
 
         Returns:
-            List[AccessLog]: A list of the AccessLog entity if found, otherwise None.
+            List[AccessLog]: A list of the AccessLog entities matching the filters.
 
         Raises:
             HTTPException: If a database error occurs during retrieval.
         """
+        filters = filters or AccessLogFilterDTO()
+        query = select(AccessLog)
+        if filters.user_id is not None:
+            query = query.where(AccessLog.user_id == filters.user_id)
+        if filters.username is not None:
+            query = query.where(AccessLog.username == filters.username)
+        if filters.date_from is not None:
+            query = query.where(AccessLog.acces_date >= filters.date_from)
+        if filters.date_to is not None:
+            query = query.where(AccessLog.acces_date < filters.date_to)
+        query = (
+            query.order_by(AccessLog.acces_date.desc())
+            .offset(filters.offset)
+            .limit(filters.limit)
+        )
+
         async for session in self.session():
             try:
-                return (
+                return (await session.exec(query)).all()
+            except IntegrityError:
+                await session.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Something wrong on server",
+                )
+
+    async def archive_before(self, cutoff: datetime) -> int:
+        """
+        Move the access logs older than `cutoff` to the archive table.
+
+        Logs are processed one calendar month at a time. Each month is
+        appended to its `AccessLogArchive` row as a gzip member of JSON
+        lines and deleted from `access_log` in the same transaction, so a
+        failed run never loses or duplicates logs.
+
+        Args:
+            cutoff (datetime): Logs strictly older than this instant are archived.
+
+        Returns:
+            int: The number of access logs moved to the archive.
+
+        Raises:
+            HTTPException: If a database error occurs during the archive.
+        """
+        archived = 0
+        async for session in self.session():
+            try:
+                oldest = (
                     await session.exec(
-                        select(AccessLog).where()
+                        select(func.min(AccessLog.acces_date)).where(
+                            AccessLog.acces_date < cutoff
+                        )
                     )
-                ).all()
+                ).one()
+                if oldest is None:
+                    return 0
+
+                month_start = datetime(oldest.year, oldest.month, 1, tzinfo=timezone.utc)
+                while month_start < cutoff:
+                    month_end = _next_month(month_start)
+                    window_end = min(month_end, cutoff)
+                    window = (
+                        AccessLog.acces_date >= month_start,
+                        AccessLog.acces_date < window_end,
+                    )
+                    logs = (
+                        await session.exec(
+                            select(AccessLog).where(*window).order_by(AccessLog.acces_date)
+                        )
+                    ).all()
+                    if logs:
+                        period = month_start.date()
+                        archive = (
+                            await session.exec(
+                                select(AccessLogArchive).where(
+                                    AccessLogArchive.period == period
+                                )
+                            )
+                        ).first() or AccessLogArchive(period=period, payload=b"")
+                        archive.payload = archive.payload + _compress_logs(logs)
+                        archive.entries += len(logs)
+                        archive.archived_at = datetime.now(timezone.utc)
+                        session.add(archive)
+                        await session.exec(
+                            delete(AccessLog)
+                            .where(*window)
+                            .execution_options(synchronize_session=False)
+                        )
+                        await session.commit()
+                        archived += len(logs)
+                    month_start = month_end
+                return archived
             except IntegrityError:
                 await session.rollback()
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Something wrong on server",
                 )
+
+
+def _next_month(moment: datetime) -> datetime:
+    """Return the first instant of the month following `moment`."""
+    if moment.month == 12:
+        return moment.replace(year=moment.year + 1, month=1)
+    return moment.replace(month=moment.month + 1)
+
+
+def _compress_logs(logs: List[AccessLog]) -> bytes:
+    """Serialize access logs as JSON lines inside a single gzip member."""
+    lines = "".join(
+        json.dumps(
+            {
+                "id": log.id,
+                "user_id": log.user_id,
+                "username": log.username,
+                "acces_date": log.acces_date.isoformat(),
+            }
+        )
+        + "\n"
+        for log in logs
+    )
+    return gzip.compress(lines.encode("utf-8"))
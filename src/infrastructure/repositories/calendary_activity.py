@@ -2,9 +2,21 @@ from sqlite3 import IntegrityError
 from typing import Callable, List, Optional
 
 from fastapi import HTTPException, status
-from sqlmodel import delete, select
+from sqlalchemy.exc import IntegrityError as DBIntegrityError
+from sqlmodel import delete, insert, select
 
+from src.domain.objects.calendar.calendar_filter_dto import (
+    CalendarFilterDTO,
+    CalendarWindowDTO,
+)
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+from src.infrastructure.entities.course.class_common_activity import ClassCommonActivity
+from src.infrastructure.entities.course.classes import Classes
+from src.infrastructure.entities.course.student_class import StudentClass
+from src.infrastructure.entities.course.subject_class import SubjectClass
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.users.parents import Parent
+from src.infrastructure.entities.users.teacher import Teacher
 
 """
 CalendarActivity Repository.
@@ -61,8 +73,16 @@ class CalendarActivityRepository:
                 detail="Something wrong on server",
             )
 
-    async def get_all(self) -> List[CalendarActivity]:
-        """Retrieve all calendar activities.
+    async def get_all(
+        self, filters: Optional[CalendarFilterDTO] = None
+    ) -> List[CalendarActivity]:
+        """Retrieve the calendar activities matching the filters, by date.
+
+        With a course and a window the query is served by the
+        (course_id, date) index.
+
+        Args:
+            filters (Optional[CalendarFilterDTO]): Course and date window.
 
         Returns:
             List[CalendarActivity]: A list of calendar activity entities.
@@ -70,9 +90,133 @@ class CalendarActivityRepository:
         Raises:
             HTTPException: If a database error occurs.
         """
+        filters = filters or CalendarFilterDTO()
+        query = select(CalendarActivity)
+        if filters.course_id is not None:
+            query = query.where(CalendarActivity.course_id == filters.course_id)
+        query = _in_window(query, filters)
+        try:
+            async for session in self.session():
+                return (await session.exec(query.order_by(CalendarActivity.date))).all()
+        except IntegrityError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Something wrong on server",
+            )
+
+    async def get_by_class(
+        self, class_id: int, window: Optional[CalendarWindowDTO] = None
+    ) -> List[CalendarActivity]:
+        """Retrieve the activities linked to a class through class_common_activities.
+
+        Args:
+            class_id (int): The ID of the class.
+            window (Optional[CalendarWindowDTO]): Date window.
+
+        Returns:
+            List[CalendarActivity]: The class activities, by date.
+
+        Raises:
+            HTTPException: If a database error occurs.
+        """
+        query = (
+            select(CalendarActivity)
+            .join(
+                ClassCommonActivity,
+                ClassCommonActivity.calendar_activities_id == CalendarActivity.id,
+            )
+            .where(ClassCommonActivity.class_id == class_id)
+        )
+        query = _in_window(query, window or CalendarWindowDTO())
+        try:
+            async for session in self.session():
+                return (await session.exec(query.order_by(CalendarActivity.date))).all()
+        except IntegrityError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Something wrong on server",
+            )
+
+    async def get_by_student(
+        self, student_id: int, window: Optional[CalendarWindowDTO] = None
+    ) -> List[CalendarActivity]:
+        """Retrieve the activities of every class a student is enrolled in.
+
+        Args:
+            student_id (int): The ID of the student.
+            window (Optional[CalendarWindowDTO]): Date window.
+
+        Returns:
+            List[CalendarActivity]: The student's activities, without
+            duplicates, by date.
+
+        Raises:
+            HTTPException: If a database error occurs.
+        """
+        query = (
+            select(CalendarActivity)
+            .join(
+                ClassCommonActivity,
+                ClassCommonActivity.calendar_activities_id == CalendarActivity.id,
+            )
+            .join(StudentClass, StudentClass.class_id == ClassCommonActivity.class_id)
+            .where(StudentClass.student_id == student_id)
+            .distinct()
+        )
+        query = _in_window(query, window or CalendarWindowDTO())
+        try:
+            async for session in self.session():
+                return (await session.exec(query.order_by(CalendarActivity.date))).all()
+        except IntegrityError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Something wrong on server",
+            )
+
+    async def follows(self, kind: str, item_id: int, user_id: int) -> bool:
+        """Check whether a user may follow the feed of a class or a student.
+
+        A student feed belongs to the student and their parents, a class feed
+        to its tutor and the teachers of its subjects.
+
+        Args:
+            kind (str): `class` or `student`.
+            item_id (int): ID of the class or the student.
+            user_id (int): ID of the user asking for the feed.
+
+        Returns:
+            bool: True if the user owns the feed.
+
+        Raises:
+            HTTPException: If a database error occurs.
+        """
+        if kind == "student":
+            queries = [
+                select(Student.id).where(
+                    Student.id == item_id, Student.user_id == user_id
+                ),
+                select(Parent.id).where(
+                    Parent.student_id == item_id, Parent.user_id == user_id
+                ),
+            ]
+        else:
+            queries = [
+                select(Classes.id)
+                .join(Teacher, Teacher.id == Classes.tutor_id)
+                .where(Classes.id == item_id, Teacher.user_id == user_id),
+                select(SubjectClass.id)
+                .join(Teacher, Teacher.id == SubjectClass.professor_id)
+                .where(SubjectClass.class_id == item_id, Teacher.user_id == user_id),
+            ]
         try:
             async for session in self.session():
-                return (await session.exec(select(CalendarActivity))).all()
+                for query in queries:
+                    if (await session.exec(query.limit(1))).first() is not None:
+                        return True
+                return False
         except IntegrityError:
             await session.rollback()
             raise HTTPException(
@@ -111,6 +255,68 @@ class CalendarActivityRepository:
                 detail="Something wrong on server",
             )
 
+    async def bulk_create(
+        self, activities: List[CalendarActivity], class_ids: List[int]
+    ) -> List[int]:
+        """Insert many calendar activities and link each one to the given classes.
+
+        The activities and the class_common_activities rows are written with
+        two executemany statements in a single transaction.
+
+        Args:
+            activities (List[CalendarActivity]): Activities of a single course.
+            class_ids (List[int]): Classes of that course to link every activity to.
+
+        Returns:
+            List[int]: The IDs of the created activities, in input order.
+
+        Raises:
+            HTTPException: If a class does not belong to the course (404) or a
+            database error occurs.
+        """
+        async for session in self.session():
+            class_ids = list(dict.fromkeys(class_ids))
+            if class_ids:
+                found = (
+                    await session.exec(
+                        select(Classes.id)
+                        .where(Classes.id.in_(class_ids))
+                        .where(Classes.course_id == activities[0].course_id)
+                    )
+                ).all()
+                if len(found) != len(class_ids):
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND, detail="Classes not found"
+                    )
+            try:
+                ids = (
+                    await session.exec(
+                        insert(CalendarActivity).returning(
+                            CalendarActivity.id, sort_by_parameter_order=True
+                        ),
+                        params=[
+                            activity.model_dump(exclude={"id"}) for activity in activities
+                        ],
+                    )
+                ).scalars().all()
+                if class_ids:
+                    await session.exec(
+                        insert(ClassCommonActivity),
+                        params=[
+                            {"class_id": class_id, "calendar_activities_id": activity_id}
+                            for activity_id in ids
+                            for class_id in class_ids
+                        ],
+                    )
+                await session.commit()
+                return list(ids)
+            except DBIntegrityError:
+                await session.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Something wrong on server",
+                )
+
     async def update(self, calendar: CalendarActivity) -> Optional[CalendarActivity]:
         """Update a calendar activity.
 
@@ -185,3 +391,12 @@ class CalendarActivityRepository:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Something wrong on server",
             )
+
+
+def _in_window(query, window: CalendarWindowDTO):
+    """Restrict a calendar query to the [date_from, date_to) window."""
+    if window.date_from is not None:
+        query = query.where(CalendarActivity.date >= window.date_from)
+    if window.date_to is not None:
+        query = query.where(CalendarActivity.date < window.date_to)
+    return query
@@ -2,11 +2,18 @@ from sqlite3 import IntegrityError
 from typing import Callable, List, Optional
 
 from fastapi import HTTPException, status
-from sqlmodel import delete, select
+from sqlalchemy.exc import IntegrityError as DBIntegrityError
+from sqlmodel import case, delete, func, insert, literal, select
 
+from src.domain.objects.classes.class_rollover_dto import (
+    ClassRolloverDTO,
+    ClassRolloverReportDTO,
+)
 from src.domain.objects.classes.class_subjects_dto import ClassSubjectsDTO
 from src.domain.objects.classes.update_class_subjects_dto import UpdateClassSubjectsDTO
 from src.infrastructure.entities.course.classes import Classes
+from src.infrastructure.entities.course.course import Course
+from src.infrastructure.entities.course.student_class import StudentClass
 from src.infrastructure.entities.course.subject_class import SubjectClass
 
 """
@@ -244,3 +251,134 @@ class ClassesRepository:
                     status_code=status.HTTP_409_CONFLICT,
                     detail="Classes already in use. Foreign key constraint violation.",
                 )
+
+    async def rollover(self, payload: ClassRolloverDTO) -> ClassRolloverReportDTO:
+        """Create next year's classes from a source course in one transaction.
+
+        Inserts every mapped class in a single executemany, then copies the
+        subject assignments and the student enrollments of the source classes
+        with one INSERT ... SELECT each. With `dry_run` only the counts are
+        computed and nothing is written.
+
+        Args:
+            payload (ClassRolloverDTO): Source and target courses and the class mapping.
+
+        Returns:
+            ClassRolloverReportDTO: Classes, subject assignments and enrollments
+            created (or that would be created), and the new class ID for each
+            source class.
+
+        Raises:
+            HTTPException: If a source class is not in the source course, the
+            target course does not exist (404), or a class name is repeated or
+            already used in the target course (409).
+        """
+        async for session in self.session():
+            source_ids = [mapping.source_class_id for mapping in payload.classes]
+            sources = {
+                classes.id: classes
+                for classes in (
+                    await session.exec(
+                        select(Classes)
+                        .where(Classes.id.in_(source_ids))
+                        .where(Classes.course_id == payload.source_course_id)
+                    )
+                ).all()
+            }
+            if len(sources) != len(set(source_ids)) or len(source_ids) != len(set(source_ids)):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Classes not found"
+                )
+            if await session.get(Course, payload.target_course_id) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Course not found"
+                )
+
+            names = [mapping.name for mapping in payload.classes]
+            taken = (
+                await session.exec(
+                    select(Classes.name)
+                    .where(Classes.course_id == payload.target_course_id)
+                    .where(Classes.name.in_(names))
+                )
+            ).all()
+            if taken or len(set(names)) != len(names):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail="Classes already exist"
+                )
+
+            subjects = 0
+            if payload.copy_subjects:
+                subjects = (
+                    await session.exec(
+                        select(func.count())
+                        .select_from(SubjectClass)
+                        .where(SubjectClass.class_id.in_(source_ids))
+                    )
+                ).one()
+            students = (
+                await session.exec(
+                    select(func.count())
+                    .select_from(StudentClass)
+                    .where(StudentClass.class_id.in_(source_ids))
+                )
+            ).one()
+            report = ClassRolloverReportDTO(
+                dry_run=payload.dry_run,
+                classes=len(payload.classes),
+                subjects=subjects,
+                students=students,
+            )
+            if payload.dry_run:
+                return report
+
+            try:
+                new_ids = (
+                    await session.exec(
+                        insert(Classes).returning(Classes.id, sort_by_parameter_order=True),
+                        params=[
+                            {
+                                "course_id": payload.target_course_id,
+                                "name": mapping.name,
+                                "tutor_id": mapping.tutor_id
+                                if mapping.tutor_id is not None
+                                else sources[mapping.source_class_id].tutor_id,
+                            }
+                            for mapping in payload.classes
+                        ],
+                    )
+                ).scalars().all()
+                created = dict(zip(source_ids, new_ids))
+
+                if payload.copy_subjects and subjects:
+                    await session.exec(
+                        insert(SubjectClass).from_select(
+                            ["subject_id", "class_id", "professor_id"],
+                            select(
+                                SubjectClass.subject_id,
+                                case(created, value=SubjectClass.class_id),
+                                SubjectClass.professor_id,
+                            ).where(SubjectClass.class_id.in_(source_ids)),
+                        )
+                    )
+                if students:
+                    await session.exec(
+                        insert(StudentClass).from_select(
+                            ["student_id", "class_id", "points"],
+                            select(
+                                StudentClass.student_id,
+                                case(created, value=StudentClass.class_id),
+                                literal(0),
+                            ).where(StudentClass.class_id.in_(source_ids)),
+                        )
+                    )
+                await session.commit()
+            except DBIntegrityError:
+                await session.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Something wrong on server",
+                )
+
+            report.created = created
+            return report
@@ -1,11 +1,18 @@
 from sqlite3 import IntegrityError
-from typing import Callable, List
+from typing import Callable, Dict, List
 
 from fastapi import HTTPException, status
+from sqlalchemy import literal, union_all
 from sqlmodel import delete, select
 
 from src.domain.objects.profiles.student_info_dto import StudentInfoDTO
 from src.domain.objects.profiles.student_update_dto import StudentUpdateDTO
+from src.infrastructure.cache.catalog_snapshot import (
+    ALLERGIES,
+    FOOD_INTOLERANCES,
+    MEDICAL_INFO,
+    CatalogSnapshotCache,
+)
 from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
 from src.infrastructure.entities.student_info.food_intolerance import FoodIntolerance
 from src.infrastructure.entities.student_info.medical_info import MedicalInfo
@@ -35,8 +42,9 @@ class StudentRepository:
 
     :author: Carlos S. Paredes Morillo
     """
-    def __init__(self, session: Callable):
+    def __init__(self, session: Callable, catalog: CatalogSnapshotCache = None):
         self.session = session
+        self.catalog = catalog
 
     async def get_student(self, student_id: int) -> Student:
         """Retrieve a student by ID.
@@ -125,6 +133,16 @@ class StudentRepository:
                 user: User
                 student, user = student_result
 
+                if self.catalog is not None:
+                    linked = await self._linked_from_catalog(session, student_id)
+                    return self._full_info(
+                        student,
+                        user,
+                        linked[ALLERGIES],
+                        linked[FOOD_INTOLERANCES],
+                        linked[MEDICAL_INFO],
+                    )
+
                 allergies_result = (
                     await session.exec(
                         select(AllergyInfo)
@@ -159,18 +177,8 @@ class StudentRepository:
                     )
                 ).all()
 
-                return StudentInfoDTO(
-                    student_id=student.id,
-                    user_id=student.user_id,
-                    name=user.name,
-                    last_name=user.last_name,
-                    email=user.email,
-                    phone=user.phone,
-                    classe="to improve",
-                    obvervations=student.observations,
-                    medical_info=medical_result,
-                    allergies=allergies_result,
-                    food_intolerance=intolerances_result,
+                return self._full_info(
+                    student, user, allergies_result, intolerances_result, medical_result
                 )
         except IntegrityError as e:
             await session.rollback()
@@ -179,6 +187,48 @@ class StudentRepository:
                 detail="Something wrong on server",
             )
 
+    async def _linked_from_catalog(self, session, student_id: int) -> Dict[str, List]:
+        """Read the student catalog links in one query and resolve them from the snapshot."""
+        links = (
+            await session.exec(
+                union_all(
+                    select(
+                        literal(ALLERGIES), StudentAllergy.allergies_info_id
+                    ).where(StudentAllergy.students_user_id == student_id),
+                    select(
+                        literal(FOOD_INTOLERANCES), StudentIntolerance.food_intolerance_id
+                    ).where(StudentIntolerance.students_user_id == student_id),
+                    select(
+                        literal(MEDICAL_INFO), StudentMedicalInfo.medical_info_id
+                    ).where(StudentMedicalInfo.students_user_id == student_id),
+                )
+            )
+        ).all()
+        linked = {ALLERGIES: [], FOOD_INTOLERANCES: [], MEDICAL_INFO: []}
+        for catalog, item_id in links:
+            item = await self.catalog.get(catalog, item_id)
+            if item is not None:
+                linked[catalog].append(item)
+        return linked
+
+    @staticmethod
+    def _full_info(
+        student: Student, user: User, allergies, intolerances, medical
+    ) -> StudentInfoDTO:
+        return StudentInfoDTO(
+            student_id=student.id,
+            user_id=student.user_id,
+            name=user.name,
+            last_name=user.last_name,
+            email=user.email,
+            phone=user.phone,
+            classe="to improve",
+            obvervations=student.observations,
+            medical_info=medical,
+            allergies=allergies,
+            food_intolerance=intolerances,
+        )
+
     async def create(self, student: Student) -> Student:
         """Create a new student.
 
@@ -7,16 +7,33 @@ Implements data access methods for the User entity.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from fastapi import HTTPException, status
+from psycopg.errors import IntegrityError as DriverIntegrityError
 from sqlalchemy.exc import IntegrityError
 from src.domain.objects.user.user_create_dto import UserCreateDTO
 from src.domain.objects.user.user_dto import UserDTO
-from sqlmodel import func, select
+from sqlmodel import func, insert, select
+from src.domain.objects.user.user_import_dto import UserImportRowDTO
 from src.domain.objects.user.user_update_dto import UserUpdateDTO
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.users.parents import Parent
+from src.infrastructure.entities.users.teacher import Teacher
 from src.infrastructure.entities.users.user import User
 
+_COPY_COLUMNS = (
+    "username",
+    "name",
+    "last_name",
+    "email",
+    "phone",
+    "dni",
+    "password",
+    "create_time",
+    "role_id",
+)
+
 
 class UserRepository:
     """Repository for managing User persistence.
@@ -370,3 +387,187 @@ class UserRepository:
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Something wrong on server",
                 )
+
+    async def bulk_create(
+        self,
+        rows: List[UserImportRowDTO],
+        profiles: Dict[int, str],
+    ) -> Dict[str, str]:
+        """Insert a batch of users with their student, teacher and parent rows.
+
+        Rows clashing with existing usernames or emails, and parents whose
+        children are neither in the database nor in the batch, are rejected
+        up front. The rest are written in one transaction: users through
+        COPY on PostgreSQL (executemany elsewhere), then the linked profile
+        rows with executemany. If the database still rejects the batch, it
+        is rolled back and retried row by row to find the failed rows.
+
+        Args:
+            rows (List[UserImportRowDTO]): Validated rows with hashed passwords.
+            profiles (Dict[int, str]): Lowercase role name keyed by role id.
+
+        Returns:
+            Dict[str, str]: Error message keyed by username for the rejected rows.
+        """
+        async for session in self.session():
+            rejected: Dict[str, str] = {}
+            usernames = [row.username for row in rows]
+            emails = [row.email for row in rows if row.email]
+
+            taken = set(
+                (await session.exec(select(User.username).where(User.username.in_(usernames)))).all()
+            )
+            taken_emails = set(
+                (await session.exec(select(User.email).where(User.email.in_(emails)))).all()
+            ) if emails else set()
+            for row in rows:
+                if row.username in taken:
+                    rejected[row.username] = "User already exist"
+                elif row.email and row.email in taken_emails:
+                    rejected[row.username] = "Email already in use"
+
+            batch_students = {
+                row.username
+                for row in rows
+                if row.username not in rejected and profiles.get(row.role_id) == "student"
+            }
+            children = {
+                child for row in rows if row.username not in rejected for child in row.children
+            }
+            known_students = set(
+                (
+                    await session.exec(
+                        select(User.username)
+                        .join(Student, Student.user_id == User.id)
+                        .where(User.username.in_(children))
+                    )
+                ).all()
+            ) if children else set()
+            for row in rows:
+                if row.username in rejected:
+                    continue
+                missing = [
+                    child
+                    for child in row.children
+                    if child not in batch_students and child not in known_students
+                ]
+                if missing:
+                    rejected[row.username] = f"Students not found: {', '.join(missing)}"
+
+            accepted = [row for row in rows if row.username not in rejected]
+            if not accepted:
+                return rejected
+
+            now = datetime.now(timezone.utc)
+            try:
+                await self._write_rows(session, accepted, profiles, now)
+                await session.commit()
+                return rejected
+            except (IntegrityError, DriverIntegrityError):
+                await session.rollback()
+
+            # A conflict the checks above could not see, such as a concurrent
+            # import: retry row by row so the report names the failed rows.
+            for row in accepted:
+                try:
+                    await self._write_rows(session, [row], profiles, now)
+                    await session.commit()
+                except (IntegrityError, DriverIntegrityError) as e:
+                    await session.rollback()
+                    rejected[row.username] = _integrity_message(e)
+                except KeyError:
+                    await session.rollback()
+                    rejected[row.username] = f"Students not found: {', '.join(row.children)}"
+            return rejected
+
+    async def _write_rows(
+        self,
+        session,
+        rows: List[UserImportRowDTO],
+        profiles: Dict[int, str],
+        now: datetime,
+    ):
+        """Write users and their profile rows, without committing."""
+        await self._insert_users(session, rows, now)
+        user_ids = dict(
+            (
+                await session.exec(
+                    select(User.username, User.id).where(
+                        User.username.in_([row.username for row in rows])
+                    )
+                )
+            ).all()
+        )
+        students = [
+            {"user_id": user_ids[row.username], "create_time": now}
+            for row in rows
+            if profiles.get(row.role_id) == "student"
+        ]
+        teachers = [
+            {"user_id": user_ids[row.username], "create_time": now}
+            for row in rows
+            if profiles.get(row.role_id) == "teacher"
+        ]
+        if students:
+            await session.exec(insert(Student), params=students)
+        if teachers:
+            await session.exec(insert(Teacher), params=teachers)
+
+        links = [(row.username, child) for row in rows for child in row.children]
+        if links:
+            student_ids = dict(
+                (
+                    await session.exec(
+                        select(User.username, Student.id)
+                        .join(Student, Student.user_id == User.id)
+                        .where(User.username.in_({child for _, child in links}))
+                    )
+                ).all()
+            )
+            await session.exec(
+                insert(Parent),
+                params=[
+                    {"user_id": user_ids[parent], "student_id": student_ids[child]}
+                    for parent, child in links
+                ],
+            )
+
+    async def _insert_users(self, session, rows: List[UserImportRowDTO], now: datetime):
+        """Write the user rows, streaming them with COPY when running on psycopg."""
+        values = [
+            (
+                row.username,
+                row.name,
+                row.last_name,
+                row.email or None,
+                row.phone or None,
+                row.dni or None,
+                row.password,
+                now,
+                row.role_id,
+            )
+            for row in rows
+        ]
+        conn = await session.connection()
+        if conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg":
+            raw = await conn.get_raw_connection()
+            async with raw.driver_connection.cursor() as cursor:
+                async with cursor.copy(
+                    f"COPY users ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+                ) as copy:
+                    for value in values:
+                        await copy.write_row(value)
+            return
+        await session.exec(
+            insert(User), params=[dict(zip(_COPY_COLUMNS, value)) for value in values]
+        )
+
+
+def _integrity_message(error: Exception) -> str:
+    """Report message for a row the database rejected."""
+    detail = str(getattr(error, "orig", None) or error).lower()
+    if "username" in detail:
+        return "User already exist"
+    if "email" in detail:
+        return "Email already in use"
+    return "Rejected by the database"
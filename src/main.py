@@ -7,10 +7,13 @@ defines the application lifecycle, and exposes the health check endpoint.
 :author: Carlos S. Paredes Morillo
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 import sentry_sdk
 
+from src.endpoints.admin import router as admin_router
+from src.endpoints.metrics import router as metrics_router
 from src.endpoints.user import router as user_router
 from src.endpoints.auth import router as auth_router
 from src.endpoints.role import router as role_router
@@ -26,8 +29,14 @@ from src.endpoints.calendar_activity import router as calendar_router
 from src.endpoints.school_subject import router as school_subject_router
 from src.endpoints.student_class import router as student_class_router
 from src.endpoints.subject_class import router as subject_class_router
+from src.middleware.compression.gzip_middleware import CompressionMiddleware
+from src.middleware.metrics.profiling import ProfilingMiddleware
+from src.middleware.metrics.query_count import QueryCountMiddleware
+from src.middleware.metrics.request_metrics import MetricsMiddleware
+from src.middleware.metrics.server_timing import ServerTimingMiddleware
+from src.infrastructure.metrics.tracing import configure_tracing, trace_layers
 from src.settings import settings
-from .infrastructure.connection.db import async_init_db
+from .infrastructure.connection.db import check_schema_revision
 from .container import Container
 
 
@@ -35,8 +44,10 @@ from .container import Container
 async def lifespan(app: FastAPI):
     """Application lifespan context.
 
-    Initializes the database at startup and keeps the app running
-    until shutdown.
+    Checks at startup that the database schema is at the migration
+    revision expected by the code, warms the catalog snapshots and listens
+    for their invalidations until shutdown, while the event loop monitor
+    measures the loop lag.
 
     Args:
         app (FastAPI): FastAPI application instance.
@@ -47,17 +58,63 @@ async def lifespan(app: FastAPI):
     :author: Carlos S. Paredes Morillo
     """
     engine = container.database_engine()
-    await async_init_db(engine)
-    yield
+    await check_schema_revision(engine)
+    catalog = container.catalog_cache()
+    listener = asyncio.create_task(catalog.listen())
+    monitor = asyncio.create_task(container.loop_monitor().run())
+    await catalog.load_all()
+    try:
+        yield
+    finally:
+        for task in (listener, monitor):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await container.redis_client().aclose()
+        await container.redis_binary_client().aclose()
 
 
 sentry_sdk.init(
     dsn=settings.sentry_dsn,
     send_default_pii=True,
 )
+tracer = configure_tracing(
+    settings.tracing_exporter,
+    sample_ratio=settings.tracing_sample_ratio,
+    file_path=settings.tracing_file,
+    otlp_endpoint=settings.tracing_otlp_endpoint,
+)
 container = Container()
+if tracer is not None:
+    trace_layers(container)
 app = FastAPI(lifespan=lifespan)
 app.container = container
+if settings.server_timing:
+    app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_level,
+)
+app.add_middleware(
+    QueryCountMiddleware,
+    metrics=container.metrics(),
+    n_plus_one_threshold=settings.n_plus_one_threshold,
+    debug_headers=settings.query_debug_headers,
+)
+if tracer is not None:
+    from src.middleware.metrics.tracing import TracingMiddleware
+
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+if settings.request_profiling:
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiles=container.profile_store(),
+        token_service=container.token_service,
+        admin_role_id=settings.admin_role_id,
+        interval=settings.profile_interval_ms / 1000,
+    )
+app.add_middleware(MetricsMiddleware, metrics=container.metrics())
 
 
 @app.get("/health")
@@ -92,6 +149,8 @@ app.include_router(calendar_router)
 app.include_router(school_subject_router)
 app.include_router(student_class_router)
 app.include_router(subject_class_router)
+app.include_router(admin_router)
+app.include_router(metrics_router)
 
 container.wire(
     modules=[
@@ -110,6 +169,10 @@ container.wire(
         "src.endpoints.school_subject",
         "src.endpoints.student_class",
         "src.endpoints.subject_class",
+        "src.endpoints.admin",
+        "src.endpoints.metrics",
         "src.middleware.token.authenticateToken",
+        "src.middleware.cache.conditional_get",
+        "src.middleware.cache.cached_body",
     ]
 )
@@ -0,0 +1,104 @@
+"""
+Cached body dependency.
+
+`cached_body` gives read routes a `CachedBody` that answers from the
+encoded bytes stored by `ResponseBodyCache` and only calls the controller
+on a miss. The body is keyed by the same resource version as the ETag of
+`conditional_get`, so the `invalidates` dependency of the write routes
+retires both at once.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Any, Awaitable, Callable, Optional
+from fastapi import Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from dependency_injector.wiring import inject, Provide
+
+from src.container import Container
+from src.infrastructure.cache.resource_version import ResourceVersionCache
+from src.infrastructure.cache.response_body import GZIP, ResponseBodyCache
+from src.middleware.compression.gzip_middleware import accepts_gzip
+from src.middleware.serialization.fast_json import FastJSONResponse
+
+
+class CachedBody:
+    """Encoded body of one read route for the current resource version."""
+
+    def __init__(
+        self,
+        cache: ResponseBodyCache,
+        request: Request,
+        response: Response,
+        resource: str,
+        version: int,
+    ):
+        self.cache = cache
+        self.request = request
+        self.response = response
+        self.resource = resource
+        self.version = version
+
+    async def respond(
+        self,
+        key: str,
+        render: Callable[[], Awaitable[Any]],
+        model: Optional[Any] = None,
+    ) -> Response:
+        """
+        Return the cached body, rendering and storing it on a miss.
+
+        Args:
+            key (str): Body key within the resource, e.g. `all` or an ID.
+            render (Callable): Coroutine factory returning the route content.
+            model (Optional[Any]): Response model of trusted content, encoded
+                with `FastJSONResponse` instead of `jsonable_encoder`.
+
+        Returns:
+            Response: The JSON body, gzip-encoded if the client accepts it
+            and a compressed copy exists.
+        """
+        accept_gzip = accepts_gzip(self.request.headers.get("accept-encoding"))
+        body, encoding = await self.cache.get(
+            self.resource, self.version, key, accept_gzip
+        )
+        if body is None:
+            content = await render()
+            if model is None:
+                encoded = self.cache.encode(JSONResponse(jsonable_encoder(content)).body)
+            else:
+                encoded = self.cache.encode(FastJSONResponse(content, model).body)
+            await self.cache.set(self.resource, self.version, key, encoded)
+            encoding = GZIP if accept_gzip and GZIP in encoded else "json"
+            body = encoded[encoding]
+
+        headers = dict(self.response.headers)
+        headers["Vary"] = "Accept-Encoding"
+        if encoding == GZIP:
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_body(resource: str):
+    """
+    Build the cached body dependency of a read route.
+
+    Declare it after `conditional_get` to reuse the version it read.
+
+    Args:
+        resource (str): Version counter the route payload depends on.
+    """
+    @inject
+    async def body_for_version(
+        request: Request,
+        response: Response,
+        cache: ResponseBodyCache = Depends(Provide[Container.response_body_cache]),
+        versions: ResourceVersionCache = Depends(Provide[Container.resource_version_cache]),
+    ) -> CachedBody:
+        version = getattr(request.state, "resource_versions", {}).get(resource)
+        if version is None:
+            version = await versions.version(resource)
+        return CachedBody(cache, request, response, resource, version)
+
+    return body_for_version
@@ -0,0 +1,78 @@
+"""
+Conditional GET dependencies.
+
+`conditional_get` tags read routes with a weak ETag built from the version
+counter of the resource they serve and answers a matching If-None-Match
+with an empty 304 before the endpoint runs, so unchanged data costs no
+query and no serialization. `invalidates` bumps those counters once a
+write route has succeeded.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, Response, status
+from dependency_injector.wiring import inject, Provide
+
+from src.container import Container
+from src.infrastructure.cache.resource_version import ResourceVersionCache
+
+NO_CACHE = "private, no-cache"
+CATALOG = "private, max-age=300, must-revalidate"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or opaque in tags
+
+
+def conditional_get(resource: str, cache_control: str = NO_CACHE):
+    """
+    Build the conditional GET dependency of a read route.
+
+    Declare it after the authentication dependency so a 304 is only
+    returned to authorized callers.
+
+    Args:
+        resource (str): Version counter the route payload depends on.
+        cache_control (str): Cache-Control policy of the route.
+    """
+    @inject
+    async def check_etag(
+        request: Request,
+        response: Response,
+        versions: ResourceVersionCache = Depends(Provide[Container.resource_version_cache]),
+    ):
+        version = await versions.version(resource)
+        request.state.resource_versions = {
+            **getattr(request.state, "resource_versions", {}),
+            resource: version,
+        }
+        etag = f'W/"{resource}.{version}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return check_etag
+
+
+def invalidates(*resources: str):
+    """
+    Build the dependency of a write route that changes the given resources.
+
+    The versions are bumped after the endpoint returns; a failed request
+    leaves them untouched.
+    """
+    @inject
+    async def bump_versions(
+        versions: ResourceVersionCache = Depends(Provide[Container.resource_version_cache]),
+    ):
+        yield
+        await versions.bump(*resources)
+
+    return bump_versions
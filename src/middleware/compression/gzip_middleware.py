@@ -0,0 +1,75 @@
+"""
+Response compression.
+
+`CompressionMiddleware` gzips responses of at least `minimum_size` bytes
+for clients whose Accept-Encoding allows it, honouring `q=0` refusals.
+Responses that already carry a Content-Encoding, such as the precompressed
+bodies served from the response and calendar feed caches, are sent as they
+are, so a cache hit costs no compression at all.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import gzip
+from typing import Optional
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder, IdentityResponder
+from starlette.types import Receive, Scope, Send
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows a gzip-encoded response."""
+    if not accept_encoding:
+        return False
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        coding = coding.strip().lower()
+        if coding in ("gzip", "x-gzip"):
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return wildcard
+
+
+def gzip_copy(body: bytes, minimum_size: int, level: int) -> Optional[bytes]:
+    """
+    Precompress a body to be cached next to the plain one.
+
+    Args:
+        body (bytes): Body to compress.
+        minimum_size (int): Smallest body, in bytes, worth compressing.
+        level (int): gzip compression level, 1 to 9.
+
+    Returns:
+        Optional[bytes]: The gzipped body, or None if it is too small.
+    """
+    if len(body) < minimum_size:
+        return None
+    # A fixed mtime makes the copy depend on the body only.
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """gzip middleware with q-value aware Accept-Encoding negotiation."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if accepts_gzip(Headers(scope=scope).get("accept-encoding")):
+            responder = GZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,110 @@
+"""
+On-demand request profiling.
+
+An administrator profiles a single request by sending it with the
+`X-Profile: 1` header or the `profile=1` query parameter:
+
+    curl -H "Authorization: Bearer $ADMIN_TOKEN" -H "X-Profile: 1" \\
+        https://staging/students/42/find
+
+`ProfilingMiddleware` checks the bearer token like `require_admin` does
+and, for an administrator, runs a `SamplingProfiler` while the request is
+served. The response carries an `X-Profile-Id` header; the profile is
+kept by the worker and downloaded in the speedscope format from
+`GET /admin/profiles/{id}`. The flag is ignored for anyone else, and the
+token is only checked for flagged requests.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from typing import Callable, Optional
+from urllib.parse import parse_qs
+
+import jwt
+from fastapi import HTTPException
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.services.token_service import TokenService
+from src.infrastructure.metrics.profiler import Profile, ProfileStore, SamplingProfiler
+from src.infrastructure.metrics.request_context import route_name
+
+PROFILE_HEADER = "x-profile"
+PROFILE_PARAM = b"profile"
+FLAG_VALUES = ("1", "true", "yes")
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling the requests flagged by an administrator."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profiles: ProfileStore,
+        token_service: Callable[[], TokenService],
+        admin_role_id: int,
+        interval: float = 0.001,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): Application to profile.
+            profiles (ProfileStore): Store keeping the profiles.
+            token_service (Callable[[], TokenService]): Provider of the token
+                service checking the administrator.
+            admin_role_id (int): Role allowed to profile requests.
+            interval (float): Seconds between two stack samples.
+        """
+        self.app = app
+        self.profiles = profiles
+        self.token_service = token_service
+        self.admin_role_id = admin_role_id
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _flagged(scope):
+            await self.app(scope, receive, send)
+            return
+        if not await self._is_admin(Headers(scope=scope).get("authorization")):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(method=scope["method"], path=scope["path"])
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", profile.id)
+            await send(message)
+
+        profiler = SamplingProfiler(profile, self.interval)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            profile.route = route_name(scope)
+            self.profiles.add(profile)
+
+    async def _is_admin(self, authorization: Optional[str]) -> bool:
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        service = self.token_service()
+        try:
+            payload = service.decode_token(token)
+            await service.validate_token(payload)
+        except (HTTPException, jwt.InvalidTokenError):
+            return False
+        return payload.get("role") == self.admin_role_id
+
+
+def _flagged(scope: Scope) -> bool:
+    for key, value in scope.get("headers", ()):
+        if key == PROFILE_HEADER.encode() and value.decode("latin-1").lower() in FLAG_VALUES:
+            return True
+    query = scope.get("query_string", b"")
+    if PROFILE_PARAM not in query:
+        return False
+    values = parse_qs(query.decode("latin-1")).get(PROFILE_PARAM.decode(), [])
+    return any(value.lower() in FLAG_VALUES for value in values)
@@ -0,0 +1,75 @@
+"""
+Per-request query counting.
+
+`QueryCountMiddleware` opens a query log for every HTTP request, records
+how many SQL statements each route runs and counts the requests with a
+likely N+1. With `debug_headers` on, the response also carries:
+
+    X-DB-Query-Count: 14
+    X-DB-Query-Time: 12.8
+    X-DB-N-Plus-One: 1
+
+the statement count, their total time in milliseconds and how many
+statements were flagged. Statements run after the response has started
+are not included.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.query_log import capture_queries
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.metrics.request_context import route_name
+
+QUERY_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+
+class QueryCountMiddleware:
+    """ASGI middleware counting the SQL statements of every request."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: MetricsRegistry,
+        n_plus_one_threshold: int,
+        debug_headers: bool = False,
+    ):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.debug_headers = debug_headers
+        self.queries = metrics.histogram(
+            "apprendre_db_queries_per_request",
+            "SQL statements run per HTTP request.",
+            ("route",),
+            buckets=QUERY_BUCKETS,
+        )
+        self.n_plus_one = metrics.counter(
+            "apprendre_db_n_plus_one_requests",
+            "HTTP requests that repeated a SQL statement with different parameters.",
+            ("route",),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with capture_queries(self.n_plus_one_threshold) as log:
+
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    route = route_name(scope)
+                    self.queries.observe(log.count, route)
+                    flagged = len(log.n_plus_one())
+                    if flagged:
+                        self.n_plus_one.inc(route)
+                    if self.debug_headers:
+                        headers = MutableHeaders(scope=message)
+                        headers["X-DB-Query-Count"] = str(log.count)
+                        headers["X-DB-Query-Time"] = f"{log.duration * 1000:.1f}"
+                        headers["X-DB-N-Plus-One"] = str(flagged)
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
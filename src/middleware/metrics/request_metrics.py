@@ -0,0 +1,60 @@
+"""
+Request metrics.
+
+`MetricsMiddleware` records, per route path template
+(`/students/{student_id}/find`, `/teachers/all`...), the latency of every HTTP request and how many are in
+flight. It is a plain ASGI middleware so the only per-request cost is two
+clock reads and a few dictionary updates; the route is read from the scope
+FastAPI fills in while routing, and requests that match no route are
+grouped under `unmatched` to keep the label set bounded. The scope is
+also bound to the request context for the diagnostics that need the route.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.metrics.request_context import bind_request, route_name
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency and concurrency."""
+
+    def __init__(self, app: ASGIApp, metrics: MetricsRegistry):
+        self.app = app
+        self.duration = metrics.histogram(
+            "apprendre_http_request_duration_seconds",
+            "HTTP request latency until the response is sent.",
+            ("method", "route", "status"),
+        )
+        self.in_flight = metrics.gauge(
+            "apprendre_http_requests_in_flight", "HTTP requests being served.", ("method",)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        bind_request(scope)
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.in_flight.dec(method)
+            self.duration.observe(
+                time.perf_counter() - started, method, route_name(scope), str(status)
+            )
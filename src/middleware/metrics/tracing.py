@@ -0,0 +1,62 @@
+"""
+Request tracing.
+
+`TracingMiddleware` opens the server span of every HTTP request, the root
+of the endpoint, controller, use case, repository, SQL and Redis spans
+described in `src.infrastructure.metrics.tracing`. The trace continues the
+one of the caller when the request carries a W3C `traceparent` header.
+
+The span is named after the route once the request has been routed
+(`GET /students/{student_id}/find`), keeping span names bounded like the metric labels.
+It is only installed when tracing is configured.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+from opentelemetry import propagate
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.request_context import route_name
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per request."""
+
+    def __init__(self, app: ASGIApp, tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope.get("headers", ())
+        }
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with self.tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = route_name(scope)
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status)
+                if status >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
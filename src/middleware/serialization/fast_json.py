@@ -0,0 +1,72 @@
+"""
+Fast JSON responses.
+
+List endpoints return DTOs built by the repositories from trusted database
+rows. Returning them as a plain dict makes FastAPI walk every object with
+`jsonable_encoder` and encode the result again with the standard `json`
+module. `FastJSONResponse` instead dumps the content in one pass through
+the pydantic-core serializer of a typed response model, compiled once per
+model, and endpoints return it directly so FastAPI does neither step.
+
+Declare the same model as the route `response_model`: it only documents
+the route, since a returned `Response` is never validated.
+
+:author: Carlos S. Paredes Morillo
+"""
+
+import time
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+
+from src.infrastructure.metrics.server_timing import SERIALIZE, current_timing
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized by a compiled pydantic-core serializer."""
+
+    def __init__(
+        self,
+        content: Any,
+        model: Optional[Any] = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        """
+        Initialize the response.
+
+        Args:
+            content (Any): Body content, usually the controller result dict.
+            model (Optional[Any]): Type of the content, e.g.
+                `DataResponse[List[UserDTO]]`; inferred per value if None.
+            status_code (int): HTTP status code.
+            headers (Optional[Mapping[str, str]]): Extra response headers.
+            background (Optional[BackgroundTask]): Task run after sending.
+        """
+        self.model = model
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        timing = current_timing()
+        if timing is None:
+            return self._dump(content)
+        started = time.perf_counter()
+        body = self._dump(content)
+        timing.add(SERIALIZE, time.perf_counter() - started)
+        return body
+
+    def _dump(self, content: Any) -> bytes:
+        if self.model is None:
+            return _adapter(Any).dump_json(content)
+        if isinstance(self.model, type) and issubclass(self.model, BaseModel):
+            # Trusted content: build the envelope without validating it again.
+            content = self.model.model_construct(**content)
+        return _adapter(self.model).dump_json(content)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
@@ -1,23 +1,31 @@
-from typing import List
+import hmac
+import time
+from typing import List, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dependency_injector.wiring import inject, Provide
 from src.application.services.token_service import TokenService
 from src.container import Container
 from src.domain.objects.token.jwtPayload import JwtPayload
+from src.infrastructure.metrics.server_timing import AUTH, add_timing
 
 
 secutiry = HTTPBearer()
+scraper = HTTPBearer(auto_error=False)
 
 @inject
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(secutiry),
     token_service: TokenService = Depends(Provide[Container.token_service]),
 ) -> JwtPayload:
-    token = credentials.credentials
-    decoded_token = token_service.decode_token(token)
-    await token_service.validate_token(decoded_token)
-    return await token_service.get_user_info(token)
+    started = time.perf_counter()
+    try:
+        token = credentials.credentials
+        decoded_token = token_service.decode_token(token)
+        await token_service.validate_token(decoded_token)
+        return await token_service.get_user_info(token)
+    finally:
+        add_timing(AUTH, time.perf_counter() - started)
 
 
 async def get_token(
@@ -42,3 +50,38 @@ def require_role(required_roles: List[int]):
         
         return user_payload
     return role_checker
+
+
+@inject
+async def require_admin(
+    user: JwtPayload = Depends(get_current_user),
+    admin_role_id: int = Depends(Provide[Container.config.provided.admin_role_id]),
+) -> JwtPayload:
+    if user.role != admin_role_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. Requires the admin role",
+        )
+    return user
+
+
+@inject
+async def require_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(scraper),
+    metrics_token: str = Depends(Provide[Container.config.provided.metrics_token]),
+    metrics_public: bool = Depends(Provide[Container.config.provided.metrics_public]),
+) -> None:
+    """Check the static bearer token of the metrics scraper.
+
+    Without a token the metrics stay closed unless `METRICS_PUBLIC` opens
+    them, for a worker only reachable by the scraper.
+    """
+    if metrics_public and not metrics_token:
+        return
+    if not metrics_token or credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+        )
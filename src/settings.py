@@ -17,6 +17,36 @@ class Settings(BaseSettings):
     sentry_dsn:str
     redis_url:str
     duration:int
+    access_log_retention_months: int = 12
+    user_import_batch_size: int = 500
+    calendar_feed_ttl: int = 60 * 60 * 24
+    catalog_snapshot_ttl: int = 60 * 10
+    response_cache_ttl: int = 60 * 5
+    response_cache_stale_ttl: int = 60
+    response_cache_lock_timeout: float = 0
+    response_body_ttl: int = 60 * 10
+    gzip_minimum_size: int = 1024
+    gzip_level: int = 6
+    admin_role_id: int = 1
+    metrics_token: str = ""
+    metrics_public: bool = False
+    n_plus_one_threshold: int = 5
+    query_debug_headers: bool = False
+    server_timing: bool = False
+    slow_query_ms: float = 200
+    slow_query_capacity: int = 100
+    slow_query_explain: bool = True
+    slow_query_explain_analyze: bool = False
+    tracing_exporter: str = ""
+    tracing_sample_ratio: float = 1.0
+    tracing_file: str = "traces.jsonl"
+    tracing_otlp_endpoint: str = ""
+    request_profiling: bool = True
+    profile_interval_ms: float = 1
+    profile_capacity: int = 20
+    loop_lag_interval_ms: float = 250
+    loop_block_ms: float = 100
+    loop_debug: bool = False
 
     model_config = SettingsConfigDict(
         env_file=".env",
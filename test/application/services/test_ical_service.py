@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.application.services.ical_service import ICalService
+from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+
+
+@pytest.fixture
+def ical_service():
+    return ICalService()
+
+
+def test_render_events(ical_service):
+    body = ical_service.render(
+        "Class 1",
+        [
+            CalendarActivity(id=1, course_id=1, date=datetime(2025, 12, 1), activity_name="Trip, museum; 1A"),
+            CalendarActivity(id=2, course_id=1, date=datetime(2025, 12, 3, 9, 30), activity_name="Exam"),
+        ],
+        stamp=datetime(2025, 11, 1, tzinfo=timezone.utc),
+    )
+
+    lines = body.decode().split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2] == "END:VCALENDAR"
+    assert "X-WR-CALNAME:Class 1" in lines
+    assert "UID:calendar-activity-1@apprendre" in lines
+    assert "DTSTAMP:20251101T000000Z" in lines
+    assert "DTSTART;VALUE=DATE:20251201" in lines
+    assert r"SUMMARY:Trip\, museum\; 1A" in lines
+    assert "DTSTART:20251203T093000Z" in lines
+    assert lines.count("BEGIN:VEVENT") == 2
+
+
+def test_render_folds_long_lines_on_utf8_boundaries(ical_service):
+    body = ical_service.render(
+        "Class 1",
+        [CalendarActivity(id=1, course_id=1, date=datetime(2025, 12, 1), activity_name="é" * 50)],
+    )
+
+    for line in body.split(b"\r\n"):
+        assert len(line) <= 75
+        line.decode("utf-8")
+    unfolded = body.replace(b"\r\n ", b"").decode()
+    assert f"SUMMARY:{'é' * 50}" in unfolded
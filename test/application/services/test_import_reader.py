@@ -0,0 +1,52 @@
+import pytest
+
+from src.application.services.import_reader import format_from_content_type, read_rows
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(rows):
+    return [row async for row in rows]
+
+
+def test_format_from_content_type():
+    assert format_from_content_type("text/csv; charset=utf-8") == "csv"
+    assert format_from_content_type("application/x-ndjson") == "ndjson"
+    assert format_from_content_type("application/json") is None
+    assert format_from_content_type(None) is None
+
+
+@pytest.mark.asyncio
+async def test_read_rows_csv_across_chunks():
+    rows = await _collect(
+        read_rows(
+            _stream(b"username,name,email\r\nana,A", b"na,\r\n\r\nluis,Luis,l@x.es"),
+            "csv",
+        )
+    )
+
+    assert rows == [
+        (2, {"username": "ana", "name": "Ana"}),
+        (4, {"username": "luis", "name": "Luis", "email": "l@x.es"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_rows_csv_column_mismatch():
+    rows = await _collect(read_rows(_stream(b"username,name\nana\n"), "csv"))
+
+    assert rows == [(2, {"_error": "Expected 2 columns, got 1"})]
+
+
+@pytest.mark.asyncio
+async def test_read_rows_ndjson_reports_bad_lines():
+    rows = await _collect(
+        read_rows(_stream(b'{"username": "ana"}\nnot json\n[1]\n'), "ndjson")
+    )
+
+    assert rows[0] == (1, {"username": "ana"})
+    assert rows[1][1]["_error"].startswith("Invalid JSON")
+    assert rows[2] == (3, {"_error": "Each line must be a JSON object"})
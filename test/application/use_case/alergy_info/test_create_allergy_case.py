@@ -39,3 +39,24 @@ async def test_create_allergy_failure(use_case, repo):
     repo.create.assert_awaited_once_with(allergy_info)
     assert str(exc_info.value) == "Database error"
 
+
+
+@pytest.mark.asyncio
+async def test_create_allergy_invalidates_catalog(repo):
+    catalog = AsyncMock()
+    repo.create.return_value = AsyncMock(id=1)
+
+    await CreateAllergyCase(repo, catalog=catalog).create(AsyncMock())
+
+    catalog.invalidate.assert_awaited_once_with("allergies")
+
+
+@pytest.mark.asyncio
+async def test_create_allergy_failure_keeps_catalog(repo):
+    catalog = AsyncMock()
+    repo.create.side_effect = Exception("Database error")
+
+    with pytest.raises(Exception):
+        await CreateAllergyCase(repo, catalog=catalog).create(AsyncMock())
+
+    catalog.invalidate.assert_not_awaited()
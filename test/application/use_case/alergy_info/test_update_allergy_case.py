@@ -41,4 +41,15 @@ async def test_update_allergy_not_found(use_case, repo):
     result = await use_case.update(payload)
 
     repo.update.assert_awaited_once_with(payload)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_update_allergy_evicts_student_profiles(repo):
+    response_cache = AsyncMock()
+    use_case = UpdateAllergyCase(repo, response_cache=response_cache)
+    repo.update.return_value = AllergyInfo(id=1, name="Updated")
+
+    await use_case.update(AllergyInfo(id=1, name="Updated"))
+
+    response_cache.invalidate.assert_awaited_once_with("allergy-info")
@@ -0,0 +1,160 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.services.ical_service import ICalService
+from src.application.use_case.calendar.calendar_feed_case import CalendarFeedCase
+from src.application.use_case.calendar.create_calendar_activity_case import CreateCalendarActivityCase
+from src.application.use_case.calendar.delete_calendar_activity_case import DeleteCalendarActivityCase
+from src.application.use_case.calendar.update_calendar_activity_case import UpdateCalendarActivityCase
+from src.domain.objects.calendar.calendar_feed_dto import CalendarFeedDTO
+from src.domain.objects.token.jwtPayload import JwtPayload
+from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+
+
+@pytest.fixture
+def repo():
+    mock = AsyncMock()
+    mock.get_by_class.return_value = [
+        CalendarActivity(id=1, course_id=1, date=datetime(2025, 12, 1), activity_name="Trip")
+    ]
+    mock.get_by_student.return_value = []
+    mock.follows.return_value = True
+    return mock
+
+
+@pytest.fixture
+def feed_cache():
+    mock = AsyncMock()
+    mock.generation.return_value = 7
+    mock.get.return_value = None
+    mock.last_modified.return_value = None
+    mock.compress = Mock(return_value=b"gzipped")
+    mock.token_version.return_value = 0
+    return mock
+
+
+@pytest.fixture
+def use_case(repo, feed_cache):
+    return CalendarFeedCase(
+        repo, feed_cache, ICalService(), secret_key="secret", admin_role_id=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_feed_miss_renders_and_stores(use_case, repo, feed_cache):
+    feed = await use_case.get_feed("class", 1)
+
+    assert b"SUMMARY:Trip" in feed.body
+    assert feed.etag.startswith('"') and feed.etag.endswith('"')
+    assert feed.gzip_body == b"gzipped"
+    feed_cache.compress.assert_called_once_with(feed.body)
+    repo.get_by_class.assert_awaited_once_with(1)
+    feed_cache.get.assert_awaited_once_with(7, "class:1")
+    feed_cache.set.assert_awaited_once_with(7, "class:1", feed)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_feed_keeps_its_validators(use_case, feed_cache):
+    first = await use_case.get_feed("class", 1)
+    scope, etag, stamp = feed_cache.set_last_modified.await_args.args
+    feed_cache.last_modified.return_value = stamp
+
+    # A write elsewhere moved the generation: the feed is rendered again.
+    feed_cache.generation.return_value = 8
+    second = await use_case.get_feed("class", 1)
+
+    assert (scope, etag) == ("class:1", first.etag)
+    assert second.body == first.body
+    assert (second.etag, second.last_modified) == (first.etag, first.last_modified)
+    feed_cache.set_last_modified.assert_awaited_once()
+    feed_cache.last_modified.assert_awaited_with("class:1", first.etag)
+
+
+@pytest.mark.asyncio
+async def test_changed_feed_gets_new_validators(use_case, repo, feed_cache):
+    first = await use_case.get_feed("class", 1)
+    repo.get_by_class.return_value = [
+        CalendarActivity(id=1, course_id=1, date=datetime(2025, 12, 2), activity_name="Trip")
+    ]
+    feed_cache.last_modified.return_value = None
+
+    second = await use_case.get_feed("class", 1)
+
+    assert second.etag != first.etag
+    assert feed_cache.set_last_modified.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_feed_hit_skips_database(use_case, repo, feed_cache):
+    cached = CalendarFeedDTO(body=b"cached", etag='"e"', last_modified=datetime(2025, 1, 1))
+    feed_cache.get.return_value = cached
+
+    assert await use_case.get_feed("student", 3) == cached
+    repo.get_by_student.assert_not_awaited()
+    feed_cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_feed_token(use_case, repo):
+    parent = JwtPayload(user_id=5, username="p", name="P", last_name="P", role=4)
+    token = await use_case.feed_token("class", 1, parent)
+
+    await use_case.check_token("class", 1, token)
+    assert token.startswith("5.0.")
+    assert token != await use_case.feed_token("student", 1, parent)
+    repo.follows.assert_awaited_with("student", 1, 5)
+    for kind, item_id, bad in [
+        ("class", 2, token),
+        ("class", 1, token.replace("5.", "6.", 1)),
+        ("class", 1, "garbage"),
+        ("class", 1, None),
+    ]:
+        with pytest.raises(HTTPException) as exc:
+            await use_case.check_token(kind, item_id, bad)
+        assert exc.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_feed_token_requires_ownership(use_case, repo):
+    repo.follows.return_value = False
+    stranger = JwtPayload(user_id=5, username="s", name="S", last_name="S", role=4)
+    admin = JwtPayload(user_id=1, username="a", name="A", last_name="A", role=1)
+
+    with pytest.raises(HTTPException) as exc:
+        await use_case.feed_token("student", 3, stranger)
+    assert exc.value.status_code == 403
+    assert await use_case.feed_token("student", 3, admin)
+
+
+@pytest.mark.asyncio
+async def test_revoked_feed_token_is_rejected(use_case, feed_cache):
+    user = JwtPayload(user_id=5, username="p", name="P", last_name="P", role=4)
+    token = await use_case.feed_token("student", 3, user)
+
+    feed_cache.revoke_tokens.return_value = 1
+    assert await use_case.revoke_tokens(user) == 1
+    feed_cache.revoke_tokens.assert_awaited_once_with(5)
+    feed_cache.token_version.return_value = 1
+
+    with pytest.raises(HTTPException) as exc:
+        await use_case.check_token("student", 3, token)
+    assert exc.value.status_code == 401
+    await use_case.check_token("student", 3, await use_case.feed_token("student", 3, user))
+
+
+@pytest.mark.asyncio
+async def test_calendar_writes_invalidate_feeds(feed_cache):
+    repo = AsyncMock()
+    repo.create.return_value = Mock(id=1)
+    repo.update.return_value = Mock(id=1)
+    repo.delete.return_value = True
+    activity = CalendarActivity(id=1, course_id=1, date=datetime(2025, 12, 1), activity_name="Trip")
+
+    await CreateCalendarActivityCase(repo, feed_cache).create(activity)
+    await UpdateCalendarActivityCase(repo, feed_cache).update(activity)
+    await DeleteCalendarActivityCase(repo, AsyncMock(), feed_cache).delete(1)
+
+    assert feed_cache.invalidate.await_count == 3
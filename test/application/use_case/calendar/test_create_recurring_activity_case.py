@@ -0,0 +1,145 @@
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.application.use_case.calendar.create_recurring_activity_case import (
+    CreateRecurringActivityCase,
+    expand_occurrences,
+)
+from src.domain.objects.calendar.calendar_recurrence_dto import CalendarRecurrenceDTO
+
+
+def _rule(**extra):
+    return CalendarRecurrenceDTO(course_id=1, activity_name="Swimming", **extra)
+
+
+def test_weekly_on_weekdays_with_interval_and_exceptions():
+    # Monday 1 Sep 2025, every second week on Monday and Thursday.
+    occurrences = expand_occurrences(
+        _rule(
+            start=datetime(2025, 9, 1, 10, 0),
+            freq="weekly",
+            interval=2,
+            weekdays=[0, 3],
+            until=datetime(2025, 9, 30, 23, 59),
+            exceptions=[date(2025, 9, 15)],
+        )
+    )
+
+    assert occurrences == [
+        datetime(2025, 9, 1, 10, 0),
+        datetime(2025, 9, 4, 10, 0),
+        datetime(2025, 9, 18, 10, 0),
+        datetime(2025, 9, 29, 10, 0),
+    ]
+
+
+def test_weekly_defaults_to_start_weekday_and_count_before_exceptions():
+    occurrences = expand_occurrences(
+        _rule(
+            start=datetime(2025, 9, 3),
+            freq="weekly",
+            count=3,
+            exceptions=[date(2025, 9, 10)],
+            dates=[datetime(2025, 12, 22)],
+        )
+    )
+
+    assert occurrences == [datetime(2025, 9, 3), datetime(2025, 9, 17), datetime(2025, 12, 22)]
+
+
+def test_daily_filtered_by_weekdays():
+    occurrences = expand_occurrences(
+        _rule(start=datetime(2025, 9, 5), freq="daily", weekdays=[0, 1, 2, 3, 4], count=3)
+    )
+
+    assert occurrences == [datetime(2025, 9, 5), datetime(2025, 9, 8), datetime(2025, 9, 9)]
+
+
+def test_too_many_occurrences():
+    with pytest.raises(HTTPException) as exc:
+        expand_occurrences(_rule(start=datetime(2025, 1, 1), freq="daily", until=datetime(2030, 1, 1)))
+
+    assert exc.value.status_code == 422
+
+
+def test_long_interval_steps_per_period():
+    occurrences = expand_occurrences(
+        _rule(start=datetime(2025, 1, 1), freq="daily", interval=365, count=5)
+    )
+
+    assert len(occurrences) == 5
+    assert occurrences[-1] == datetime(2028, 12, 31)
+
+
+def test_count_beyond_the_span_limit():
+    with pytest.raises(HTTPException) as exc:
+        expand_occurrences(_rule(start=datetime(2025, 1, 1), freq="weekly", interval=365, count=5))
+
+    assert exc.value.status_code == 422
+
+
+def test_date_overflow():
+    with pytest.raises(HTTPException) as exc:
+        expand_occurrences(_rule(start=datetime(9999, 12, 1), freq="daily", interval=30, count=5))
+
+    assert exc.value.status_code == 422
+
+
+def test_rule_validation():
+    with pytest.raises(ValidationError):
+        _rule(start=datetime(2025, 1, 1), freq="weekly")
+    with pytest.raises(ValidationError):
+        _rule(start=datetime(2025, 1, 1), freq="weekly", count=2, until=datetime(2025, 2, 1))
+    with pytest.raises(ValidationError):
+        _rule(start=datetime(2025, 1, 1), freq="weekly", count=2, weekdays=[7])
+    with pytest.raises(ValidationError):
+        _rule()
+    with pytest.raises(ValidationError):
+        _rule(start=datetime(2025, 1, 1), freq="daily", interval=100000, count=5)
+    with pytest.raises(ValidationError):
+        _rule(start=datetime(2025, 1, 1), freq="daily", until=datetime(9999, 1, 1))
+    with pytest.raises(ValidationError):
+        _rule(
+            start=datetime(2025, 1, 1),
+            freq="daily",
+            until=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        )
+    with pytest.raises(ValidationError):
+        _rule(dates=[datetime(2025, 1, 1), datetime(2025, 1, 2, tzinfo=timezone.utc)])
+
+
+@pytest.mark.asyncio
+async def test_create_stores_occurrences_and_invalidates_feeds():
+    repo = AsyncMock()
+    repo.bulk_create.return_value = [10, 11]
+    feed_cache = AsyncMock()
+    use_case = CreateRecurringActivityCase(repo, feed_cache)
+
+    resp = await use_case.create(
+        _rule(start=datetime(2025, 9, 1), freq="weekly", count=2, class_ids=[3])
+    )
+
+    assert resp.ids == [10, 11]
+    activities, class_ids = repo.bulk_create.await_args.args
+    assert [a.date for a in activities] == [datetime(2025, 9, 1), datetime(2025, 9, 8)]
+    assert all(a.activity_name == "Swimming" and a.course_id == 1 for a in activities)
+    assert class_ids == [3]
+    feed_cache.invalidate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_without_occurrences():
+    repo = AsyncMock()
+    use_case = CreateRecurringActivityCase(repo, AsyncMock())
+
+    with pytest.raises(HTTPException) as exc:
+        await use_case.create(
+            _rule(start=datetime(2025, 9, 1), freq="weekly", count=1, exceptions=[date(2025, 9, 1)])
+        )
+
+    assert exc.value.status_code == 422
+    repo.bulk_create.assert_not_awaited()
@@ -43,3 +43,14 @@ async def test_update_medical_not_found(use_case, repo):
 
     repo.update.assert_awaited_once_with(payload)
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_update_medical_evicts_student_profiles(repo):
+    response_cache = AsyncMock()
+    use_case = UpdateMedicalCase(repo, response_cache=response_cache)
+    repo.update.return_value = MedicalInfo(id=1, name="Updated")
+
+    await use_case.update(MedicalInfo(id=1, name="Updated"))
+
+    response_cache.invalidate.assert_awaited_once_with("medical-info")
@@ -96,3 +96,23 @@ async def test_find_by_name_not_found(find_role_case, role_repo):
         await find_role_case.find_by_name("Admin")
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     assert exc_info.value.detail["message"] == "Role not found"
+
+@pytest.mark.asyncio
+async def test_reads_from_catalog_snapshot(role_repo):
+    """
+    @brief Verifies that roles are served from the catalog snapshot when one is wired.
+    @param role_repo Mocked RoleRepository.
+    """
+    catalog = AsyncMock()
+    catalog.get_all.return_value = [RoleDTO(role_id=1, role_name="Admin")]
+    catalog.get.return_value = None
+    use_case = FindRoleCase(role_repo, catalog=catalog)
+
+    assert (await use_case.get_all())[0].role_name == "Admin"
+    with pytest.raises(HTTPException):
+        await use_case.find_by_id(9)
+
+    catalog.get_all.assert_awaited_once_with("roles")
+    catalog.get.assert_awaited_once_with("roles", 9)
+    role_repo.get_roles.assert_not_awaited()
+    role_repo.find_role.assert_not_awaited()
@@ -66,3 +66,17 @@ async def test_delete_teacher_not_found_raises(delete_teacher_case, mock_repo):
     with pytest.raises(HTTPException):
         await delete_teacher_case.delete(teacher_id=999)
 
+
+
+@pytest.mark.asyncio
+async def test_delete_teacher_evicts_cached_reads(mock_repo, find_teacher_case, sample_teacher):
+    response_cache = AsyncMock()
+    delete_teacher_case = DeleteTeacherCase(
+        repo=mock_repo, find_case=find_teacher_case, response_cache=response_cache
+    )
+    delete_teacher_case.find_case.get = AsyncMock(return_value=sample_teacher)
+    mock_repo.delete.return_value = True
+
+    await delete_teacher_case.delete(teacher_id=1)
+
+    response_cache.invalidate.assert_awaited_once_with("teacher:1", "teachers")
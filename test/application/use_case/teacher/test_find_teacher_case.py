@@ -93,3 +93,19 @@ async def test_get_teacher_full_info_not_found_raises(find_teacher_case, mock_re
     with pytest.raises(HTTPException):
         await find_teacher_case.get_teacher_full_info(teacher_id=1)
 
+
+
+@pytest.mark.asyncio
+async def test_get_teacher_full_info_goes_through_response_cache(mock_repo, sample_teacher_dto):
+    response_cache = AsyncMock()
+    response_cache.get_or_load.return_value = sample_teacher_dto
+    find_teacher_case = FindTeacherCase(repo=mock_repo, response_cache=response_cache)
+
+    result = await find_teacher_case.get_teacher_full_info(teacher_id=1)
+
+    assert result == sample_teacher_dto
+    name, key, tags = response_cache.get_or_load.await_args.args[:3]
+    assert (name, key) == ("teacher-profile", "1")
+    assert tags[0] == "teacher:1"
+    assert "user:{result.user_id}" in tags
+    mock_repo.get_teacher_full_info.assert_not_awaited()
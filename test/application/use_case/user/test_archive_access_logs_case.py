@@ -0,0 +1,38 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from src.application.use_case.user.archive_access_logs_case import ArchiveAccessLogsCase
+from src.infrastructure.repositories.acces_logs import AccessRepository
+
+
+@pytest.fixture
+def repo():
+    return AsyncMock(spec=AccessRepository)
+
+
+@pytest.fixture
+def use_case(repo):
+    return ArchiveAccessLogsCase(repo=repo, retention_months=3)
+
+
+def test_cutoff_keeps_complete_months(use_case):
+    now = datetime(2025, 5, 17, 10, 30, tzinfo=timezone.utc)
+    assert use_case.cutoff(now) == datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+def test_cutoff_crosses_year_boundary(use_case):
+    now = datetime(2025, 2, 3, tzinfo=timezone.utc)
+    assert use_case.cutoff(now) == datetime(2024, 11, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_archive_returns_archived_count(use_case, repo):
+    repo.archive_before.return_value = 120
+
+    resp = await use_case.archive()
+
+    assert resp.item_id == 120
+    cutoff = repo.archive_before.await_args.args[0]
+    assert cutoff.day == 1
+    assert cutoff.tzinfo == timezone.utc
@@ -0,0 +1,106 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.application.use_case.user.import_users_case import ImportUsersCase
+
+
+@pytest.fixture
+def user_repo():
+    mock = AsyncMock()
+    mock.bulk_create.return_value = {}
+    return mock
+
+@pytest.fixture
+def pwd_service():
+    mock = Mock()
+    mock.hash_password.return_value = "hashed_password"
+    return mock
+
+@pytest.fixture
+def find_role_case():
+    mock = AsyncMock()
+    mock.get_all.return_value = [
+        Mock(role_id=1, role_name="Admin"),
+        Mock(role_id=2, role_name="Teacher"),
+        Mock(role_id=3, role_name="Student"),
+        Mock(role_id=4, role_name="Parent"),
+    ]
+    return mock
+
+@pytest.fixture
+def use_case(pwd_service, user_repo, find_role_case):
+    return ImportUsersCase(pwd_service, user_repo, find_role_case, batch_size=2)
+
+
+def _user(username, role_id=3, **extra):
+    return {
+        "username": username,
+        "name": "Name",
+        "last_name": "Last",
+        "password": "secret",
+        "role_id": role_id,
+        **extra,
+    }
+
+
+async def _rows(*rows):
+    for line_no, row in enumerate(rows, start=1):
+        yield line_no, row
+
+
+@pytest.mark.asyncio
+async def test_import_rows_batches_valid_rows(use_case, user_repo):
+    report = await use_case.import_rows(
+        _rows(_user("s1"), _user("s2"), _user("p1", role_id=4, children="s1;s2"))
+    )
+
+    assert report.total == 3
+    assert report.created == 3
+    assert report.failed == 0
+    assert user_repo.bulk_create.await_count == 2
+    first_batch, profiles = user_repo.bulk_create.await_args_list[0].args
+    assert [row.username for row in first_batch] == ["s1", "s2"]
+    assert first_batch[0].password == "hashed_password"
+    assert profiles[4] == "parent"
+    last_batch = user_repo.bulk_create.await_args_list[1].args[0]
+    assert last_batch[0].children == ["s1", "s2"]
+
+
+@pytest.mark.asyncio
+async def test_import_rows_reports_invalid_rows(use_case, user_repo):
+    report = await use_case.import_rows(
+        _rows(
+            _user("ok"),
+            {"username": "broken", "role_id": 3},
+            _user("ok"),
+            _user("norole", role_id=9),
+            _user("kid", role_id=3, children="ok"),
+            {"_error": "Invalid JSON"},
+        )
+    )
+
+    assert report.total == 6
+    assert report.created == 1
+    assert report.failed == 5
+    assert [(e.row, e.username) for e in report.errors] == [
+        (2, "broken"),
+        (3, "ok"),
+        (4, "norole"),
+        (5, "kid"),
+        (6, None),
+    ]
+    assert "name" in report.errors[0].message
+    assert report.errors[1].message == "Duplicated username in file"
+    user_repo.bulk_create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_import_rows_reports_rows_rejected_by_repository(use_case, user_repo):
+    user_repo.bulk_create.return_value = {"taken": "User already exist"}
+
+    report = await use_case.import_rows(_rows(_user("taken"), _user("new")))
+
+    assert report.created == 1
+    assert report.failed == 1
+    assert report.errors[0].row == 1
+    assert report.errors[0].message == "User already exist"
@@ -0,0 +1,35 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.infrastructure.connection.db import async_init_db
+from src.infrastructure.jobs.seed_dataset import SIZES, generate, load
+
+
+@pytest.fixture(scope="session")
+def school_dataset():
+    """Tiny synthetic school, the same on every run."""
+    return generate(SIZES["tiny"], seed=0)
+
+
+@pytest_asyncio.fixture
+async def school_engine(school_dataset):
+    """In-memory SQLite database loaded with `school_dataset`."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    await async_init_db(engine)
+    await load(engine, school_dataset)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def school_session(school_engine):
+    """Session provider over `school_engine`, as the repositories expect it."""
+    async with AsyncSession(school_engine, expire_on_commit=False) as shared_session:
+
+        async def session():
+            yield shared_session
+
+        yield session
@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import gzip
+
+import pytest
+
+from src.domain.objects.calendar.calendar_feed_dto import CalendarFeedDTO
+from src.infrastructure.cache.calendar_feed import GENERATION_KEY, STAMP_TTL, CalendarFeedCache
+
+
+@pytest.fixture
+def redis_mock():
+    mock = AsyncMock()
+    mock.pipeline = MagicMock(return_value=AsyncMock())
+    return mock
+
+
+@pytest.fixture
+def feed_cache(redis_mock):
+    async def redis_session():
+        yield redis_mock
+
+    return CalendarFeedCache(redis_session=redis_session, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_generation_defaults_to_zero(feed_cache, redis_mock):
+    redis_mock.get.return_value = None
+
+    assert await feed_cache.generation() == 0
+    redis_mock.get.assert_awaited_once_with(GENERATION_KEY)
+
+
+@pytest.mark.asyncio
+async def test_get_hit_and_miss(feed_cache, redis_mock):
+    redis_mock.hgetall.return_value = {
+        b"body": b"BEGIN:VCALENDAR",
+        b"etag": b'"abc"',
+        b"last_modified": b"2025-11-01T00:00:00+00:00",
+    }
+
+    feed = await feed_cache.get(3, "class:1")
+
+    assert feed.body == b"BEGIN:VCALENDAR"
+    assert feed.etag == '"abc"'
+    assert feed.last_modified == datetime(2025, 11, 1, tzinfo=timezone.utc)
+    assert feed.gzip_body is None
+    redis_mock.hgetall.assert_awaited_once_with("calendar:feed:3:class:1")
+
+    redis_mock.hgetall.return_value = {}
+    assert await feed_cache.get(3, "class:2") is None
+
+
+@pytest.mark.asyncio
+async def test_set_writes_hash_with_ttl(feed_cache, redis_mock):
+    pipe = redis_mock.pipeline.return_value
+    pipe.hset = MagicMock()
+    pipe.expire = MagicMock()
+
+    await feed_cache.set(
+        1,
+        "student:4",
+        CalendarFeedDTO(body=b"x", etag='"e"', last_modified=datetime(2025, 1, 1, tzinfo=timezone.utc)),
+    )
+
+    assert pipe.hset.call_args.args[0] == "calendar:feed:1:student:4"
+    assert pipe.hset.call_args.kwargs["mapping"]["body"] == b"x"
+    assert "gzip_body" not in pipe.hset.call_args.kwargs["mapping"]
+    pipe.expire.assert_called_once_with("calendar:feed:1:student:4", 60)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_generation(feed_cache, redis_mock):
+    redis_mock.incr.return_value = 5
+
+    assert await feed_cache.invalidate() == 5
+    redis_mock.incr.assert_awaited_once_with(GENERATION_KEY)
+
+
+@pytest.mark.asyncio
+async def test_large_feeds_are_stored_gzipped(feed_cache, redis_mock):
+    pipe = redis_mock.pipeline.return_value
+    pipe.hset = MagicMock()
+    pipe.expire = MagicMock()
+    body = b"BEGIN:VEVENT\r\nSUMMARY:Trip\r\nEND:VEVENT\r\n" * 100
+
+    compressed = feed_cache.compress(body)
+    await feed_cache.set(
+        1,
+        "class:1",
+        CalendarFeedDTO(
+            body=body,
+            etag='"e"',
+            last_modified=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            gzip_body=compressed,
+        ),
+    )
+
+    assert gzip.decompress(compressed) == body
+    assert feed_cache.compress(b"BEGIN:VCALENDAR") is None
+    assert pipe.hset.call_args.kwargs["mapping"]["gzip_body"] == compressed
+
+
+@pytest.mark.asyncio
+async def test_last_modified_only_for_the_same_content(feed_cache, redis_mock):
+    redis_mock.hgetall.return_value = {
+        b"etag": b'"abc"',
+        b"last_modified": b"2025-11-01T00:00:00+00:00",
+    }
+
+    assert await feed_cache.last_modified("class:1", '"abc"') == datetime(
+        2025, 11, 1, tzinfo=timezone.utc
+    )
+    assert await feed_cache.last_modified("class:1", '"def"') is None
+    redis_mock.hgetall.assert_awaited_with("calendar:feed:stamp:class:1")
+
+
+@pytest.mark.asyncio
+async def test_set_last_modified_outlives_generations(feed_cache, redis_mock):
+    pipe = redis_mock.pipeline.return_value
+    pipe.hset = MagicMock()
+    pipe.expire = MagicMock()
+    moment = datetime(2025, 11, 1, tzinfo=timezone.utc)
+
+    await feed_cache.set_last_modified("class:1", '"abc"', moment)
+
+    pipe.hset.assert_called_once_with(
+        "calendar:feed:stamp:class:1",
+        mapping={"etag": '"abc"', "last_modified": moment.isoformat()},
+    )
+    pipe.expire.assert_called_once_with("calendar:feed:stamp:class:1", STAMP_TTL)
+    pipe.execute.assert_awaited_once()
@@ -0,0 +1,130 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.objects.role.role_dto import RoleDTO
+from src.infrastructure.cache.catalog_snapshot import (
+    ALLERGIES,
+    CHANNEL,
+    ROLES,
+    CatalogSnapshotCache,
+)
+from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
+
+
+@pytest.fixture
+def redis_mock():
+    mock = AsyncMock()
+    mock.get.return_value = None
+    mock.pubsub = MagicMock()
+    return mock
+
+
+@pytest.fixture
+def loaders():
+    return {
+        ROLES: AsyncMock(return_value=[RoleDTO(role_id=1, role_name="admin")]),
+        ALLERGIES: AsyncMock(return_value=[AllergyInfo(id=3, name="Peanuts")]),
+    }
+
+
+@pytest.fixture
+def catalog(redis_mock, loaders):
+    async def redis_session():
+        yield redis_mock
+
+    return CatalogSnapshotCache(
+        redis_session=redis_session, loaders=loaders, ttl=0, retry_delay=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_loads_once_and_serves_from_memory(catalog, loaders, redis_mock):
+    assert [a.name for a in await catalog.get_all(ALLERGIES)] == ["Peanuts"]
+    assert (await catalog.get(ALLERGIES, 3)).name == "Peanuts"
+    assert await catalog.get(ALLERGIES, 4) is None
+    assert (await catalog.get(ROLES, 1)).role_name == "admin"
+
+    loaders[ALLERGIES].assert_awaited_once()
+    redis_mock.get.assert_any_await("catalog:version:allergies")
+
+
+@pytest.mark.asyncio
+async def test_load_all(catalog, loaders):
+    await catalog.load_all()
+
+    loaders[ROLES].assert_awaited_once()
+    loaders[ALLERGIES].assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_publishes_and_reloads(catalog, loaders, redis_mock):
+    await catalog.get_all(ALLERGIES)
+    redis_mock.incr.return_value = 1
+
+    assert await catalog.invalidate(ALLERGIES) == 1
+
+    redis_mock.incr.assert_awaited_once_with("catalog:version:allergies")
+    redis_mock.publish.assert_awaited_once_with(CHANNEL, "allergies:1")
+    redis_mock.get.return_value = "1"
+    await catalog.get_all(ALLERGIES)
+    assert loaders[ALLERGIES].await_count == 2
+    await catalog.get_all(ALLERGIES)
+    assert loaders[ALLERGIES].await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_loaded_for_an_old_version_is_reloaded(catalog, loaders, redis_mock):
+    async def racing_write():
+        catalog._seen(ALLERGIES, 1)
+        return [AllergyInfo(id=3, name="Peanuts")]
+
+    loaders[ALLERGIES].side_effect = racing_write
+    await catalog.get_all(ALLERGIES)
+    loaders[ALLERGIES].side_effect = None
+    redis_mock.get.return_value = "1"
+
+    await catalog.get_all(ALLERGIES)
+
+    assert loaders[ALLERGIES].await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_expires_snapshots(catalog, loaders):
+    catalog.ttl = 60
+    await catalog.get_all(ROLES)
+    catalog._snapshots[ROLES].loaded_at -= 61
+
+    await catalog.get_all(ROLES)
+
+    assert loaders[ROLES].await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_listen_applies_messages_from_other_workers(catalog, loaders, redis_mock):
+    await catalog.get_all(ROLES)
+    received = asyncio.Event()
+    messages = [{"type": "message", "data": "roles:5"}]
+
+    async def get_message(**kwargs):
+        if messages:
+            return messages.pop()
+        received.set()
+        await asyncio.sleep(0.01)
+        return None
+
+    pubsub = AsyncMock()
+    pubsub.get_message.side_effect = get_message
+    redis_mock.pubsub.return_value = pubsub
+
+    listener = asyncio.create_task(catalog.listen())
+    await asyncio.wait_for(received.wait(), 1)
+    listener.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await listener
+
+    pubsub.subscribe.assert_awaited_once_with(CHANNEL)
+    pubsub.aclose.assert_awaited_once()
+    assert ROLES not in catalog._snapshots
+    assert catalog._latest[ROLES] == 5
@@ -0,0 +1,42 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.cache.resource_version import ResourceVersionCache
+
+
+@pytest.fixture
+def redis_mock():
+    mock = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock.pipeline = MagicMock(return_value=pipe)
+    return mock
+
+
+@pytest.fixture
+def versions(redis_mock):
+    async def redis_session():
+        yield redis_mock
+
+    return ResourceVersionCache(redis_session=redis_session)
+
+
+@pytest.mark.asyncio
+async def test_version(versions, redis_mock):
+    redis_mock.get.return_value = None
+    assert await versions.version("roles") == 0
+
+    redis_mock.get.return_value = "7"
+    assert await versions.version("roles") == 7
+    redis_mock.get.assert_awaited_with("http:version:roles")
+
+
+@pytest.mark.asyncio
+async def test_bump(versions, redis_mock):
+    await versions.bump("classes", "teachers")
+
+    pipe = redis_mock.pipeline.return_value
+    pipe.incr.assert_any_call("http:version:classes")
+    pipe.incr.assert_any_call("http:version:teachers")
+    pipe.execute.assert_awaited_once()
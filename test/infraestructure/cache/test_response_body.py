@@ -0,0 +1,58 @@
+import gzip
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.cache.response_body import GZIP, JSON, ResponseBodyCache
+
+
+@pytest.fixture
+def redis_mock():
+    mock = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock.pipeline = MagicMock(return_value=pipe)
+    return mock
+
+
+@pytest.fixture
+def cache(redis_mock):
+    async def redis_session():
+        yield redis_mock
+
+    return ResponseBodyCache(redis_session=redis_session, ttl=600, gzip_min_size=16)
+
+
+def test_encode_gzips_large_bodies_only(cache):
+    body = b'{"status":"success","data":[1,2,3,4,5]}'
+
+    encoded = cache.encode(body)
+
+    assert encoded[JSON] == body
+    assert gzip.decompress(encoded[GZIP]) == body
+    assert cache.encode(b"[]") == {JSON: b"[]"}
+
+
+@pytest.mark.asyncio
+async def test_get_prefers_gzip(cache, redis_mock):
+    redis_mock.hget.side_effect = [b"gz", b"plain"]
+
+    assert await cache.get("roles", 3, "all", accept_gzip=True) == (b"gz", GZIP)
+    redis_mock.hget.assert_awaited_once_with("http:body:roles:3:all", GZIP)
+
+
+@pytest.mark.asyncio
+async def test_get_falls_back_to_plain_body(cache, redis_mock):
+    redis_mock.hget.side_effect = [None, b"plain"]
+
+    assert await cache.get("roles", 3, "all", accept_gzip=True) == (b"plain", JSON)
+
+
+@pytest.mark.asyncio
+async def test_set(cache, redis_mock):
+    await cache.set("classes", 2, "7", {JSON: b"{}"})
+
+    pipe = redis_mock.pipeline.return_value
+    pipe.hset.assert_called_once_with("http:body:classes:2:7", mapping={JSON: b"{}"})
+    pipe.expire.assert_called_once_with("http:body:classes:2:7", 600)
+    pipe.execute.assert_awaited_once()
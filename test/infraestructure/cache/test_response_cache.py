@@ -0,0 +1,246 @@
+import asyncio
+import time
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from src.infrastructure.cache.response_cache import ResponseCache, cached_response, evicts
+
+
+class Profile(BaseModel):
+    id: int
+    user_id: int
+    name: str
+
+
+@pytest.fixture
+def store():
+    return {}
+
+
+@pytest.fixture
+def redis_mock(store):
+    mock = AsyncMock()
+    mock.get.side_effect = lambda key: store.get(key)
+    mock.mget.side_effect = lambda keys: [store.get(key) for key in keys]
+
+    async def set_(key, value, ex=None, nx=False, px=None):
+        if nx and key in store:
+            return None
+        store[key] = value
+        return True
+
+    mock.set.side_effect = set_
+
+    def incr(key):
+        store[key] = str(int(store.get(key) or 0) + 1)
+
+    pipe = MagicMock()
+    pipe.incr.side_effect = incr
+    pipe.execute = AsyncMock()
+    mock.pipeline = MagicMock(return_value=pipe)
+    return mock
+
+
+@pytest.fixture
+def cache(redis_mock):
+    async def redis_session():
+        yield redis_mock
+
+    return ResponseCache(redis_session=redis_session, ttl=300)
+
+
+class ProfileCase:
+    def __init__(self, repo, response_cache=None):
+        self.repo = repo
+        self.response_cache = response_cache
+
+    @cached_response(
+        "profile",
+        "{profile_id}",
+        Profile,
+        tags=("profile:{profile_id}", "user:{result.user_id}"),
+    )
+    async def get(self, profile_id: int) -> Profile:
+        return await self.repo.get(profile_id)
+
+    @cached_response("profiles", "all", List[Profile], tags=("profiles",))
+    async def get_all(self) -> List[Profile]:
+        return await self.repo.get_all()
+
+    @evicts("profile:{profile_id}", "profiles")
+    async def rename(self, profile_id: int, name: str):
+        return await self.repo.rename(profile_id, name)
+
+
+@pytest.fixture
+def repo():
+    repo = AsyncMock()
+    repo.get.return_value = Profile(id=1, user_id=10, name="Ana")
+    repo.get_all.return_value = [Profile(id=1, user_id=10, name="Ana")]
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_second_read_is_a_hit(cache, repo, store):
+    case = ProfileCase(repo, cache)
+
+    first = await case.get(1)
+    second = await case.get(profile_id=1)
+
+    assert first == second == Profile(id=1, user_id=10, name="Ana")
+    repo.get.assert_awaited_once_with(1)
+    _, tags, versions, _ = store["cache:entry:profile:1"].split("\n", 3)
+    assert tags.split() == ["profile:1", "user:10"]
+    assert versions.split() == ["0", "0"]
+    assert cache.stats() == {
+        "profile": {"hit": 1, "miss": 1, "evict": 0, "stale": 0, "coalesced": 0}
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_results_are_cached(cache, repo):
+    case = ProfileCase(repo, cache)
+
+    await case.get_all()
+    result = await case.get_all()
+
+    assert result == [Profile(id=1, user_id=10, name="Ana")]
+    repo.get_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_write_evicts_entries_built_from_its_tags(cache, repo):
+    case = ProfileCase(repo, cache)
+    await case.get(1)
+    await case.get_all()
+
+    await case.rename(1, "Eva")
+    repo.get.return_value = Profile(id=1, user_id=10, name="Eva")
+    result = await case.get(1)
+
+    assert result.name == "Eva"
+    assert repo.get.await_count == 2
+    assert cache.stats()["profile"]["miss"] == 2
+    assert cache.stats()["profile"]["evict"] == 1
+    await case.get_all()
+    assert repo.get_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tags_from_the_result_evict(cache, repo):
+    case = ProfileCase(repo, cache)
+    await case.get(1)
+
+    await cache.invalidate("user:10")
+    await case.get(1)
+
+    assert repo.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_write_does_not_evict(cache, repo, redis_mock):
+    case = ProfileCase(repo, cache)
+    repo.rename.side_effect = ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await case.rename(1, "Eva")
+
+    redis_mock.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_loader_errors_are_not_cached(cache, repo, redis_mock):
+    case = ProfileCase(repo, cache)
+    repo.get.side_effect = ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await case.get(1)
+
+    redis_mock.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_without_cache_calls_through(repo):
+    case = ProfileCase(repo)
+
+    await case.get(1)
+    await case.get(1)
+    await case.rename(1, "Eva")
+
+    assert repo.get.await_count == 2
+    repo.rename.assert_awaited_once_with(1, "Eva")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(cache, repo):
+    case = ProfileCase(repo, cache)
+    release = asyncio.Event()
+
+    async def slow_get(profile_id):
+        await release.wait()
+        return Profile(id=profile_id, user_id=10, name="Ana")
+
+    repo.get.side_effect = slow_get
+    readers = asyncio.gather(*(case.get(1) for _ in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+    results = await readers
+
+    assert all(result.name == "Ana" for result in results)
+    repo.get.assert_awaited_once_with(1)
+    assert cache.stats()["profile"]["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_served_stale_and_refreshed(cache, repo, monkeypatch):
+    cache.stale_ttl = 60
+    case = ProfileCase(repo, cache)
+    await case.get(1)
+    repo.get.return_value = Profile(id=1, user_id=10, name="Eva")
+
+    clock = time.time() + 301
+    monkeypatch.setattr(time, "time", lambda: clock)
+    stale = await case.get(1)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    fresh = await case.get(1)
+
+    assert stale.name == "Ana"
+    assert fresh.name == "Eva"
+    assert repo.get.await_count == 2
+    assert cache.stats()["profile"]["stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_evicted_entry_is_never_served_stale(cache, repo):
+    cache.stale_ttl = 60
+    case = ProfileCase(repo, cache)
+    await case.get(1)
+
+    await case.rename(1, "Eva")
+    repo.get.return_value = Profile(id=1, user_id=10, name="Eva")
+
+    assert (await case.get(1)).name == "Eva"
+
+
+@pytest.mark.asyncio
+async def test_waits_for_the_worker_holding_the_lock(cache, repo, redis_mock, store):
+    cache.lock_timeout = 1
+    cache.lock_poll = 0
+    store["cache:lock:profile:1"] = "other-worker"
+    waiting = asyncio.ensure_future(ProfileCase(repo, cache).get(1))
+    while not redis_mock.set.await_count:
+        await asyncio.sleep(0)
+
+    other_repo = AsyncMock()
+    other_repo.get.return_value = Profile(id=1, user_id=10, name="Ana")
+    other_worker = ResponseCache(redis_session=cache.redis, ttl=300)
+    await ProfileCase(other_repo, other_worker).get(1)
+    result = await waiting
+
+    assert result.name == "Ana"
+    repo.get.assert_not_awaited()
+    assert cache.stats()["profile"]["coalesced"] == 1
@@ -8,7 +8,13 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
 from sqlmodel.ext.asyncio.session import AsyncSession
-from src.infrastructure.connection.db import get_engine, async_init_db, get_session
+from src.infrastructure.connection.db import (
+    async_init_db,
+    check_schema_revision,
+    expected_revision,
+    get_engine,
+    get_session,
+)
 
 
 @patch("src.infrastructure.connection.db.create_async_engine")
@@ -111,3 +117,41 @@ async def test_get_session_closes_after_use():
     ):
         async for session in get_session(AsyncMock(spec=AsyncEngine)):
             assert isinstance(session, AsyncSession)
+
+
+def test_expected_revision_is_migrations_head():
+    """
+    @brief Verifies that the expected revision is read from the migration scripts.
+    """
+    assert expected_revision() == "0003"
+
+
+@pytest.mark.asyncio
+async def test_check_schema_revision_accepts_head():
+    """
+    @brief Verifies that startup goes on when the database is at the expected revision.
+    """
+    with (
+        patch("src.infrastructure.connection.db.expected_revision", return_value="0002"),
+        patch(
+            "src.infrastructure.connection.db.current_revision",
+            AsyncMock(return_value="0002"),
+        ),
+    ):
+        await check_schema_revision(AsyncMock(spec=AsyncEngine))
+
+
+@pytest.mark.asyncio
+async def test_check_schema_revision_rejects_outdated_schema():
+    """
+    @brief Verifies that startup fails when the database has not been migrated.
+    """
+    with (
+        patch("src.infrastructure.connection.db.expected_revision", return_value="0002"),
+        patch(
+            "src.infrastructure.connection.db.current_revision",
+            AsyncMock(return_value=None),
+        ),
+    ):
+        with pytest.raises(RuntimeError, match="make migrate"):
+            await check_schema_revision(AsyncMock(spec=AsyncEngine))
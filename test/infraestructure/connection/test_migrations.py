@@ -0,0 +1,100 @@
+"""
+@file test_migrations.py
+@brief Tests for the Alembic migrations.
+@details Verifies that upgrading an empty database to head produces exactly the schema declared by the entities, and that the migrations can be rolled back.
+"""
+
+import asyncio
+from pathlib import Path
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy import create_engine, inspect
+from sqlmodel import SQLModel
+
+from src.infrastructure.connection.db import (
+    check_schema_revision,
+    current_revision,
+    load_entities,
+)
+
+
+def alembic_config(db_path) -> Config:
+    config = Config(str(Path(__file__).parents[3] / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", f"sqlite+aiosqlite:///{db_path}")
+    return config
+
+
+def test_upgrade_head_matches_entities(tmp_path):
+    """
+    @brief Verifies that the migrated schema has no differences with the entity metadata.
+    """
+    db_path = tmp_path / "migrations.db"
+    command.upgrade(alembic_config(db_path), "head")
+
+    load_entities()
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), SQLModel.metadata)
+    engine.dispose()
+
+    assert diff == []
+
+
+def test_downgrade_base_drops_everything(tmp_path):
+    """
+    @brief Verifies that the migrations can be fully rolled back.
+    """
+    db_path = tmp_path / "migrations.db"
+    config = alembic_config(db_path)
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    assert inspect(engine).get_table_names() == ["alembic_version"]
+    engine.dispose()
+
+
+def test_adopted_baseline_gets_later_tables(tmp_path):
+    """
+    @brief Verifies that 0001 is the create_all baseline and later revisions add the access log archive.
+    """
+    db_path = tmp_path / "migrations.db"
+    config = alembic_config(db_path)
+    command.upgrade(config, "0001")
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    tables = inspect(engine).get_table_names()
+    indexes = [index["name"] for index in inspect(engine).get_indexes("access_log")]
+    assert "access_log_archive" not in tables
+    assert indexes == []
+
+    command.upgrade(config, "head")
+    inspector = inspect(engine)
+    assert "access_log_archive" in inspector.get_table_names()
+    assert {index["name"] for index in inspector.get_indexes("access_log")} == {
+        "ix_access_log_acces_date",
+        "ix_access_log_user_id_acces_date",
+    }
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_check_schema_revision_after_upgrade(tmp_path):
+    """
+    @brief Verifies the startup check against a database migrated to head and an empty one.
+    """
+    db_path = tmp_path / "migrations.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    assert await current_revision(engine) is None
+    with pytest.raises(RuntimeError):
+        await check_schema_revision(engine)
+
+    await asyncio.to_thread(command.upgrade, alembic_config(db_path), "head")
+
+    await check_schema_revision(engine)
+    await engine.dispose()
@@ -38,3 +38,49 @@ async def test_get_redis_session_yields_client_and_closes():
         with pytest.raises(StopAsyncIteration):
             await gen.__anext__()
         mock_client.aclose.assert_awaited_once()
+
+
+def test_get_redis_client_binary():
+    """
+    @brief Verifies that get_redis_client can return a client that keeps raw bytes.
+    """
+    client = redis_utils.get_redis_client(decode_responses=False)
+    assert client.connection_pool.connection_kwargs["decode_responses"] is False
+
+
+@pytest.mark.asyncio
+async def test_shared_redis_session_keeps_client_open():
+    """
+    @brief Verifies that shared_redis_session hands out the same client without closing it.
+    """
+    mock_client = AsyncMock()
+    gen = redis_utils.shared_redis_session(mock_client)
+    assert await gen.__anext__() is mock_client
+
+    with pytest.raises(StopAsyncIteration):
+        await gen.__anext__()
+    mock_client.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_container_caches_share_redis_clients():
+    """
+    @brief Verifies that every cache lookup reuses the container's Redis clients.
+    """
+    from src.container import Container
+
+    container = Container()
+    clients = []
+    for cache in (
+        container.resource_version_cache(),
+        container.resource_version_cache(),
+        container.response_cache(),
+        container.response_body_cache(),
+        container.calendar_feed_cache(),
+    ):
+        async for client in cache.redis():
+            clients.append(client)
+
+    assert clients[0] is clients[1] is clients[2] is container.redis_client()
+    assert clients[3] is clients[4] is container.redis_binary_client()
+    assert clients[3].connection_pool.connection_kwargs["decode_responses"] is False
@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from src.infrastructure.controllers.admin import AdminController
+from src.infrastructure.metrics.memory import AllocationTracker
+from src.infrastructure.metrics.profiler import Profile, ProfileStore
+from src.infrastructure.metrics.slow_queries import SlowQueryLog
+
+
+@pytest.fixture
+def slow_query_log():
+    log = SlowQueryLog(threshold_ms=100, capacity=10, explain=False)
+    log.record("SELECT * FROM students WHERE id = %(id)s", {"id": 7}, 0.25)
+    return log
+
+
+@pytest.fixture
+def profiles():
+    store = ProfileStore(capacity=5)
+    store.add(Profile(method="GET", path="/students/7/find", route="find-student"))
+    return store
+
+
+@pytest.fixture
+def admin_controller(slow_query_log, profiles):
+    response_cache = MagicMock()
+    response_cache.stats.return_value = {"teachers": {"hit": 1}}
+    controller = AdminController(
+        response_cache=response_cache,
+        slow_query_log=slow_query_log,
+        profiles=profiles,
+        allocations=AllocationTracker(),
+    )
+    yield controller
+    controller.allocations.stop()
+
+
+@pytest.mark.asyncio
+async def test_cache_stats(admin_controller):
+    response = await admin_controller.cache_stats()
+
+    assert response == {"status": "success", "data": {"teachers": {"hit": 1}}}
+
+
+@pytest.mark.asyncio
+async def test_slow_queries(admin_controller):
+    response = await admin_controller.slow_queries(limit=5)
+
+    [entry] = response["data"]
+    assert entry["statement"] == "SELECT * FROM students WHERE id = %(id)s"
+    assert entry["parameters"] == {"id": "<int>"}
+    assert entry["duration_ms"] == 250.0
+
+
+@pytest.mark.asyncio
+async def test_clear_slow_queries(admin_controller, slow_query_log):
+    assert await admin_controller.clear_slow_queries() == {"status": "success"}
+    assert slow_query_log.recent() == []
+
+
+@pytest.mark.asyncio
+async def test_list_profiles(admin_controller, profiles):
+    response = await admin_controller.list_profiles()
+
+    [summary] = response["data"]
+    assert summary["id"] == profiles.recent()[0].id
+    assert summary["route"] == "find-student"
+
+
+@pytest.mark.asyncio
+async def test_get_profile(admin_controller, profiles):
+    document = await admin_controller.get_profile(profiles.recent()[0].id)
+
+    assert document["name"] == "GET /students/7/find"
+    assert document["profiles"][0]["type"] == "sampled"
+
+
+@pytest.mark.asyncio
+async def test_get_missing_profile(admin_controller):
+    with pytest.raises(HTTPException) as exc:
+        await admin_controller.get_profile("missing")
+
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_top_allocations_while_tracing(admin_controller):
+    assert await admin_controller.start_allocation_tracing() == {"status": "success"}
+
+    response = await admin_controller.top_allocations(5, "module", False)
+
+    assert response["status"] == "success"
+    assert len(response["data"]["sites"]) <= 5
+    assert await admin_controller.stop_allocation_tracing() == {"status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_top_allocations_requires_tracing(admin_controller):
+    with pytest.raises(HTTPException) as exc:
+        await admin_controller.top_allocations(5, "module", False)
+
+    assert exc.value.status_code == 409
@@ -3,6 +3,9 @@ from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 from datetime import datetime, timezone
 
+from src.domain.objects.calendar.calendar_feed_dto import CalendarFeedDTO
+from src.domain.objects.calendar.calendar_filter_dto import CalendarWindowDTO
+from src.domain.objects.calendar.calendar_recurrence_dto import CalendarBulkResultDTO
 from src.infrastructure.controllers.calendar_activity import CalendarController
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
 
@@ -35,12 +38,27 @@ def calendar_activity_dto():
     )
 
 @pytest.fixture
-def calendar_controller(find_case, create_case, update_case, delete_case):
+def feed_case():
+    mock = AsyncMock()
+    mock.feed_token.return_value = "tok"
+    mock.get_feed.return_value = CalendarFeedDTO(
+        body=b"BEGIN:VCALENDAR", etag='"abc"', last_modified=datetime(2025, 11, 1, tzinfo=timezone.utc)
+    )
+    return mock
+
+@pytest.fixture
+def recurring_case():
+    return AsyncMock()
+
+@pytest.fixture
+def calendar_controller(find_case, create_case, update_case, delete_case, feed_case, recurring_case):
     return CalendarController(
         find_case=find_case,
         create_case=create_case,
         update_case=update_case,
         delete_case=delete_case,
+        feed_case=feed_case,
+        recurring_case=recurring_case,
     )
 
 
@@ -170,3 +188,154 @@ async def test_get_all_calendar_exception(calendar_controller, find_case):
         await calendar_controller.get_all()
 
     find_case.get_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_by_class_calendar_success(calendar_controller, find_case, calendar_activity_dto):
+    find_case.get_by_class.return_value = [calendar_activity_dto]
+    window = CalendarWindowDTO(date_from=datetime(2025, 12, 1), date_to=datetime(2026, 1, 1))
+
+    response = await calendar_controller.get_by_class(1, window)
+
+    assert response["status"] == "success"
+    assert response["data"] == [calendar_activity_dto]
+    find_case.get_by_class.assert_awaited_once_with(1, window)
+
+
+@pytest.mark.asyncio
+async def test_get_by_class_calendar_exception(calendar_controller, find_case):
+    find_case.get_by_class.side_effect = HTTPException(status_code=404, detail="Not found")
+
+    with pytest.raises(HTTPException):
+        await calendar_controller.get_by_class(1)
+
+
+@pytest.mark.asyncio
+async def test_feed_returns_calendar_with_validators(calendar_controller, feed_case):
+    response = await calendar_controller.feed("class", 1, "tok")
+
+    assert response.status_code == 200
+    assert response.body == b"BEGIN:VCALENDAR"
+    assert response.headers["content-type"].startswith("text/calendar")
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["last-modified"] == "Sat, 01 Nov 2025 00:00:00 GMT"
+    feed_case.check_token.assert_awaited_once_with("class", 1, "tok")
+
+
+@pytest.mark.asyncio
+async def test_feed_not_modified(calendar_controller):
+    by_etag = await calendar_controller.feed("class", 1, "tok", if_none_match='"old", "abc"')
+    by_date = await calendar_controller.feed(
+        "class", 1, "tok", if_modified_since="Sat, 01 Nov 2025 00:00:00 GMT"
+    )
+    stale = await calendar_controller.feed("class", 1, "tok", if_none_match='"old"')
+
+    assert by_etag.status_code == 304
+    assert by_etag.body == b""
+    assert by_date.status_code == 304
+    assert stale.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_feed_not_modified_with_naive_date(calendar_controller):
+    response = await calendar_controller.feed(
+        "class", 1, "tok", if_modified_since="Sat, 01 Nov 2025 00:00:00 -0000"
+    )
+    older = await calendar_controller.feed(
+        "class", 1, "tok", if_modified_since="Fri, 31 Oct 2025 00:00:00 -0000"
+    )
+
+    assert response.status_code == 304
+    assert older.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_feed_serves_precompressed_body(calendar_controller, feed_case):
+    feed_case.get_feed.return_value = CalendarFeedDTO(
+        body=b"BEGIN:VCALENDAR",
+        etag='"abc"',
+        last_modified=datetime(2025, 11, 1, tzinfo=timezone.utc),
+        gzip_body=b"gzipped",
+    )
+
+    gzipped = await calendar_controller.feed("class", 1, "tok", accept_encoding="gzip, br")
+    plain = await calendar_controller.feed("class", 1, "tok", accept_encoding="gzip;q=0")
+
+    assert gzipped.body == b"gzipped"
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert plain.body == b"BEGIN:VCALENDAR"
+    assert "content-encoding" not in plain.headers
+
+
+@pytest.mark.asyncio
+async def test_feed_invalid_token(calendar_controller, feed_case):
+    feed_case.check_token.side_effect = HTTPException(status_code=401, detail="Invalid feed token")
+
+    with pytest.raises(HTTPException) as exc:
+        await calendar_controller.feed("student", 1, "bad")
+
+    assert exc.value.status_code == 401
+    feed_case.get_feed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_feed_url(calendar_controller, feed_case):
+    user = MagicMock(user_id=9)
+    response = await calendar_controller.feed_url("student", 4, user)
+
+    assert response["data"]["url"] == "/calendar/feed/student/4.ics?token=tok"
+    feed_case.feed_token.assert_awaited_once_with("student", 4, user)
+
+
+@pytest.mark.asyncio
+async def test_feed_url_not_owner(calendar_controller, feed_case):
+    feed_case.feed_token.side_effect = HTTPException(status_code=403, detail="Not your calendar")
+
+    with pytest.raises(HTTPException) as exc:
+        await calendar_controller.feed_url("class", 2, MagicMock(user_id=9))
+
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_revoke_feed_tokens(calendar_controller, feed_case):
+    user = MagicMock(user_id=9)
+    response = await calendar_controller.revoke_feed_tokens(user)
+
+    assert response["status"] == "success"
+    feed_case.revoke_tokens.assert_awaited_once_with(user)
+
+
+@pytest.mark.asyncio
+async def test_create_recurring_success(calendar_controller, recurring_case):
+    recurring_case.create.return_value = CalendarBulkResultDTO(
+        ids=[1, 2], event_date=datetime.now(timezone.utc)
+    )
+
+    response = await calendar_controller.create_recurring(MagicMock())
+
+    assert response["status"] == "success"
+    assert response["data"]["ids"] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_create_recurring_too_many(calendar_controller, recurring_case):
+    recurring_case.create.side_effect = HTTPException(status_code=422, detail="Too many")
+
+    with pytest.raises(HTTPException) as exc:
+        await calendar_controller.create_recurring(MagicMock())
+
+    assert exc.value.status_code == 422
+    assert exc.value.detail["message"] == "Too many"
+
+
+@pytest.mark.asyncio
+async def test_create_recurring_keeps_not_found_detail(calendar_controller, recurring_case):
+    recurring_case.create.side_effect = HTTPException(status_code=404, detail="Classes not found")
+
+    with pytest.raises(HTTPException) as exc:
+        await calendar_controller.create_recurring(MagicMock())
+
+    assert exc.value.status_code == 404
+    assert exc.value.detail["message"] == "Classes not found"
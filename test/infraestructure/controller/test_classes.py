@@ -3,6 +3,11 @@ from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 from datetime import datetime, timezone
 
+from src.domain.objects.classes.class_rollover_dto import (
+    ClassRolloverDTO,
+    ClassRolloverMappingDTO,
+    ClassRolloverReportDTO,
+)
 from src.domain.objects.classes.subject_assignment_dto import SubjectAssignmentDTO
 from src.infrastructure.controllers.classes import ClassesController
 from src.infrastructure.entities.course.classes import Classes
@@ -47,12 +52,18 @@ def update_subjects_payload():
 
 
 @pytest.fixture
-def classes_controller(find_case, create_case, update_case, delete_case):
+def rollover_case():
+    return AsyncMock()
+
+
+@pytest.fixture
+def classes_controller(find_case, create_case, update_case, delete_case, rollover_case):
     return ClassesController(
         find_case=find_case,
         create_case=create_case,
         update_case=update_case,
         delete_case=delete_case,
+        rollover_case=rollover_case,
     )
 
 
@@ -223,3 +234,32 @@ async def test_get_all_classes_exception(classes_controller, find_case):
         await classes_controller.get_all()
 
     find_case.get_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rollover_success(classes_controller, rollover_case):
+    payload = ClassRolloverDTO(
+        source_course_id=1,
+        target_course_id=2,
+        classes=[ClassRolloverMappingDTO(source_class_id=1, name="2A")],
+        dry_run=True,
+    )
+    rollover_case.rollover.return_value = ClassRolloverReportDTO(
+        dry_run=True, classes=1, subjects=3, students=20
+    )
+
+    response = await classes_controller.rollover(payload)
+
+    assert response["status"] == "success"
+    assert response["data"].students == 20
+    rollover_case.rollover.assert_awaited_once_with(payload)
+
+
+@pytest.mark.asyncio
+async def test_rollover_exception(classes_controller, rollover_case):
+    rollover_case.rollover.side_effect = HTTPException(status_code=409, detail="Classes already exist")
+
+    with pytest.raises(HTTPException) as exc:
+        await classes_controller.rollover(MagicMock())
+
+    assert exc.value.status_code == 409
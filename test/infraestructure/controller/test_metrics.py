@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.controllers.metrics import CONTENT_TYPE, MetricsController
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+@pytest.mark.asyncio
+async def test_render_collects_pool_and_cache_stats():
+    engine = MagicMock()
+    engine.sync_engine.pool.size.return_value = 5
+    response_cache = MagicMock()
+    response_cache.stats.return_value = {"teachers": {"hit": 3, "miss": 1}}
+    controller = MetricsController(MetricsRegistry(), response_cache, engine)
+
+    response = await controller.render()
+
+    assert response.media_type == CONTENT_TYPE
+    body = response.body.decode()
+    assert 'apprendre_db_pool_connections{state="size"} 5' in body
+    assert 'apprendre_response_cache_events_total{cache="teachers",event="hit"} 3' in body
+    assert 'apprendre_process_memory_bytes{kind="peak_rss"}' in body
@@ -5,8 +5,10 @@ from datetime import datetime, timezone
 
 from src.infrastructure.controllers.user import UserController
 from src.domain.objects.user.user_create_dto import UserCreateDTO
+from src.domain.objects.user.user_import_dto import UserImportReportDTO
 from src.domain.objects.user.user_update_dto import UserUpdateDTO
 from src.domain.objects.auth.change_pass_dto import ChangePasswordDTO
+from src.domain.objects.user.access_log_filter_dto import AccessLogFilterDTO
 from src.domain.objects.user.user_dto import UserDTO
 from src.domain.objects.common.common_resp import CommonResponse
 
@@ -50,12 +52,26 @@ def find_case():
 
 
 @pytest.fixture
-def user_controller(find_case, create_case, update_case, delete_case):
+def archive_case():
+    mock = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def import_case():
+    mock = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def user_controller(find_case, create_case, update_case, delete_case, archive_case, import_case):
     return UserController(
         find_case=find_case,
         create_case=create_case,
         update_case=update_case,
         delete_case=delete_case,
+        archive_logs_case=archive_case,
+        import_case=import_case,
     )
 
 
@@ -265,6 +281,42 @@ async def test_get_access_logs_exception(user_controller, find_case):
         mock_sentry.assert_called_once()
         mock_manager.assert_called_once()
 
+@pytest.mark.asyncio
+async def test_get_access_logs_with_filters(user_controller, find_case):
+    filters = AccessLogFilterDTO(user_id=1, limit=10)
+    find_case.get_access_logs.return_value = []
+
+    resp = await user_controller.get_access_logs(filters)
+
+    assert resp["status"] == "success"
+    find_case.get_access_logs.assert_awaited_once_with(filters)
+
+
+@pytest.mark.asyncio
+async def test_archive_access_logs_success(user_controller, archive_case):
+    archive_case.archive.return_value = CommonResponse(
+        item_id=42, event_date=datetime.now(timezone.utc)
+    )
+
+    resp = await user_controller.archive_access_logs()
+
+    assert resp["status"] == "success"
+    assert resp["data"]["archived"] == 42
+    archive_case.archive.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_archive_access_logs_exception(user_controller, archive_case):
+    archive_case.archive.side_effect = HTTPException(status_code=500, detail="Error")
+
+    with (
+        patch("src.infrastructure.controllers.user.sentry_sdk.capture_exception") as mock_sentry,
+        patch("src.infrastructure.controllers.user.manage_user_except") as mock_manager,
+    ):
+        await user_controller.archive_access_logs()
+        mock_sentry.assert_called_once()
+        mock_manager.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_get_sessions_success(user_controller, find_case):
     find_case.get_day_sessions.return_value = 5
@@ -287,3 +339,23 @@ async def test_get_sessions_exception(user_controller, find_case):
         await user_controller.get_sessions()
         mock_sentry.assert_called_once()
         mock_manager.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_import_users_success(user_controller, import_case):
+    async def body():
+        yield b"username,name,last_name,password,role_id\n"
+        yield b"ana,Ana,Lopez,secret,3\n"
+
+    async def consume(rows):
+        return UserImportReportDTO(
+            total=len([row async for row in rows]), created=1
+        )
+
+    import_case.import_rows.side_effect = consume
+
+    resp = await user_controller.import_users(body(), "csv")
+
+    assert resp["status"] == "success"
+    assert resp["data"].total == 1
+    assert resp["data"].created == 1
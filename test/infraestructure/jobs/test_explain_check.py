@@ -0,0 +1,43 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+
+from src.infrastructure.connection.db import load_entities
+from src.infrastructure.entities.users.user import User
+from src.infrastructure.jobs.explain_check import _postgres_seq_scans, explain, run_check
+
+
+@pytest_asyncio.fixture
+async def sqlite_engine():
+    load_entities()
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(sqlite_engine):
+    flagged = await run_check(sqlite_engine)
+    assert flagged == {}
+
+
+@pytest.mark.asyncio
+async def test_explain_flags_unindexed_predicate(sqlite_engine):
+    async with sqlite_engine.connect() as conn:
+        scans = await explain(conn, select(User).where(User.name == "Ana"))
+    assert scans == ["users"]
+
+
+def test_postgres_seq_scans_walks_nested_plans():
+    plan = {
+        "Node Type": "Hash Join",
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "subject_class"},
+            {"Node Type": "Index Scan", "Relation Name": "school_subjects"},
+        ],
+    }
+    assert _postgres_seq_scans(plan) == ["subject_class"]
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.responses import StreamingResponse
+
+from src.infrastructure.jobs.load_test import (
+    LOGIN,
+    ASGIClient,
+    HTTPClient,
+    Recorder,
+    compare,
+    login_storm,
+    percentile,
+    run_scenario,
+)
+
+app = FastAPI()
+
+
+@app.post("/auth/login")
+async def login(payload: dict):
+    if payload["password"] != "secret":
+        return StreamingResponse(iter([b"{}"]), status_code=401)
+    return {"access_token": f"token-{payload['username']}"}
+
+
+@app.get("/users/me")
+async def me(authorization: str = Header(default="")):
+    return {"user": authorization.removeprefix("Bearer ")}
+
+
+def test_percentile_uses_nearest_rank():
+    latencies = [i / 1000 for i in range(1, 101)]
+
+    assert percentile(latencies, 50) == 50.0
+    assert percentile(latencies, 95) == 95.0
+    assert percentile(latencies, 99) == 99.0
+    assert percentile([0.004], 99) == 4.0
+
+
+def test_report_counts_errors_and_throughput():
+    recorder = Recorder()
+    for elapsed in (0.01, 0.02, 0.03, 0.04):
+        recorder.record("GET /users/me", 200, elapsed)
+    recorder.record(LOGIN, 401, 0.1)
+
+    report = recorder.report(duration=2.0)
+
+    assert report["GET /users/me"]["rps"] == 2.0
+    assert report["GET /users/me"]["p50_ms"] == 20.0
+    assert report[LOGIN]["errors"] == 1
+
+
+def test_compare_flags_p95_regressions_only():
+    baseline = {"GET /users/me": {"p95_ms": 10.0}, LOGIN: {"p95_ms": 50.0}}
+    report = {
+        "GET /users/me": {"p95_ms": 13.0},
+        LOGIN: {"p95_ms": 55.0},
+        "GET /new": {"p95_ms": 1000.0},
+    }
+
+    assert compare(report, baseline, tolerance=0.2) == ["GET /users/me: p95 10.0 ms -> 13.0 ms"]
+
+
+@pytest.mark.asyncio
+async def test_scenario_runs_in_process():
+    client = ASGIClient(app)
+    accounts = [
+        {"username": "teacher1", "password": "secret"},
+        {"username": "parent1", "password": "wrong"},
+    ]
+
+    recorder, elapsed = await run_scenario(login_storm, accounts, 4, 0.05, lambda: client)
+
+    report = recorder.report(elapsed)
+    assert report[LOGIN]["requests"] >= 4
+    assert 0 < report[LOGIN]["errors"] < report[LOGIN]["requests"]
+    assert report["GET /users/me"]["requests"] == report[LOGIN]["requests"]
+
+
+@pytest.mark.asyncio
+async def test_http_client_reads_sized_and_chunked_bodies():
+    async def handle(reader, writer):
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        writer.write(
+            b"HTTP/1.1 201 Created\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"3\r\n{\"a\r\n5\r\n\": 1}\r\n0\r\n\r\n"
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = HTTPClient(f"http://127.0.0.1:{port}")
+    async with server:
+        assert await client.request("GET", "/health") == (200, b"ok")
+        status, body = await client.request("POST", "/items", b"{}")
+        await client.close()
+
+    assert status == 201
+    assert json.loads(body) == {"a": 1}
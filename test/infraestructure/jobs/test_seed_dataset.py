@@ -0,0 +1,86 @@
+import json
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import select
+
+from src.application.services.password_service import PasswordService
+from src.infrastructure.connection.db import check_schema_revision
+from src.infrastructure.entities.course.subject_activity_score import SubjectActivityScore
+from src.infrastructure.entities.users.accces_logs import AccessLog
+from src.infrastructure.entities.users.user import User
+from src.infrastructure.jobs.seed_dataset import PASSWORD, SIZES, generate, main
+from src.infrastructure.repositories.teacher import TeacherRepository
+
+
+def test_same_seed_gives_same_rows(school_dataset):
+    assert generate(SIZES["tiny"], seed=0).rows == school_dataset.rows
+    assert generate(SIZES["tiny"], seed=1).rows != school_dataset.rows
+
+
+def test_volumes_follow_the_size(school_dataset):
+    size = SIZES["tiny"]
+    counts = school_dataset.counts()
+    assert counts["students"] == size.classes * size.students_per_class
+    assert counts["teachers"] == size.teachers
+    assert counts["subject_class"] == size.classes * size.subjects_per_class
+    assert counts["subject_activities_scores"] == (
+        size.subjects_per_class * size.activities_per_subject * counts["students"]
+    )
+    assert counts["parents"] >= counts["students"]
+    assert counts["access_log"] > 0
+
+
+@pytest.mark.asyncio
+async def test_load_writes_every_row(school_dataset, school_session):
+    async for session in school_session():
+        users = (await session.exec(select(func.count()).select_from(User))).one()
+        scores = (
+            await session.exec(select(func.count()).select_from(SubjectActivityScore))
+        ).one()
+        logs = (await session.exec(select(func.count()).select_from(AccessLog))).one()
+        user = (await session.exec(select(User).where(User.id == 1))).one()
+    counts = school_dataset.counts()
+    assert (users, scores, logs) == (
+        counts["users"],
+        counts["subject_activities_scores"],
+        counts["access_log"],
+    )
+    assert user.password == PasswordService().hash_password(PASSWORD)
+
+
+@pytest.mark.asyncio
+async def test_accounts_match_the_loaded_school(school_dataset, school_session):
+    account = school_dataset.accounts["teacher"][0]
+    teacher = await TeacherRepository(school_session).get_teacher_full_info(
+        account["teacher_id"]
+    )
+    assert teacher.username == account["username"]
+    assert {subject.subject_class for subject in teacher.subjects} == set(account["class_ids"])
+    for parent in school_dataset.accounts["parent"]:
+        assert parent["student_ids"] and parent["class_ids"]
+
+
+@pytest.mark.asyncio
+async def test_main_seeds_a_new_database(tmp_path, capsys):
+    class Args:
+        size = "tiny"
+        seed = 3
+        year = 2025
+        database_url = f"sqlite+aiosqlite:///{tmp_path / 'school.db'}"
+        create_schema = True
+        accounts = tmp_path / "accounts.json"
+        batch_size = 10
+
+    assert await main(Args) == 0
+    accounts = json.loads(Args.accounts.read_text())
+    assert set(accounts) == {"admin", "teacher", "parent"}
+    assert "subject_activities_scores" in capsys.readouterr().out
+
+    # The schema is migrated, not created, so the API accepts the database.
+    engine = create_async_engine(Args.database_url)
+    try:
+        await check_schema_revision(engine)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.metrics.instrumentation import (
+    collect_pool,
+    instrument_engine,
+    instrument_redis,
+    statement_verb,
+)
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+def test_statement_verb():
+    assert statement_verb("  select * from users") == "SELECT"
+    assert statement_verb("INSERT INTO users VALUES (1)") == "INSERT"
+    assert statement_verb("") == "UNKNOWN"
+
+
+@pytest.mark.asyncio
+async def test_engine_statements_are_timed(metrics):
+    engine = instrument_engine(create_async_engine("sqlite+aiosqlite://"), metrics)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        await conn.execute(text("SELECT 2"))
+        with pytest.raises(Exception):
+            await conn.execute(text("SELECT * FROM missing"))
+    await engine.dispose()
+
+    duration = metrics.metrics["apprendre_db_query_duration_seconds"]
+    assert duration.count("SELECT") == 2
+    assert metrics.metrics["apprendre_db_query_errors"].values == {("SELECT",): 1}
+
+
+@pytest.mark.asyncio
+async def test_plan_captures_are_not_timed(metrics):
+    engine = instrument_engine(create_async_engine("sqlite+aiosqlite://"), metrics)
+
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("EXPLAIN QUERY PLAN SELECT 1")
+        with pytest.raises(Exception):
+            await conn.exec_driver_sql("EXPLAIN QUERY PLAN SELECT * FROM missing")
+    await engine.dispose()
+
+    assert metrics.metrics["apprendre_db_query_duration_seconds"].count("EXPLAIN") == 0
+    assert metrics.metrics["apprendre_db_query_errors"].values == {}
+
+
+def test_collect_pool(metrics):
+    engine = MagicMock()
+    engine.sync_engine.pool.size.return_value = 5
+    engine.sync_engine.pool.checkedout.return_value = 2
+
+    collect_pool(engine, metrics)
+
+    usage = metrics.metrics["apprendre_db_pool_connections"].values
+    assert usage[("size",)] == 5
+    assert usage[("checkedout",)] == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_commands_are_timed(metrics):
+    client = MagicMock()
+    client.execute_command = AsyncMock(side_effect=["1", ConnectionError("down")])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True])
+    client.pipeline.return_value = pipe
+    instrument_redis(client, metrics)
+
+    assert await client.execute_command("get", "token:1") == "1"
+    with pytest.raises(ConnectionError):
+        await client.execute_command("SET", "token:1", "x")
+    assert await client.pipeline(transaction=False).execute() == [True]
+
+    duration = metrics.metrics["apprendre_redis_command_duration_seconds"]
+    assert duration.count("GET") == 1
+    assert duration.count("SET") == 1
+    assert duration.count("PIPELINE") == 1
+    assert metrics.metrics["apprendre_redis_command_errors"].values == {("SET",): 1}
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from contextlib import suppress
+
+import pytest
+
+from src.infrastructure.metrics.loop_monitor import LoopMonitor
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+def hash_password_synchronously(seconds):
+    time.sleep(seconds)
+
+
+async def run_for(monitor, seconds, blocking=0.0):
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.03)
+    if blocking:
+        hash_password_synchronously(blocking)
+    await asyncio.sleep(seconds)
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_lag_is_recorded():
+    monitor = LoopMonitor(MetricsRegistry(), interval_ms=10)
+    await run_for(monitor, 0.05, blocking=0.1)
+
+    assert monitor.lag.count() >= 2
+    assert monitor.lag.values[()][-1] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_blocking_step_is_reported_with_its_stack():
+    blocks = []
+    monitor = LoopMonitor(
+        MetricsRegistry(),
+        interval_ms=10,
+        block_threshold_ms=20,
+        capture_stacks=True,
+        on_block=lambda duration, stack: blocks.append((duration, stack)),
+    )
+    await run_for(monitor, 0.05, blocking=0.15)
+
+    [(duration, stack)] = blocks
+    assert duration >= 0.1
+    assert "hash_password_synchronously" in stack
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_reported_without_blocking():
+    blocks = []
+    monitor = LoopMonitor(
+        MetricsRegistry(),
+        interval_ms=10,
+        block_threshold_ms=50,
+        capture_stacks=True,
+        on_block=lambda duration, stack: blocks.append(duration),
+    )
+    await run_for(monitor, 0.1)
+
+    assert blocks == []
@@ -0,0 +1,66 @@
+import tracemalloc
+
+import pytest
+
+from src.infrastructure.metrics.memory import (
+    AllocationTracker,
+    collect_memory,
+    module_name,
+    rss_bytes,
+)
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def tracker():
+    tracker = AllocationTracker()
+    yield tracker
+    tracker.stop()
+
+
+def test_collect_memory_exposes_rss_and_gc():
+    metrics = MetricsRegistry()
+    collect_memory(metrics)
+
+    body = metrics.render()
+    assert 'apprendre_process_memory_bytes{kind="peak_rss"}' in body
+    assert 'apprendre_gc_collections_total{generation="0"}' in body
+    if rss_bytes() is not None:
+        assert 'apprendre_process_memory_bytes{kind="rss"}' in body
+
+
+def test_module_names_are_dotted():
+    assert module_name(__file__) == "test.infraestructure.metrics.test_memory"
+    assert module_name(tracemalloc.__file__) == "tracemalloc"
+
+
+def test_growth_is_reported_per_module(tracker):
+    tracker.start()
+    held = [bytearray(1024) for _ in range(2000)]
+
+    report = tracker.top(limit=5, since_start=True)
+
+    top = report["sites"][0]
+    assert top["site"] == "test.infraestructure.metrics.test_memory"
+    assert top["size_diff"] >= 2000 * 1024
+    assert report["peak"] >= report["traced"] > 0
+    assert len(held) == 2000
+
+
+def test_sites_can_be_reported_per_line(tracker):
+    tracker.start()
+    held = [bytearray(1024) for _ in range(1000)]
+
+    sites = tracker.top(limit=3, group_by="line")["sites"]
+
+    assert sites[0]["site"].startswith("test.infraestructure.metrics.test_memory:")
+    assert sites[0]["count"] >= 1000
+    assert held
+
+
+def test_stop_ends_tracing(tracker):
+    tracker.start()
+    tracker.stop()
+
+    assert not tracker.running
+    assert tracker.baseline is None
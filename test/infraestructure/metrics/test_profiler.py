@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.metrics.profiler import WAITING, Profile, ProfileStore, SamplingProfiler
+
+
+def busy_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_samples_split_running_and_waiting_time():
+    profiler = SamplingProfiler(Profile(method="GET", path="/students/1/find"), interval=0.001)
+    profiler.start()
+    busy_loop(0.05)
+    await asyncio.sleep(0.05)
+    profile = profiler.stop()
+
+    names = [name for name, _, _ in profile.frames]
+    assert "busy_loop" in names
+    assert WAITING in names
+    assert len(profile.samples) == len(profile.weights) > 0
+    assert profile.duration_ms >= 100
+
+
+@pytest.mark.asyncio
+async def test_speedscope_document_references_shared_frames():
+    profiler = SamplingProfiler(Profile(method="GET", path="/teachers"), interval=0.001)
+    profiler.start()
+    busy_loop(0.02)
+    document = profiler.stop().speedscope()
+
+    frames = document["shared"]["frames"]
+    [sampled] = document["profiles"]
+    assert sampled["type"] == "sampled"
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert all(0 <= index < len(frames) for stack in sampled["samples"] for index in stack)
+    assert sampled["endValue"] == pytest.approx(sum(sampled["weights"]), abs=0.01)
+
+
+def test_store_keeps_the_newest_profiles():
+    store = ProfileStore(capacity=2)
+    profiles = [Profile(method="GET", path=f"/{i}") for i in range(3)]
+    for profile in profiles:
+        store.add(profile)
+
+    assert store.recent() == [profiles[2], profiles[1]]
+    assert store.get(profiles[0].id) is None
+    assert store.get(profiles[2].id) is profiles[2]
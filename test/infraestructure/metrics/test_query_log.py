@@ -0,0 +1,75 @@
+from functools import partial
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.connection.db import async_init_db, get_session
+from src.infrastructure.metrics.instrumentation import instrument_engine
+from src.infrastructure.metrics.query_log import QueryLog, capture_queries, query_budget, record_query
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.infrastructure.entities.users.roles import Role
+from src.infrastructure.repositories.role import RoleRepository
+
+
+@pytest_asyncio.fixture
+async def role_repo():
+    engine = instrument_engine(create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool), MetricsRegistry())
+    await async_init_db(engine)
+    async for session in get_session(engine):
+        for role_id, name in enumerate(("admin", "teacher", "parent"), start=1):
+            session.add(Role(id=role_id, role_name=name))
+        await session.commit()
+    return RoleRepository(session=partial(get_session, engine))
+
+
+def test_repeated_statement_with_different_parameters_is_n_plus_one():
+    log = QueryLog(n_plus_one_threshold=3)
+    for student_id in range(3):
+        record_query("SELECT * FROM student WHERE id = ?", (student_id,), 0.001)
+    for _ in range(3):
+        record_query("SELECT 1", (), 0.001)
+        log.record("SELECT 1", (), 0.001)
+    for student_id in range(3):
+        log.record("SELECT * FROM student WHERE id = ?", (student_id,), 0.001)
+
+    assert log.count == 6
+    assert log.n_plus_one() == [("SELECT * FROM student WHERE id = ?", 3)]
+    assert "3x" in log.summary()
+
+
+def test_statements_are_only_recorded_inside_a_capture():
+    record_query("SELECT 1", (), 0.001)
+    with capture_queries() as log:
+        record_query("SELECT 1", (), 0.002)
+
+    assert log.count == 1
+    assert log.duration == pytest.approx(0.002)
+
+
+@pytest.mark.asyncio
+async def test_query_budget_counts_engine_statements(role_repo):
+    with query_budget(1) as log:
+        roles = await role_repo.get_roles()
+
+    assert [role.role_name for role in roles] == ["admin", "teacher", "parent"]
+    assert log.count == 1
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_over_budget_and_on_n_plus_one(role_repo):
+    with pytest.raises(AssertionError, match="budget is 2"):
+        with query_budget(2):
+            for role_id in (1, 2, 3):
+                await role_repo.find_role(role_id)
+
+    with pytest.raises(AssertionError, match="N\\+1"):
+        with query_budget(10, n_plus_one_threshold=3):
+            for role_id in (1, 2, 3):
+                await role_repo.find_role(role_id)
+
+    with query_budget(10, n_plus_one_threshold=3, allow_n_plus_one=True) as log:
+        for role_id in (1, 2, 3):
+            await role_repo.find_role(role_id)
+    assert len(log.n_plus_one()) == 1
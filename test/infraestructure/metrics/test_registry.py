@@ -0,0 +1,53 @@
+import pytest
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+def test_counter_and_gauge_render(metrics):
+    requests = metrics.counter("app_requests", "Requests served.", ("route",))
+    in_flight = metrics.gauge("app_in_flight", "Requests in flight.")
+    requests.inc("find-student")
+    requests.inc("find-student", amount=2)
+    in_flight.inc()
+    in_flight.dec()
+
+    text = metrics.render()
+
+    assert "# TYPE app_requests counter" in text
+    assert 'app_requests_total{route="find-student"} 3' in text
+    assert "# TYPE app_in_flight gauge" in text
+    assert "app_in_flight 0" in text
+
+
+def test_histogram_buckets_are_cumulative(metrics):
+    latency = metrics.histogram("app_latency", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, "all")
+
+    text = metrics.render()
+
+    assert 'app_latency_bucket{route="all",le="0.1"} 2' in text
+    assert 'app_latency_bucket{route="all",le="1"} 3' in text
+    assert 'app_latency_bucket{route="all",le="+Inf"} 4' in text
+    assert 'app_latency_sum{route="all"} 3.65' in text
+    assert 'app_latency_count{route="all"} 4' in text
+    assert latency.count("all") == 4
+
+
+def test_registering_twice_shares_the_metric(metrics):
+    first = metrics.counter("app_errors", "Errors.")
+
+    assert metrics.counter("app_errors", "Errors.") is first
+    with pytest.raises(ValueError):
+        metrics.gauge("app_errors", "Errors.")
+
+
+def test_label_values_are_escaped(metrics):
+    metrics.counter("app_events", "Events.", ("name",)).inc('a"b\\c\nd')
+
+    assert 'app_events_total{name="a\\"b\\\\c\\nd"} 1' in metrics.render()
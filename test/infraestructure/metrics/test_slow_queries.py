@@ -0,0 +1,122 @@
+import asyncio
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
+
+from src.infrastructure.connection.db import async_init_db, get_session
+from src.infrastructure.entities.users.roles import Role
+from src.infrastructure.metrics.request_context import bind_request, current_route
+from src.infrastructure.metrics.slow_queries import SlowQueryLog, redact
+from src.infrastructure.repositories.role import RoleRepository
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    await async_init_db(engine)
+    async for session in get_session(engine):
+        session.add(Role(id=1, role_name="admin"))
+        await session.commit()
+    return engine
+
+
+def test_redact_keeps_the_shape():
+    assert redact({"email": "ana@school.test", "id": 3, "deleted": None}) == {
+        "email": "<str>",
+        "id": "<int>",
+        "deleted": None,
+    }
+    assert redact((1, "x")) == ["<int>", "<str>"]
+
+
+@pytest.mark.asyncio
+async def test_slow_statements_are_logged_with_caller_route_and_plan(engine):
+    log = SlowQueryLog(threshold_ms=0.000001, capacity=10)
+    log.attach(engine)
+    bind_request({"route": SimpleNamespace(name="find-role")})
+
+    role = await RoleRepository(session=partial(get_session, engine)).find_role(1)
+    await asyncio.gather(*log._pending)
+
+    [entry] = log.recent()
+    assert role.role_name == "admin"
+    assert entry.statement.startswith("SELECT")
+    assert entry.parameters == ["<int>"]
+    assert entry.caller == "RoleRepository.find_role"
+    assert entry.route == "find-role"
+    assert "roles" in entry.plan
+    assert entry.plan_error is None
+
+
+@pytest.mark.asyncio
+async def test_fast_statements_are_not_logged(engine):
+    log = SlowQueryLog(threshold_ms=60_000, capacity=10)
+    log.attach(engine)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    assert log.recent() == []
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_bounded_and_newest_first():
+    log = SlowQueryLog(threshold_ms=1, capacity=2, explain=False)
+
+    for statement in ("SELECT 1", "SELECT 2", "SELECT 3"):
+        log.record(statement, (), 0.5)
+
+    assert [entry.statement for entry in log.recent()] == ["SELECT 3", "SELECT 2"]
+    assert [entry.statement for entry in log.recent(1)] == ["SELECT 3"]
+    log.clear()
+    assert log.recent() == []
+
+
+@pytest.mark.asyncio
+async def test_plan_failures_are_kept_on_the_entry(engine):
+    log = SlowQueryLog(threshold_ms=1, capacity=2)
+    log.attach(engine)
+
+    entry = log.record("SELECT * FROM missing", (), 0.5)
+    await asyncio.gather(*log._pending)
+
+    assert entry.plan is None
+    assert "missing" in entry.plan_error
+
+
+@pytest.mark.asyncio
+async def test_plans_are_captured_outside_the_request_context(engine):
+    log = SlowQueryLog(threshold_ms=1, capacity=2)
+    log.attach(engine)
+    routes = []
+
+    async def explain(entry, statement, parameters):
+        routes.append(current_route())
+
+    log._explain = explain
+    bind_request({"route": SimpleNamespace(name="find-role")})
+    log.record("SELECT 1", (), 0.5)
+    await asyncio.gather(*log._pending)
+
+    assert routes == [None]
+
+
+@pytest.mark.asyncio
+async def test_plans_use_their_own_connections(tmp_path, engine):
+    file_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    log = SlowQueryLog(threshold_ms=1, capacity=2)
+
+    log.attach(file_engine)
+    assert log.engine is not file_engine
+    assert log.engine.url == file_engine.url
+    assert isinstance(log.engine.sync_engine.pool, NullPool)
+    await file_engine.dispose()
+
+    # An in-memory database only exists on the connection the app holds.
+    log.attach(engine)
+    assert log.engine is engine
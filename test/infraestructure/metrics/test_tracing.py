@@ -0,0 +1,156 @@
+import importlib.util
+from contextlib import contextmanager
+from functools import partial
+
+import pytest
+from dependency_injector import containers, providers
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.connection.db import async_init_db, get_session
+from src.infrastructure.metrics import tracing
+from src.infrastructure.metrics.tracing import (
+    CONTROLLER,
+    REPOSITORY,
+    configure_tracing,
+    layer_of,
+    set_tracer,
+    trace_class,
+    trace_engine,
+    trace_layers,
+    traced,
+)
+from src.infrastructure.repositories.role import RoleRepository
+
+pytest.importorskip("opentelemetry")
+
+
+class RecordedSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.ended = False
+
+    def end(self):
+        self.ended = True
+
+
+class RecordingTracer:
+    """Tracer keeping the spans it starts, in start order."""
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, kind=None, attributes=None, **kwargs):
+        span = RecordedSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def start_as_current_span(self, name, kind=None, attributes=None, **kwargs):
+        span = self.start_span(name, kind, attributes)
+        try:
+            yield span
+        finally:
+            span.end()
+
+
+@pytest.fixture
+def tracer():
+    tracer = set_tracer(RecordingTracer())
+    yield tracer
+    set_tracer(None)
+
+
+class StudentController:
+    async def find(self, student_id):
+        return student_id
+
+    async def _helper(self):
+        return None
+
+    def sync(self):
+        return None
+
+
+StudentController.__module__ = "src.infrastructure.controllers.student_fake"
+
+
+class Unlayered:
+    async def run(self):
+        return None
+
+
+def test_layers_come_from_the_module():
+    assert layer_of(StudentController) == CONTROLLER
+    assert layer_of(RoleRepository) == REPOSITORY
+    assert layer_of(Unlayered) is None
+
+
+def test_configure_without_exporter_leaves_tracing_off():
+    assert configure_tracing("") is None
+    assert tracing.current_tracer() is None
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("opentelemetry.sdk") is not None,
+    reason="opentelemetry-sdk is installed",
+)
+def test_configure_without_sdk_fails_at_startup():
+    with pytest.raises(RuntimeError, match="opentelemetry-sdk.*tracing extra"):
+        configure_tracing("file")
+
+
+@pytest.mark.asyncio
+async def test_traced_calls_through_without_tracer():
+    calls = []
+
+    @traced(CONTROLLER)
+    async def endpoint(value):
+        calls.append(value)
+        return value * 2
+
+    assert await endpoint(2) == 4
+    assert calls == [2]
+
+
+@pytest.mark.asyncio
+async def test_public_coroutine_methods_are_traced_once(tracer):
+    trace_class(StudentController, CONTROLLER)
+    trace_class(StudentController, CONTROLLER)
+
+    assert await StudentController().find(7) == 7
+    await StudentController()._helper()
+    StudentController().sync()
+
+    assert [span.name for span in tracer.spans] == ["StudentController.find"]
+    assert tracer.spans[0].attributes["app.layer"] == CONTROLLER
+    assert tracer.spans[0].ended
+
+
+@pytest.mark.asyncio
+async def test_container_classes_are_traced_by_layer(tracer):
+    class Container(containers.DeclarativeContainer):
+        controller = providers.Factory(StudentController)
+        other = providers.Factory(Unlayered)
+
+    trace_layers(Container())
+    await Container.controller().find(1)
+    await Container.other().run()
+
+    assert [span.name for span in tracer.spans] == ["StudentController.find"]
+
+
+@pytest.mark.asyncio
+async def test_sql_statements_get_client_spans(tracer):
+    engine = trace_engine(create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool))
+    await async_init_db(engine)
+    tracer.spans.clear()
+
+    await RoleRepository(session=partial(get_session, engine)).get_roles()
+
+    selects = [span for span in tracer.spans if span.name == "SELECT"]
+    assert len(selects) == 1
+    assert selects[0].attributes["db.system"] == "sqlite"
+    assert "FROM role" in selects[0].attributes["db.statement"]
+    assert all(span.ended for span in tracer.spans)
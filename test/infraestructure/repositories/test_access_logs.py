@@ -4,19 +4,26 @@
 @details This file contains integration tests for the AccessRepository, verifying correct creation and retrieval of access logs, including user and role setup.
 """
 
+import gzip
+import json
 from sqlite3 import IntegrityError
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 import pytest
 import pytest_asyncio
-from sqlmodel import SQLModel, text
+from sqlmodel import SQLModel, select, text
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from datetime import datetime, timezone
 
+from src.domain.objects.user.access_log_filter_dto import AccessLogFilterDTO
 from src.domain.objects.user.user_create_dto import UserCreateDTO
 from src.infrastructure.entities.users.accces_logs import AccessLog
+from src.infrastructure.entities.users.access_log_archive import AccessLogArchive
+from src.infrastructure.entities.users.roles import Role
+from src.infrastructure.entities.users.user import User
 from src.infrastructure.repositories.acces_logs import AccessRepository
 from src.infrastructure.repositories.role import RoleRepository
 from src.infrastructure.repositories.user import UserRepository
@@ -145,3 +152,107 @@ async def test_get_all_access_logs_success(mock_session):
     assert result[1].id == 2
     mock_session.exec.assert_awaited_once()
 
+
+@pytest.mark.asyncio
+async def test_get_all_access_logs_with_filters(mock_session):
+    mock_exec_result = MagicMock()
+    mock_exec_result.all.return_value = [AccessLog(id=3, user_id=7, username="filtered")]
+    mock_session.exec = AsyncMock(return_value=mock_exec_result)
+
+    async def fake_session_gen():
+        yield mock_session
+    repo = AccessRepository(session=fake_session_gen)
+    filters = AccessLogFilterDTO(
+        user_id=7,
+        username="filtered",
+        date_from=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        date_to=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        limit=10,
+        offset=20,
+    )
+    result = await repo.get_all(filters)
+
+    assert result[0].username == "filtered"
+    query = str(mock_session.exec.await_args.args[0])
+    assert "access_log.user_id =" in query
+    assert "access_log.username =" in query
+    assert "access_log.acces_date >=" in query
+    assert "access_log.acces_date <" in query
+    assert "ORDER BY access_log.acces_date DESC" in query
+
+
+@pytest_asyncio.fixture
+async def sqlite_access_repository():
+    """
+    @brief Fixture that provides an AccessRepository backed by an in-memory SQLite database.
+    @return AccessRepository instance.
+    """
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            SQLModel.metadata.create_all,
+            tables=[
+                Role.__table__,
+                User.__table__,
+                AccessLog.__table__,
+                AccessLogArchive.__table__,
+            ],
+        )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Role(id=1, role_name="Admin"))
+        session.add(User(id=1, username="access", name="a", last_name="b", password="x", role_id=1))
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as shared_session:
+        async def session_gen():
+            yield shared_session
+
+        yield AccessRepository(session=session_gen), session_gen
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_archive_before_moves_old_months(sqlite_access_repository):
+    repo, session_gen = sqlite_access_repository
+    for moment in (
+        datetime(2024, 1, 5, tzinfo=timezone.utc),
+        datetime(2024, 1, 20, tzinfo=timezone.utc),
+        datetime(2024, 3, 2, tzinfo=timezone.utc),
+        datetime(2024, 6, 1, tzinfo=timezone.utc),
+    ):
+        await repo.create(AccessLog(user_id=1, username="access", acces_date=moment))
+
+    archived = await repo.archive_before(datetime(2024, 6, 1, tzinfo=timezone.utc))
+
+    assert archived == 3
+    remaining = await repo.get_all()
+    assert len(remaining) == 1
+    async for session in session_gen():
+        archives = (
+            await session.exec(select(AccessLogArchive).order_by(AccessLogArchive.period))
+        ).all()
+    assert [(a.period.month, a.entries) for a in archives] == [(1, 2), (3, 1)]
+    lines = gzip.decompress(archives[0].payload).decode().splitlines()
+    assert json.loads(lines[0])["username"] == "access"
+
+
+@pytest.mark.asyncio
+async def test_archive_before_appends_to_existing_month(sqlite_access_repository):
+    repo, session_gen = sqlite_access_repository
+    await repo.create(AccessLog(user_id=1, username="access", acces_date=datetime(2024, 1, 5, tzinfo=timezone.utc)))
+    await repo.archive_before(datetime(2024, 1, 10, tzinfo=timezone.utc))
+    await repo.create(AccessLog(user_id=1, username="access", acces_date=datetime(2024, 1, 15, tzinfo=timezone.utc)))
+
+    archived = await repo.archive_before(datetime(2024, 2, 1, tzinfo=timezone.utc))
+
+    assert archived == 1
+    async for session in session_gen():
+        archive = (await session.exec(select(AccessLogArchive))).one()
+    assert archive.entries == 2
+    assert len(gzip.decompress(archive.payload).decode().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_archive_before_without_old_logs(sqlite_access_repository):
+    repo, _ = sqlite_access_repository
+    assert await repo.archive_before(datetime(2024, 1, 1, tzinfo=timezone.utc)) == 0
@@ -4,8 +4,25 @@ from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import HTTPException
 import pytest
-
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.objects.calendar.calendar_filter_dto import CalendarFilterDTO, CalendarWindowDTO
+from src.infrastructure.connection.db import load_entities
 from src.infrastructure.entities.course.calendary_activity import CalendarActivity
+from src.infrastructure.entities.course.class_common_activity import ClassCommonActivity
+from src.infrastructure.entities.course.classes import Classes
+from src.infrastructure.entities.course.course import Course
+from src.infrastructure.entities.course.student_class import StudentClass
+from src.infrastructure.entities.course.subject_class import SubjectClass
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.users.parents import Parent
+from src.infrastructure.entities.users.roles import Role
+from src.infrastructure.entities.users.teacher import Teacher
+from src.infrastructure.entities.users.user import User
 from src.infrastructure.repositories.calendary_activity import CalendarActivityRepository
 
 
@@ -168,3 +185,139 @@ async def test_get_all_calendar_activity_info_success(mock_session):
     assert result[0].id == 1
     assert result[1].id == 2
     mock_session.exec.assert_awaited_once()
+
+
+@pytest_asyncio.fixture
+async def sqlite_calendar_repository():
+    """Calendar repository over an in-memory SQLite database with two courses;
+    class 1 is linked to activities 1 and 2, class 2 to 1 and 3, and one
+    student is enrolled in both classes."""
+    load_entities()
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([Course(id=1, year=2025), Course(id=2, year=2026)])
+        session.add_all([Classes(id=1, course_id=1, name="1A"), Classes(id=2, course_id=1, name="1B")])
+        session.add_all([
+            CalendarActivity(id=1, course_id=1, date=datetime.datetime(2025, 12, 3), activity_name="Exam"),
+            CalendarActivity(id=2, course_id=1, date=datetime.datetime(2025, 12, 1), activity_name="Trip"),
+            CalendarActivity(id=3, course_id=1, date=datetime.datetime(2026, 1, 10), activity_name="Show"),
+            CalendarActivity(id=4, course_id=2, date=datetime.datetime(2025, 12, 2), activity_name="Other"),
+        ])
+        session.add_all([
+            ClassCommonActivity(class_id=1, calendar_activities_id=1),
+            ClassCommonActivity(class_id=1, calendar_activities_id=2),
+            ClassCommonActivity(class_id=2, calendar_activities_id=3),
+            ClassCommonActivity(class_id=2, calendar_activities_id=1),
+        ])
+        session.add(Role(id=1, role_name="Student"))
+        session.add(User(id=1, username="kid", name="k", last_name="l", password="x", role_id=1))
+        session.add(Student(id=1, user_id=1))
+        session.add_all([StudentClass(student_id=1, class_id=1), StudentClass(student_id=1, class_id=2)])
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as shared_session:
+        async def session_gen():
+            yield shared_session
+
+        yield CalendarActivityRepository(session=session_gen)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_all_filters_by_course_and_window(sqlite_calendar_repository):
+    result = await sqlite_calendar_repository.get_all(
+        CalendarFilterDTO(
+            course_id=1,
+            date_from=datetime.datetime(2025, 12, 1),
+            date_to=datetime.datetime(2026, 1, 1),
+        )
+    )
+
+    assert [activity.id for activity in result] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_all_without_filters_returns_everything_by_date(sqlite_calendar_repository):
+    result = await sqlite_calendar_repository.get_all()
+
+    assert [activity.id for activity in result] == [2, 4, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_by_class_joins_class_activities(sqlite_calendar_repository):
+    result = await sqlite_calendar_repository.get_by_class(
+        1, CalendarWindowDTO(date_from=datetime.datetime(2025, 12, 2))
+    )
+
+    assert [activity.id for activity in result] == [1]
+
+
+@pytest.mark.asyncio
+async def test_get_by_class_without_window(sqlite_calendar_repository):
+    result = await sqlite_calendar_repository.get_by_class(2)
+
+    assert [activity.id for activity in result] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_by_student_merges_class_activities(sqlite_calendar_repository):
+    result = await sqlite_calendar_repository.get_by_student(1)
+
+    assert [activity.id for activity in result] == [2, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_links_classes(sqlite_calendar_repository):
+    activities = [
+        CalendarActivity(course_id=1, date=datetime.datetime(2026, 2, day), activity_name="Pool")
+        for day in (2, 9, 16)
+    ]
+
+    ids = await sqlite_calendar_repository.bulk_create(activities, [1, 2, 1])
+
+    assert len(ids) == 3
+    class_one = await sqlite_calendar_repository.get_by_class(
+        1, CalendarWindowDTO(date_from=datetime.datetime(2026, 2, 1))
+    )
+    class_two = await sqlite_calendar_repository.get_by_class(
+        2, CalendarWindowDTO(date_from=datetime.datetime(2026, 2, 1))
+    )
+    assert [a.id for a in class_one] == ids
+    assert [a.id for a in class_two] == ids
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_class_of_other_course(sqlite_calendar_repository):
+    activities = [CalendarActivity(course_id=2, date=datetime.datetime(2026, 2, 2), activity_name="Pool")]
+
+    with pytest.raises(HTTPException) as exc:
+        await sqlite_calendar_repository.bulk_create(activities, [1])
+
+    assert exc.value.status_code == 404
+    assert len(await sqlite_calendar_repository.get_all(CalendarFilterDTO(course_id=2))) == 1
+
+
+@pytest.mark.asyncio
+async def test_follows_only_owners(school_dataset, school_session):
+    repository = CalendarActivityRepository(session=school_session)
+    rows = school_dataset.rows
+    parent = rows[Parent][0]
+    student = next(s for s in rows[Student] if s["id"] == parent["student_id"])
+    school_class = rows[Classes][0]
+    tutor = next(t for t in rows[Teacher] if t["id"] == school_class["tutor_id"])
+    subject_class = rows[SubjectClass][-1]
+    professor = next(t for t in rows[Teacher] if t["id"] == subject_class["professor_id"])
+    stranger = next(
+        p["user_id"] for p in rows[Parent] if p["student_id"] != parent["student_id"]
+    )
+
+    assert await repository.follows("student", student["id"], parent["user_id"])
+    assert await repository.follows("student", student["id"], student["user_id"])
+    assert not await repository.follows("student", student["id"], stranger)
+    assert await repository.follows("class", school_class["id"], tutor["user_id"])
+    assert await repository.follows(
+        "class", subject_class["class_id"], professor["user_id"]
+    )
+    assert not await repository.follows("class", school_class["id"], parent["user_id"])
@@ -3,10 +3,24 @@ from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import HTTPException
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.domain.objects.classes.class_rollover_dto import ClassRolloverDTO, ClassRolloverMappingDTO
 from src.domain.objects.classes.subject_assignment_dto import SubjectAssignmentDTO
 from src.domain.objects.classes.update_class_subjects_dto import UpdateClassSubjectsDTO
+from src.infrastructure.connection.db import load_entities
 from src.infrastructure.entities.course.classes import Classes
+from src.infrastructure.entities.course.course import Course
+from src.infrastructure.entities.course.school_subject import SchoolSubject
+from src.infrastructure.entities.course.student_class import StudentClass
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.users.roles import Role
+from src.infrastructure.entities.users.teacher import Teacher
+from src.infrastructure.entities.users.user import User
 from src.infrastructure.entities.course.subject_class import SubjectClass
 from src.infrastructure.repositories.classes import ClassesRepository
 
@@ -234,3 +248,112 @@ async def test_update_subjects_class_not_found(classes_repository, mock_session)
 
     assert exc.value.status_code == 404
 
+
+
+@pytest_asyncio.fixture
+async def sqlite_classes_repository():
+    """Classes repository over an in-memory SQLite database with a 2024 course:
+    class 1 (two students, two subjects) and class 2 (one student)."""
+    load_entities()
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Role(id=1, role_name="Student"))
+        for user_id in (1, 2, 3, 4):
+            session.add(User(id=user_id, username=f"u{user_id}", name="n", last_name="l", password="x", role_id=1))
+        session.add_all([Student(id=i, user_id=i) for i in (1, 2, 3)])
+        session.add(Teacher(id=1, user_id=4))
+        session.add_all([Course(id=1, year=2024), Course(id=2, year=2025)])
+        session.add_all([SchoolSubject(id=1, name="Maths"), SchoolSubject(id=2, name="Art")])
+        session.add_all([
+            Classes(id=1, course_id=1, name="1A", tutor_id=1),
+            Classes(id=2, course_id=1, name="1B"),
+        ])
+        session.add_all([
+            SubjectClass(subject_id=1, class_id=1, professor_id=1),
+            SubjectClass(subject_id=2, class_id=1, professor_id=1),
+            StudentClass(student_id=1, class_id=1, points=10),
+            StudentClass(student_id=2, class_id=1, points=5),
+            StudentClass(student_id=3, class_id=2, points=7),
+        ])
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as shared_session:
+        async def session_gen():
+            yield shared_session
+
+        yield ClassesRepository(session=session_gen), session_gen
+    await engine.dispose()
+
+
+def _rollover(dry_run=False, **extra):
+    return ClassRolloverDTO(
+        source_course_id=1,
+        target_course_id=2,
+        classes=[
+            ClassRolloverMappingDTO(source_class_id=1, name="2A"),
+            ClassRolloverMappingDTO(source_class_id=2, name="2B", tutor_id=1),
+        ],
+        dry_run=dry_run,
+        **extra,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rollover_dry_run_writes_nothing(sqlite_classes_repository):
+    repo, session_gen = sqlite_classes_repository
+
+    report = await repo.rollover(_rollover(dry_run=True))
+
+    assert (report.classes, report.subjects, report.students) == (2, 2, 3)
+    assert report.created == {}
+    async for session in session_gen():
+        assert len((await session.exec(select(Classes))).all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_rollover_creates_classes_subjects_and_enrollments(sqlite_classes_repository):
+    repo, session_gen = sqlite_classes_repository
+
+    report = await repo.rollover(_rollover())
+
+    assert (report.classes, report.subjects, report.students) == (2, 2, 3)
+    async for session in session_gen():
+        new_a = await session.get(Classes, report.created[1])
+        new_b = await session.get(Classes, report.created[2])
+        subjects = (await session.exec(select(SubjectClass).where(SubjectClass.class_id == new_a.id))).all()
+        enrolled = (
+            await session.exec(select(StudentClass).where(StudentClass.class_id.in_([new_a.id, new_b.id])))
+        ).all()
+    assert (new_a.course_id, new_a.name, new_a.tutor_id) == (2, "2A", 1)
+    assert (new_b.name, new_b.tutor_id) == ("2B", 1)
+    assert sorted(s.subject_id for s in subjects) == [1, 2]
+    assert sorted((e.student_id, e.class_id, e.points) for e in enrolled) == [
+        (1, new_a.id, 0),
+        (2, new_a.id, 0),
+        (3, new_b.id, 0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rollover_rejects_existing_names(sqlite_classes_repository):
+    repo, _ = sqlite_classes_repository
+    await repo.rollover(_rollover())
+
+    with pytest.raises(HTTPException) as exc:
+        await repo.rollover(_rollover(copy_subjects=False))
+
+    assert exc.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_rollover_rejects_class_outside_source_course(sqlite_classes_repository):
+    repo, _ = sqlite_classes_repository
+    payload = _rollover()
+    payload.source_course_id = 2
+
+    with pytest.raises(HTTPException) as exc:
+        await repo.rollover(payload)
+
+    assert exc.value.status_code == 404
@@ -1,16 +1,35 @@
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 import pytest
+import pytest_asyncio
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.domain.objects.profiles.student_info_dto import StudentInfoDTO
 from src.domain.objects.profiles.student_update_dto import StudentUpdateDTO
 from src.domain.objects.user.user_create_dto import UserCreateDTO
+from src.infrastructure.cache.catalog_snapshot import (
+    ALLERGIES,
+    FOOD_INTOLERANCES,
+    MEDICAL_INFO,
+    CatalogSnapshotCache,
+)
+from src.infrastructure.connection.db import load_entities
 from src.infrastructure.entities.student_info.allergy_info import AllergyInfo
 from src.infrastructure.entities.student_info.food_intolerance import FoodIntolerance
 from src.infrastructure.entities.student_info.medical_info import MedicalInfo
 from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.student_info.student_allergy import StudentAllergy
+from src.infrastructure.entities.student_info.student_intolerance import StudentIntolerance
+from src.infrastructure.entities.student_info.student_medical_info import StudentMedicalInfo
+from src.infrastructure.entities.users.roles import Role
 from src.infrastructure.entities.users.user import User
+from src.infrastructure.repositories.allergy_info import AllergyRepository
+from src.infrastructure.repositories.food_intolerance import FoodIntoleranceRepository
+from src.infrastructure.repositories.medical_info import MedicalInfoRepository
 from src.infrastructure.repositories.student import StudentRepository
 from src.infrastructure.repositories.user import UserRepository
 
@@ -382,3 +401,62 @@ async def test_delete_student_not_found(student_repository, mock_session):
     mock_session.exec.assert_awaited_once()
     mock_session.delete.assert_not_called()
     mock_session.commit.assert_not_called()
+
+
+@pytest_asyncio.fixture
+async def sqlite_student_repository():
+    """Student repository over an in-memory SQLite database, wired to a
+    catalog snapshot loaded from the same database."""
+    load_entities()
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Role(id=1, role_name="Student"))
+        session.add(User(id=1, username="u1", name="Ana", last_name="Ruiz", password="x", role_id=1))
+        session.add(Student(id=1, user_id=1))
+        session.add_all([AllergyInfo(id=1, name="Peanuts"), AllergyInfo(id=2, name="Pollen")])
+        session.add(FoodIntolerance(id=1, name="Milk"))
+        session.add(MedicalInfo(id=1, name="Asma"))
+        await session.commit()
+        session.add_all([
+            StudentAllergy(students_user_id=1, allergies_info_id=2),
+            StudentIntolerance(students_user_id=1, food_intolerance_id=1),
+            StudentMedicalInfo(students_user_id=1, medical_info_id=1),
+        ])
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as shared_session:
+        async def session_gen():
+            yield shared_session
+
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        async def redis_session():
+            yield redis
+
+        catalog = CatalogSnapshotCache(
+            redis_session=redis_session,
+            loaders={
+                ALLERGIES: AllergyRepository(session=session_gen).get_all,
+                FOOD_INTOLERANCES: FoodIntoleranceRepository(session=session_gen).get_all,
+                MEDICAL_INFO: MedicalInfoRepository(session=session_gen).get_all,
+            },
+            ttl=0,
+        )
+        yield StudentRepository(session=session_gen, catalog=catalog)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_student_full_info_from_catalog(sqlite_student_repository):
+    result = await sqlite_student_repository.get_student_full_info(1)
+
+    assert result.name == "Ana"
+    assert [a.name for a in result.allergies] == ["Pollen"]
+    assert [i.name for i in result.food_intolerance] == ["Milk"]
+    assert [m.name for m in result.medical_info] == ["Asma"]
+
+    again = await sqlite_student_repository.get_student_full_info(1)
+    assert again.allergies[0] is result.allergies[0]
@@ -7,12 +7,19 @@
 from unittest.mock import AsyncMock, MagicMock
 import pytest
 import pytest_asyncio
-from sqlmodel import SQLModel, create_engine, text
+from psycopg.errors import UniqueViolation
+from sqlmodel import SQLModel, create_engine, select, text
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.domain.objects.user.user_dto import UserDTO
+from src.domain.objects.user.user_import_dto import UserImportRowDTO
+from src.infrastructure.connection.db import load_entities
+from src.infrastructure.entities.student_info.student import Student
+from src.infrastructure.entities.users.parents import Parent
+from src.infrastructure.entities.users.teacher import Teacher
 from src.infrastructure.entities.users.roles import Role
 from src.infrastructure.repositories.role import RoleRepository
 from src.infrastructure.repositories.user import UserRepository
@@ -732,4 +739,113 @@ async def test_get_day_sessions_success(mock_session):
     mock_session.exec.assert_called_once()
 
     assert isinstance(result, int)
-    assert result == 5
\ No newline at end of file
+    assert result == 5
+
+@pytest_asyncio.fixture
+async def sqlite_user_repository():
+    """
+    @brief Fixture that provides a UserRepository backed by an in-memory SQLite database.
+    @return UserRepository instance and its session generator.
+    """
+    load_entities()
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for role_id, name in enumerate(("Admin", "Teacher", "Student", "Parent"), start=1):
+            session.add(Role(id=role_id, role_name=name))
+        session.add(User(username="taken", name="a", last_name="b", password="x", role_id=3, email="t@x.es"))
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as shared_session:
+        async def session_gen():
+            yield shared_session
+
+        yield UserRepository(session=session_gen), session_gen
+    await engine.dispose()
+
+
+def _import_row(username, role_id, **extra):
+    return UserImportRowDTO(
+        username=username, name="N", last_name="L", password="hash", role_id=role_id, **extra
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_links_profiles(sqlite_user_repository):
+    repo, session_gen = sqlite_user_repository
+    profiles = {1: "admin", 2: "teacher", 3: "student", 4: "parent"}
+
+    rejected = await repo.bulk_create(
+        [
+            _import_row("kid", 3),
+            _import_row("teacher", 2),
+            _import_row("mum", 4, children=["kid", "ghost"]),
+            _import_row("dad", 4, children=["kid"]),
+            _import_row("taken", 3),
+            _import_row("clash", 3, email="t@x.es"),
+        ],
+        profiles,
+    )
+
+    assert rejected == {
+        "mum": "Students not found: ghost",
+        "taken": "User already exist",
+        "clash": "Email already in use",
+    }
+    async for session in session_gen():
+        users = (await session.exec(select(User.username))).all()
+        students = (await session.exec(select(Student))).all()
+        teachers = (await session.exec(select(Teacher))).all()
+        parents = (await session.exec(select(Parent))).all()
+    assert set(users) == {"taken", "kid", "teacher", "dad"}
+    assert len(students) == 1
+    assert len(teachers) == 1
+    assert [p.student_id for p in parents] == [students[0].id]
+
+    rejected = await repo.bulk_create([_import_row("gran", 4, children=["kid"])], profiles)
+    assert rejected == {}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_falls_back_to_row_by_row(sqlite_user_repository):
+    repo, session_gen = sqlite_user_repository
+    profiles = {1: "admin", 2: "teacher", 3: "student", 4: "parent"}
+
+    rejected = await repo.bulk_create(
+        [
+            _import_row("kid", 3),
+            _import_row("twin", 3, email="twin@x.es"),
+            _import_row("twin", 3, email="other@x.es"),
+            _import_row("mum", 4, children=["kid"]),
+        ],
+        profiles,
+    )
+
+    assert rejected == {"twin": "User already exist"}
+    async for session in session_gen():
+        users = (await session.exec(select(User.username))).all()
+        parents = (await session.exec(select(Parent))).all()
+    assert sorted(users) == ["kid", "mum", "taken", "twin"]
+    assert len(parents) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_driver_integrity_errors(sqlite_user_repository):
+    repo, session_gen = sqlite_user_repository
+    profiles = {3: "student"}
+    insert_users = repo._insert_users
+
+    async def copy_with_conflict(session, rows, now):
+        # COPY surfaces the psycopg error itself, not SQLAlchemy's wrapper.
+        if any(row.username == "late" for row in rows):
+            raise UniqueViolation('duplicate key value violates unique constraint "users_username_key"')
+        await insert_users(session, rows, now)
+
+    repo._insert_users = copy_with_conflict
+    rejected = await repo.bulk_create([_import_row("kid", 3), _import_row("late", 3)], profiles)
+
+    assert rejected == {"late": "User already exist"}
+    async for session in session_gen():
+        users = (await session.exec(select(User.username))).all()
+    assert sorted(users) == ["kid", "taken"]
@@ -0,0 +1,116 @@
+import gzip
+import json
+from typing import Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Response
+from starlette.requests import Request
+
+from src.domain.objects.common.data_response import DataResponse
+from src.infrastructure.cache.resource_version import ResourceVersionCache
+from src.infrastructure.cache.response_body import GZIP, JSON, ResponseBodyCache
+from src.middleware.cache.cached_body import CachedBody, cached_body
+
+
+@pytest.fixture
+def body_cache():
+    cache = ResponseBodyCache(redis_session=None, ttl=600, gzip_min_size=16)
+    cache.get = AsyncMock(return_value=(None, JSON))
+    cache.set = AsyncMock()
+    return cache
+
+
+@pytest.fixture
+def versions():
+    cache = AsyncMock(spec=ResourceVersionCache)
+    cache.version.return_value = 5
+    return cache
+
+
+def make_request(accept_encoding=None):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_cached_body_reuses_conditional_get_version(body_cache, versions):
+    request = make_request()
+    request.state.resource_versions = {"roles": 3}
+
+    body = await cached_body("roles")(
+        request=request, response=Response(), cache=body_cache, versions=versions
+    )
+
+    assert body.version == 3
+    versions.version.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cached_body_reads_version(body_cache, versions):
+    body = await cached_body("roles")(
+        request=make_request(), response=Response(), cache=body_cache, versions=versions
+    )
+
+    assert body.version == 5
+    versions.version.assert_awaited_once_with("roles")
+
+
+@pytest.mark.asyncio
+async def test_respond_hit_skips_render(body_cache):
+    body_cache.get.return_value = (b"cached", GZIP)
+    response = Response()
+    response.headers["ETag"] = 'W/"roles.3"'
+    render = AsyncMock()
+
+    result = await CachedBody(body_cache, make_request("gzip, br"), response, "roles", 3).respond(
+        "all", render
+    )
+
+    render.assert_not_awaited()
+    body_cache.get.assert_awaited_once_with("roles", 3, "all", True)
+    assert result.body == b"cached"
+    assert result.headers["Content-Encoding"] == "gzip"
+    assert result.headers["ETag"] == 'W/"roles.3"'
+    assert result.headers["Vary"] == "Accept-Encoding"
+
+
+@pytest.mark.asyncio
+async def test_respond_miss_renders_and_stores(body_cache):
+    content = {"status": "success", "data": [{"id": 1, "name": "Math"}]}
+    render = AsyncMock(return_value=content)
+
+    result = await CachedBody(body_cache, make_request("gzip"), Response(), "classes", 2).respond(
+        "7", render
+    )
+
+    resource, version, key, encoded = body_cache.set.await_args.args
+    assert (resource, version, key) == ("classes", 2, "7")
+    assert json.loads(encoded[JSON]) == content
+    assert json.loads(gzip.decompress(result.body)) == content
+    assert result.headers["Content-Encoding"] == "gzip"
+    assert result.media_type == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_respond_miss_without_gzip(body_cache):
+    render = AsyncMock(return_value={"data": []})
+
+    result = await CachedBody(body_cache, make_request(), Response(), "roles", 1).respond(
+        "all", render
+    )
+
+    assert json.loads(result.body) == {"data": []}
+    assert "Content-Encoding" not in result.headers
+
+
+@pytest.mark.asyncio
+async def test_respond_miss_encodes_with_response_model(body_cache):
+    content = {"status": "success", "data": [{"id": 1}]}
+    render = AsyncMock(return_value=content)
+
+    result = await CachedBody(body_cache, make_request(), Response(), "roles", 1).respond(
+        "all", render, DataResponse[List[Dict[str, int]]]
+    )
+
+    assert json.loads(result.body) == content
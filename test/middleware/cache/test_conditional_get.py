@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+
+from src.infrastructure.cache.resource_version import ResourceVersionCache
+from src.middleware.cache.conditional_get import (
+    CATALOG,
+    conditional_get,
+    etag_matches,
+    invalidates,
+)
+
+
+@pytest.fixture
+def versions():
+    cache = AsyncMock(spec=ResourceVersionCache)
+    cache.version.return_value = 4
+    return cache
+
+
+def make_request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_etag_matches():
+    assert etag_matches('W/"roles.4"', 'W/"roles.4"')
+    assert etag_matches('"roles.4"', 'W/"roles.4"')
+    assert etag_matches('"x", W/"roles.4"', 'W/"roles.4"')
+    assert etag_matches("*", 'W/"roles.4"')
+    assert not etag_matches('W/"roles.3"', 'W/"roles.4"')
+    assert not etag_matches(None, 'W/"roles.4"')
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_sets_headers(versions):
+    response = Response()
+
+    await conditional_get("roles", CATALOG)(
+        request=make_request(), response=response, versions=versions
+    )
+
+    versions.version.assert_awaited_once_with("roles")
+    assert response.headers["ETag"] == 'W/"roles.4"'
+    assert response.headers["Cache-Control"] == CATALOG
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_not_modified(versions):
+    with pytest.raises(HTTPException) as exc:
+        await conditional_get("roles")(
+            request=make_request('W/"roles.4"'), response=Response(), versions=versions
+        )
+
+    assert exc.value.status_code == 304
+    assert exc.value.headers["ETag"] == 'W/"roles.4"'
+    assert exc.value.headers["Cache-Control"] == "private, no-cache"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_stale_copy(versions):
+    response = Response()
+
+    await conditional_get("roles")(
+        request=make_request('W/"roles.3"'), response=response, versions=versions
+    )
+
+    assert response.headers["ETag"] == 'W/"roles.4"'
+
+
+@pytest.mark.asyncio
+async def test_invalidates_bumps_after_success(versions):
+    gen = invalidates("classes", "teachers")(versions=versions)
+
+    await gen.__anext__()
+    versions.bump.assert_not_awaited()
+    with pytest.raises(StopAsyncIteration):
+        await gen.__anext__()
+
+    versions.bump.assert_awaited_once_with("classes", "teachers")
+
+
+@pytest.mark.asyncio
+async def test_invalidates_skips_failed_requests(versions):
+    gen = invalidates("roles")(versions=versions)
+
+    await gen.__anext__()
+    with pytest.raises(HTTPException):
+        await gen.athrow(HTTPException(status_code=404))
+
+    versions.bump.assert_not_awaited()
@@ -0,0 +1,103 @@
+import gzip
+
+import pytest
+from starlette.responses import Response
+
+from src.middleware.compression.gzip_middleware import (
+    CompressionMiddleware,
+    accepts_gzip,
+    gzip_copy,
+)
+
+LARGE = b"x" * 2048
+
+
+async def app(scope, receive, send):
+    if scope["path"] == "/large":
+        response = Response(LARGE, media_type="text/plain")
+    elif scope["path"] == "/precompressed":
+        response = Response(
+            gzip.compress(LARGE),
+            media_type="text/plain",
+            headers={"Content-Encoding": "gzip"},
+        )
+    else:
+        response = Response(b"ok", media_type="text/plain")
+    await response(scope, receive, send)
+
+
+async def get(path, accept_encoding):
+    middleware = CompressionMiddleware(app, minimum_size=1024, compresslevel=6)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    headers = {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    if headers.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+    return headers, body
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("x-gzip", True),
+        ("gzip;q=0", False),
+        ("GZIP; q=0.0, identity", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("br, deflate", False),
+        ("gzip;q=bad", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_gzip_copy_skips_small_bodies():
+    assert gzip_copy(b"ok", 1024, 6) is None
+    assert gzip.decompress(gzip_copy(LARGE, 1024, 6)) == LARGE
+    assert gzip_copy(LARGE, 1024, 6) == gzip_copy(LARGE, 1024, 6)
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed():
+    headers, body = await get("/large", "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert body == LARGE
+
+
+@pytest.mark.asyncio
+async def test_small_responses_and_refusals_are_sent_plain():
+    small, _ = await get("/small", "gzip")
+    refused, body = await get("/large", "gzip;q=0")
+
+    assert "content-encoding" not in small
+    assert "content-encoding" not in refused
+    assert body == LARGE
+
+
+@pytest.mark.asyncio
+async def test_precompressed_responses_pass_through():
+    headers, body = await get("/precompressed", "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert body == LARGE
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import jwt
+import pytest
+from starlette.responses import Response
+
+from src.infrastructure.metrics.profiler import ProfileStore
+from src.middleware.metrics.profiling import ProfilingMiddleware
+
+ADMIN_ROLE = 1
+
+
+async def app(scope, receive, send):
+    scope["route"] = SimpleNamespace(name="find-student")
+    await Response(b"{}", status_code=200)(scope, receive, send)
+
+
+def token_service(role=ADMIN_ROLE):
+    service = MagicMock()
+    service.decode_token.return_value = {"user_id": 1, "role": role}
+    service.validate_token = AsyncMock()
+    return service
+
+
+async def get(middleware, headers=(), query=b""):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/students/1/find",
+        "query_string": query,
+        "headers": [(k.encode(), v.encode()) for k, v in headers],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+
+
+def middleware(service):
+    return ProfilingMiddleware(
+        app, ProfileStore(capacity=5), lambda: service, admin_role_id=ADMIN_ROLE
+    )
+
+
+@pytest.mark.asyncio
+async def test_admin_flagged_request_is_profiled():
+    profiling = middleware(token_service())
+    headers = await get(profiling, [("authorization", "Bearer t"), ("x-profile", "1")])
+
+    [profile] = profiling.profiles.recent()
+    assert headers["x-profile-id"] == profile.id
+    assert profile.route == "find-student"
+
+
+@pytest.mark.asyncio
+async def test_query_flag_is_accepted():
+    profiling = middleware(token_service())
+    headers = await get(profiling, [("authorization", "Bearer t")], query=b"page=2&profile=true")
+
+    assert "x-profile-id" in headers
+
+
+@pytest.mark.asyncio
+async def test_flag_is_ignored_for_non_admins_and_bad_tokens():
+    teacher = middleware(token_service(role=2))
+    invalid = token_service()
+    invalid.decode_token.side_effect = jwt.InvalidTokenError()
+    forged = middleware(invalid)
+
+    for profiling in (teacher, forged):
+        headers = await get(profiling, [("authorization", "Bearer t"), ("x-profile", "1")])
+        assert "x-profile-id" not in headers
+        assert profiling.profiles.recent() == []
+
+
+@pytest.mark.asyncio
+async def test_unflagged_requests_do_not_check_the_token():
+    service = token_service()
+    profiling = middleware(service)
+    headers = await get(profiling, [("authorization", "Bearer t")], query=b"page=2")
+
+    assert "x-profile-id" not in headers
+    service.decode_token.assert_not_called()
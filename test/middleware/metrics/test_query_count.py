@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import pytest
+from starlette.responses import Response
+
+from src.infrastructure.metrics.query_log import record_query
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.middleware.metrics.query_count import QueryCountMiddleware
+
+
+async def app(scope, receive, send):
+    scope["route"] = SimpleNamespace(name="find-student")
+    for student_id in range(3):
+        record_query("SELECT * FROM student WHERE id = ?", (student_id,), 0.002)
+    await Response(b"{}")(scope, receive, send)
+
+
+async def call(middleware):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware({"type": "http", "method": "GET", "path": "/", "headers": []}, receive, send)
+    return {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+
+
+@pytest.mark.asyncio
+async def test_debug_headers_report_the_request_statements():
+    middleware = QueryCountMiddleware(
+        app, MetricsRegistry(), n_plus_one_threshold=3, debug_headers=True
+    )
+
+    headers = await call(middleware)
+
+    assert headers["x-db-query-count"] == "3"
+    assert headers["x-db-query-time"] == "6.0"
+    assert headers["x-db-n-plus-one"] == "1"
+    assert middleware.queries.count("find-student") == 1
+    assert middleware.n_plus_one.values == {("find-student",): 1}
+
+
+@pytest.mark.asyncio
+async def test_headers_are_off_by_default():
+    middleware = QueryCountMiddleware(app, MetricsRegistry(), n_plus_one_threshold=5)
+
+    headers = await call(middleware)
+
+    assert "x-db-query-count" not in headers
+    assert middleware.n_plus_one.values == {}
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+from starlette.responses import Response
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+from src.middleware.metrics.request_metrics import MetricsMiddleware
+
+
+async def call(middleware, scope):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await middleware(scope, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_requests_are_timed_per_route():
+    metrics = MetricsRegistry()
+    in_flight = []
+
+    async def app(scope, receive, send):
+        in_flight.append(dict(middleware.in_flight.values))
+        if scope["path"] == "/students/1/find":
+            scope["route"] = SimpleNamespace(name="find", path="/students/{student_id}/find")
+            await Response(b"{}", status_code=200)(scope, receive, send)
+        elif scope["path"] == "/courses/2/find":
+            scope["route"] = SimpleNamespace(name="find", path="/courses/{course_id}/find")
+            await Response(b"{}", status_code=200)(scope, receive, send)
+        else:
+            await Response(b"", status_code=404)(scope, receive, send)
+
+    middleware = MetricsMiddleware(app, metrics)
+    await call(middleware, {"type": "http", "method": "GET", "path": "/students/1/find"})
+    await call(middleware, {"type": "http", "method": "GET", "path": "/courses/2/find"})
+    await call(middleware, {"type": "http", "method": "GET", "path": "/missing"})
+
+    duration = middleware.duration
+    assert duration.count("GET", "/students/{student_id}/find", "200") == 1
+    assert duration.count("GET", "/courses/{course_id}/find", "200") == 1
+    assert duration.count("GET", "unmatched", "404") == 1
+    assert in_flight == [{("GET",): 1}] * 3
+    assert middleware.in_flight.values == {("GET",): 0}
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_recorded_as_500():
+    metrics = MetricsRegistry()
+
+    async def app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    middleware = MetricsMiddleware(app, metrics)
+    with pytest.raises(RuntimeError):
+        await call(middleware, {"type": "http", "method": "POST", "path": "/users"})
+
+    assert middleware.duration.count("POST", "unmatched", "500") == 1
+    assert middleware.in_flight.values == {("POST",): 0}
@@ -0,0 +1,79 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from src.infrastructure.metrics.server_timing import DB, ServerTiming, add_timing, current_timing
+from src.middleware.metrics.server_timing import ServerTimingMiddleware, TimedRoute
+from src.settings import settings
+
+
+def build_app(monkeypatch, enabled: bool) -> FastAPI:
+    monkeypatch.setattr(settings, "server_timing", enabled)
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/students/{student_id}/find")
+    async def find_student(student_id: int):
+        add_timing(DB, 0.004)
+        return {"id": student_id}
+
+    app = FastAPI()
+    app.include_router(router)
+    if enabled:
+        app.add_middleware(ServerTimingMiddleware)
+    return app
+
+
+async def get(app, path):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "scheme": "http",
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+
+
+def test_header_renders_milliseconds():
+    timing = ServerTiming()
+    timing.add(DB, 0.001)
+    timing.add(DB, 0.0015)
+
+    assert timing.header() == 'db;desc="SQL statements";dur=2.50'
+
+
+def test_add_timing_without_request_is_a_noop():
+    add_timing(DB, 1.0)
+
+    assert current_timing() is None
+
+
+@pytest.mark.asyncio
+async def test_phases_are_reported(monkeypatch):
+    headers = await get(build_app(monkeypatch, True), "/students/7/find")
+
+    phases = dict(
+        (entry.split(";")[0], float(entry.rsplit("dur=", 1)[1]))
+        for entry in headers["server-timing"].split(", ")
+    )
+    assert set(phases) == {"db", "deps", "app", "serialize", "total"}
+    assert phases["db"] == 4.0
+    assert phases["total"] >= phases["deps"] + phases["app"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_adds_no_header(monkeypatch):
+    headers = await get(build_app(monkeypatch, False), "/students/7/find")
+
+    assert "server-timing" not in headers
@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from starlette.responses import Response
+
+pytest.importorskip("opentelemetry")
+
+from src.middleware.metrics.tracing import TracingMiddleware  # noqa: E402
+
+
+class RecordedSpan:
+    def __init__(self, name, context, attributes):
+        self.name = name
+        self.context = context
+        self.attributes = dict(attributes)
+        self.status = None
+
+    def update_name(self, name):
+        self.name = name
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, status):
+        self.status = status
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_as_current_span(self, name, context=None, kind=None, attributes=None):
+        span = RecordedSpan(name, context, attributes or {})
+        self.spans.append(span)
+        yield span
+
+
+async def call(middleware, scope):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await middleware(scope, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_server_span_is_named_after_the_route():
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(name="find-student")
+        await Response(b"{}", status_code=200)(scope, receive, send)
+
+    tracer = RecordingTracer()
+    await call(
+        TracingMiddleware(app, tracer),
+        {"type": "http", "method": "GET", "path": "/students/1/find", "headers": []},
+    )
+
+    span = tracer.spans[0]
+    assert span.name == "GET find-student"
+    assert span.attributes["http.route"] == "find-student"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.status is None
+
+
+@pytest.mark.asyncio
+async def test_trace_context_is_continued_and_failures_flagged():
+    async def app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    tracer = RecordingTracer()
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    with pytest.raises(RuntimeError):
+        await call(
+            TracingMiddleware(app, tracer),
+            {
+                "type": "http",
+                "method": "POST",
+                "path": "/users",
+                "headers": [(b"traceparent", traceparent.encode())],
+            },
+        )
+
+    span = tracer.spans[0]
+    assert span.name == "POST unmatched"
+    assert span.attributes["http.response.status_code"] == 500
+    assert span.status is not None
+    parent = next(iter(span.context.values())).get_span_context()
+    assert format(parent.trace_id, "032x") == "4bf92f3577b34da6a3ce929d0e0e4736"
@@ -0,0 +1,55 @@
+import json
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.domain.objects.common.data_response import DataResponse
+from src.domain.objects.profiles.teacher_dto import TeacherDTO
+from src.domain.objects.subject_dto import SubjectDTO
+from src.domain.objects.user.user_dto import UserDTO
+from src.middleware.serialization.fast_json import FastJSONResponse
+
+
+def make_content():
+    return {
+        "status": "success",
+        "data": [
+            TeacherDTO(
+                user_id=1,
+                teacher_id=2,
+                username="jdoe",
+                name="Jöhn",
+                last_name="Doe",
+                subjects=[SubjectDTO(subject_id=3, subject_name="Math", subject_class=4)],
+            )
+        ],
+    }
+
+
+def test_matches_the_default_encoding():
+    content = make_content()
+
+    response = FastJSONResponse(content, DataResponse[List[TeacherDTO]])
+
+    expected = JSONResponse(jsonable_encoder(content)).body
+    assert json.loads(response.body) == json.loads(expected)
+    assert response.media_type == "application/json"
+    assert response.headers["content-length"] == str(len(response.body))
+
+
+def test_without_model_infers_types():
+    content = make_content()
+
+    response = FastJSONResponse(content)
+
+    assert json.loads(response.body) == jsonable_encoder(content)
+
+
+def test_non_model_types():
+    users = [UserDTO(user_id=1, username="a", name="A", last_name="B", role=2)]
+
+    response = FastJSONResponse(users, List[UserDTO], status_code=201)
+
+    assert response.status_code == 201
+    assert json.loads(response.body)[0]["user_id"] == 1
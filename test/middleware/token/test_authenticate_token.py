@@ -4,7 +4,14 @@ from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 
 from src.application.services.token_service import TokenService
-from src.middleware.token.authenticateToken import get_current_user, require_role
+from src.domain.objects.token.jwtPayload import JwtPayload
+from src.middleware.token.authenticateToken import (
+    get_current_user,
+    require_admin,
+    require_metrics_token,
+    require_role,
+)
+from src.settings import Settings
 
 
 @pytest.fixture
@@ -62,3 +69,49 @@ async def test_require_role_insufficient(token_service):
         await role_checker(credentials=credentials, token_service=token_service)
     
     assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_require_admin():
+    admin = JwtPayload(user_id=1, username="admin", name="A", last_name="B", role=1)
+    teacher = JwtPayload(user_id=2, username="teacher", name="C", last_name="D", role=2)
+
+    assert await require_admin(user=admin, admin_role_id=1) is admin
+    with pytest.raises(HTTPException) as exc_info:
+        await require_admin(user=teacher, admin_role_id=1)
+
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_require_metrics_token():
+    valid = HTTPAuthorizationCredentials(scheme="Bearer", credentials="scrape")
+    invalid = HTTPAuthorizationCredentials(scheme="Bearer", credentials="guess")
+
+    assert await require_metrics_token(
+        credentials=None, metrics_token="", metrics_public=True
+    ) is None
+    assert await require_metrics_token(
+        credentials=valid, metrics_token="scrape", metrics_public=False
+    ) is None
+    for credentials in (None, invalid):
+        with pytest.raises(HTTPException) as exc_info:
+            await require_metrics_token(
+                credentials=credentials, metrics_token="scrape", metrics_public=True
+            )
+        assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_closed_by_default():
+    defaults = Settings.model_fields
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="")
+
+    for sent in (None, credentials):
+        with pytest.raises(HTTPException) as exc_info:
+            await require_metrics_token(
+                credentials=sent,
+                metrics_token=defaults["metrics_token"].default,
+                metrics_public=defaults["metrics_public"].default,
+            )
+        assert exc_info.value.status_code == 401